@@ -0,0 +1,189 @@
+"""Concurrent load on the WSGI deployment (sync views) vs the ASGI one (async views).
+
+    pip install uvicorn
+    python -m benchmarks.asgi --products 100000 --clients 32
+
+Each deployment runs as its own server process on a local port:
+
+    wsgi        sync views behind a WSGI server with a fixed pool of --threads threads,
+                like gunicorn --threads
+    asgi-sync   the same sync views under uvicorn (one thread per request)
+    asgi        the *_async views under uvicorn
+
+--clients threads then keep requesting each listing for --seconds, while one more client
+requests /playground/hello/ (no queries) to see how long a cheap page waits behind them.
+"""
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.simple_server import WSGIServer
+
+from benchmarks.common import BASE_DIR, add_db_arguments, resolve_db, setup
+from benchmarks.load import QuietHandler, percentiles
+
+DEPLOYMENTS = {
+    # name: (server, urls)
+    'wsgi': ('wsgi', ['/playground/filter/', '/playground/related/']),
+    'asgi-sync': ('asgi', ['/playground/filter/', '/playground/related/']),
+    'asgi': ('asgi', ['/playground/filter/async/', '/playground/related/async/']),
+}
+PROBE_URL = '/playground/hello/'
+
+
+class PoolWSGIServer(WSGIServer):
+    # Requests queue up for a fixed number of threads, like a gthread worker
+    def __init__(self, *args, threads, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = ThreadPoolExecutor(threads)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def serve(server, db_path, port, threads):
+    from django.conf import settings
+
+    setup(db_path)
+    # Every request should do its work
+    settings.CATALOG_CACHE_TIMEOUT = 0
+    settings.PROFILING_SAMPLE_RATE = 0
+    if server == 'wsgi':
+        from django.core.wsgi import get_wsgi_application
+
+        httpd = PoolWSGIServer(('127.0.0.1', port), QuietHandler, threads=threads)
+        httpd.set_app(get_wsgi_application())
+        httpd.serve_forever()
+    else:
+        import uvicorn
+        from django.core.asgi import get_asgi_application
+        from django.utils.module_loading import import_string
+
+        # A sync-only middleware would run every async view in a thread, measuring nothing
+        sync_only = [path for path in settings.MIDDLEWARE
+                     if not getattr(import_string(path), 'async_capable', False)]
+        if sync_only:
+            sys.exit(f'sync-only middleware in settings.MIDDLEWARE: {", ".join(sync_only)}')
+        uvicorn.run(get_asgi_application(), host='127.0.0.1', port=port, log_level='warning')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'server on port {port} did not come up')
+
+
+def get(base, url):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(base + url, timeout=60) as response:
+            response.read()
+            status = response.status
+    except Exception as error:
+        status = repr(error)
+    return time.perf_counter() - started, status
+
+
+def load(base, url, clients, seconds):
+    latencies, errors, probe = [], [], []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def client():
+        while time.perf_counter() < deadline:
+            elapsed, status = get(base, url)
+            with lock:
+                latencies.append(elapsed)
+                if status != 200:
+                    errors.append(status)
+
+    def prober():
+        while time.perf_counter() < deadline:
+            probe.append(get(base, PROBE_URL)[0])
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    threads.append(threading.Thread(target=prober))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'throughput_rps': round(len(latencies) / seconds, 1),
+        **percentiles(latencies),
+        'probe': {'requests': len(probe), **percentiles(probe)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--clients', type=int, default=32, help='Concurrent client threads')
+    parser.add_argument('--seconds', type=float, default=10, help='Per deployment and url')
+    parser.add_argument('--threads', type=int, default=4, help='Worker threads of the WSGI server')
+    parser.add_argument('--deployments', nargs='+', choices=DEPLOYMENTS, default=list(DEPLOYMENTS))
+    parser.add_argument('--serve', choices=['wsgi', 'asgi'], help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    db_path = resolve_db(args)
+
+    if args.serve:
+        return serve(args.serve, db_path, args.port, args.threads)
+
+    results = {}
+    for name in args.deployments:
+        server, urls = DEPLOYMENTS[name]
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'benchmarks.asgi', '--db', str(db_path), '--serve', server,
+             '--port', str(port), '--threads', str(args.threads)],
+            cwd=BASE_DIR,
+        )
+        try:
+            wait_for(port)
+            base = f'http://127.0.0.1:{port}'
+            results[name] = {}
+            for url in urls:
+                # Warm up connections and caches first
+                load(base, url, 1, 1)
+                results[name][url] = load(base, url, args.clients, args.seconds)
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(json.dumps({
+        'database': db_path.name,
+        'clients': args.clients,
+        'wsgi_threads': args.threads,
+        'results': results,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Checkout throughput: concurrent shop.services.place_order calls, in orders/sec.
+
+    python -m benchmarks.checkout --products 100000 --workers 1 4 8
+
+Every worker thread keeps filling a cart with --items products and checking it out for
+--seconds, like a checkout request would. --hot limits the carts to that many products so
+the workers race for the same rows and the same last units of stock. The orders are placed
+in a copy of the database, the original stays as it is.
+"""
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import add_db_arguments, resolve_db, setup
+from benchmarks.load import percentiles
+
+
+def run(workers, seconds, items, product_ids, customer_ids):
+    from django.db import connection
+    from shop.models import Cart, CartItem, Customer
+    from shop.services import InsufficientInventory, place_order
+
+    deadline = time.perf_counter() + seconds
+    latencies, sold_out, errors = [], [], []
+    lock = threading.Lock()
+
+    def worker(number):
+        rng = random.Random(number)
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    cart = Cart.objects.create()
+                    CartItem.objects.bulk_create(
+                        CartItem(cart=cart, items_id=product_id, quantity=1)
+                        for product_id in rng.sample(product_ids, min(items, len(product_ids)))
+                    )
+                    started = time.perf_counter()
+                    place_order(cart, Customer(pk=rng.choice(customer_ids)))
+                except InsufficientInventory:
+                    # The cart is left behind, like a shopper's would be
+                    with lock:
+                        sold_out.append(1)
+                except Exception as error:
+                    with lock:
+                        errors.append(repr(error))
+                else:
+                    with lock:
+                        latencies.append(time.perf_counter() - started)
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'workers': workers,
+        'orders': len(latencies),
+        'orders_per_sec': round(len(latencies) / elapsed, 1),
+        **percentiles(latencies),
+        'sold_out': len(sold_out),
+        'errors': len(errors),
+        'first_error': (errors or [None])[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8],
+                        help='Concurrent checkouts, one run per value')
+    parser.add_argument('--seconds', type=float, default=10, help='Length of every run')
+    parser.add_argument('--items', type=int, default=3, help='Products per cart')
+    parser.add_argument('--hot', type=int, help='Only put this many products in carts')
+    args = parser.parse_args()
+    db_path = resolve_db(args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy = Path(directory) / 'checkout.sqlite3'
+        shutil.copyfile(db_path, copy)
+        setup(copy)
+        from django.conf import settings
+        from django.core.management import call_command
+        from django.db import connection
+        from shop.models import Customer, Product
+
+        settings.PROFILING_SAMPLE_RATE = 0
+        call_command('migrate', verbosity=0)
+        product_ids = list(Product.objects.filter(inventory__gt=0).values_list('id', flat=True))
+        if args.hot:
+            product_ids = random.Random(0).sample(product_ids, args.hot)
+        customer_ids = list(Customer.objects.values_list('id', flat=True)[:10_000])
+        connection.close()
+
+        results = [
+            run(workers, args.seconds, args.items, product_ids, customer_ids)
+            for workers in args.workers
+        ]
+    print(json.dumps({
+        'database': str(db_path),
+        'items': args.items,
+        'products': len(product_ids),
+        'results': results,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
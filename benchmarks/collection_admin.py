@@ -0,0 +1,60 @@
+"""Collection changelist timing: stored product_count vs the old Count('product') annotation.
+
+    python -m benchmarks.collection_admin --products 1000000
+"""
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.common import add_db_arguments, resolve_db, setup
+
+
+def admin_client():
+    from django.contrib.auth.models import User
+    from django.test import Client
+
+    user, _ = User.objects.get_or_create(
+        username='benchmark', defaults={'is_staff': True, 'is_superuser': True}
+    )
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+def time_changelist(client, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = client.get('/admin/shop/collection/')
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.status_code
+    return {'median_ms': round(statistics.median(timings), 1), 'max_ms': round(max(timings), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    setup(resolve_db(args))
+
+    from django.contrib import admin
+    from django.db.models import Count
+    from shop.admin import CollectionAdmin
+    from shop.models import Collection, Product
+
+    client = admin_client()
+    results = {'products': Product.objects.count()}
+    results['stored_column'] = time_changelist(client, args.runs)
+
+    # What CollectionAdmin.get_queryset used to do
+    def annotated(self, request):
+        return admin.ModelAdmin.get_queryset(self, request).annotate(products_annotated=Count('product'))
+    CollectionAdmin.get_queryset = annotated
+    results['count_annotation'] = time_changelist(client, args.runs)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
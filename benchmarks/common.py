@@ -0,0 +1,44 @@
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / 'benchmarks' / 'data'
+
+
+def setup(db_path=None):
+    # Point the project at a benchmark database and boot Django. DEBUG stays off because
+    # it keeps every executed query in memory, and so does the debug toolbar, whose sync-only
+    # middleware would put every async view behind a thread. store.settings reads both flags
+    # when it is imported, so they have to be set before the first settings access.
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'store.settings')
+    os.environ['DJANGO_DEBUG'] = '0'
+    os.environ['DJANGO_DEBUG_TOOLBAR'] = '0'
+    from django.conf import settings
+    settings.ALLOWED_HOSTS = ['*']
+    if db_path is not None:
+        settings.DATABASES['default']['NAME'] = str(db_path)
+        if 'replica' in settings.DATABASES:
+            settings.DATABASES['replica']['NAME'] = f'file:{db_path}?mode=ro'
+
+    import django
+    django.setup()
+
+
+def default_db_path(products):
+    return DATA_DIR / f'store-{products}.sqlite3'
+
+
+def add_db_arguments(parser):
+    parser.add_argument('--db', type=Path, help='Benchmark database (built with benchmarks.dataset)')
+    parser.add_argument('--products', type=int, default=100_000,
+                        help='Size of the dataset to use when --db is not given')
+
+
+def resolve_db(args):
+    db_path = args.db or default_db_path(args.products)
+    if not db_path.exists():
+        sys.exit(f'{db_path} does not exist, build it with: '
+                 f'python -m benchmarks.dataset --products {args.products}')
+    return db_path
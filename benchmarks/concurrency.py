@@ -0,0 +1,163 @@
+"""Read latency under write load: the old bare SQLite setup vs the tuned connection layer.
+
+    python -m benchmarks.concurrency --products 100000
+
+Reader threads request listing pages through a local WSGI server while writer threads
+run transactions like admin edits and order placement. Each profile runs in its own
+process on its own copy of the database, once without and once with the writers.
+
+    baseline  rollback journal, synchronous=FULL, a new connection per request, no routing
+    tuned     store.settings as they are: WAL, pragmas, persistent connections, read replica
+"""
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import BASE_DIR, add_db_arguments, resolve_db, setup
+from benchmarks.load import percentiles, server_requester, staff_session
+
+PROFILES = ['baseline', 'tuned']
+READ_URLS = ['/catalog/', '/playground/related/']
+
+
+def configure(profile, db_path):
+    from django.conf import settings
+    from django.db import connection
+    from store.sqlite import set_journal_mode
+
+    setup(db_path)
+    # Every read should reach the database
+    settings.CATALOG_CACHE_TIMEOUT = 0
+    settings.PROFILING_SAMPLE_RATE = 0
+    if profile == 'baseline':
+        default = settings.DATABASES['default']
+        default['OPTIONS'] = {}
+        default['CONN_MAX_AGE'] = 0
+        default['CONN_HEALTH_CHECKS'] = False
+        del settings.DATABASES['replica']
+        settings.SQLITE_PRAGMAS = {}
+    # The journal mode belongs to the file, the migrations set WAL but older copies may predate it
+    set_journal_mode(connection, 'delete' if profile == 'baseline' else 'wal')
+    connection.close()
+
+
+def write_once(rng, products, customers):
+    # An order with a few items plus a batch of inventory edits, in one transaction
+    from django.db import transaction
+    from django.db.models import F
+    from shop.models import Order, OrderItems, Product
+
+    with transaction.atomic():
+        order = Order.objects.create(customer_id=rng.randrange(1, customers + 1))
+        OrderItems.objects.bulk_create(
+            OrderItems(order=order, products_id=rng.randrange(1, products + 1), quantity=1, unitPrice=1)
+            for _ in range(3)
+        )
+        ids = [rng.randrange(1, products + 1) for _ in range(50)]
+        Product.objects.filter(pk__in=ids).update(inventory=F('inventory') + 1)
+
+
+def child(profile, db_path, seconds, readers, writers, with_writes):
+    configure(profile, db_path)
+    from django.db import connection
+    from shop.models import Customer, Product
+
+    products, customers = Product.objects.count(), Customer.objects.count()
+    get, stop = server_requester(staff_session())
+    connection.close()
+
+    deadline = time.perf_counter() + seconds
+    latencies, read_errors, writes, write_errors = [], [], [], []
+    lock = threading.Lock()
+
+    def reader(number):
+        url = READ_URLS[number % len(READ_URLS)]
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = get(url)
+            except Exception as error:
+                status = repr(error)
+            with lock:
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    read_errors.append(status)
+
+    def writer(number):
+        rng = random.Random(number)
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    write_once(rng, products, customers)
+                    with lock:
+                        writes.append(1)
+                except Exception as error:
+                    with lock:
+                        write_errors.append(repr(error))
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    if with_writes:
+        threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop()
+
+    print(json.dumps({
+        'profile': profile,
+        'writers': writers if with_writes else 0,
+        'reads': len(latencies),
+        'reads_per_sec': round(len(latencies) / seconds, 1),
+        **percentiles(latencies),
+        'read_errors': len(read_errors),
+        'writes_per_sec': round(len(writes) / seconds, 1),
+        'write_errors': len(write_errors),
+        'first_error': (read_errors or write_errors or [None])[0],
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--seconds', type=float, default=10, help='Length of every run')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--profile', choices=PROFILES, help=argparse.SUPPRESS)
+    parser.add_argument('--with-writes', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    db_path = resolve_db(args)
+
+    if args.profile:
+        return child(args.profile, db_path, args.seconds, args.readers, args.writers, args.with_writes)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in PROFILES:
+            # A fresh copy per profile: the writes pile up and WAL mode sticks to the file
+            copy = Path(directory) / f'{profile}.sqlite3'
+            shutil.copyfile(db_path, copy)
+            for with_writes in (False, True):
+                command = [
+                    sys.executable, '-m', 'benchmarks.concurrency', '--db', str(copy),
+                    '--profile', profile, '--seconds', str(args.seconds),
+                    '--readers', str(args.readers), '--writers', str(args.writers),
+                ]
+                if with_writes:
+                    command.append('--with-writes')
+                output = subprocess.run(command, cwd=BASE_DIR, check=True, capture_output=True, text=True).stdout
+                results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps({'database': str(db_path), 'readers': args.readers, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Build a benchmark database by scaling up the shapes in data_population_query.sql.
+
+    python -m benchmarks.dataset --products 1000000
+
+Customers, orders and order items scale with the product count unless given explicitly.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from benchmarks.common import DATA_DIR, default_db_path, setup
+
+WORDS = (
+    'bread cheese wine beer tofu basil salt beef peach guava sugar oil sauce gin '
+    'mustard turkey lettuce tomatoes shrimp straw chips mayonnaise sprouts pepper'
+).split()
+LOREM = 'lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc'
+COLLECTIONS = ['Grocery', 'Beauty', 'Cleaning', 'Stationary', 'Pets', 'Baking', 'Spices', 'Toys', 'Magazines']
+START = datetime(2020, 7, 1, tzinfo=timezone.utc)
+SPAN = timedelta(days=365)
+
+
+def random_time(rng):
+    return START + timedelta(seconds=rng.randrange(int(SPAN.total_seconds())))
+
+
+def build(path, products, customers, orders, items_per_order, batch_size=10_000, seed=0):
+    from django.core.management import call_command
+    from django.db import connection, transaction
+
+    from shop.management.commands.bulk_load import batched, preserve_timestamps
+    from shop.models import Collection, Customer, Order, OrderItems, Product
+    from store.sqlite import set_journal_mode
+
+    rng = random.Random(seed)
+    call_command('migrate', verbosity=0)
+    with connection.cursor() as cursor:
+        # The file is throwaway until the build finishes, durability buys nothing here
+        cursor.execute('PRAGMA journal_mode = OFF')
+        cursor.execute('PRAGMA synchronous = OFF')
+
+    def load(model, rows):
+        started = time.perf_counter()
+        count = 0
+        with preserve_timestamps(model):
+            for batch in batched(rows, batch_size):
+                with transaction.atomic():
+                    model.objects.bulk_create(batch)
+                count += len(batch)
+        elapsed = time.perf_counter() - started
+        print(f'{model.__name__}: {count} rows in {elapsed:.1f}s')
+
+    load(Collection, (Collection(id=i + 2, title=title) for i, title in enumerate(COLLECTIONS)))
+    collection_ids = list(range(2, len(COLLECTIONS) + 2))
+    load(Product, (
+        Product(
+            id=i,
+            title=f'{rng.choice(WORDS).title()} - {rng.choice(WORDS).title()} {i}',
+            description=LOREM,
+            price=round(rng.uniform(1, 100), 2),
+            inventory=rng.randrange(100),
+            last_update=random_time(rng),
+            collection_id=rng.choice(collection_ids),
+        )
+        for i in range(1, products + 1)
+    ))
+    load(Customer, (
+        Customer(
+            id=i,
+            first_name=rng.choice(WORDS).title(),
+            last_name=f'{rng.choice(WORDS).title()}{i}',
+            email=f'customer{i}@example.com',
+            phone=rng.randrange(10 ** 9, 10 ** 10),
+            membership=rng.choice('SGB'),
+        )
+        for i in range(1, customers + 1)
+    ))
+    load(Order, (
+        Order(id=i, placed_at=random_time(rng), payment_status=rng.choice('CPF'),
+              customer_id=rng.randrange(1, customers + 1))
+        for i in range(1, orders + 1)
+    ))
+    load(OrderItems, (
+        OrderItems(order_id=order_id, products_id=rng.randrange(1, products + 1),
+                   quantity=rng.randrange(1, 6), unitPrice=round(rng.uniform(1, 100), 2))
+        for order_id in range(1, orders + 1)
+        for _ in range(items_per_order)
+    ))
+    Order.objects.refresh_totals()
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    # Turning the journal off above took the file out of WAL mode
+    set_journal_mode(connection, 'wal')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=100_000)
+    parser.add_argument('--customers', type=int)
+    parser.add_argument('--orders', type=int)
+    parser.add_argument('--items-per-order', type=int, default=3)
+    parser.add_argument('--out', help='Database file, defaults to benchmarks/data/store-<products>.sqlite3')
+    args = parser.parse_args()
+
+    path = Path(args.out) if args.out else default_db_path(args.products)
+    DATA_DIR.mkdir(exist_ok=True)
+    path.unlink(missing_ok=True)
+    setup(path)
+    build(
+        path,
+        products=args.products,
+        customers=args.customers or max(args.products // 10, 1000),
+        orders=args.orders or max(args.products // 10, 1000),
+        items_per_order=args.items_per_order,
+    )
+    print(f'Wrote {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""Concurrent HTTP load against the sandbox views and the admin changelists.
+
+    python -m benchmarks.dataset --products 100000     # once, builds the database
+    python -m benchmarks.load --products 100000 --concurrency 8 --out before.json
+
+Every url gets its own run of --requests requests from --concurrency threads, after a
+short warm-up. --server puts a threaded WSGI server on a local port in front of the
+project and goes through real sockets; without it the requests go through the test
+Client in-process. The results are JSON (p50 / p95 / p99 latency, throughput and SQL
+queries per request) with the commit they were measured on, so two runs can be diffed.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import threading
+import time
+import urllib.request
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from benchmarks.common import BASE_DIR, add_db_arguments, resolve_db, setup
+
+URLS = [
+    '/playground/filter/',
+    '/playground/related/',
+    '/admin/shop/product/',
+    '/admin/shop/customer/',
+    '/admin/shop/order/',
+    '/admin/shop/collection/',
+]
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def staff_session():
+    from django.contrib.auth.models import User
+    from django.test import Client
+
+    user, _ = User.objects.get_or_create(
+        username='benchmark', defaults={'is_staff': True, 'is_superuser': True}
+    )
+    client = Client()
+    client.force_login(user)
+    return client.cookies['sessionid'].value
+
+
+def in_process_requester(session):
+    from django.db import connection
+    from django.test import Client
+
+    local = threading.local()
+
+    def get(url):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = Client()
+            client.cookies['sessionid'] = session
+        try:
+            response = client.get(url)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            return response.status_code
+        finally:
+            # What the request_finished handler does for a real server thread
+            connection.close_if_unusable_or_obsolete()
+    return get, lambda: None
+
+
+def server_requester(session):
+    from django.core.wsgi import get_wsgi_application
+
+    server = make_server(
+        '127.0.0.1', 0, get_wsgi_application(), server_class=ThreadingWSGIServer, handler_class=QuietHandler
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    def get(url):
+        request = urllib.request.Request(base + url, headers={'Cookie': f'sessionid={session}'})
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            return response.status
+    return get, server.shutdown
+
+
+def run(get, url, requests, concurrency):
+    latencies, errors = [], []
+    remaining = iter(range(requests))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            try:
+                status = get(url)
+            except Exception as error:
+                status = repr(error)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                if status != 200:
+                    errors.append(status)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+def percentiles(latencies):
+    if len(latencies) < 2:
+        value = round(latencies[0] * 1000, 2) if latencies else None
+        return {'p50_ms': value, 'p95_ms': value, 'p99_ms': value}
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {f'p{p}_ms': round(cuts[p - 1] * 1000, 2) for p in (50, 95, 99)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--urls', nargs='+', default=URLS)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per url')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--warmup', type=int, default=5, help='Untimed requests per url first')
+    parser.add_argument('--server', action='store_true', help='Go through a local WSGI server')
+    parser.add_argument('--no-response-cache', action='store_true',
+                        help='Turn off shop.cache.cache_response so every request does the work')
+    parser.add_argument('--out', help='Also write the JSON to this file')
+    args = parser.parse_args()
+    db_path = resolve_db(args)
+    setup(db_path)
+
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.core.management import call_command
+    from shop.models import Customer, Order, Product
+    from store.profiling import registry
+
+    call_command('migrate', verbosity=0)
+    # Every request is profiled, the SQL query histograms give the queries per request
+    settings.PROFILING_SAMPLE_RATE = 1
+    if args.no_response_cache:
+        settings.CATALOG_CACHE_TIMEOUT = 0
+    cache.clear()
+
+    session = staff_session()
+    get, stop = (server_requester if args.server else in_process_requester)(session)
+    results = {}
+    try:
+        for url in args.urls:
+            run(get, url, args.warmup, 1)
+            registry.clear()
+            latencies, errors, elapsed = run(get, url, args.requests, args.concurrency)
+            queries = [total / count for count, total in registry.totals('django_db_queries').values() if count]
+            results[url] = {
+                'requests': len(latencies),
+                'errors': len(errors),
+                'throughput_rps': round(len(latencies) / elapsed, 1),
+                **percentiles(latencies),
+                'queries_per_request': round(queries[0], 2) if len(queries) == 1 else None,
+            }
+            if errors:
+                results[url]['first_error'] = str(errors[0])
+    finally:
+        stop()
+
+    report = {
+        'commit': git_commit(),
+        'database': db_path.name,
+        'dataset': {
+            'products': Product.objects.count(),
+            'customers': Customer.objects.count(),
+            'orders': Order.objects.count(),
+        },
+        'mode': 'server' if args.server else 'in-process',
+        'concurrency': args.concurrency,
+        'response_cache': not args.no_response_cache,
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, 'w') as file:
+            file.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
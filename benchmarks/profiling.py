@@ -0,0 +1,87 @@
+"""Overhead of store.profiling.ProfilingMiddleware at different sample rates.
+
+    python -m benchmarks.profiling --products 100000
+
+The middleware's own cost is measured in isolation around a trivial view, since a few
+dozen microseconds disappear in the noise of end-to-end timings. That cost is then put
+against the end-to-end time of a few real pages.
+"""
+import argparse
+import json
+import statistics
+import timeit
+
+from benchmarks.collection_admin import admin_client
+from benchmarks.common import add_db_arguments, resolve_db, setup
+
+# From nearly free (no SQL, no template) to a full admin changelist
+URLS = ['/playground/hello/', '/playground/html/', '/search/?q=beef', '/admin/shop/product/']
+
+
+def per_call_us(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--rates', type=float, nargs='+', default=[0.01, 0.1, 1.0])
+    args = parser.parse_args()
+    setup(resolve_db(args))
+
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.db import connection
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+    from django.urls import resolve
+    from store.profiling import ProfilingMiddleware, registry
+
+    request = RequestFactory().get('/playground/hello/')
+    request.resolver_match = resolve('/playground/hello/')
+
+    def view(request):
+        # One query, so the execute_wrapper path is part of the measurement
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        return HttpResponse('hi')
+
+    middleware = ProfilingMiddleware(view)
+    settings.PROFILING_SAMPLE_RATE = 0
+    unsampled = per_call_us(lambda: middleware(request), 20000) - per_call_us(lambda: view(request), 20000)
+    settings.PROFILING_SAMPLE_RATE = 1
+    sampled = per_call_us(lambda: middleware(request), 20000) - per_call_us(lambda: view(request), 20000)
+    registry.clear()
+
+    settings.PROFILING_SAMPLE_RATE = 0
+    settings.CATALOG_CACHE_TIMEOUT = 0
+    cache.clear()
+    client = admin_client()
+
+    def get(url):
+        assert client.get(url).status_code == 200, url
+
+    pages = {}
+    for url in URLS:
+        get(url)
+        number = max(1, int(0.2 / (per_call_us(lambda: get(url), 1) / 1e6)))
+        pages[url] = statistics.median(timeit.repeat(lambda: get(url), number=number, repeat=5)) / number * 1e6
+
+    results = {
+        'middleware_us': {'unsampled': round(unsampled, 1), 'sampled': round(sampled, 1)},
+        'overhead_percent': {
+            url: {
+                'request_us': round(request_us, 1),
+                **{
+                    f'rate_{rate}': round((unsampled + rate * (sampled - unsampled)) / request_us * 100, 3)
+                    for rate in args.rates
+                },
+            }
+            for url, request_us in pages.items()
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
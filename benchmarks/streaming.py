@@ -0,0 +1,98 @@
+"""Peak RSS and time to first byte of /playground/related/ buffered vs streamed.
+
+    python -m benchmarks.streaming --products 100000
+
+Every mode runs in its own process so ru_maxrss only sees that mode's peak.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import BASE_DIR, add_db_arguments, resolve_db, setup
+
+MODES = {
+    # One keyset page, what the view serves by default
+    'page': '/playground/related/',
+    # The whole catalog rendered in one string, like the view did before pagination
+    'buffered': None,
+    'stream-html': '/playground/related/?stream=html',
+    'stream-ndjson': '/playground/related/?stream=ndjson',
+}
+
+
+def peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_buffered():
+    from django.template.loader import render_to_string
+    from shop.models import Product
+
+    started = time.perf_counter()
+    products = list(Product.objects.select_related('collection').all())
+    body = render_to_string('related_stream_head.html', {'user': 'Amik'}) + \
+        render_to_string('related_rows.html', {'products': products}) + \
+        render_to_string('related_stream_tail.html', {})
+    elapsed = time.perf_counter() - started
+    return elapsed, elapsed, len(body.encode())
+
+
+def run_client(url):
+    from django.test import Client
+
+    started = time.perf_counter()
+    response = Client().get(url)
+    if not response.streaming:
+        elapsed = time.perf_counter() - started
+        return elapsed, elapsed, len(response.content)
+    chunks = iter(response.streaming_content)
+    size = len(next(chunks))
+    first_byte = time.perf_counter() - started
+    for chunk in chunks:
+        size += len(chunk)
+    response.close()
+    return first_byte, time.perf_counter() - started, size
+
+
+def child(mode, db_path):
+    setup(db_path)
+    from django.db import connection
+    connection.ensure_connection()
+    baseline = peak_rss_kb()
+    url = MODES[mode]
+    ttfb, total, size = run_buffered() if url is None else run_client(url)
+    print(json.dumps({
+        'mode': mode,
+        'ttfb_ms': round(ttfb * 1000, 1),
+        'total_ms': round(total * 1000, 1),
+        'bytes': size,
+        'peak_rss_mb': round(peak_rss_kb() / 1024, 1),
+        'rss_growth_mb': round((peak_rss_kb() - baseline) / 1024, 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_db_arguments(parser)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    db_path = resolve_db(args)
+
+    if args.mode:
+        return child(args.mode, db_path)
+
+    results = []
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.streaming', '--db', str(db_path), '--mode', mode],
+            cwd=BASE_DIR, check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps({'database': str(db_path), 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
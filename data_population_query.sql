@@ -1,1015 +1,1015 @@
-insert into shop_collection (id, title, featured_products_id)
-values  (2, 'Grocery', null),
-        (3, 'Beauty', null),
-        (4, 'Cleaning', null),
-        (5, 'Stationary', null),
-        (6, 'Pets', null),
-        (7, 'Baking', null),
-        (8, 'Spices', null),
-        (9, 'Toys', null),
-        (10, 'Magazines', null);
+insert into shop_collection (id, title, featured_products_id, product_count)
+values  (2, 'Grocery', null, 0),
+        (3, 'Beauty', null, 0),
+        (4, 'Cleaning', null, 0),
+        (5, 'Stationary', null, 0),
+        (6, 'Pets', null, 0),
+        (7, 'Baking', null, 0),
+        (8, 'Spices', null, 0),
+        (9, 'Toys', null, 0),
+        (10, 'Magazines', null, 0);
 
-insert into shop_product (id, title, description, price, inventory, last_update, collection_id, slug)
-values  (1, 'Bread Ww Cluster', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 4.00, 11, '2020-09-11 00:00:00', 6, '-'),
-        (2, 'Island Oasis - Raspberry', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque', 84.64, 40, '2020-07-07 00:00:00', 3, '-'),
-        (3, 'Shrimp - 21/25, Peel And Deviened', 'nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 11.52, 29, '2021-04-05 00:00:00', 3, '-'),
-        (4, 'Wood Chips - Regular', 'posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut', 73.47, 40, '2020-07-20 00:00:00', 5, '-'),
-        (5, 'Lettuce - Mini Greens, Whole', 'lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc', 60.21, 56, '2020-08-18 00:00:00', 5, '-'),
-        (6, 'Mustard - Individual Pkg', 'pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna', 76.62, 18, '2020-10-25 00:00:00', 6, '-'),
-        (7, 'Turkey Tenderloin Frozen', 'sit amet erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim', 13.64, 48, '2020-08-08 00:00:00', 4, '-'),
-        (8, 'Silicone Parch. 16.3x24.3', 'faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis', 85.76, 55, '2021-06-03 00:00:00', 6, '-'),
-        (9, 'Tomatoes - Cherry, Yellow', 'sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing', 30.81, 45, '2021-03-03 00:00:00', 5, '-'),
-        (10, 'Sloe Gin - Mcguinness', 'fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 2.82, 69, '2021-04-18 00:00:00', 5, '-'),
-        (11, 'Wine - Magnotta - Belpaese', 'ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 37.72, 71, '2021-01-19 00:00:00', 6, '-'),
-        (12, 'Beer - Alexander Kieths, Pale Ale', 'nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa', 92.74, 55, '2020-12-28 00:00:00', 3, '-'),
-        (13, 'Basil - Thai', 'rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 50.07, 41, '2020-07-07 00:00:00', 6, '-'),
-        (14, 'Tofu - Soft', 'at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula', 88.70, 24, '2020-08-29 00:00:00', 4, '-'),
-        (15, 'Mayonnaise - Individual Pkg', 'id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 81.81, 35, '2020-07-25 00:00:00', 4, '-'),
-        (16, 'Sauce - Hollandaise', 'blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede', 9.09, 63, '2020-07-16 00:00:00', 6, '-'),
-        (17, 'Salt - Rock, Course', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 41.53, 60, '2021-03-05 00:00:00', 3, '-'),
-        (18, 'Beef - Ox Tail, Frozen', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien', 80.97, 85, '2020-07-26 00:00:00', 4, '-'),
-        (19, 'Schnappes - Peach, Walkers', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 81.97, 10, '2021-05-14 00:00:00', 5, '-'),
-        (20, 'Cheese - Parmesan Cubes', 'ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra', 32.94, 97, '2020-08-12 00:00:00', 3, '-'),
-        (21, 'Sweet Pea Sprouts', 'lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 31.93, 49, '2021-01-14 00:00:00', 5, '-'),
-        (22, 'Straw - Regular', 'nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel', 76.59, 56, '2020-11-13 00:00:00', 5, '-'),
-        (23, 'Peach - Fresh', 'feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien', 2.95, 63, '2021-01-22 00:00:00', 6, '-'),
-        (24, 'Chinese Foods - Pepper Beef', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 86.30, 64, '2020-10-31 00:00:00', 3, '-'),
-        (25, 'Guava', 'erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 17.53, 96, '2021-05-05 00:00:00', 4, '-'),
-        (26, 'Tendrils - Baby Pea, Organic', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat', 18.18, 0, '2021-03-24 00:00:00', 3, '-'),
-        (27, 'Sugar - Brown', 'lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam nec dui', 65.01, 84, '2020-10-24 00:00:00', 5, '-'),
-        (28, 'Oil - Pumpkinseed', 'cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis', 86.27, 90, '2021-02-11 00:00:00', 5, '-'),
-        (29, 'Beef - Tongue, Cooked', 'sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo', 73.48, 82, '2021-02-07 00:00:00', 6, '-'),
-        (30, 'Goat - Leg', 'vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in', 83.98, 66, '2021-03-01 00:00:00', 4, '-'),
-        (31, 'Orange Roughy 4/6 Oz', 'id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie', 99.48, 79, '2021-05-26 00:00:00', 5, '-'),
-        (32, 'Lemons', 'et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit', 29.08, 83, '2021-06-03 00:00:00', 5, '-'),
-        (33, 'Turnip - Mini', 'id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 13.93, 8, '2021-03-23 00:00:00', 6, '-'),
-        (34, 'Hinge W Undercut', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 20.24, 45, '2020-08-23 00:00:00', 3, '-'),
-        (35, 'Cheese - Mozzarella', 'nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla', 34.71, 76, '2020-10-13 00:00:00', 3, '-'),
-        (36, 'Basil - Fresh', 'pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu', 11.80, 2, '2021-06-07 00:00:00', 4, '-'),
-        (37, 'Pastry - Choclate Baked', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at', 61.87, 12, '2020-11-17 00:00:00', 3, '-'),
-        (38, 'Vol Au Vents', 'non mauris morbi non lectus aliquam sit amet diam in', 81.78, 98, '2021-04-29 00:00:00', 5, '-'),
-        (39, 'Tomatoes - Roma', 'turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 29.81, 61, '2020-09-04 00:00:00', 4, '-'),
-        (40, 'Bread - Hamburger Buns', 'vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget', 51.39, 8, '2021-04-07 00:00:00', 5, '-'),
-        (41, 'Cheese - Cambozola', 'vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non', 64.20, 54, '2020-12-22 00:00:00', 3, '-'),
-        (42, 'Cup - 4oz Translucent', 'mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a', 71.97, 52, '2020-08-29 00:00:00', 5, '-'),
-        (43, 'Macaroons - Two Bite Choc', 'tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 14.87, 38, '2021-05-15 00:00:00', 6, '-'),
-        (44, 'Vinegar - Raspberry', 'platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 52.43, 88, '2021-02-10 00:00:00', 6, '-'),
-        (45, 'Cake - Night And Day Choclate', 'magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 84.60, 93, '2020-09-26 00:00:00', 3, '-'),
-        (46, 'Wine - Domaine Boyar Royal', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 39.61, 92, '2020-07-14 00:00:00', 6, '-'),
-        (47, 'Sword Pick Asst', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 75.08, 15, '2021-04-28 00:00:00', 3, '-'),
-        (48, 'Sage - Ground', 'ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl', 16.75, 94, '2021-06-06 00:00:00', 6, '-'),
-        (49, 'Muffin Mix - Chocolate Chip', 'ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel', 93.49, 16, '2020-07-07 00:00:00', 3, '-'),
-        (50, 'Tia Maria', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam', 69.22, 14, '2020-06-11 00:00:00', 4, '-'),
-        (51, 'Apple - Fuji', 'in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus', 20.42, 94, '2021-05-05 00:00:00', 3, '-'),
-        (52, 'Veal - Tenderloin, Untrimmed', 'cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien', 89.46, 44, '2020-06-14 00:00:00', 4, '-'),
-        (53, 'Mushroom - Crimini', 'ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur', 42.13, 58, '2021-01-19 00:00:00', 3, '-'),
-        (54, 'Parsley Italian - Fresh', 'rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis', 85.92, 93, '2021-04-24 00:00:00', 3, '-'),
-        (55, 'Tart - Pecan Butter Squares', 'in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 91.98, 43, '2020-09-06 00:00:00', 4, '-'),
-        (56, 'Vinegar - Tarragon', 'orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum', 7.30, 60, '2021-05-09 00:00:00', 5, '-'),
-        (57, 'Beef - Tender Tips', 'nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum', 8.83, 5, '2021-01-01 00:00:00', 3, '-'),
-        (58, 'Chicken - Whole Roasting', 'id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 47.43, 11, '2021-04-07 00:00:00', 3, '-'),
-        (59, 'Water - Tonic', 'sit amet eleifend pede libero quis orci nullam molestie nibh', 36.84, 13, '2020-08-14 00:00:00', 6, '-'),
-        (60, 'Shrimp - Tiger 21/25', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 64.38, 100, '2020-07-21 00:00:00', 4, '-'),
-        (61, 'Hagen Daza - Dk Choocolate', 'sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 37.63, 43, '2020-09-25 00:00:00', 6, '-'),
-        (62, 'Grenadillo', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius', 14.57, 34, '2020-10-14 00:00:00', 6, '-'),
-        (63, 'Coffee - 10oz Cup 92961', 'quam fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet', 26.36, 34, '2020-09-22 00:00:00', 5, '-'),
-        (64, 'Seabream Whole Farmed', 'interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis', 59.91, 32, '2021-02-13 00:00:00', 5, '-'),
-        (65, 'Coconut Milk - Unsweetened', 'felis eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque', 79.79, 12, '2021-03-10 00:00:00', 4, '-'),
-        (66, 'Soap - Mr.clean Floor Soap', 'consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum', 38.03, 31, '2020-06-13 00:00:00', 5, '-'),
-        (67, 'Cheese - Cambozola', 'tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc', 19.49, 33, '2021-01-13 00:00:00', 5, '-'),
-        (68, 'Soup Campbells Mexicali Tortilla', 'pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat', 93.16, 7, '2021-04-14 00:00:00', 5, '-'),
-        (69, 'Apron', 'amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse', 4.66, 6, '2021-02-10 00:00:00', 4, '-'),
-        (70, 'Wine - Penfolds Koonuga Hill', 'aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut', 1.27, 15, '2020-12-10 00:00:00', 3, '-'),
-        (71, 'Milk - Chocolate 250 Ml', 'gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio cras', 1.88, 25, '2020-08-19 00:00:00', 5, '-'),
-        (72, 'Beer - Paulaner Hefeweisse', 'lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 36.96, 43, '2020-10-10 00:00:00', 4, '-'),
-        (73, 'Chocolate - Feathers', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris', 65.35, 50, '2020-11-02 00:00:00', 4, '-'),
-        (74, 'Club Soda - Schweppes, 355 Ml', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at', 90.39, 72, '2021-04-13 00:00:00', 3, '-'),
-        (75, 'Corn Kernels - Frozen', 'odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum', 98.61, 53, '2020-10-12 00:00:00', 4, '-'),
-        (76, 'Cheese Cloth No 60', 'posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet', 66.25, 72, '2020-12-08 00:00:00', 3, '-'),
-        (77, 'Chips - Assorted', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 86.36, 93, '2020-07-06 00:00:00', 3, '-'),
-        (78, 'Bagelers', 'eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim', 82.37, 39, '2020-08-29 00:00:00', 4, '-'),
-        (79, 'Corn - Cream, Canned', 'in consequat ut nulla sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque', 85.46, 24, '2021-05-13 00:00:00', 3, '-'),
-        (80, 'Bread - Raisin', 'donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis', 8.70, 70, '2020-07-09 00:00:00', 4, '-'),
-        (81, 'Soup - Campbells', 'turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 8.13, 29, '2020-12-15 00:00:00', 5, '-'),
-        (82, 'Ecolab - Hobart Washarm End Cap', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt', 83.36, 67, '2020-10-25 00:00:00', 5, '-'),
-        (83, 'Asparagus - White, Canned', 'in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 71.01, 17, '2020-07-27 00:00:00', 3, '-'),
-        (84, 'Muffin Mix - Lemon Cranberry', 'ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo', 47.63, 11, '2020-12-23 00:00:00', 6, '-'),
-        (85, 'Shrimp - 16/20, Peeled Deviened', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor', 1.08, 58, '2021-06-07 00:00:00', 5, '-'),
-        (86, 'Soda Water - Club Soda, 355 Ml', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus', 90.06, 88, '2021-05-04 00:00:00', 3, '-'),
-        (87, 'Napkin White - Starched', 'quam nec dui luctus rutrum nulla tellus in sagittis dui', 30.95, 52, '2020-10-10 00:00:00', 5, '-'),
-        (88, 'Beer - Steamwhistle', 'nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet', 11.89, 59, '2020-06-20 00:00:00', 3, '-'),
-        (89, 'Pail For Lid 1537', 'in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 35.85, 92, '2020-10-11 00:00:00', 6, '-'),
-        (90, 'Chinese Foods - Chicken Wing', 'purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 28.87, 48, '2020-12-28 00:00:00', 3, '-'),
-        (91, 'Spice - Montreal Steak Spice', 'donec dapibus duis at velit eu est congue elementum in', 35.71, 32, '2021-05-15 00:00:00', 5, '-'),
-        (92, 'Juice - Grapefruit, 341 Ml', 'vestibulum proin eu mi nulla ac enim in tempor turpis nec', 33.37, 26, '2020-07-16 00:00:00', 5, '-'),
-        (93, 'Wine - Wyndham Estate Bin 777', 'pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus', 3.34, 87, '2020-12-29 00:00:00', 5, '-'),
-        (94, 'Water - Mineral, Natural', 'pretium quis lectus suspendisse potenti in eleifend quam a odio in hac', 61.59, 71, '2020-07-16 00:00:00', 5, '-'),
-        (95, 'Chicken - Leg, Boneless', 'eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero nam dui proin', 84.83, 15, '2020-06-21 00:00:00', 3, '-'),
-        (96, 'Sunflower Seed Raw', 'volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat', 28.16, 2, '2020-10-19 00:00:00', 3, '-'),
-        (97, 'Energy Drink Bawls', 'risus praesent lectus vestibulum quam sapien varius ut blandit non', 87.65, 31, '2021-02-23 00:00:00', 6, '-'),
-        (98, 'Tarragon - Primerba, Paste', 'non quam nec dui luctus rutrum nulla tellus in sagittis', 20.87, 38, '2020-08-11 00:00:00', 3, '-'),
-        (99, 'Table Cloth 62x120 Colour', 'et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis', 27.91, 96, '2021-03-20 00:00:00', 3, '-'),
-        (100, 'Lamb - Loin Chops', 'praesent id massa id nisl venenatis lacinia aenean sit amet justo', 87.47, 40, '2021-02-20 00:00:00', 3, '-'),
-        (101, 'Sherry - Dry', 'morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit', 70.52, 32, '2020-06-27 00:00:00', 6, '-'),
-        (102, 'Chickensplit Half', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue', 93.81, 66, '2021-03-02 00:00:00', 4, '-'),
-        (103, 'Tea - Orange Pekoe', 'vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus', 12.71, 77, '2020-07-12 00:00:00', 3, '-'),
-        (104, 'Sauce - Caesar Dressing', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis', 98.89, 62, '2020-09-03 00:00:00', 3, '-'),
-        (105, 'Rice - Brown', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra', 83.88, 24, '2020-06-20 00:00:00', 6, '-'),
-        (106, 'Soup - Knorr, Ministrone', 'rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia', 4.88, 22, '2020-07-30 00:00:00', 5, '-'),
-        (107, 'Wine - Cotes Du Rhone Parallele', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam', 13.89, 10, '2021-04-13 00:00:00', 3, '-'),
-        (108, 'Chips Potato All Dressed - 43g', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi', 35.65, 13, '2020-10-23 00:00:00', 3, '-'),
-        (109, 'Sugar - Crumb', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea', 5.07, 95, '2021-01-08 00:00:00', 3, '-'),
-        (110, 'Ice Cream - Strawberry', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel', 22.63, 7, '2021-04-06 00:00:00', 4, '-'),
-        (111, 'Paper Cocktail Umberlla 80 - 180', 'sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 94.11, 94, '2021-04-14 00:00:00', 3, '-'),
-        (112, 'Salmon - Canned', 'est quam pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et', 80.67, 59, '2021-02-26 00:00:00', 6, '-'),
-        (113, 'Seedlings - Buckwheat, Organic', 'vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 44.29, 80, '2020-08-14 00:00:00', 5, '-'),
-        (114, 'Cheese - Brie, Triple Creme', 'sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus', 46.60, 66, '2020-08-06 00:00:00', 3, '-'),
-        (115, 'Phyllo Dough', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula', 35.53, 45, '2021-02-03 00:00:00', 3, '-'),
-        (116, 'Pastry - Banana Muffin - Mini', 'vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa', 85.57, 59, '2020-12-29 00:00:00', 4, '-'),
-        (117, 'Jameson - Irish Whiskey', 'non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel', 65.52, 97, '2020-11-25 00:00:00', 3, '-'),
-        (118, 'Praline Paste', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 57.27, 3, '2021-04-02 00:00:00', 3, '-'),
-        (119, 'Flour - Fast / Rapid', 'suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 77.83, 79, '2020-11-03 00:00:00', 5, '-'),
-        (120, 'Sausage - Meat', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem', 49.77, 44, '2020-06-22 00:00:00', 6, '-'),
-        (121, 'Wine - Vovray Sec Domaine Huet', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 2.20, 84, '2021-01-11 00:00:00', 4, '-'),
-        (122, 'Ecolab - Hand Soap Form Antibac', 'amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut', 44.58, 96, '2020-09-17 00:00:00', 4, '-'),
-        (123, 'Melon - Honey Dew', 'quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse', 57.94, 55, '2021-04-24 00:00:00', 4, '-'),
-        (124, 'Dill - Primerba, Paste', 'ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl', 97.81, 72, '2020-11-11 00:00:00', 6, '-'),
-        (125, 'Pork - Ham, Virginia', 'sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus', 97.58, 74, '2021-03-06 00:00:00', 3, '-'),
-        (126, 'Pasta - Cannelloni, Sheets, Fresh', 'mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis', 86.27, 5, '2021-01-20 00:00:00', 3, '-'),
-        (127, 'Apple - Macintosh', 'volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus', 19.96, 45, '2021-01-07 00:00:00', 6, '-'),
-        (128, 'Vodka - Moskovskaya', 'ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 43.45, 74, '2021-04-19 00:00:00', 6, '-'),
-        (129, 'Curry Powder', 'vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum', 32.31, 42, '2021-01-30 00:00:00', 4, '-'),
-        (130, 'Sauce - Vodka Blush', 'a suscipit nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 53.31, 27, '2020-07-20 00:00:00', 6, '-'),
-        (131, 'Venison - Ground', 'vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in', 15.76, 26, '2021-05-13 00:00:00', 4, '-'),
-        (132, 'Doilies - 8, Paper', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros', 46.59, 79, '2020-09-09 00:00:00', 6, '-'),
-        (133, 'Vaccum Bag - 14x20', 'vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae', 57.26, 15, '2021-01-08 00:00:00', 6, '-'),
-        (134, 'Gherkin', 'nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 8.68, 94, '2020-08-20 00:00:00', 3, '-'),
-        (135, 'Water - Mineral, Natural', 'morbi odio odio elementum eu interdum eu tincidunt in leo', 58.27, 17, '2021-05-13 00:00:00', 3, '-'),
-        (136, 'Ecolab - Solid Fusion', 'magna at nunc commodo placerat praesent blandit nam nulla integer', 94.84, 71, '2021-03-22 00:00:00', 5, '-'),
-        (137, 'Bar - Sweet And Salty Chocolate', 'erat volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus', 50.15, 46, '2020-07-03 00:00:00', 3, '-'),
-        (138, 'Spice - Peppercorn Melange', 'dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 86.52, 58, '2020-12-29 00:00:00', 4, '-'),
-        (139, 'Chicken Breast Wing On', 'fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet', 42.81, 31, '2020-06-21 00:00:00', 5, '-'),
-        (140, 'Sauce - Roasted Red Pepper', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 39.14, 35, '2021-01-13 00:00:00', 5, '-'),
-        (141, 'Mackerel Whole Fresh', 'at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante', 24.36, 98, '2021-02-08 00:00:00', 3, '-'),
-        (142, 'Glass Clear 8 Oz', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu', 4.34, 97, '2020-08-11 00:00:00', 6, '-'),
-        (143, 'Soup - Campbells, Spinach Crm', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 15.47, 18, '2021-01-03 00:00:00', 3, '-'),
-        (144, 'Pork Salted Bellies', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus', 61.50, 50, '2021-04-14 00:00:00', 6, '-'),
-        (145, 'Juice - Pineapple, 48 Oz', 'accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in', 73.24, 31, '2020-09-08 00:00:00', 4, '-'),
-        (146, 'Cheese - Comtomme', 'fermentum justo nec condimentum neque sapien placerat ante nulla justo', 20.58, 65, '2020-11-27 00:00:00', 6, '-'),
-        (147, 'Cookie Dough - Peanut Butter', 'consequat nulla nisl nunc nisl duis bibendum felis sed interdum', 49.25, 71, '2020-07-14 00:00:00', 5, '-'),
-        (148, 'Paste - Black Olive', 'sit amet justo morbi ut odio cras mi pede malesuada', 55.51, 49, '2020-10-17 00:00:00', 3, '-'),
-        (149, 'Lettuce - Treviso', 'malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor', 56.29, 92, '2020-08-21 00:00:00', 3, '-'),
-        (150, 'Tea - Lemon Green Tea', 'commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id', 70.09, 10, '2020-09-16 00:00:00', 3, '-'),
-        (151, 'Lettuce - Curly Endive', 'maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 60.41, 27, '2021-04-19 00:00:00', 5, '-'),
-        (152, 'Vinegar - Balsamic', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis', 8.40, 15, '2020-07-17 00:00:00', 6, '-'),
-        (153, 'Cheese - Brie Roitelet', 'in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 80.45, 69, '2021-06-07 00:00:00', 4, '-'),
-        (154, 'Tomatoes - Diced, Canned', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum', 47.43, 41, '2020-07-31 00:00:00', 4, '-'),
-        (155, 'Muffin Mix - Morning Glory', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 62.77, 56, '2020-09-05 00:00:00', 3, '-'),
-        (156, 'Yogurt - Cherry, 175 Gr', 'mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in', 27.78, 86, '2020-08-18 00:00:00', 6, '-'),
-        (157, 'Food Colouring - Green', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 69.86, 29, '2020-09-25 00:00:00', 4, '-'),
-        (158, 'Eel Fresh', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 40.25, 28, '2021-02-06 00:00:00', 5, '-'),
-        (159, 'Lemonade - Strawberry, 591 Ml', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna', 7.04, 7, '2020-10-02 00:00:00', 6, '-'),
-        (160, 'Cod - Salted, Boneless', 'magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien', 37.31, 91, '2021-01-25 00:00:00', 4, '-'),
-        (161, 'Jam - Strawberry, 20 Ml Jar', 'elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy', 25.74, 10, '2020-08-10 00:00:00', 3, '-'),
-        (162, 'Veal - Inside Round / Top, Lean', 'ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et', 72.51, 85, '2021-05-19 00:00:00', 6, '-'),
-        (163, 'Lemonade - Pineapple Passion', 'nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique', 14.67, 8, '2021-04-23 00:00:00', 3, '-'),
-        (164, 'Peach - Fresh', 'non sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi', 74.71, 51, '2021-06-08 00:00:00', 5, '-'),
-        (165, 'Garlic', 'nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id', 85.06, 64, '2021-01-18 00:00:00', 4, '-'),
-        (166, 'Artichoke - Fresh', 'pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing', 70.35, 100, '2020-09-27 00:00:00', 6, '-'),
-        (167, 'Sauce - Thousand Island', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis', 35.45, 64, '2021-03-02 00:00:00', 3, '-'),
-        (168, 'Sparkling Wine - Rose, Freixenet', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed', 73.38, 45, '2020-11-28 00:00:00', 4, '-'),
-        (169, 'Cheese - Cheddar, Medium', 'tempus sit amet sem fusce consequat nulla nisl nunc nisl duis', 80.33, 95, '2020-11-09 00:00:00', 3, '-'),
-        (170, 'Yeast Dry - Fleischman', 'adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien', 46.37, 39, '2020-06-17 00:00:00', 4, '-'),
-        (171, 'Chips - Potato Jalapeno', 'augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis', 30.96, 9, '2021-03-07 00:00:00', 4, '-'),
-        (172, 'Shallots', 'sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 84.84, 87, '2021-02-25 00:00:00', 4, '-'),
-        (173, 'Coke - Diet, 355 Ml', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 89.46, 52, '2020-07-20 00:00:00', 3, '-'),
-        (174, 'Pernod', 'condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est', 68.59, 78, '2021-05-24 00:00:00', 5, '-'),
-        (175, 'Pate - Cognac', 'eu est congue elementum in hac habitasse platea dictumst morbi', 87.37, 3, '2021-05-06 00:00:00', 6, '-'),
-        (176, 'Wine - Penfolds Koonuga Hill', 'vestibulum sit amet cursus id turpis integer aliquet massa id', 43.99, 34, '2020-08-03 00:00:00', 5, '-'),
-        (177, 'Shrimp - Tiger 21/25', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat', 59.91, 4, '2020-07-23 00:00:00', 3, '-'),
-        (178, 'Watercress', 'blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 25.40, 94, '2021-04-14 00:00:00', 4, '-'),
-        (179, 'Flour - Chickpea', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum', 11.58, 20, '2021-05-25 00:00:00', 6, '-'),
-        (180, 'Tea Leaves - Oolong', 'varius ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 9.86, 92, '2021-03-14 00:00:00', 4, '-'),
-        (181, 'Wine - Hardys Bankside Shiraz', 'vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc', 98.46, 69, '2020-12-29 00:00:00', 3, '-'),
-        (182, 'Magnotta - Bel Paese White', 'mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit', 87.08, 65, '2021-04-24 00:00:00', 5, '-'),
-        (183, 'Beef - Montreal Smoked Brisket', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 65.66, 68, '2021-02-25 00:00:00', 5, '-'),
-        (184, 'Doilies - 7, Paper', 'nunc purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 6.42, 9, '2021-05-09 00:00:00', 4, '-'),
-        (185, 'Venison - Striploin', 'vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis', 85.15, 88, '2021-02-20 00:00:00', 6, '-'),
-        (186, 'Turnip - Mini', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque', 80.88, 67, '2021-02-06 00:00:00', 6, '-'),
-        (187, 'Peach - Halves', 'non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus', 12.87, 76, '2021-01-01 00:00:00', 3, '-'),
-        (188, 'Glaze - Clear', 'quam a odio in hac habitasse platea dictumst maecenas ut massa', 19.86, 1, '2020-11-12 00:00:00', 3, '-'),
-        (189, 'Wine - Red, Concha Y Toro', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 65.45, 24, '2020-11-01 00:00:00', 5, '-'),
-        (190, 'Wine - Ej Gallo Sonoma', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor', 91.58, 6, '2021-02-17 00:00:00', 4, '-'),
-        (191, 'Pickles - Gherkins', 'lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis', 68.10, 18, '2020-12-12 00:00:00', 3, '-'),
-        (192, 'Butter Sweet', 'fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 39.80, 72, '2020-10-04 00:00:00', 6, '-'),
-        (193, 'Onions - Red Pearl', 'magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 35.52, 51, '2021-05-31 00:00:00', 3, '-'),
-        (194, 'Seedlings - Mix, Organic', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris', 6.23, 51, '2020-11-29 00:00:00', 5, '-'),
-        (195, 'Bread - Calabrese Baguette', 'enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu est congue', 80.51, 43, '2020-07-18 00:00:00', 3, '-'),
-        (196, 'Lamb - Loin Chops', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan', 94.45, 2, '2020-08-07 00:00:00', 5, '-'),
-        (197, 'Peas Snow', 'egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend', 18.05, 93, '2021-06-07 00:00:00', 5, '-'),
-        (198, 'Blueberries', 'a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante', 74.23, 11, '2021-06-06 00:00:00', 5, '-'),
-        (199, 'Cookie - Dough Variety', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id', 37.39, 79, '2021-04-17 00:00:00', 4, '-'),
-        (200, 'Extract - Almond', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 9.97, 86, '2021-02-14 00:00:00', 5, '-'),
-        (201, 'Pastry - Banana Muffin - Mini', 'convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante', 34.27, 98, '2021-03-05 00:00:00', 4, '-'),
-        (202, 'Food Colouring - Orange', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 74.11, 20, '2021-01-31 00:00:00', 5, '-'),
-        (203, 'Split Peas - Green, Dry', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 2.51, 77, '2020-08-02 00:00:00', 4, '-'),
-        (204, 'Lid Coffee Cup 8oz Blk', 'mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt', 26.97, 71, '2020-08-27 00:00:00', 3, '-'),
-        (205, 'Truffle Cups Green', 'proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 88.95, 38, '2021-01-20 00:00:00', 3, '-'),
-        (206, 'Cheese - Sheep Milk', 'risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in', 64.43, 87, '2020-11-21 00:00:00', 3, '-'),
-        (207, 'Oil - Shortening - All - Purpose', 'ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere', 68.52, 78, '2021-06-09 00:00:00', 6, '-'),
-        (208, 'Pepper - Chillies, Crushed', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie', 17.08, 77, '2020-11-08 00:00:00', 5, '-'),
-        (209, 'Chicken - Whole Roasting', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 95.44, 9, '2021-05-06 00:00:00', 5, '-'),
-        (210, 'Wiberg Cure', 'vel est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis', 52.18, 6, '2021-04-09 00:00:00', 6, '-'),
-        (211, 'Cleaner - Lime Away', 'ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 78.25, 95, '2020-09-06 00:00:00', 6, '-'),
-        (212, 'Puree - Kiwi', 'ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 49.93, 80, '2020-09-11 00:00:00', 4, '-'),
-        (213, 'Pineapple - Canned, Rings', 'ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec nisi', 19.07, 23, '2020-07-19 00:00:00', 3, '-'),
-        (214, 'Turkey - Oven Roast Breast', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 85.71, 10, '2021-03-31 00:00:00', 3, '-'),
-        (215, 'Hand Towel', 'suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl', 36.16, 54, '2020-09-25 00:00:00', 4, '-'),
-        (216, 'Pork - Sausage, Medium', 'vitae quam suspendisse potenti nullam porttitor lacus at turpis donec', 68.06, 25, '2020-10-31 00:00:00', 3, '-'),
-        (217, 'Cheese Cloth No 100', 'id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 11.95, 52, '2020-12-31 00:00:00', 3, '-'),
-        (218, 'Sobe - Tropical Energy', 'purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 24.26, 34, '2021-04-07 00:00:00', 6, '-'),
-        (219, 'Beef - Rib Roast, Capless', 'accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 85.39, 41, '2020-10-28 00:00:00', 5, '-'),
-        (220, 'Beans - Turtle, Black, Dry', 'turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 40.72, 30, '2020-09-23 00:00:00', 6, '-'),
-        (221, 'Cookie - Oatmeal', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 55.05, 33, '2021-03-08 00:00:00', 4, '-'),
-        (222, 'Lettuce - Escarole', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac', 94.97, 46, '2020-11-13 00:00:00', 5, '-'),
-        (223, 'Bread - Bistro White', 'scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor', 36.65, 30, '2021-04-14 00:00:00', 3, '-'),
-        (224, 'English Muffin', 'sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices', 99.65, 46, '2021-05-24 00:00:00', 6, '-'),
-        (225, 'Table Cloth 54x54 White', 'ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue', 37.58, 54, '2021-03-19 00:00:00', 3, '-'),
-        (226, 'Melon - Watermelon, Seedless', 'sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar', 57.44, 26, '2021-05-15 00:00:00', 3, '-'),
-        (227, 'Dill Weed - Dry', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit', 99.51, 40, '2020-10-26 00:00:00', 3, '-'),
-        (228, 'Pepper Squash', 'pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum', 11.07, 45, '2021-02-14 00:00:00', 5, '-'),
-        (229, 'Flavouring - Orange', 'elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 6.83, 95, '2021-04-06 00:00:00', 5, '-'),
-        (230, 'Spice - Peppercorn Melange', 'felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices', 56.29, 49, '2021-05-13 00:00:00', 5, '-'),
-        (231, 'Sprouts - Onion', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat', 5.68, 67, '2021-01-14 00:00:00', 4, '-'),
-        (232, 'Wine - Magnotta - Cab Franc', 'lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit', 52.31, 50, '2020-11-21 00:00:00', 4, '-'),
-        (233, 'Cup - 6oz, Foam', 'imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in', 92.28, 97, '2021-04-02 00:00:00', 6, '-'),
-        (234, 'Cake - Dulce De Leche', 'dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet', 6.62, 54, '2021-02-01 00:00:00', 3, '-'),
-        (235, 'Greens Mustard', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel', 67.25, 74, '2020-11-28 00:00:00', 3, '-'),
-        (236, 'Kiwano', 'volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in', 27.60, 13, '2020-10-22 00:00:00', 6, '-'),
-        (237, 'Carbonated Water - Wildberry', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 54.57, 22, '2020-12-24 00:00:00', 6, '-'),
-        (238, 'Cheese - St. Paulin', 'convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut', 23.35, 98, '2020-08-11 00:00:00', 3, '-'),
-        (239, 'Wine - Jaboulet Cotes Du Rhone', 'eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat', 14.43, 48, '2020-07-13 00:00:00', 5, '-'),
-        (240, 'Pie Box - Cello Window 2.5', 'ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit', 46.42, 94, '2021-03-30 00:00:00', 4, '-'),
-        (241, 'Brandy - Bar', 'pellentesque ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue', 72.33, 96, '2020-09-08 00:00:00', 4, '-'),
-        (242, 'Veal - Slab Bacon', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna', 74.61, 69, '2020-11-07 00:00:00', 3, '-'),
-        (243, 'Duck - Whole', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin', 25.38, 73, '2021-05-16 00:00:00', 4, '-'),
-        (244, 'Bagelers', 'id pretium iaculis diam erat fermentum justo nec condimentum neque sapien', 57.79, 92, '2020-08-28 00:00:00', 4, '-'),
-        (245, 'Pepper - Pablano', 'porttitor lacus at turpis donec posuere metus vitae ipsum aliquam', 62.55, 71, '2021-04-19 00:00:00', 6, '-'),
-        (246, 'Mustard - Seed', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit', 88.31, 65, '2021-02-08 00:00:00', 4, '-'),
-        (247, 'Strawberries', 'libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum', 43.48, 97, '2020-11-12 00:00:00', 3, '-'),
-        (248, 'Cup - Translucent 7 Oz Clear', 'dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla', 54.28, 78, '2021-02-11 00:00:00', 6, '-'),
-        (249, 'Jameson Irish Whiskey', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis', 52.91, 54, '2021-02-17 00:00:00', 4, '-'),
-        (250, 'Beef - Eye Of Round', 'magna at nunc commodo placerat praesent blandit nam nulla integer pede justo', 48.84, 7, '2020-10-22 00:00:00', 3, '-'),
-        (251, 'The Pop Shoppe - Grape', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 18.35, 5, '2021-04-01 00:00:00', 6, '-'),
-        (252, 'Cheese - Cheddar, Medium', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis', 92.34, 85, '2020-06-10 00:00:00', 3, '-'),
-        (253, 'Tomatoes Tear Drop Yellow', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis', 10.60, 0, '2021-02-08 00:00:00', 3, '-'),
-        (254, 'Extract Vanilla Pure', 'mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh', 10.05, 87, '2021-01-22 00:00:00', 6, '-'),
-        (255, 'Ham - Smoked, Bone - In', 'vel est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia', 83.75, 93, '2020-12-29 00:00:00', 3, '-'),
-        (256, 'Burger Veggie', 'vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 53.73, 44, '2020-10-09 00:00:00', 3, '-'),
-        (257, 'Appetizer - Sausage Rolls', 'at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id', 96.43, 84, '2021-01-14 00:00:00', 5, '-'),
-        (258, 'Wine - Magnotta - Pinot Gris Sr', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 26.42, 2, '2021-02-17 00:00:00', 4, '-'),
-        (259, 'Melon - Watermelon Yellow', 'sit amet justo morbi ut odio cras mi pede malesuada in', 60.34, 15, '2021-04-09 00:00:00', 6, '-'),
-        (260, 'Cheese - Brie, Triple Creme', 'tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim', 17.75, 88, '2021-05-25 00:00:00', 4, '-'),
-        (261, 'Table Cloth 54x72 White', 'turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget', 44.88, 48, '2020-07-07 00:00:00', 4, '-'),
-        (262, 'Chocolate Bar - Oh Henry', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu', 67.60, 99, '2020-07-16 00:00:00', 5, '-'),
-        (263, 'Cheese - Camembert', 'semper porta volutpat quam pede lobortis ligula sit amet eleifend', 23.20, 27, '2021-01-20 00:00:00', 5, '-'),
-        (264, 'Soup - Campbells, Spinach Crm', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 31.98, 100, '2021-05-13 00:00:00', 3, '-'),
-        (265, 'Tea - Herbal Orange Spice', 'a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla', 80.89, 86, '2021-03-03 00:00:00', 5, '-'),
-        (266, 'Berry Brulee', 'praesent id massa id nisl venenatis lacinia aenean sit amet justo', 37.42, 5, '2021-05-21 00:00:00', 4, '-'),
-        (267, 'Bar - Sweet And Salty Chocolate', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi', 22.84, 26, '2020-12-21 00:00:00', 5, '-'),
-        (268, 'Gherkin', 'at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes', 57.02, 86, '2021-04-16 00:00:00', 4, '-'),
-        (269, 'Lady Fingers', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet', 75.55, 59, '2020-08-07 00:00:00', 5, '-'),
-        (270, 'Beer - Upper Canada Light', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 40.14, 56, '2020-12-07 00:00:00', 5, '-'),
-        (271, 'Cocoa Powder - Dutched', 'est congue elementum in hac habitasse platea dictumst morbi vestibulum velit', 13.36, 84, '2021-05-01 00:00:00', 4, '-'),
-        (272, 'Spice - Montreal Steak Spice', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 45.15, 81, '2020-11-29 00:00:00', 5, '-'),
-        (273, 'Jicama', 'in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor', 47.77, 92, '2021-03-29 00:00:00', 4, '-'),
-        (274, 'Bar Mix - Lime', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 49.72, 80, '2020-10-10 00:00:00', 6, '-'),
-        (275, 'Macaroons - Two Bite Choc', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at', 80.59, 50, '2021-05-23 00:00:00', 5, '-'),
-        (276, 'Bandage - Fexible 1x3', 'nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non', 63.84, 93, '2021-05-15 00:00:00', 6, '-'),
-        (277, 'V8 - Tropical Blend', 'in tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum', 87.59, 70, '2020-12-29 00:00:00', 6, '-'),
-        (278, 'Yoplait Drink', 'tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non', 59.28, 16, '2020-08-03 00:00:00', 4, '-'),
-        (279, 'Sugar - Invert', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor', 69.37, 87, '2020-06-28 00:00:00', 5, '-'),
-        (280, 'Doilies - 10, Paper', 'mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla', 99.19, 24, '2021-05-08 00:00:00', 4, '-'),
-        (281, 'Shrimp, Dried, Small / Lb', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 24.32, 34, '2020-08-29 00:00:00', 3, '-'),
-        (282, 'Vinegar - Tarragon', 'auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio', 16.87, 63, '2021-05-17 00:00:00', 5, '-'),
-        (283, 'Cheese - La Sauvagine', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et', 82.33, 81, '2021-01-31 00:00:00', 3, '-'),
-        (284, 'Yucca', 'erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam', 14.26, 67, '2020-10-19 00:00:00', 4, '-'),
-        (285, 'Beef - Shank', 'at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra', 18.74, 25, '2020-11-03 00:00:00', 4, '-'),
-        (286, 'Potatoes - Mini White 3 Oz', 'sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia', 4.00, 13, '2020-12-24 00:00:00', 5, '-'),
-        (287, 'Cup - 6oz, Foam', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 2.83, 38, '2021-01-11 00:00:00', 5, '-'),
-        (288, 'Allspice - Jamaican', 'rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis', 46.53, 71, '2021-04-05 00:00:00', 4, '-'),
-        (289, 'Spice - Peppercorn Melange', 'ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem', 32.25, 8, '2021-02-24 00:00:00', 5, '-'),
-        (290, 'Ham Black Forest', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 2.97, 68, '2020-12-13 00:00:00', 6, '-'),
-        (291, 'Chocolate - Chips Compound', 'interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu est', 10.59, 95, '2020-08-11 00:00:00', 5, '-'),
-        (292, 'Lamb - Shanks', 'accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum', 85.78, 91, '2021-05-30 00:00:00', 3, '-'),
-        (293, 'Wine - Chianti Classico Riserva', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum', 42.08, 82, '2021-01-20 00:00:00', 6, '-'),
-        (294, 'Coffee - Colombian, Portioned', 'felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed', 5.99, 48, '2020-08-15 00:00:00', 3, '-'),
-        (295, 'Pasta - Fettuccine, Egg, Fresh', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis', 12.85, 16, '2020-06-12 00:00:00', 6, '-'),
-        (296, 'Tequila Rose Cream Liquor', 'molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac', 94.35, 28, '2020-12-03 00:00:00', 3, '-'),
-        (297, 'Eggwhite Frozen', 'faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat', 64.40, 80, '2021-02-24 00:00:00', 5, '-'),
-        (298, 'Pate - Liver', 'sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc', 87.14, 86, '2021-03-26 00:00:00', 4, '-'),
-        (299, 'Thyme - Fresh', 'lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 13.95, 80, '2020-10-30 00:00:00', 5, '-'),
-        (300, 'Ice Cream - Strawberry', 'purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam', 78.47, 75, '2020-11-13 00:00:00', 6, '-'),
-        (301, 'Steampan - Lid For Half Size', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam', 29.54, 95, '2020-07-30 00:00:00', 4, '-'),
-        (302, 'Oats Large Flake', 'fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio', 99.60, 100, '2020-08-02 00:00:00', 3, '-'),
-        (303, 'Mcguinness - Blue Curacao', 'convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim', 30.76, 42, '2020-08-22 00:00:00', 5, '-'),
-        (304, 'Sauce - Salsa', 'a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 82.29, 24, '2020-12-09 00:00:00', 5, '-'),
-        (305, 'Frangelico', 'ante ipsum primis in faucibus orci luctus et ultrices posuere', 8.45, 20, '2021-04-12 00:00:00', 5, '-'),
-        (306, 'Wine - Blue Nun Qualitatswein', 'neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo', 67.43, 65, '2020-07-17 00:00:00', 4, '-'),
-        (307, 'Bread - Calabrese Baguette', 'est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est', 40.96, 5, '2020-11-04 00:00:00', 5, '-'),
-        (308, 'Soup - Campbells', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet', 70.29, 81, '2021-05-08 00:00:00', 4, '-'),
-        (309, 'Doilies - 8, Paper', 'pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo', 49.70, 80, '2021-04-30 00:00:00', 4, '-'),
-        (310, 'Taro Leaves', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus', 64.75, 87, '2020-12-12 00:00:00', 5, '-'),
-        (311, 'Tumeric', 'volutpat erat quisque erat eros viverra eget congue eget semper rutrum', 17.35, 70, '2020-07-25 00:00:00', 6, '-'),
-        (312, 'Coconut - Creamed, Pure', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet', 52.81, 80, '2021-03-02 00:00:00', 5, '-'),
-        (313, 'Bread - Olive Dinner Roll', 'ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor', 88.96, 61, '2021-02-12 00:00:00', 3, '-'),
-        (314, 'Wine - Fat Bastard Merlot', 'nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum integer', 73.55, 14, '2020-12-04 00:00:00', 3, '-'),
-        (315, 'Beef - Tenderloin', 'nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo', 52.03, 10, '2020-08-02 00:00:00', 3, '-'),
-        (316, 'Bread - White Epi Baguette', 'morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu', 2.21, 48, '2021-05-03 00:00:00', 6, '-'),
-        (317, 'Soup - Campbells, Creamy', 'hac habitasse platea dictumst maecenas ut massa quis augue luctus', 14.16, 67, '2020-10-20 00:00:00', 3, '-'),
-        (318, 'Dasheen', 'donec dapibus duis at velit eu est congue elementum in hac habitasse', 33.04, 88, '2021-02-18 00:00:00', 3, '-'),
-        (319, 'Towel - Roll White', 'mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci', 36.51, 11, '2021-01-30 00:00:00', 6, '-'),
-        (320, 'Juice - Orange 1.89l', 'elit proin risus praesent lectus vestibulum quam sapien varius ut blandit', 85.16, 7, '2021-02-12 00:00:00', 3, '-'),
-        (321, 'Vermouth - White, Cinzano', 'molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue', 46.15, 35, '2020-09-13 00:00:00', 5, '-'),
-        (322, 'Bread - French Baquette', 'mi in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac', 30.31, 38, '2020-08-24 00:00:00', 5, '-'),
-        (323, 'Chinese Foods - Plain Fried Rice', 'pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu', 24.39, 6, '2021-02-07 00:00:00', 4, '-'),
-        (324, 'Sausage - Chorizo', 'magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis', 72.17, 62, '2021-03-31 00:00:00', 6, '-'),
-        (325, 'Lotus Root', 'mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis', 16.48, 55, '2021-03-12 00:00:00', 3, '-'),
-        (326, 'Ecolab - Solid Fusion', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate', 78.05, 98, '2021-03-17 00:00:00', 5, '-'),
-        (327, 'Chicken - Thigh, Bone In', 'nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu', 61.95, 100, '2020-08-15 00:00:00', 6, '-'),
-        (328, 'Pepper - Red Chili', 'suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus', 5.21, 96, '2020-09-12 00:00:00', 4, '-'),
-        (329, 'Soup - Beef, Base Mix', 'amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus', 41.99, 89, '2020-10-20 00:00:00', 6, '-'),
-        (330, 'Wine - Magnotta - Cab Franc', 'ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 13.21, 43, '2021-05-16 00:00:00', 6, '-'),
-        (331, 'Red Currant Jelly', 'at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat', 44.53, 95, '2020-07-08 00:00:00', 6, '-'),
-        (332, 'Soup - Knorr, Country Bean', 'consequat metus sapien ut nunc vestibulum ante ipsum primis in', 75.74, 54, '2021-02-20 00:00:00', 3, '-'),
-        (333, 'Cafe Royale', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus', 77.72, 73, '2021-01-27 00:00:00', 4, '-'),
-        (334, 'Napkin White', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at', 41.16, 75, '2021-05-24 00:00:00', 5, '-'),
-        (335, 'Cheese - Provolone', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo in', 54.32, 19, '2021-02-04 00:00:00', 3, '-'),
-        (336, 'Vermacelli - Sprinkles, Assorted', 'id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at', 33.79, 46, '2020-06-10 00:00:00', 6, '-'),
-        (337, 'Creme De Cacao White', 'condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales', 30.59, 29, '2020-10-29 00:00:00', 5, '-'),
-        (338, 'Mushroom - Lg - Cello', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 29.11, 29, '2021-05-23 00:00:00', 4, '-'),
-        (339, 'Assorted Desserts', 'phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 16.77, 97, '2020-06-23 00:00:00', 6, '-'),
-        (340, 'Pork - Suckling Pig', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis', 76.52, 73, '2021-02-17 00:00:00', 4, '-'),
-        (341, 'Wine - Hardys Bankside Shiraz', 'dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti', 65.85, 72, '2020-10-04 00:00:00', 4, '-'),
-        (342, 'Tart Shells - Savory, 3', 'rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 64.88, 44, '2020-08-26 00:00:00', 3, '-'),
-        (343, 'Cheese - Gouda', 'pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis', 98.07, 44, '2021-03-11 00:00:00', 4, '-'),
-        (344, 'Beef - Tenderloin - Aa', 'ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 36.69, 9, '2020-11-28 00:00:00', 4, '-'),
-        (345, 'Pork - Ham, Virginia', 'consequat morbi a ipsum integer a nibh in quis justo maecenas', 58.53, 79, '2021-03-01 00:00:00', 6, '-'),
-        (346, 'Lid Tray - 16in Dome', 'accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean', 30.96, 32, '2021-01-29 00:00:00', 6, '-'),
-        (347, 'Beer - Corona', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 93.68, 84, '2020-06-14 00:00:00', 5, '-'),
-        (348, 'Milkettes - 2%', 'dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 86.05, 64, '2020-09-23 00:00:00', 3, '-'),
-        (349, 'Five Alive Citrus', 'orci pede venenatis non sodales sed tincidunt eu felis fusce', 27.86, 59, '2021-05-12 00:00:00', 4, '-'),
-        (350, 'Pasta - Canelloni, Single Serve', 'nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 20.21, 19, '2020-08-27 00:00:00', 5, '-'),
-        (351, 'Juice - Cranberry 284ml', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede', 13.05, 56, '2021-05-11 00:00:00', 5, '-'),
-        (352, 'Wine - Vineland Estate Semi - Dry', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque', 33.35, 71, '2021-05-18 00:00:00', 3, '-'),
-        (353, 'Syrup - Monin - Passion Fruit', 'non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 64.58, 56, '2020-09-25 00:00:00', 5, '-'),
-        (354, 'Marsala - Sperone, Fine, D.o.c.', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus', 71.21, 80, '2021-04-09 00:00:00', 4, '-'),
-        (355, 'Bowl 12 Oz - Showcase 92012', 'quis lectus suspendisse potenti in eleifend quam a odio in', 7.67, 33, '2020-07-20 00:00:00', 6, '-'),
-        (356, 'Cod - Salted, Boneless', 'est risus auctor sed tristique in tempus sit amet sem fusce consequat', 26.71, 12, '2020-07-28 00:00:00', 5, '-'),
-        (357, 'Lemonade - Kiwi, 591 Ml', 'tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse', 43.40, 41, '2020-10-11 00:00:00', 5, '-'),
-        (358, 'Yeast Dry - Fleischman', 'tellus nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas', 44.77, 32, '2020-08-19 00:00:00', 4, '-'),
-        (359, 'Beef - Striploin', 'sapien non mi integer ac neque duis bibendum morbi non quam nec dui luctus', 77.01, 95, '2021-05-13 00:00:00', 4, '-'),
-        (360, 'Plate Pie Foil', 'lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse', 6.97, 84, '2020-08-05 00:00:00', 5, '-'),
-        (361, 'Madeira', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus', 28.66, 89, '2020-11-30 00:00:00', 4, '-'),
-        (362, 'Broccoli - Fresh', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 84.58, 93, '2020-11-20 00:00:00', 4, '-'),
-        (363, 'Wine - Rubyport', 'turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu', 98.70, 92, '2020-08-10 00:00:00', 4, '-'),
-        (364, 'Bread Base - Italian', 'lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi', 19.74, 28, '2021-06-03 00:00:00', 6, '-'),
-        (365, 'Flour - Corn, Fine', 'curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 32.55, 68, '2021-04-02 00:00:00', 5, '-'),
-        (366, 'Bread Cranberry Foccacia', 'nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed', 95.08, 76, '2020-10-24 00:00:00', 3, '-'),
-        (367, 'Lettuce - Boston Bib - Organic', 'elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus', 41.65, 31, '2021-03-17 00:00:00', 4, '-'),
-        (368, 'Beef - Tenderlion, Center Cut', 'quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus', 3.45, 36, '2020-09-08 00:00:00', 5, '-'),
-        (369, 'Squeeze Bottle', 'consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 75.90, 17, '2020-12-27 00:00:00', 5, '-'),
-        (370, 'Muffin - Zero Transfat', 'quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at', 15.91, 65, '2020-07-21 00:00:00', 6, '-'),
-        (371, 'Worcestershire Sauce', 'cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus', 45.93, 61, '2020-12-06 00:00:00', 5, '-'),
-        (372, 'Lid Coffee Cup 8oz Blk', 'sit amet erat nulla tempus vivamus in felis eu sapien cursus', 52.14, 21, '2021-02-18 00:00:00', 3, '-'),
-        (373, 'Yoplait Drink', 'eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit', 20.55, 67, '2021-04-18 00:00:00', 6, '-'),
-        (374, 'Sausage - Liver', 'lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi', 58.67, 39, '2020-10-20 00:00:00', 4, '-'),
-        (375, 'Snapple Lemon Tea', 'interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie', 42.45, 43, '2020-11-02 00:00:00', 4, '-'),
-        (376, 'Salmon - Atlantic, No Skin', 'dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus', 38.85, 15, '2020-10-31 00:00:00', 3, '-'),
-        (377, 'Black Currants', 'accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean', 76.68, 63, '2020-09-21 00:00:00', 4, '-'),
-        (378, 'Food Colouring - Red', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum', 52.70, 87, '2020-08-17 00:00:00', 4, '-'),
-        (379, 'Chocolate - White', 'id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit', 1.92, 69, '2021-04-02 00:00:00', 4, '-'),
-        (380, 'Calaloo', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 8.55, 76, '2020-08-03 00:00:00', 5, '-'),
-        (381, 'Cherries - Fresh', 'nulla nunc purus phasellus in felis donec semper sapien a', 31.41, 45, '2020-09-04 00:00:00', 3, '-'),
-        (382, 'Muffin Orange Individual', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 54.18, 13, '2020-07-09 00:00:00', 3, '-'),
-        (383, 'Soup - French Can Pea', 'sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla', 76.57, 85, '2021-04-17 00:00:00', 4, '-'),
-        (384, 'Nectarines', 'arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 11.16, 30, '2020-10-26 00:00:00', 4, '-'),
-        (385, 'Shrimp - 21/25, Peel And Deviened', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat', 68.55, 65, '2020-11-14 00:00:00', 5, '-'),
-        (386, 'Salmon - Smoked, Sliced', 'suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 50.50, 100, '2021-03-27 00:00:00', 3, '-'),
-        (387, 'Quail - Jumbo Boneless', 'ligula vehicula consequat morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus', 20.37, 97, '2020-08-19 00:00:00', 4, '-'),
-        (388, 'Water - Spring Water, 355 Ml', 'diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et', 11.69, 75, '2021-02-04 00:00:00', 4, '-'),
-        (389, 'Pastry - Choclate Baked', 'purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat', 70.65, 11, '2020-12-27 00:00:00', 3, '-'),
-        (390, 'Banana Turning', 'ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 17.12, 36, '2020-12-24 00:00:00', 5, '-'),
-        (391, 'Flavouring Vanilla Artificial', 'sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor', 9.47, 59, '2021-01-21 00:00:00', 3, '-'),
-        (392, 'Lotus Rootlets - Canned', 'pede justo lacinia eget tincidunt eget tempus vel pede morbi', 72.76, 8, '2021-05-06 00:00:00', 5, '-'),
-        (393, 'Filter - Coffee', 'convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat', 85.17, 51, '2021-04-10 00:00:00', 4, '-'),
-        (394, 'Appetizer - Smoked Salmon / Dill', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate', 32.16, 11, '2020-11-08 00:00:00', 5, '-'),
-        (395, 'Macaroons - Two Bite Choc', 'eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 68.07, 19, '2020-08-08 00:00:00', 3, '-'),
-        (396, 'Lamb - Bones', 'pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 36.67, 24, '2021-05-13 00:00:00', 6, '-'),
-        (397, 'Mousse - Mango', 'nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem', 84.22, 91, '2020-08-03 00:00:00', 3, '-'),
-        (398, 'Truffle Shells - Semi - Sweet', 'maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 72.09, 19, '2020-08-17 00:00:00', 5, '-'),
-        (399, 'Pork - Tenderloin, Frozen', 'eu felis fusce posuere felis sed lacus morbi sem mauris', 52.90, 8, '2020-10-29 00:00:00', 4, '-'),
-        (400, 'Chilli Paste, Ginger Garlic', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 50.47, 3, '2021-03-12 00:00:00', 3, '-'),
-        (401, 'Creme De Menth - White', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 23.97, 49, '2021-01-05 00:00:00', 5, '-'),
-        (402, 'Thyme - Dried', 'semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 85.99, 96, '2020-11-26 00:00:00', 4, '-'),
-        (403, 'Pasta - Lasagna, Dry', 'eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien', 37.80, 49, '2020-11-12 00:00:00', 4, '-'),
-        (404, 'Eggplant Italian', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque', 80.68, 52, '2021-05-13 00:00:00', 5, '-'),
-        (405, 'V8 - Vegetable Cocktail', 'ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi', 26.62, 14, '2021-04-16 00:00:00', 3, '-'),
-        (406, 'Tray - 16in Rnd Blk', 'nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit', 20.69, 46, '2021-04-09 00:00:00', 6, '-'),
-        (407, 'Juice Peach Nectar', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit', 47.08, 11, '2020-11-07 00:00:00', 4, '-'),
-        (408, 'Shrimp - Baby, Warm Water', 'magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed', 21.07, 14, '2021-04-10 00:00:00', 6, '-'),
-        (409, 'Chicken - Whole Fryers', 'ac lobortis vel dapibus at diam nam tristique tortor eu', 60.39, 59, '2020-09-25 00:00:00', 6, '-'),
-        (410, 'Gatorade - Orange', 'ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia', 98.40, 58, '2020-11-18 00:00:00', 5, '-'),
-        (411, 'Fib N9 - Prague Powder', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 53.53, 91, '2020-11-21 00:00:00', 5, '-'),
-        (412, 'Mushroom - Enoki, Fresh', 'adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at', 39.73, 44, '2021-03-23 00:00:00', 5, '-'),
-        (413, 'Sauce - Hp', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea', 57.26, 35, '2021-01-23 00:00:00', 4, '-'),
-        (414, 'Beer - Paulaner Hefeweisse', 'duis consequat dui nec nisi volutpat eleifend donec ut dolor', 95.30, 68, '2020-12-15 00:00:00', 3, '-'),
-        (415, 'Nut - Pecan, Halves', 'fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus', 81.11, 48, '2021-05-16 00:00:00', 4, '-'),
-        (416, 'Vodka - Smirnoff', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 24.05, 62, '2020-08-07 00:00:00', 3, '-'),
-        (417, 'Wine - Port Late Bottled Vintage', 'suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 27.91, 95, '2021-04-25 00:00:00', 6, '-'),
-        (418, 'Kiwi Gold Zespri', 'id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget', 28.83, 92, '2020-12-31 00:00:00', 3, '-'),
-        (419, 'Soup - Chicken And Wild Rice', 'primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 74.76, 96, '2020-12-04 00:00:00', 5, '-'),
-        (420, 'Cream Of Tartar', 'suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 4.22, 42, '2021-02-15 00:00:00', 3, '-'),
-        (421, 'Pasta - Cheese / Spinach Bauletti', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 81.91, 12, '2020-10-23 00:00:00', 3, '-'),
-        (422, 'Yucca', 'augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 7.39, 34, '2020-09-13 00:00:00', 4, '-'),
-        (423, 'Zucchini - Yellow', 'in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis', 55.25, 83, '2020-07-31 00:00:00', 6, '-'),
-        (424, 'Transfer Sheets', 'ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus', 91.43, 95, '2021-01-26 00:00:00', 6, '-'),
-        (425, 'Beef - Cooked, Corned', 'ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit', 24.65, 65, '2021-01-02 00:00:00', 6, '-'),
-        (426, 'Bar Bran Honey Nut', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 68.49, 30, '2021-04-14 00:00:00', 6, '-'),
-        (427, 'Quail - Whole, Bone - In', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare', 41.85, 30, '2021-01-11 00:00:00', 6, '-'),
-        (428, 'Pepper - Julienne, Frozen', 'tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus', 22.56, 65, '2021-05-14 00:00:00', 5, '-'),
-        (429, 'Radish - Pickled', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel', 91.52, 79, '2020-12-09 00:00:00', 5, '-'),
-        (430, 'Chocolate Eclairs', 'dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 75.55, 30, '2021-05-11 00:00:00', 5, '-'),
-        (431, 'Godiva White Chocolate', 'velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis', 36.17, 73, '2020-09-08 00:00:00', 5, '-'),
-        (432, 'Sauce - Soya, Light', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 81.10, 48, '2021-04-24 00:00:00', 6, '-'),
-        (433, 'Sherry - Dry', 'natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 78.54, 9, '2020-12-18 00:00:00', 5, '-'),
-        (434, 'Potatoes - Peeled', 'at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam', 82.59, 76, '2021-02-02 00:00:00', 6, '-'),
-        (435, 'Wine - Two Oceans Cabernet', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 33.55, 86, '2020-10-16 00:00:00', 4, '-'),
-        (436, 'Appetizer - Southwestern', 'amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor', 38.94, 77, '2021-04-27 00:00:00', 4, '-'),
-        (437, 'Wine - Penfolds Koonuga Hill', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus', 50.05, 11, '2021-01-22 00:00:00', 5, '-'),
-        (438, 'Appetizer - Shrimp Puff', 'viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 65.45, 30, '2020-12-04 00:00:00', 4, '-'),
-        (439, 'Isomalt', 'sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum', 33.57, 93, '2020-09-06 00:00:00', 5, '-'),
-        (440, 'Beans - Soya Bean', 'id turpis integer aliquet massa id lobortis convallis tortor risus', 88.40, 29, '2021-05-20 00:00:00', 4, '-'),
-        (441, 'Beef - Shank', 'volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea', 58.80, 99, '2020-10-19 00:00:00', 3, '-'),
-        (442, 'Oil - Shortening - All - Purpose', 'congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 15.47, 51, '2021-01-27 00:00:00', 3, '-'),
-        (443, 'Pepper - Chilli Seeds Mild', 'nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla', 39.69, 35, '2020-10-03 00:00:00', 6, '-'),
-        (444, 'Pasta - Fusili, Dry', 'pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante', 17.95, 19, '2020-11-17 00:00:00', 3, '-'),
-        (445, 'Flower - Leather Leaf Fern', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem', 69.96, 83, '2021-01-24 00:00:00', 5, '-'),
-        (446, 'Black Currants', 'lacus purus aliquet at feugiat non pretium quis lectus suspendisse', 8.73, 8, '2020-07-28 00:00:00', 6, '-'),
-        (447, 'Sword Pick Asst', 'ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi', 32.29, 16, '2021-01-21 00:00:00', 5, '-'),
-        (448, 'Soup - Campbells, Lentil', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 48.58, 76, '2021-01-27 00:00:00', 5, '-'),
-        (449, 'Roe - Lump Fish, Red', 'non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 84.19, 65, '2021-04-04 00:00:00', 4, '-'),
-        (450, 'Sauce - Demi Glace', 'ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa', 81.03, 90, '2020-09-09 00:00:00', 4, '-'),
-        (451, 'Coffee Cup 8oz 5338cd', 'vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl', 73.11, 71, '2021-02-15 00:00:00', 6, '-'),
-        (452, 'Salmon - Smoked, Sliced', 'rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi', 30.55, 11, '2020-10-09 00:00:00', 4, '-'),
-        (453, 'Veal - Osso Bucco', 'ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo', 93.75, 23, '2020-10-31 00:00:00', 4, '-'),
-        (454, 'Sole - Dover, Whole, Fresh', 'nunc donec quis orci eget orci vehicula condimentum curabitur in libero', 14.14, 29, '2021-06-05 00:00:00', 6, '-'),
-        (455, 'Vaccum Bag - 14x20', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed', 56.18, 92, '2021-03-26 00:00:00', 3, '-'),
-        (456, 'Sausage - Liver', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 87.44, 25, '2020-08-01 00:00:00', 6, '-'),
-        (457, 'Wine - Magnotta, White', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 96.03, 34, '2021-01-30 00:00:00', 5, '-'),
-        (458, 'Ham - Virginia', 'hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem', 93.87, 87, '2021-04-08 00:00:00', 4, '-'),
-        (459, 'Onion - Dried', 'semper porta volutpat quam pede lobortis ligula sit amet eleifend', 5.80, 5, '2020-09-24 00:00:00', 4, '-'),
-        (460, 'Coffee - Decafenated', 'mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam', 35.38, 32, '2020-09-29 00:00:00', 3, '-'),
-        (461, 'Sauce - Plum', 'platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 8.77, 35, '2020-07-03 00:00:00', 4, '-'),
-        (462, 'Yogurt - Raspberry, 175 Gr', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque', 74.58, 100, '2020-12-08 00:00:00', 4, '-'),
-        (463, 'Orange - Tangerine', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra', 91.78, 85, '2020-06-19 00:00:00', 5, '-'),
-        (464, 'Chicken - Soup Base', 'nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula', 11.88, 55, '2020-08-20 00:00:00', 4, '-'),
-        (465, 'Ecolab - Lime - A - Way 4/4 L', 'nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 88.85, 93, '2021-05-27 00:00:00', 3, '-'),
-        (466, 'Cheese - Parmigiano Reggiano', 'morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non', 77.72, 82, '2020-08-17 00:00:00', 3, '-'),
-        (467, 'Beef - Chuck, Boneless', 'viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec', 85.88, 22, '2020-10-21 00:00:00', 5, '-'),
-        (468, 'Raisin - Golden', 'duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim', 94.29, 51, '2020-12-04 00:00:00', 4, '-'),
-        (469, 'Molasses - Fancy', 'ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 1.13, 8, '2021-02-25 00:00:00', 3, '-'),
-        (470, 'Pork - Ground', 'vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus', 96.62, 34, '2020-07-19 00:00:00', 6, '-'),
-        (471, 'Bread - White, Unsliced', 'donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna', 83.52, 51, '2021-01-17 00:00:00', 4, '-'),
-        (472, 'Versatainer Nc - 8288', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia', 23.04, 81, '2020-07-13 00:00:00', 5, '-'),
-        (473, 'Lambcasing', 'nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in', 78.97, 70, '2020-06-16 00:00:00', 6, '-'),
-        (474, 'Beef - Ox Tongue', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat', 27.92, 79, '2020-11-05 00:00:00', 4, '-'),
-        (475, 'Pepper - Green, Chili', 'eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in', 95.20, 61, '2021-01-13 00:00:00', 6, '-'),
-        (476, 'Beer - Tetleys', 'dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 34.41, 16, '2020-12-14 00:00:00', 3, '-'),
-        (477, 'Yogurt - Cherry, 175 Gr', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut', 52.89, 80, '2020-08-05 00:00:00', 3, '-'),
-        (478, 'Sole - Fillet', 'interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu', 28.28, 35, '2021-04-26 00:00:00', 5, '-'),
-        (479, 'Turnip - White, Organic', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam tristique', 50.07, 25, '2021-02-09 00:00:00', 5, '-'),
-        (480, 'Dip - Tapenade', 'tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium', 45.11, 41, '2020-08-11 00:00:00', 6, '-'),
-        (481, 'Coffee - 10oz Cup 92961', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros', 21.42, 93, '2021-05-01 00:00:00', 4, '-'),
-        (482, 'Pasta - Elbows, Macaroni, Dry', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus', 37.30, 87, '2021-04-08 00:00:00', 6, '-'),
-        (483, 'Wine - White, Colubia Cresh', 'lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a', 1.59, 42, '2020-06-24 00:00:00', 4, '-'),
-        (484, 'Soup - Beef Conomme, Dry', 'ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec', 92.54, 75, '2021-01-05 00:00:00', 4, '-'),
-        (485, 'Soup - Campbells Mushroom', 'eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus', 32.67, 17, '2020-09-27 00:00:00', 4, '-'),
-        (486, 'Potatoes - Mini Red', 'purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 57.24, 21, '2021-03-14 00:00:00', 5, '-'),
-        (487, 'Cheese - Havarti, Salsa', 'blandit non interdum in ante vestibulum ante ipsum primis in', 31.03, 75, '2020-12-06 00:00:00', 6, '-'),
-        (488, 'Shrimp - 21/25, Peel And Deviened', 'sed tristique in tempus sit amet sem fusce consequat nulla', 83.12, 20, '2020-07-09 00:00:00', 4, '-'),
-        (489, 'Propel Sport Drink', 'aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 50.37, 18, '2020-08-03 00:00:00', 4, '-'),
-        (490, 'Chicken - White Meat With Tender', 'vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis', 39.47, 64, '2020-12-23 00:00:00', 6, '-'),
-        (491, 'Guinea Fowl', 'erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis', 84.54, 43, '2020-11-04 00:00:00', 5, '-'),
-        (492, 'Bowl 12 Oz - Showcase 92012', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo', 29.71, 13, '2021-02-04 00:00:00', 4, '-'),
-        (493, 'Yeast Dry - Fermipan', 'libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 10.79, 86, '2021-05-11 00:00:00', 3, '-'),
-        (494, 'Mushroom - Chantrelle, Fresh', 'amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 23.61, 39, '2020-09-12 00:00:00', 5, '-'),
-        (495, 'Beer - Steamwhistle', 'sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit', 7.39, 82, '2021-03-12 00:00:00', 4, '-'),
-        (496, 'Lettuce - Belgian Endive', 'libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate', 40.96, 59, '2020-09-30 00:00:00', 3, '-'),
-        (497, 'Jello - Assorted', 'in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu', 13.53, 97, '2021-02-22 00:00:00', 5, '-'),
-        (498, 'Garlic Powder', 'morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec', 2.19, 3, '2020-08-27 00:00:00', 6, '-'),
-        (499, 'Pickle - Dill', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 31.52, 77, '2020-09-20 00:00:00', 6, '-'),
-        (500, 'Flour Dark Rye', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel', 37.41, 75, '2020-10-22 00:00:00', 5, '-'),
-        (501, 'Compound - Pear', 'potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 93.42, 51, '2021-06-07 00:00:00', 6, '-'),
-        (502, 'Cookie Chocolate Chip With', 'libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 66.30, 29, '2020-07-25 00:00:00', 3, '-'),
-        (503, 'Cloves - Ground', 'nulla nunc purus phasellus in felis donec semper sapien a libero', 26.06, 15, '2020-11-08 00:00:00', 5, '-'),
-        (504, 'Sauce - Thousand Island', 'congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 60.11, 46, '2020-09-27 00:00:00', 4, '-'),
-        (505, 'Yogurt - Assorted Pack', 'suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 12.44, 67, '2020-07-25 00:00:00', 3, '-'),
-        (506, 'Dooleys Toffee', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 71.19, 52, '2021-05-26 00:00:00', 6, '-'),
-        (507, 'Marzipan 50/50', 'felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 89.05, 58, '2021-03-25 00:00:00', 3, '-'),
-        (508, 'Flavouring - Raspberry', 'tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est', 72.89, 40, '2021-02-28 00:00:00', 6, '-'),
-        (509, 'Lamb - Bones', 'aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa', 1.44, 80, '2021-04-09 00:00:00', 5, '-'),
-        (510, 'Pineapple - Canned, Rings', 'aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed', 14.96, 77, '2021-04-04 00:00:00', 3, '-'),
-        (511, 'Chicken - Whole Roasting', 'sagittis nam congue risus semper porta volutpat quam pede lobortis ligula', 54.87, 44, '2021-02-10 00:00:00', 4, '-'),
-        (512, 'Scallops - U - 10', 'blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae', 88.21, 100, '2021-04-25 00:00:00', 4, '-'),
-        (513, 'Container - Clear 32 Oz', 'quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea', 5.78, 30, '2021-03-04 00:00:00', 6, '-'),
-        (514, 'Juice - Orange 1.89l', 'eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis', 54.45, 65, '2020-10-04 00:00:00', 4, '-'),
-        (515, 'Sparkling Wine - Rose, Freixenet', 'justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue', 95.18, 44, '2020-12-24 00:00:00', 3, '-'),
-        (516, 'Sultanas', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum', 48.75, 64, '2020-08-27 00:00:00', 3, '-'),
-        (517, 'Pasta - Cheese / Spinach Bauletti', 'primis in faucibus orci luctus et ultrices posuere cubilia curae donec', 93.85, 21, '2021-03-28 00:00:00', 4, '-'),
-        (518, 'Tart - Pecan Butter Squares', 'ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 4.75, 43, '2021-04-23 00:00:00', 4, '-'),
-        (519, 'Tarts Assorted', 'pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla', 68.34, 87, '2021-04-21 00:00:00', 6, '-'),
-        (520, 'Appetizer - Asian Shrimp Roll', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan', 92.58, 47, '2021-03-15 00:00:00', 6, '-'),
-        (521, 'Pork - Smoked Back Bacon', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 14.00, 1, '2021-05-13 00:00:00', 5, '-'),
-        (522, 'Vodka - Smirnoff', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in', 66.15, 38, '2020-09-15 00:00:00', 4, '-'),
-        (523, 'Cake - Miini Cheesecake Cherry', 'potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non', 57.35, 37, '2020-11-19 00:00:00', 6, '-'),
-        (524, 'Tia Maria', 'dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam', 57.76, 82, '2021-01-29 00:00:00', 6, '-'),
-        (525, 'Banana Turning', 'augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum', 90.39, 64, '2020-07-10 00:00:00', 6, '-'),
-        (526, 'Rice - Brown', 'eget vulputate ut ultrices vel augue vestibulum ante ipsum primis', 57.03, 54, '2020-10-04 00:00:00', 5, '-'),
-        (527, 'Potatoes - Fingerling 4 Oz', 'commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem', 32.99, 89, '2021-02-07 00:00:00', 6, '-'),
-        (528, 'Shrimp - Tiger 21/25', 'fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris', 79.68, 71, '2021-03-27 00:00:00', 6, '-'),
-        (529, 'Lamb - Shanks', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus', 17.39, 29, '2020-07-01 00:00:00', 6, '-'),
-        (530, 'Wine - Red, Cabernet Merlot', 'platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum', 89.73, 57, '2020-12-11 00:00:00', 4, '-'),
-        (531, 'Bread - Sour Batard', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien', 57.33, 6, '2021-05-04 00:00:00', 3, '-'),
-        (532, 'Ginger - Crystalized', 'turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at turpis a', 8.17, 88, '2020-08-25 00:00:00', 3, '-'),
-        (533, 'Eggplant - Asian', 'lectus in est risus auctor sed tristique in tempus sit amet sem', 50.50, 69, '2020-12-26 00:00:00', 3, '-'),
-        (534, 'Wine - Malbec Trapiche Reserve', 'dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 90.41, 61, '2020-11-10 00:00:00', 5, '-'),
-        (535, 'Coffee Cup 16oz Foam', 'justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus', 2.94, 82, '2021-02-04 00:00:00', 6, '-'),
-        (536, 'Coconut Milk - Unsweetened', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 66.22, 90, '2020-11-09 00:00:00', 6, '-'),
-        (537, 'Squid Ink', 'suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam', 32.21, 65, '2020-06-20 00:00:00', 3, '-'),
-        (538, 'Wine - Bouchard La Vignee Pinot', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum', 90.55, 70, '2020-06-24 00:00:00', 6, '-'),
-        (539, 'Guinea Fowl', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque', 4.85, 97, '2020-08-02 00:00:00', 3, '-'),
-        (540, 'Remy Red', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 67.10, 41, '2021-04-05 00:00:00', 6, '-'),
-        (541, 'Cookie Dough - Chocolate Chip', 'erat fermentum justo nec condimentum neque sapien placerat ante nulla justo', 16.48, 11, '2020-09-09 00:00:00', 3, '-'),
-        (542, 'Fennel', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis', 2.73, 15, '2021-01-15 00:00:00', 4, '-'),
-        (543, 'Nacho Chips', 'massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh', 57.42, 97, '2021-04-09 00:00:00', 6, '-'),
-        (544, 'Sugar - Invert', 'eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes', 23.54, 77, '2020-12-25 00:00:00', 6, '-'),
-        (545, 'Tarts Assorted', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna', 79.79, 51, '2020-11-02 00:00:00', 3, '-'),
-        (546, 'Mushroom Morel Fresh', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 27.00, 52, '2020-10-21 00:00:00', 3, '-'),
-        (547, 'Hersey Shakes', 'sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis', 47.61, 23, '2020-12-19 00:00:00', 6, '-'),
-        (548, 'Tomatoes - Heirloom', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero nam dui proin', 74.60, 84, '2021-01-14 00:00:00', 5, '-'),
-        (549, 'Tea - Herbal Orange Spice', 'vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in', 68.15, 1, '2021-04-13 00:00:00', 3, '-'),
-        (550, 'Pork - Bacon Cooked Slcd', 'nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 2.24, 94, '2020-09-04 00:00:00', 6, '-'),
-        (551, 'Mint - Fresh', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue', 84.18, 45, '2020-10-01 00:00:00', 5, '-'),
-        (552, 'Bread - Bistro Sour', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer', 99.35, 69, '2021-01-13 00:00:00', 3, '-'),
-        (553, 'Wine - Magnotta - Red, Baco', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices', 27.60, 71, '2021-02-14 00:00:00', 5, '-'),
-        (554, 'Chicken - Leg, Fresh', 'leo odio condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam', 11.50, 2, '2021-06-02 00:00:00', 4, '-'),
-        (555, 'Soup - French Onion, Dry', 'libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit amet nunc', 66.46, 37, '2021-01-24 00:00:00', 6, '-'),
-        (556, 'Sachet', 'faucibus cursus urna ut tellus nulla ut erat id mauris', 74.35, 81, '2021-03-21 00:00:00', 3, '-'),
-        (557, 'Carrots - Purple, Organic', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis', 12.34, 48, '2021-06-02 00:00:00', 5, '-'),
-        (558, 'Yogurt - Raspberry, 175 Gr', 'sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet', 73.13, 32, '2021-05-07 00:00:00', 6, '-'),
-        (559, 'Chocolate - Chips Compound', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim', 91.36, 13, '2020-11-17 00:00:00', 4, '-'),
-        (560, 'Sponge Cake Mix - Chocolate', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede', 77.66, 75, '2020-07-28 00:00:00', 4, '-'),
-        (561, 'Flower - Potmums', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id', 62.42, 82, '2020-09-22 00:00:00', 5, '-'),
-        (562, 'Glass Clear 7 Oz Xl', 'sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 97.10, 97, '2020-11-03 00:00:00', 4, '-'),
-        (563, 'Flour - Strong Pizza', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo', 2.22, 15, '2020-08-01 00:00:00', 6, '-'),
-        (564, 'Glass Clear 7 Oz Xl', 'tellus nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit', 45.75, 85, '2020-09-28 00:00:00', 5, '-'),
-        (565, 'Taro Leaves', 'rutrum nulla nunc purus phasellus in felis donec semper sapien a libero', 56.91, 58, '2020-12-01 00:00:00', 3, '-'),
-        (566, 'Bread Bowl Plain', 'eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et', 11.53, 77, '2021-04-04 00:00:00', 5, '-'),
-        (567, 'Cheese - Cambozola', 'nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend', 52.08, 44, '2020-07-02 00:00:00', 6, '-'),
-        (568, 'Lettuce - Spring Mix', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 14.24, 50, '2020-08-29 00:00:00', 5, '-'),
-        (569, 'Crab - Claws, 26 - 30', 'congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero', 60.21, 78, '2021-02-22 00:00:00', 3, '-'),
-        (570, 'Stock - Chicken, White', 'velit eu est congue elementum in hac habitasse platea dictumst', 48.55, 24, '2021-04-15 00:00:00', 6, '-'),
-        (571, 'Latex Rubber Gloves Size 9', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 1.13, 44, '2021-01-19 00:00:00', 3, '-'),
-        (572, 'Wine - White Cab Sauv.on', 'amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh in', 34.66, 27, '2020-12-06 00:00:00', 6, '-'),
-        (573, 'Cheese - Brie, Cups 125g', 'nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur', 36.30, 32, '2020-06-12 00:00:00', 5, '-'),
-        (574, 'Flour - All Purpose', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam', 5.11, 41, '2021-03-28 00:00:00', 4, '-'),
-        (575, 'Lemon Balm - Fresh', 'quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio', 24.68, 64, '2021-04-24 00:00:00', 3, '-'),
-        (576, 'Tomatoes - Roma', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 10.38, 89, '2020-07-05 00:00:00', 4, '-'),
-        (577, 'Soup - Campbells, Classic Chix', 'eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem', 24.59, 48, '2020-12-10 00:00:00', 5, '-'),
-        (578, 'Beer - Upper Canada Light', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper', 98.21, 66, '2020-10-11 00:00:00', 4, '-'),
-        (579, 'Hersey Shakes', 'at nulla suspendisse potenti cras in purus eu magna vulputate luctus', 79.61, 74, '2020-09-16 00:00:00', 5, '-'),
-        (580, 'Extract - Rum', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in', 23.37, 62, '2021-03-02 00:00:00', 3, '-'),
-        (581, 'Yams', 'elit ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum', 12.88, 40, '2020-10-05 00:00:00', 4, '-'),
-        (582, 'Water - Spring 1.5lit', 'vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 99.96, 49, '2021-03-18 00:00:00', 4, '-'),
-        (583, 'Skirt - 24 Foot', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 92.67, 7, '2021-03-20 00:00:00', 5, '-'),
-        (584, 'Flour Dark Rye', 'nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in', 52.70, 69, '2020-08-17 00:00:00', 6, '-'),
-        (585, 'Coffee - Almond Amaretto', 'lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna', 97.09, 82, '2020-09-17 00:00:00', 4, '-'),
-        (586, 'Bread - Rolls, Rye', 'erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi', 80.76, 76, '2021-02-01 00:00:00', 4, '-'),
-        (587, 'Salmon - Fillets', 'euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at turpis', 68.90, 8, '2021-03-12 00:00:00', 3, '-'),
-        (588, 'Cheese - Brick With Onion', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 52.21, 63, '2020-07-31 00:00:00', 6, '-'),
-        (589, 'Tray - 16in Rnd Blk', 'libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis', 32.03, 89, '2021-04-15 00:00:00', 5, '-'),
-        (590, 'Pike - Frozen Fillet', 'consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 6.97, 5, '2021-01-12 00:00:00', 3, '-'),
-        (591, 'Kirsch - Schloss', 'dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat', 42.90, 44, '2021-03-09 00:00:00', 6, '-'),
-        (592, 'Ham - Procutinni', 'ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor', 41.48, 56, '2020-08-29 00:00:00', 5, '-'),
-        (593, 'Lettuce - Curly Endive', 'lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit', 2.38, 74, '2020-10-14 00:00:00', 4, '-'),
-        (594, 'Black Currants', 'morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus', 17.39, 52, '2021-05-24 00:00:00', 6, '-'),
-        (595, 'Doilies - 5, Paper', 'vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi', 1.06, 86, '2020-07-15 00:00:00', 6, '-'),
-        (596, 'Gelatine Powder', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat', 60.24, 100, '2020-08-11 00:00:00', 6, '-'),
-        (597, 'Noodles - Steamed Chow Mein', 'venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 10.56, 49, '2021-03-02 00:00:00', 5, '-'),
-        (598, 'Yogurt - Raspberry, 175 Gr', 'mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel', 9.79, 35, '2020-09-23 00:00:00', 4, '-'),
-        (599, 'Tarts Assorted', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus', 84.04, 27, '2020-09-04 00:00:00', 4, '-'),
-        (600, 'Icecream - Dstk Super Cone', 'pede lobortis ligula sit amet eleifend pede libero quis orci', 50.84, 96, '2020-11-30 00:00:00', 3, '-'),
-        (601, 'Wine - Rhine Riesling Wolf Blass', 'ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue', 11.87, 17, '2021-04-27 00:00:00', 3, '-'),
-        (602, 'Beans - Fine', 'sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla', 54.25, 84, '2021-01-09 00:00:00', 4, '-'),
-        (603, 'Wine - Cousino Macul Antiguas', 'purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 33.22, 48, '2020-12-12 00:00:00', 4, '-'),
-        (604, 'Appetizer - Sausage Rolls', 'luctus et ultrices posuere cubilia curae mauris viverra diam vitae', 91.63, 13, '2020-06-18 00:00:00', 6, '-'),
-        (605, 'Russian Prince', 'donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam', 72.46, 49, '2020-08-25 00:00:00', 6, '-'),
-        (606, 'Cabbage - Nappa', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae', 74.35, 2, '2021-04-13 00:00:00', 4, '-'),
-        (607, 'Syrup - Monin - Passion Fruit', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 14.17, 55, '2020-06-10 00:00:00', 4, '-'),
-        (608, 'Jack Daniels', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 63.09, 30, '2020-10-25 00:00:00', 4, '-'),
-        (609, 'Beef - Ground, Extra Lean, Fresh', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at', 88.73, 35, '2021-04-12 00:00:00', 6, '-'),
-        (610, 'Icecream - Dstk Cml And Fdg', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien', 78.11, 81, '2020-11-13 00:00:00', 3, '-'),
-        (611, 'Beer - Muskoka Cream Ale', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 95.62, 10, '2021-02-15 00:00:00', 5, '-'),
-        (612, 'Wine - Acient Coast Caberne', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 86.89, 7, '2020-10-04 00:00:00', 6, '-'),
-        (613, 'Shrimp - Baby, Warm Water', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi', 37.16, 33, '2020-07-26 00:00:00', 5, '-'),
-        (614, 'Quiche Assorted', 'sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo in hac', 25.19, 57, '2021-05-03 00:00:00', 6, '-'),
-        (615, 'Appetizer - Sausage Rolls', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 93.60, 94, '2021-04-02 00:00:00', 4, '-'),
-        (616, 'Ecolab - Ster Bac', 'donec semper sapien a libero nam dui proin leo odio porttitor id consequat', 93.16, 79, '2020-12-05 00:00:00', 6, '-'),
-        (617, 'Olives - Black, Pitted', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est', 67.08, 76, '2021-06-04 00:00:00', 3, '-'),
-        (618, 'Napkin - Beverge, White 2 - Ply', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu', 73.73, 36, '2020-11-27 00:00:00', 4, '-'),
-        (619, 'Wine - Charddonnay Errazuriz', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam', 16.29, 33, '2020-09-02 00:00:00', 5, '-'),
-        (620, 'Oil - Safflower', 'orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel', 7.67, 95, '2021-06-08 00:00:00', 4, '-'),
-        (621, 'Bread - Dark Rye', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 65.31, 77, '2021-05-31 00:00:00', 6, '-'),
-        (622, 'Ginger - Ground', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae', 71.12, 14, '2020-07-12 00:00:00', 3, '-'),
-        (623, 'Cucumber - English', 'cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et', 82.68, 68, '2021-01-19 00:00:00', 5, '-'),
-        (624, 'Sterno - Chafing Dish Fuel', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus', 52.77, 48, '2021-01-20 00:00:00', 4, '-'),
-        (625, 'Soup - Knorr, Chicken Noodle', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 50.07, 30, '2021-04-23 00:00:00', 3, '-'),
-        (626, 'Rum - Light, Captain Morgan', 'tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 90.20, 52, '2020-11-17 00:00:00', 5, '-'),
-        (627, 'Wine - Zinfandel California 2002', 'hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum', 55.71, 38, '2020-07-04 00:00:00', 4, '-'),
-        (628, 'Pasta - Linguini, Dry', 'ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus', 78.66, 35, '2020-09-30 00:00:00', 4, '-'),
-        (629, 'Juice Peach Nectar', 'elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 25.05, 66, '2020-06-21 00:00:00', 3, '-'),
-        (630, 'Beef - Roasted, Cooked', 'eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 81.59, 13, '2021-02-13 00:00:00', 4, '-'),
-        (631, 'Icecream Cone - Areo Chocolate', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 82.33, 89, '2020-09-14 00:00:00', 5, '-'),
-        (632, 'Wine - Maipo Valle Cabernet', 'eget nunc donec quis orci eget orci vehicula condimentum curabitur', 16.52, 92, '2020-06-14 00:00:00', 3, '-'),
-        (633, 'Lamb Rack Frenched Australian', 'et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat', 95.50, 12, '2021-01-07 00:00:00', 4, '-'),
-        (634, 'Wine - Spumante Bambino White', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 99.09, 30, '2021-02-06 00:00:00', 5, '-'),
-        (635, 'Sauce - White, Mix', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 90.02, 54, '2021-05-22 00:00:00', 3, '-'),
-        (636, 'Calypso - Black Cherry Lemonade', 'nullam orci pede venenatis non sodales sed tincidunt eu felis fusce', 28.12, 42, '2021-01-12 00:00:00', 5, '-'),
-        (637, 'Flour - Strong Pizza', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor', 10.05, 85, '2021-04-15 00:00:00', 6, '-'),
-        (638, 'Ecolab - Hand Soap Form Antibac', 'nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et', 89.15, 74, '2021-05-31 00:00:00', 4, '-'),
-        (639, 'Nori Sea Weed', 'imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 82.66, 91, '2021-03-05 00:00:00', 6, '-'),
-        (640, 'Bread - Calabrese Baguette', 'ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac', 25.38, 43, '2020-10-03 00:00:00', 5, '-'),
-        (641, 'Tea - Earl Grey', 'nibh ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere', 95.08, 31, '2020-09-13 00:00:00', 3, '-'),
-        (642, 'Capicola - Hot', 'ac est lacinia nisi venenatis tristique fusce congue diam id', 90.60, 55, '2020-06-27 00:00:00', 3, '-'),
-        (643, 'Chinese Foods - Chicken', 'sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis ut', 4.77, 76, '2020-12-19 00:00:00', 6, '-'),
-        (644, 'Bread - French Stick', 'convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus', 94.19, 21, '2021-04-02 00:00:00', 5, '-'),
-        (645, 'Sprouts - Onion', 'nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget', 80.48, 64, '2020-07-06 00:00:00', 5, '-'),
-        (646, 'Pastry - French Mini Assorted', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat', 53.14, 42, '2020-10-31 00:00:00', 6, '-'),
-        (647, 'Star Anise, Whole', 'luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur', 23.01, 78, '2020-06-13 00:00:00', 5, '-'),
-        (648, '7up Diet, 355 Ml', 'tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est', 79.07, 82, '2020-07-16 00:00:00', 5, '-'),
-        (649, 'Rabbit - Saddles', 'cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 93.25, 69, '2021-02-08 00:00:00', 4, '-'),
-        (650, 'Sour Puss - Tangerine', 'cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris', 40.35, 89, '2021-01-11 00:00:00', 6, '-'),
-        (651, 'Potato - Sweet', 'et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 85.45, 82, '2021-02-12 00:00:00', 4, '-'),
-        (652, 'Nantucket - Kiwi Berry Cktl.', 'morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices', 59.74, 98, '2020-09-07 00:00:00', 6, '-'),
-        (653, 'Wine - Ej Gallo Sierra Valley', 'nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis', 28.12, 21, '2021-02-16 00:00:00', 5, '-'),
-        (654, 'Onions - Red Pearl', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien', 2.23, 93, '2021-05-01 00:00:00', 5, '-'),
-        (655, 'Soy Protein', 'in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 94.42, 14, '2020-08-07 00:00:00', 4, '-'),
-        (656, 'Sauce - Marinara', 'enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur', 5.62, 14, '2020-11-06 00:00:00', 4, '-'),
-        (657, 'Salt - Sea', 'justo morbi ut odio cras mi pede malesuada in imperdiet', 25.91, 95, '2020-11-25 00:00:00', 3, '-'),
-        (658, 'Wine - Jafflin Bourgongone', 'erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget', 91.01, 21, '2020-10-09 00:00:00', 4, '-'),
-        (659, 'Hot Choc Vending', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam', 52.05, 76, '2020-09-06 00:00:00', 4, '-'),
-        (660, 'Amaretto', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id', 96.34, 57, '2020-06-19 00:00:00', 4, '-'),
-        (661, 'Garlic - Primerba, Paste', 'pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst morbi', 16.36, 31, '2020-09-19 00:00:00', 4, '-'),
-        (662, 'Ecolab Silver Fusion', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla', 88.79, 83, '2020-08-01 00:00:00', 3, '-'),
-        (663, 'Raisin - Golden', 'nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam', 58.76, 97, '2020-08-25 00:00:00', 5, '-'),
-        (664, 'Lettuce - Sea / Sea Asparagus', 'orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec', 41.73, 8, '2020-09-12 00:00:00', 5, '-'),
-        (665, 'Wine - Red, Gamay Noir', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 6.72, 23, '2020-06-18 00:00:00', 3, '-'),
-        (666, 'Coffee - Decafenated', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula', 21.93, 74, '2020-07-09 00:00:00', 5, '-'),
-        (667, 'Mix - Cocktail Strawberry Daiquiri', 'pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis', 52.74, 53, '2021-06-08 00:00:00', 6, '-'),
-        (668, 'Carbonated Water - Strawberry', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque', 40.86, 44, '2021-05-27 00:00:00', 3, '-'),
-        (669, 'Pepper - Red Bell', 'turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet', 25.64, 41, '2020-07-12 00:00:00', 6, '-'),
-        (670, 'Ham - Black Forest', 'et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 87.40, 56, '2021-05-19 00:00:00', 3, '-'),
-        (671, 'Cakes Assorted', 'et tempus semper est quam pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis', 31.81, 79, '2020-08-03 00:00:00', 5, '-'),
-        (672, 'Wine - Domaine Boyar Royal', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam', 25.10, 31, '2021-05-23 00:00:00', 3, '-'),
-        (673, 'Cheese - Brie,danish', 'elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 91.06, 42, '2020-12-13 00:00:00', 6, '-'),
-        (674, 'Bread - Kimel Stick Poly', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus', 79.45, 60, '2021-02-09 00:00:00', 6, '-'),
-        (675, 'Tomato - Green', 'integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 38.98, 18, '2020-10-01 00:00:00', 4, '-'),
-        (676, 'Extract - Lemon', 'suspendisse potenti in eleifend quam a odio in hac habitasse', 78.16, 5, '2021-05-04 00:00:00', 6, '-'),
-        (677, 'Tea - Orange Pekoe', 'id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 13.80, 5, '2021-04-09 00:00:00', 6, '-'),
-        (678, 'Langers - Mango Nectar', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 75.50, 24, '2020-12-08 00:00:00', 6, '-'),
-        (679, 'Apple - Delicious, Red', 'primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis', 74.54, 58, '2020-06-20 00:00:00', 6, '-'),
-        (680, 'Cleaner - Bleach', 'duis at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam', 59.18, 88, '2021-04-28 00:00:00', 5, '-'),
-        (681, 'Spinach - Packaged', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 24.33, 13, '2021-06-06 00:00:00', 3, '-'),
-        (682, 'Bacardi Breezer - Strawberry', 'in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 37.22, 97, '2021-05-29 00:00:00', 6, '-'),
-        (683, 'Sobe - Green Tea', 'dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce', 52.08, 13, '2020-08-29 00:00:00', 5, '-'),
-        (684, 'Butter - Salted, Micro', 'convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 14.83, 68, '2021-05-04 00:00:00', 6, '-'),
-        (685, 'Spic And Span All Purpose', 'et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor', 5.57, 77, '2021-01-19 00:00:00', 5, '-'),
-        (686, 'Milkettes - 2%', 'vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl', 11.77, 32, '2021-06-06 00:00:00', 6, '-'),
-        (687, 'Quail Eggs - Canned', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque', 72.23, 82, '2020-12-07 00:00:00', 6, '-'),
-        (688, 'Soap - Pine Sol Floor Cleaner', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 97.73, 0, '2021-04-12 00:00:00', 4, '-'),
-        (689, 'Pail - 15l White, With Handle', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 73.84, 49, '2020-08-17 00:00:00', 3, '-'),
-        (690, 'Flounder - Fresh', 'ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam', 47.02, 23, '2020-11-28 00:00:00', 4, '-'),
-        (691, 'Vol Au Vents', 'congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 25.05, 52, '2020-06-11 00:00:00', 3, '-'),
-        (692, 'Tea - Honey Green Tea', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 9.78, 93, '2021-03-28 00:00:00', 3, '-'),
-        (693, 'Nectarines', 'velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat', 53.85, 11, '2021-05-23 00:00:00', 6, '-'),
-        (694, 'Bagels Poppyseed', 'id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 77.76, 52, '2020-07-28 00:00:00', 5, '-'),
-        (695, 'Table Cloth 53x69 White', 'habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 92.17, 67, '2021-01-03 00:00:00', 3, '-'),
-        (696, 'Wine - Balbach Riverside', 'purus phasellus in felis donec semper sapien a libero nam dui proin', 45.95, 47, '2020-10-24 00:00:00', 4, '-'),
-        (697, 'Bread Country Roll', 'nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula', 48.85, 46, '2020-07-07 00:00:00', 3, '-'),
-        (698, 'Wine - Tio Pepe Sherry Fino', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 58.48, 75, '2020-11-02 00:00:00', 5, '-'),
-        (699, 'Curry Paste - Madras', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 50.49, 14, '2020-07-15 00:00:00', 6, '-'),
-        (700, 'Lime Cordial - Roses', 'ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit', 4.09, 98, '2020-07-20 00:00:00', 5, '-'),
-        (701, 'Fish - Halibut, Cold Smoked', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 4.66, 44, '2020-11-18 00:00:00', 4, '-'),
-        (702, 'Veal - Ground', 'ut nunc vestibulum ante ipsum primis in faucibus orci luctus et', 61.72, 36, '2020-09-10 00:00:00', 5, '-'),
-        (703, 'Marsala - Sperone, Fine, D.o.c.', 'viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 75.52, 94, '2020-11-26 00:00:00', 3, '-'),
-        (704, 'Tabasco Sauce, 2 Oz', 'praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 47.85, 76, '2020-12-17 00:00:00', 3, '-'),
-        (705, 'Uniform Linen Charge', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue', 53.02, 4, '2020-09-14 00:00:00', 5, '-'),
-        (706, 'Soup - Campbells Beef Noodle', 'pellentesque ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla', 28.68, 41, '2020-08-26 00:00:00', 4, '-'),
-        (707, 'Salmon - Atlantic, No Skin', 'metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean', 23.02, 44, '2020-11-26 00:00:00', 3, '-'),
-        (708, 'Rice - Jasmine Sented', 'dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh', 5.20, 58, '2020-09-15 00:00:00', 6, '-'),
-        (709, 'Wine La Vielle Ferme Cote Du', 'rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 23.11, 28, '2020-11-02 00:00:00', 6, '-'),
-        (710, 'Juice - Apple, 341 Ml', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis', 73.52, 35, '2020-07-18 00:00:00', 4, '-'),
-        (711, 'Lemon Balm - Fresh', 'pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 66.85, 68, '2020-09-04 00:00:00', 6, '-'),
-        (712, 'Garlic - Primerba, Paste', 'sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 22.25, 89, '2020-07-08 00:00:00', 5, '-'),
-        (713, 'Chocolate - Milk, Callets', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel', 15.33, 75, '2020-07-17 00:00:00', 6, '-'),
-        (714, 'Dill Weed - Dry', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae', 32.07, 72, '2021-01-26 00:00:00', 3, '-'),
-        (715, 'Beef - Montreal Smoked Brisket', 'elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 68.72, 7, '2020-11-05 00:00:00', 5, '-'),
-        (716, 'Vaccum Bag - 14x20', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus', 41.39, 17, '2021-04-13 00:00:00', 6, '-'),
-        (717, 'Soap - Mr.clean Floor Soap', 'lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 98.67, 4, '2020-07-29 00:00:00', 6, '-'),
-        (718, 'Sauce - Apple, Unsweetened', 'mauris vulputate elementum nullam varius nulla facilisi cras non velit', 35.30, 12, '2020-12-27 00:00:00', 4, '-'),
-        (719, 'Crush - Grape, 355 Ml', 'nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac', 2.04, 49, '2020-12-14 00:00:00', 4, '-'),
-        (720, 'Cornstarch', 'vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum', 58.32, 4, '2020-08-26 00:00:00', 3, '-'),
-        (721, 'Dip - Tapenade', 'platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at', 81.86, 91, '2021-02-22 00:00:00', 6, '-'),
-        (722, 'Chicken - Livers', 'in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus', 19.45, 44, '2021-03-26 00:00:00', 4, '-'),
-        (723, 'Wine - Casillero Deldiablo', 'quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus', 30.36, 17, '2021-04-06 00:00:00', 4, '-'),
-        (724, 'Lambcasing', 'pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet', 55.42, 76, '2020-10-27 00:00:00', 6, '-'),
-        (725, 'Salmon Steak - Cohoe 8 Oz', 'sapien a libero nam dui proin leo odio porttitor id consequat in', 38.96, 21, '2020-09-10 00:00:00', 6, '-'),
-        (726, 'Cheese - Fontina', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia', 22.05, 85, '2021-03-25 00:00:00', 4, '-'),
-        (727, 'Pails With Lids', 'nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec', 3.75, 52, '2020-10-04 00:00:00', 5, '-'),
-        (728, 'Pork - Smoked Kassler', 'duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl duis', 30.41, 4, '2021-01-18 00:00:00', 3, '-'),
-        (729, 'Juice - Cranberry, 341 Ml', 'in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non', 3.74, 48, '2020-12-19 00:00:00', 5, '-'),
-        (730, 'Lettuce - Red Leaf', 'sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 62.54, 39, '2021-02-25 00:00:00', 4, '-'),
-        (731, 'Garbag Bags - Black', 'convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum', 10.00, 83, '2020-12-30 00:00:00', 3, '-'),
-        (732, 'Mustard - Individual Pkg', 'dui proin leo odio porttitor id consequat in consequat ut nulla sed', 39.85, 82, '2020-08-09 00:00:00', 6, '-'),
-        (733, 'Wine - White, Gewurtzraminer', 'sapien non mi integer ac neque duis bibendum morbi non quam', 20.81, 38, '2020-09-15 00:00:00', 4, '-'),
-        (734, 'Tea - Black Currant', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 87.59, 82, '2021-03-25 00:00:00', 5, '-'),
-        (735, 'Chicken - Whole Fryers', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 92.72, 44, '2020-08-23 00:00:00', 6, '-'),
-        (736, 'Iced Tea - Lemon, 460 Ml', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum', 10.87, 93, '2020-11-11 00:00:00', 6, '-'),
-        (737, 'Anchovy Paste - 56 G Tube', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed', 91.27, 73, '2021-03-02 00:00:00', 6, '-'),
-        (738, 'Spice - Chili Powder Mexican', 'nulla eget eros elementum pellentesque quisque porta volutpat erat quisque', 81.19, 46, '2021-01-15 00:00:00', 5, '-'),
-        (739, 'Milk - Buttermilk', 'ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu', 51.96, 46, '2020-07-09 00:00:00', 4, '-'),
-        (740, 'Teriyaki Sauce', 'in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem', 74.90, 6, '2021-01-19 00:00:00', 6, '-'),
-        (741, 'Mcgillicuddy Vanilla Schnap', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed', 6.59, 8, '2021-04-25 00:00:00', 6, '-'),
-        (742, 'Syrup - Monin - Blue Curacao', 'elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel nulla', 4.21, 0, '2020-10-24 00:00:00', 5, '-'),
-        (743, 'Bagels Poppyseed', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 41.27, 46, '2020-07-05 00:00:00', 6, '-'),
-        (744, 'Bread - Focaccia Quarter', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut', 97.63, 63, '2020-10-21 00:00:00', 5, '-'),
-        (745, 'Quinoa', 'consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla', 98.74, 75, '2020-06-20 00:00:00', 4, '-'),
-        (746, 'Eggplant - Regular', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo', 17.56, 26, '2020-12-02 00:00:00', 6, '-'),
-        (747, 'Bagels Poppyseed', 'sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 53.78, 22, '2020-08-26 00:00:00', 6, '-'),
-        (748, 'Bread - Hamburger Buns', 'ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae', 23.54, 93, '2020-09-13 00:00:00', 6, '-'),
-        (749, 'Bread - Roll, Calabrese', 'ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros', 85.75, 49, '2021-04-09 00:00:00', 5, '-'),
-        (750, 'Apricots - Dried', 'ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis', 38.67, 81, '2021-02-06 00:00:00', 3, '-'),
-        (751, 'Tea - Mint', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 24.54, 17, '2020-12-27 00:00:00', 3, '-'),
-        (752, 'Beef - Shank', 'ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies', 34.42, 24, '2021-04-20 00:00:00', 4, '-'),
-        (753, 'Soup - Beef, Base Mix', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 42.17, 81, '2020-11-25 00:00:00', 4, '-'),
-        (754, 'Horseradish - Prepared', 'at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id', 58.71, 3, '2020-07-23 00:00:00', 5, '-'),
-        (755, 'Snapple Raspberry Tea', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut', 53.58, 53, '2020-12-12 00:00:00', 5, '-'),
-        (756, 'Pastry - Apple Muffins - Mini', 'sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis', 39.85, 93, '2021-05-06 00:00:00', 3, '-'),
-        (757, 'Cheese - Cheddar, Old White', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis', 89.36, 78, '2020-08-03 00:00:00', 6, '-'),
-        (758, 'Syrup - Monin - Granny Smith', 'id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit', 8.14, 3, '2020-10-04 00:00:00', 5, '-'),
-        (759, 'Cinnamon Rolls', 'tortor duis mattis egestas metus aenean fermentum donec ut mauris', 62.92, 78, '2021-02-19 00:00:00', 4, '-'),
-        (760, 'Sparkling Wine - Rose, Freixenet', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 67.78, 32, '2020-06-25 00:00:00', 5, '-'),
-        (761, 'Sultanas', 'erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit', 7.33, 1, '2020-10-26 00:00:00', 6, '-'),
-        (762, 'Pepper - Green', 'in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus', 97.54, 5, '2021-04-24 00:00:00', 3, '-'),
-        (763, 'Cheese - Ricotta', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet', 25.22, 35, '2021-01-27 00:00:00', 4, '-'),
-        (764, 'Hot Choc Vending', 'et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium', 82.25, 74, '2021-06-01 00:00:00', 6, '-'),
-        (765, 'Tomato - Tricolor Cherry', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus', 21.61, 34, '2020-11-17 00:00:00', 3, '-'),
-        (766, 'Cookie Double Choco', 'leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 72.75, 90, '2021-05-26 00:00:00', 4, '-'),
-        (767, 'Frangelico', 'orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus', 59.70, 81, '2021-05-18 00:00:00', 4, '-'),
-        (768, 'Wine - Muscadet Sur Lie', 'turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam', 22.25, 89, '2020-07-21 00:00:00', 5, '-'),
-        (769, 'Steel Wool', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh', 20.32, 55, '2021-01-27 00:00:00', 5, '-'),
-        (770, 'Olives - Morracan Dired', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 32.72, 10, '2021-02-28 00:00:00', 4, '-'),
-        (771, 'Tomato Puree', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 55.37, 37, '2020-10-27 00:00:00', 3, '-'),
-        (772, 'Sobe - Orange Carrot', 'sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 84.76, 80, '2021-01-08 00:00:00', 5, '-'),
-        (773, 'Beef Wellington', 'amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam nec', 20.72, 18, '2020-08-09 00:00:00', 4, '-'),
-        (774, 'Table Cloth 90x90 Colour', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 70.40, 12, '2021-01-13 00:00:00', 3, '-'),
-        (775, 'Flour - Semolina', 'fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 40.01, 63, '2020-12-07 00:00:00', 6, '-'),
-        (776, 'Sobe - Berry Energy', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi', 14.85, 70, '2021-01-10 00:00:00', 4, '-'),
-        (777, 'Mcguinness - Blue Curacao', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque', 94.68, 60, '2020-06-13 00:00:00', 4, '-'),
-        (778, 'Bag Stand', 'nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 63.02, 22, '2021-01-18 00:00:00', 4, '-'),
-        (779, 'Waffle Stix', 'vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor', 88.15, 18, '2020-12-13 00:00:00', 3, '-'),
-        (780, 'Bread - Frozen Basket Variety', 'nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 89.47, 2, '2020-12-25 00:00:00', 6, '-'),
-        (781, 'Wine - Shiraz South Eastern', 'sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque', 62.23, 47, '2021-01-16 00:00:00', 6, '-'),
-        (782, 'Wine - Jaboulet Cotes Du Rhone', 'eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at', 84.37, 43, '2021-06-07 00:00:00', 5, '-'),
-        (783, 'Bandage - Finger Cots', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices', 28.05, 64, '2021-03-20 00:00:00', 4, '-'),
-        (784, 'Bread Ww Cluster', 'nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 24.96, 71, '2020-11-28 00:00:00', 5, '-'),
-        (785, 'Sauce - Plum', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 4.87, 26, '2020-10-15 00:00:00', 5, '-'),
-        (786, 'Salmon - Atlantic, Skin On', 'quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in', 40.60, 57, '2020-11-03 00:00:00', 4, '-'),
-        (787, 'Tea - Decaf Lipton', 'in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem', 99.45, 87, '2020-11-30 00:00:00', 5, '-'),
-        (788, 'Cake - Cake Sheet Macaroon', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 25.66, 63, '2021-05-25 00:00:00', 6, '-'),
-        (789, 'Wine - Magnotta, Merlot Sr Vqa', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 95.54, 61, '2021-04-21 00:00:00', 4, '-'),
-        (790, 'Apples - Spartan', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio', 40.39, 47, '2020-09-02 00:00:00', 6, '-'),
-        (791, 'Pie Box - Cello Window 2.5', 'donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac', 84.34, 68, '2020-09-12 00:00:00', 3, '-'),
-        (792, 'Spice - Peppercorn Melange', 'at turpis a pede posuere nonummy integer non velit donec', 63.42, 53, '2021-04-23 00:00:00', 6, '-'),
-        (793, 'Cherries - Bing, Canned', 'nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 7.50, 74, '2021-05-20 00:00:00', 6, '-'),
-        (794, 'Bread - English Muffin', 'platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis', 20.67, 70, '2020-09-26 00:00:00', 6, '-'),
-        (795, 'Trueblue - Blueberry', 'cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor', 93.86, 81, '2021-04-24 00:00:00', 3, '-'),
-        (796, 'Longos - Penne With Pesto', 'turpis integer aliquet massa id lobortis convallis tortor risus dapibus', 95.72, 53, '2020-10-24 00:00:00', 5, '-'),
-        (797, 'Lamb - Loin, Trimmed, Boneless', 'eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 38.98, 97, '2020-09-04 00:00:00', 6, '-'),
-        (798, 'Wine - Rioja Campo Viejo', 'nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi', 95.76, 84, '2021-02-17 00:00:00', 3, '-'),
-        (799, 'Loquat', 'eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 26.98, 66, '2020-09-15 00:00:00', 3, '-'),
-        (800, 'Hold Up Tool Storage Rack', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in', 4.35, 89, '2020-10-28 00:00:00', 3, '-'),
-        (801, 'Parsley - Dried', 'morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar', 4.62, 61, '2020-07-25 00:00:00', 4, '-'),
-        (802, 'Plasticforkblack', 'nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed', 50.81, 58, '2020-12-23 00:00:00', 6, '-'),
-        (803, 'Potato - Sweet', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 63.85, 59, '2020-12-09 00:00:00', 4, '-'),
-        (804, 'Coffee - Cafe Moreno', 'ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 15.59, 91, '2021-01-02 00:00:00', 6, '-'),
-        (805, 'Wine - Red, Colio Cabernet', 'lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium', 96.99, 59, '2021-03-23 00:00:00', 3, '-'),
-        (806, 'Ostrich - Fan Fillet', 'orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio', 60.59, 23, '2020-11-23 00:00:00', 4, '-'),
-        (807, 'Green Tea Refresher', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec vitae', 57.25, 90, '2021-05-04 00:00:00', 3, '-'),
-        (808, 'Flour - Rye', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor', 88.01, 18, '2021-02-03 00:00:00', 6, '-'),
-        (809, 'Sugar Thermometer', 'eu orci mauris lacinia sapien quis libero nullam sit amet', 97.85, 81, '2020-09-11 00:00:00', 6, '-'),
-        (810, 'Wine - Tio Pepe Sherry Fino', 'molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget', 47.11, 67, '2021-02-20 00:00:00', 3, '-'),
-        (811, 'Cassis', 'ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et', 94.98, 96, '2021-01-17 00:00:00', 3, '-'),
-        (812, 'Ice Cream - Super Sandwich', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien', 15.08, 84, '2021-01-19 00:00:00', 6, '-'),
-        (813, 'Sauce - Salsa', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 88.19, 73, '2021-05-26 00:00:00', 3, '-'),
-        (814, 'Jerusalem Artichoke', 'faucibus cursus urna ut tellus nulla ut erat id mauris vulputate', 60.16, 87, '2021-03-05 00:00:00', 3, '-'),
-        (815, 'Juice - Prune', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus', 70.29, 45, '2020-06-22 00:00:00', 6, '-'),
-        (816, 'Lamb - Sausage Casings', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 52.51, 89, '2020-09-05 00:00:00', 5, '-'),
-        (817, 'Cleaner - Lime Away', 'nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse', 24.67, 39, '2021-02-14 00:00:00', 4, '-'),
-        (818, 'Flour Dark Rye', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed', 99.45, 93, '2020-08-20 00:00:00', 4, '-'),
-        (819, 'Chef Hat 20cm', 'justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus', 53.60, 55, '2021-01-16 00:00:00', 3, '-'),
-        (820, 'Pork - Sausage, Medium', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus', 56.86, 26, '2021-02-25 00:00:00', 4, '-'),
-        (821, 'Iced Tea - Lemon, 460 Ml', 'tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 3.29, 68, '2021-03-20 00:00:00', 5, '-'),
-        (822, 'Lobak', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia', 82.45, 27, '2021-01-28 00:00:00', 5, '-'),
-        (823, 'Juice - Apple, 500 Ml', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce', 47.96, 50, '2021-04-02 00:00:00', 3, '-'),
-        (824, 'Cheese - La Sauvagine', 'amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 76.15, 61, '2021-01-17 00:00:00', 4, '-'),
-        (825, 'Plasticknivesblack', 'nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio', 46.41, 62, '2020-07-28 00:00:00', 5, '-'),
-        (826, 'Broom - Push', 'morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra', 65.92, 65, '2020-10-29 00:00:00', 3, '-'),
-        (827, 'Cookies - Assorted', 'diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus', 2.58, 66, '2020-06-30 00:00:00', 6, '-'),
-        (828, 'Shrimp - 150 - 250', 'sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus', 72.34, 29, '2021-04-27 00:00:00', 5, '-'),
-        (829, 'Toamtoes 6x7 Select', 'est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 74.25, 44, '2020-11-05 00:00:00', 6, '-'),
-        (830, 'Duck - Breast', 'consequat ut nulla sed accumsan felis ut at dolor quis odio', 93.37, 100, '2020-10-04 00:00:00', 5, '-'),
-        (831, 'Spice - Chili Powder Mexican', 'sapien a libero nam dui proin leo odio porttitor id', 7.24, 68, '2020-07-25 00:00:00', 3, '-'),
-        (832, 'Mushroom - Chanterelle Frozen', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 9.80, 27, '2020-10-01 00:00:00', 5, '-'),
-        (833, 'Wine - Red, Gallo, Merlot', 'pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus', 49.76, 31, '2021-05-31 00:00:00', 6, '-'),
-        (834, 'Wine - Puligny Montrachet A.', 'nulla ut erat id mauris vulputate elementum nullam varius nulla', 88.48, 10, '2020-11-18 00:00:00', 3, '-'),
-        (835, 'Sole - Dover, Whole, Fresh', 'in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti', 54.55, 42, '2020-07-22 00:00:00', 5, '-'),
-        (836, 'Pork Ham Prager', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit', 35.20, 15, '2021-02-16 00:00:00', 6, '-'),
-        (837, 'Beef - Sushi Flat Iron Steak', 'pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat metus sapien ut nunc', 24.61, 9, '2020-12-17 00:00:00', 6, '-'),
-        (838, 'General Purpose Trigger', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus', 57.76, 89, '2020-07-24 00:00:00', 4, '-'),
-        (839, 'Chicken - White Meat With Tender', 'tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 43.96, 64, '2020-11-13 00:00:00', 6, '-'),
-        (840, 'Veal - Osso Bucco', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 47.20, 48, '2020-11-23 00:00:00', 4, '-'),
-        (841, 'Soup - Beef Conomme, Dry', 'lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam', 81.56, 86, '2020-07-17 00:00:00', 5, '-'),
-        (842, 'Aromat Spice / Seasoning', 'nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus', 53.24, 43, '2021-01-16 00:00:00', 5, '-'),
-        (843, 'Veal - Loin', 'fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis', 15.52, 66, '2021-04-07 00:00:00', 3, '-'),
-        (844, 'Beef - Cooked, Corned', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt', 62.21, 56, '2021-04-29 00:00:00', 5, '-'),
-        (845, 'Crawfish', 'malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet', 8.68, 26, '2020-09-06 00:00:00', 6, '-'),
-        (846, 'Pastry - Mini French Pastries', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi', 30.74, 66, '2021-01-12 00:00:00', 3, '-'),
-        (847, 'Food Colouring - Green', 'quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse', 64.27, 12, '2020-12-22 00:00:00', 3, '-'),
-        (848, 'Chicken - Breast, 5 - 7 Oz', 'vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 32.82, 72, '2021-03-25 00:00:00', 6, '-'),
-        (849, 'Brownies - Two Bite, Chocolate', 'ultrices libero non mattis pulvinar nulla pede ullamcorper augue a', 69.04, 69, '2021-05-03 00:00:00', 6, '-'),
-        (850, 'Peppercorns - Green', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet', 59.43, 11, '2020-07-11 00:00:00', 6, '-'),
-        (851, 'Beef Dry Aged Tenderloin Aaa', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui', 55.63, 31, '2020-11-26 00:00:00', 5, '-'),
-        (852, 'Soup - Cream Of Potato / Leek', 'ut nulla sed accumsan felis ut at dolor quis odio consequat varius integer ac leo', 4.49, 52, '2020-10-27 00:00:00', 4, '-'),
-        (853, 'Corn - On The Cob', 'ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque', 98.90, 51, '2020-09-02 00:00:00', 4, '-'),
-        (854, 'Cream - 18%', 'integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor', 37.33, 74, '2021-05-03 00:00:00', 5, '-'),
-        (855, 'Lobster - Cooked', 'interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 9.93, 91, '2021-04-03 00:00:00', 6, '-'),
-        (856, 'Pork - Hock And Feet Attached', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id', 47.68, 26, '2021-06-07 00:00:00', 3, '-'),
-        (857, 'Wine - Red, Marechal Foch', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 78.94, 77, '2021-04-02 00:00:00', 3, '-'),
-        (858, 'Salmon Steak - Cohoe 8 Oz', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a', 3.38, 98, '2021-05-23 00:00:00', 6, '-'),
-        (859, 'Salmon Steak - Cohoe 8 Oz', 'mi in porttitor pede justo eu massa donec dapibus duis at', 61.72, 11, '2021-03-24 00:00:00', 4, '-'),
-        (860, 'Onions - Vidalia', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas', 7.96, 24, '2020-07-21 00:00:00', 6, '-'),
-        (861, 'Cheese - Brick With Onion', 'eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis', 83.98, 12, '2020-08-29 00:00:00', 3, '-'),
-        (862, 'Juice - Apple, 500 Ml', 'ligula in lacus curabitur at ipsum ac tellus semper interdum', 91.83, 41, '2020-06-20 00:00:00', 6, '-'),
-        (863, 'Coffee Cup 12oz 5342cd', 'mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam tristique', 91.88, 60, '2021-04-28 00:00:00', 6, '-'),
-        (864, 'Appetizer - Crab And Brie', 'metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 77.29, 94, '2021-04-30 00:00:00', 5, '-'),
-        (865, 'Heavy Duty Dust Pan', 'ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec', 97.70, 6, '2020-07-25 00:00:00', 6, '-'),
-        (866, 'Devonshire Cream', 'mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis', 28.21, 6, '2021-01-04 00:00:00', 4, '-'),
-        (867, 'Soup - Chicken And Wild Rice', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo', 36.20, 74, '2020-07-29 00:00:00', 5, '-'),
-        (868, 'Lamb - Ground', 'nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 67.34, 34, '2021-05-09 00:00:00', 5, '-'),
-        (869, 'Nut - Walnut, Pieces', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante', 90.88, 63, '2021-02-24 00:00:00', 4, '-'),
-        (870, 'Pail With Metal Handle 16l White', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus semper', 67.41, 96, '2020-10-12 00:00:00', 4, '-'),
-        (871, 'Cheese - Stilton', 'porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis', 54.74, 84, '2021-05-24 00:00:00', 3, '-'),
-        (872, 'Edible Flower - Mixed', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat', 17.58, 50, '2020-12-08 00:00:00', 3, '-'),
-        (873, 'Vinegar - Rice', 'volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus', 13.34, 60, '2021-01-25 00:00:00', 4, '-'),
-        (874, 'Jameson - Irish Whiskey', 'ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor', 70.75, 42, '2021-04-23 00:00:00', 4, '-'),
-        (875, 'Milk - Condensed', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy', 72.56, 57, '2020-06-30 00:00:00', 3, '-'),
-        (876, 'Coffee - Beans, Whole', 'cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 38.07, 31, '2021-05-06 00:00:00', 5, '-'),
-        (877, 'Tea - Honey Green Tea', 'hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget', 34.94, 59, '2020-07-15 00:00:00', 4, '-'),
-        (878, 'Mountain Dew', 'sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce', 72.29, 78, '2020-06-18 00:00:00', 3, '-'),
-        (879, 'Dehydrated Kelp Kombo', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl', 19.22, 42, '2020-11-24 00:00:00', 4, '-'),
-        (880, 'Ham - Cooked Italian', 'porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam', 69.17, 36, '2020-09-03 00:00:00', 4, '-'),
-        (881, 'Pasta - Penne, Rigate, Dry', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 68.17, 14, '2020-07-24 00:00:00', 3, '-'),
-        (882, 'Vinegar - White Wine', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam', 1.41, 95, '2021-01-02 00:00:00', 4, '-'),
-        (883, 'Chicken - Leg / Back Attach', 'sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 62.32, 8, '2020-12-06 00:00:00', 3, '-'),
-        (884, 'Dc Hikiage Hira Huba', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis', 86.10, 88, '2020-12-31 00:00:00', 3, '-'),
-        (885, 'Beets', 'morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est', 4.77, 79, '2020-09-19 00:00:00', 5, '-'),
-        (886, 'Cinnamon Buns Sticky', 'neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan', 84.08, 81, '2020-09-06 00:00:00', 4, '-'),
-        (887, 'Bagels Poppyseed', 'massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo', 24.20, 32, '2021-03-19 00:00:00', 6, '-'),
-        (888, 'Pork - Loin, Boneless', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam', 30.54, 31, '2021-01-31 00:00:00', 3, '-'),
-        (889, 'Broom And Broom Rack White', 'aenean fermentum donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque', 65.63, 63, '2020-07-16 00:00:00', 5, '-'),
-        (890, 'Filo Dough', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 29.75, 8, '2021-01-31 00:00:00', 4, '-'),
-        (891, 'Mushroom - Morels, Dry', 'tellus nulla ut erat id mauris vulputate elementum nullam varius', 93.01, 99, '2021-05-05 00:00:00', 5, '-'),
-        (892, 'Milkettes - 2%', 'ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt', 39.56, 27, '2021-01-25 00:00:00', 6, '-'),
-        (893, 'Flour - Buckwheat, Dark', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 63.49, 73, '2021-02-23 00:00:00', 5, '-'),
-        (894, 'Lemonade - Island Tea, 591 Ml', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan', 87.53, 17, '2020-07-29 00:00:00', 5, '-'),
-        (895, 'Cup - 8oz Coffee Perforated', 'integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 4.99, 51, '2021-03-24 00:00:00', 5, '-'),
-        (896, 'Wine - Periguita Fonseca', 'in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla', 28.30, 60, '2021-01-09 00:00:00', 5, '-'),
-        (897, 'Sour Puss - Tangerine', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue', 2.28, 23, '2021-03-14 00:00:00', 4, '-'),
-        (898, 'Pie Shells 10', 'dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed', 93.69, 5, '2020-07-03 00:00:00', 4, '-'),
-        (899, 'Steampan Lid', 'accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi', 74.10, 70, '2020-09-23 00:00:00', 6, '-'),
-        (900, 'Flower - Leather Leaf Fern', 'elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est', 74.87, 40, '2020-11-21 00:00:00', 4, '-'),
-        (901, 'Tea - Grapefruit Green Tea', 'mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 55.42, 40, '2021-03-10 00:00:00', 5, '-'),
-        (902, 'Nacho Chips', 'pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 8.37, 22, '2020-12-20 00:00:00', 5, '-'),
-        (903, 'Apples - Spartan', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 45.92, 93, '2021-02-24 00:00:00', 3, '-'),
-        (904, 'Salami - Genova', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 13.74, 97, '2020-07-16 00:00:00', 4, '-'),
-        (905, 'Absolut Citron', 'dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et eros', 88.20, 32, '2020-10-23 00:00:00', 4, '-'),
-        (906, 'Lumpfish Black', 'tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo', 56.77, 62, '2020-07-17 00:00:00', 5, '-'),
-        (907, 'Lamb - Whole, Frozen', 'duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit', 16.64, 39, '2020-11-10 00:00:00', 5, '-'),
-        (908, 'Soup - Campbells', 'sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis', 58.28, 78, '2020-12-13 00:00:00', 4, '-'),
-        (909, 'Bread - Mini Hamburger Bun', 'eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique', 3.98, 56, '2021-05-10 00:00:00', 4, '-'),
-        (910, 'Beef - Top Butt Aaa', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi', 70.60, 93, '2020-10-23 00:00:00', 5, '-'),
-        (911, 'The Pop Shoppe - Root Beer', 'vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 81.50, 97, '2020-11-28 00:00:00', 3, '-'),
-        (912, 'Wine - Niagara Peninsula Vqa', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper', 77.05, 87, '2021-03-31 00:00:00', 6, '-'),
-        (913, 'Wine - Red, Mouton Cadet', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy', 16.96, 32, '2020-12-05 00:00:00', 5, '-'),
-        (914, 'Longos - Chicken Cordon Bleu', 'interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat', 64.01, 90, '2020-06-21 00:00:00', 4, '-'),
-        (915, 'Lamb - Ground', 'metus aenean fermentum donec ut mauris eget massa tempor convallis nulla', 73.04, 92, '2020-11-07 00:00:00', 3, '-'),
-        (916, 'Sour Puss Sour Apple', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros', 59.71, 1, '2021-05-21 00:00:00', 4, '-'),
-        (917, 'Gingerale - Diet - Schweppes', 'enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 80.01, 96, '2020-12-21 00:00:00', 4, '-'),
-        (918, 'Soup - Base Broth Chix', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus', 1.82, 45, '2020-08-03 00:00:00', 4, '-'),
-        (919, 'Bread - French Stick', 'mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 62.49, 73, '2020-09-18 00:00:00', 4, '-'),
-        (920, 'Turnip - White, Organic', 'nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta', 43.91, 63, '2021-05-30 00:00:00', 5, '-'),
-        (921, 'Flour - Semolina', 'accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 25.44, 16, '2020-12-17 00:00:00', 5, '-'),
-        (922, 'Snapple Lemon Tea', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus', 92.30, 49, '2020-12-06 00:00:00', 6, '-'),
-        (923, 'Chocolate - Semi Sweet', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 93.91, 46, '2020-11-12 00:00:00', 3, '-'),
-        (924, 'Apple - Fuji', 'ut tellus nulla ut erat id mauris vulputate elementum nullam varius', 82.27, 22, '2020-12-08 00:00:00', 6, '-'),
-        (925, 'Oil - Grapeseed Oil', 'luctus et ultrices posuere cubilia curae duis faucibus accumsan odio', 11.68, 87, '2020-09-05 00:00:00', 5, '-'),
-        (926, 'Ham - Cooked', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum', 57.01, 16, '2021-02-10 00:00:00', 4, '-'),
-        (927, 'Blackberries', 'aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi', 22.24, 17, '2020-07-21 00:00:00', 4, '-'),
-        (928, 'Onions - Spanish', 'tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla neque', 99.83, 15, '2021-06-09 00:00:00', 3, '-'),
-        (929, 'Wheat - Soft Kernal Of Wheat', 'non velit donec diam neque vestibulum eget vulputate ut ultrices vel', 38.36, 28, '2020-08-18 00:00:00', 5, '-'),
-        (930, 'Tandoori Curry Paste', 'sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum', 15.51, 7, '2021-04-03 00:00:00', 4, '-'),
-        (931, 'Ice Cream Bar - Oreo Sandwich', 'eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 29.51, 43, '2020-09-09 00:00:00', 4, '-'),
-        (932, 'Instant Coffee', 'adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus', 67.65, 26, '2021-03-16 00:00:00', 4, '-'),
-        (933, 'Yogurt - Blueberry, 175 Gr', 'tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet', 93.57, 8, '2020-09-07 00:00:00', 5, '-'),
-        (934, 'Juice - Orange 1.89l', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla', 24.33, 63, '2020-07-20 00:00:00', 4, '-'),
-        (935, 'Clams - Littleneck, Whole', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 80.37, 45, '2020-08-19 00:00:00', 4, '-'),
-        (936, 'Chicken - Whole Fryers', 'ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam', 59.14, 59, '2021-01-09 00:00:00', 3, '-'),
-        (937, 'Tart - Lemon', 'sem fusce consequat nulla nisl nunc nisl duis bibendum felis', 56.34, 88, '2020-10-06 00:00:00', 6, '-'),
-        (938, 'Pesto - Primerba, Paste', 'lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat', 85.67, 27, '2021-01-16 00:00:00', 6, '-'),
-        (939, 'Apple - Granny Smith', 'convallis nunc proin at turpis a pede posuere nonummy integer non', 77.92, 68, '2020-09-30 00:00:00', 4, '-'),
-        (940, 'Cranberries - Dry', 'pellentesque volutpat dui maecenas tristique est et tempus semper est', 50.45, 87, '2020-08-14 00:00:00', 5, '-'),
-        (941, 'Sponge Cake Mix - Chocolate', 'eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 72.18, 84, '2021-03-04 00:00:00', 5, '-'),
-        (942, 'Daikon Radish', 'a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis', 12.90, 47, '2021-05-30 00:00:00', 6, '-'),
-        (943, 'Bread - Roll, Whole Wheat', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum', 85.47, 95, '2020-09-05 00:00:00', 6, '-'),
-        (944, 'Wine - White, French Cross', 'convallis nulla neque libero convallis eget eleifend luctus ultricies eu', 19.88, 88, '2021-01-06 00:00:00', 3, '-'),
-        (945, 'Numi - Assorted Teas', 'hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc', 29.59, 7, '2020-12-22 00:00:00', 3, '-'),
-        (946, 'Longos - Chicken Cordon Bleu', 'vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc', 46.23, 46, '2021-05-26 00:00:00', 5, '-'),
-        (947, 'Spice - Pepper Portions', 'nunc proin at turpis a pede posuere nonummy integer non', 7.48, 100, '2020-08-29 00:00:00', 4, '-'),
-        (948, 'Pastry - Cheese Baked Scones', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 48.37, 3, '2020-08-19 00:00:00', 3, '-'),
-        (949, 'Sprouts - Pea', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 76.76, 82, '2021-02-02 00:00:00', 3, '-'),
-        (950, 'Yoghurt Tubes', 'sapien sapien non mi integer ac neque duis bibendum morbi non', 97.98, 34, '2020-10-01 00:00:00', 4, '-'),
-        (951, 'Ginger - Pickled', 'cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 49.31, 56, '2020-06-28 00:00:00', 4, '-'),
-        (952, 'Salmon Steak - Cohoe 6 Oz', 'vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam', 16.26, 35, '2020-06-18 00:00:00', 3, '-'),
-        (953, 'Loaf Pan - 2 Lb, Foil', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 31.72, 85, '2020-08-29 00:00:00', 5, '-'),
-        (954, 'Pastry - Choclate Baked', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue', 64.81, 65, '2021-02-08 00:00:00', 3, '-'),
-        (955, 'Mustard - Seed', 'pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices', 21.70, 7, '2021-03-09 00:00:00', 4, '-'),
-        (956, 'Mushroom - Enoki, Fresh', 'curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend', 94.14, 36, '2021-06-03 00:00:00', 6, '-'),
-        (957, 'Coffee - Colombian, Portioned', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh', 30.80, 88, '2020-11-29 00:00:00', 4, '-'),
-        (958, 'Juice - Ocean Spray Cranberry', 'pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc', 33.25, 93, '2020-06-14 00:00:00', 6, '-'),
-        (959, 'Tomato Puree', 'quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris', 87.22, 46, '2020-07-29 00:00:00', 4, '-'),
-        (960, 'Wine - Rosso Del Veronese Igt', 'elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 78.05, 45, '2021-05-28 00:00:00', 3, '-'),
-        (961, 'Wine - Fume Blanc Fetzer', 'aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac', 1.16, 46, '2020-10-25 00:00:00', 4, '-'),
-        (962, 'Goldschalger', 'erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam', 37.26, 91, '2021-03-16 00:00:00', 4, '-'),
-        (963, 'Wine - Manischewitz Concord', 'id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 48.87, 53, '2021-04-20 00:00:00', 4, '-'),
-        (964, 'Beets - Golden', 'integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas', 42.69, 72, '2020-09-11 00:00:00', 5, '-'),
-        (965, 'Oysters - Smoked', 'sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean', 41.69, 0, '2021-04-29 00:00:00', 3, '-'),
-        (966, 'Salmon Atl.whole 8 - 10 Lb', 'dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida', 30.31, 74, '2021-01-03 00:00:00', 6, '-'),
-        (967, 'Rolled Oats', 'quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue', 30.25, 62, '2020-09-07 00:00:00', 4, '-'),
-        (968, 'Monkfish - Fresh', 'ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 71.71, 98, '2020-10-16 00:00:00', 6, '-'),
-        (969, 'Carbonated Water - Blackcherry', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien', 62.44, 94, '2021-04-21 00:00:00', 5, '-'),
-        (970, 'Pur Source', 'maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem', 35.58, 28, '2020-08-21 00:00:00', 3, '-'),
-        (971, 'Pie Filling - Pumpkin', 'tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque', 1.38, 46, '2020-12-01 00:00:00', 5, '-'),
-        (972, 'Wonton Wrappers', 'primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna', 61.63, 19, '2020-09-26 00:00:00', 3, '-'),
-        (973, 'Straw - Regular', 'luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 14.67, 3, '2021-03-24 00:00:00', 4, '-'),
-        (974, 'Sparkling Wine - Rose, Freixenet', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum', 56.63, 66, '2020-08-07 00:00:00', 3, '-'),
-        (975, 'Galliano', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero', 93.29, 90, '2021-01-29 00:00:00', 5, '-'),
-        (976, 'Passion Fruit', 'habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 64.48, 35, '2020-11-27 00:00:00', 4, '-'),
-        (977, 'Neckerchief Blck', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus', 90.31, 100, '2020-07-14 00:00:00', 6, '-'),
-        (978, 'Sugar - Crumb', 'eget rutrum at lorem integer tincidunt ante vel ipsum praesent', 87.45, 0, '2021-02-17 00:00:00', 6, '-'),
-        (979, 'Oats Large Flake', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 53.35, 82, '2020-09-17 00:00:00', 3, '-'),
-        (980, 'Gelatine Leaves - Envelopes', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat', 74.18, 91, '2020-11-19 00:00:00', 5, '-'),
-        (981, 'Chicken - Leg / Back Attach', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci', 54.26, 65, '2020-08-12 00:00:00', 3, '-'),
-        (982, 'Cheese - Comte', 'curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque', 75.97, 42, '2020-09-08 00:00:00', 3, '-'),
-        (983, 'Vinegar - Champagne', 'nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit', 86.92, 81, '2020-06-20 00:00:00', 5, '-'),
-        (984, 'Kiwi', 'nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean', 79.46, 99, '2021-02-24 00:00:00', 6, '-'),
-        (985, 'Kohlrabi', 'est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 48.16, 77, '2021-03-12 00:00:00', 3, '-'),
-        (986, 'Brandy Cherry - Mcguinness', 'ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus', 9.64, 57, '2021-01-20 00:00:00', 3, '-'),
-        (987, 'Sultanas', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 62.10, 1, '2020-06-20 00:00:00', 3, '-'),
-        (988, 'V8 - Berry Blend', 'ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at', 15.77, 64, '2020-07-16 00:00:00', 5, '-'),
-        (989, 'Soup - Campbells, Creamy', 'pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 22.70, 30, '2021-01-06 00:00:00', 3, '-'),
-        (990, 'Creamers - 10%', 'suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa', 71.17, 53, '2021-01-05 00:00:00', 5, '-'),
-        (991, 'Mushroom - Porcini, Dry', 'turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor', 41.43, 36, '2020-07-08 00:00:00', 4, '-'),
-        (992, 'Cake - Miini Cheesecake Cherry', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula', 53.99, 59, '2020-10-27 00:00:00', 6, '-'),
-        (993, 'Carbonated Water - Raspberry', 'proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis', 32.22, 51, '2021-04-20 00:00:00', 3, '-'),
-        (994, 'Cream Of Tartar', 'sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend', 35.22, 44, '2020-08-31 00:00:00', 4, '-'),
-        (995, 'Club Soda - Schweppes, 355 Ml', 'sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc nisl', 8.32, 61, '2021-03-19 00:00:00', 3, '-'),
-        (996, 'Beef - Rib Roast, Capless', 'sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci', 52.90, 68, '2020-06-20 00:00:00', 6, '-'),
-        (997, 'Salt - Table', 'etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat', 37.51, 7, '2021-05-02 00:00:00', 6, '-'),
-        (998, 'Muffin Hinge 117n', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 59.84, 98, '2020-06-29 00:00:00', 3, '-'),
-        (999, 'Chicken - Wieners', 'eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 58.57, 5, '2020-08-16 00:00:00', 6, '-'),
-        (1000, 'Dried Peach', 'in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 41.22, 39, '2020-12-12 00:00:00', 4, '-');
+insert into shop_product (id, title, description, price, inventory, last_update, collection_id, slug, effective_price)
+values  (1, 'Bread Ww Cluster', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 4.00, 11, '2020-09-11 00:00:00', 6, 'bread-ww-cluster', 4.00),
+        (2, 'Island Oasis - Raspberry', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque', 84.64, 40, '2020-07-07 00:00:00', 3, 'island-oasis-raspberry', 84.64),
+        (3, 'Shrimp - 21/25, Peel And Deviened', 'nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 11.52, 29, '2021-04-05 00:00:00', 3, 'shrimp-2125-peel-and-deviened', 11.52),
+        (4, 'Wood Chips - Regular', 'posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut', 73.47, 40, '2020-07-20 00:00:00', 5, 'wood-chips-regular', 73.47),
+        (5, 'Lettuce - Mini Greens, Whole', 'lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc', 60.21, 56, '2020-08-18 00:00:00', 5, 'lettuce-mini-greens-whole', 60.21),
+        (6, 'Mustard - Individual Pkg', 'pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna', 76.62, 18, '2020-10-25 00:00:00', 6, 'mustard-individual-pkg', 76.62),
+        (7, 'Turkey Tenderloin Frozen', 'sit amet erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim', 13.64, 48, '2020-08-08 00:00:00', 4, 'turkey-tenderloin-frozen', 13.64),
+        (8, 'Silicone Parch. 16.3x24.3', 'faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis', 85.76, 55, '2021-06-03 00:00:00', 6, 'silicone-parch-163x243', 85.76),
+        (9, 'Tomatoes - Cherry, Yellow', 'sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing', 30.81, 45, '2021-03-03 00:00:00', 5, 'tomatoes-cherry-yellow', 30.81),
+        (10, 'Sloe Gin - Mcguinness', 'fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 2.82, 69, '2021-04-18 00:00:00', 5, 'sloe-gin-mcguinness', 2.82),
+        (11, 'Wine - Magnotta - Belpaese', 'ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 37.72, 71, '2021-01-19 00:00:00', 6, 'wine-magnotta-belpaese', 37.72),
+        (12, 'Beer - Alexander Kieths, Pale Ale', 'nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa', 92.74, 55, '2020-12-28 00:00:00', 3, 'beer-alexander-kieths-pale-ale', 92.74),
+        (13, 'Basil - Thai', 'rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 50.07, 41, '2020-07-07 00:00:00', 6, 'basil-thai', 50.07),
+        (14, 'Tofu - Soft', 'at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula', 88.70, 24, '2020-08-29 00:00:00', 4, 'tofu-soft', 88.70),
+        (15, 'Mayonnaise - Individual Pkg', 'id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 81.81, 35, '2020-07-25 00:00:00', 4, 'mayonnaise-individual-pkg', 81.81),
+        (16, 'Sauce - Hollandaise', 'blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede', 9.09, 63, '2020-07-16 00:00:00', 6, 'sauce-hollandaise', 9.09),
+        (17, 'Salt - Rock, Course', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 41.53, 60, '2021-03-05 00:00:00', 3, 'salt-rock-course', 41.53),
+        (18, 'Beef - Ox Tail, Frozen', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien', 80.97, 85, '2020-07-26 00:00:00', 4, 'beef-ox-tail-frozen', 80.97),
+        (19, 'Schnappes - Peach, Walkers', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 81.97, 10, '2021-05-14 00:00:00', 5, 'schnappes-peach-walkers', 81.97),
+        (20, 'Cheese - Parmesan Cubes', 'ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra', 32.94, 97, '2020-08-12 00:00:00', 3, 'cheese-parmesan-cubes', 32.94),
+        (21, 'Sweet Pea Sprouts', 'lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 31.93, 49, '2021-01-14 00:00:00', 5, 'sweet-pea-sprouts', 31.93),
+        (22, 'Straw - Regular', 'nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel', 76.59, 56, '2020-11-13 00:00:00', 5, 'straw-regular', 76.59),
+        (23, 'Peach - Fresh', 'feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien', 2.95, 63, '2021-01-22 00:00:00', 6, 'peach-fresh', 2.95),
+        (24, 'Chinese Foods - Pepper Beef', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 86.30, 64, '2020-10-31 00:00:00', 3, 'chinese-foods-pepper-beef', 86.30),
+        (25, 'Guava', 'erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 17.53, 96, '2021-05-05 00:00:00', 4, 'guava', 17.53),
+        (26, 'Tendrils - Baby Pea, Organic', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat', 18.18, 0, '2021-03-24 00:00:00', 3, 'tendrils-baby-pea-organic', 18.18),
+        (27, 'Sugar - Brown', 'lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam nec dui', 65.01, 84, '2020-10-24 00:00:00', 5, 'sugar-brown', 65.01),
+        (28, 'Oil - Pumpkinseed', 'cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis', 86.27, 90, '2021-02-11 00:00:00', 5, 'oil-pumpkinseed', 86.27),
+        (29, 'Beef - Tongue, Cooked', 'sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo', 73.48, 82, '2021-02-07 00:00:00', 6, 'beef-tongue-cooked', 73.48),
+        (30, 'Goat - Leg', 'vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in', 83.98, 66, '2021-03-01 00:00:00', 4, 'goat-leg', 83.98),
+        (31, 'Orange Roughy 4/6 Oz', 'id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie', 99.48, 79, '2021-05-26 00:00:00', 5, 'orange-roughy-46-oz', 99.48),
+        (32, 'Lemons', 'et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit', 29.08, 83, '2021-06-03 00:00:00', 5, 'lemons', 29.08),
+        (33, 'Turnip - Mini', 'id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 13.93, 8, '2021-03-23 00:00:00', 6, 'turnip-mini', 13.93),
+        (34, 'Hinge W Undercut', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 20.24, 45, '2020-08-23 00:00:00', 3, 'hinge-w-undercut', 20.24),
+        (35, 'Cheese - Mozzarella', 'nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla', 34.71, 76, '2020-10-13 00:00:00', 3, 'cheese-mozzarella', 34.71),
+        (36, 'Basil - Fresh', 'pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu', 11.80, 2, '2021-06-07 00:00:00', 4, 'basil-fresh', 11.80),
+        (37, 'Pastry - Choclate Baked', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at', 61.87, 12, '2020-11-17 00:00:00', 3, 'pastry-choclate-baked', 61.87),
+        (38, 'Vol Au Vents', 'non mauris morbi non lectus aliquam sit amet diam in', 81.78, 98, '2021-04-29 00:00:00', 5, 'vol-au-vents', 81.78),
+        (39, 'Tomatoes - Roma', 'turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 29.81, 61, '2020-09-04 00:00:00', 4, 'tomatoes-roma', 29.81),
+        (40, 'Bread - Hamburger Buns', 'vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget', 51.39, 8, '2021-04-07 00:00:00', 5, 'bread-hamburger-buns', 51.39),
+        (41, 'Cheese - Cambozola', 'vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non', 64.20, 54, '2020-12-22 00:00:00', 3, 'cheese-cambozola', 64.20),
+        (42, 'Cup - 4oz Translucent', 'mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a', 71.97, 52, '2020-08-29 00:00:00', 5, 'cup-4oz-translucent', 71.97),
+        (43, 'Macaroons - Two Bite Choc', 'tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 14.87, 38, '2021-05-15 00:00:00', 6, 'macaroons-two-bite-choc', 14.87),
+        (44, 'Vinegar - Raspberry', 'platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 52.43, 88, '2021-02-10 00:00:00', 6, 'vinegar-raspberry', 52.43),
+        (45, 'Cake - Night And Day Choclate', 'magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 84.60, 93, '2020-09-26 00:00:00', 3, 'cake-night-and-day-choclate', 84.60),
+        (46, 'Wine - Domaine Boyar Royal', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 39.61, 92, '2020-07-14 00:00:00', 6, 'wine-domaine-boyar-royal', 39.61),
+        (47, 'Sword Pick Asst', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 75.08, 15, '2021-04-28 00:00:00', 3, 'sword-pick-asst', 75.08),
+        (48, 'Sage - Ground', 'ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl', 16.75, 94, '2021-06-06 00:00:00', 6, 'sage-ground', 16.75),
+        (49, 'Muffin Mix - Chocolate Chip', 'ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel', 93.49, 16, '2020-07-07 00:00:00', 3, 'muffin-mix-chocolate-chip', 93.49),
+        (50, 'Tia Maria', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam', 69.22, 14, '2020-06-11 00:00:00', 4, 'tia-maria', 69.22),
+        (51, 'Apple - Fuji', 'in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus', 20.42, 94, '2021-05-05 00:00:00', 3, 'apple-fuji', 20.42),
+        (52, 'Veal - Tenderloin, Untrimmed', 'cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien', 89.46, 44, '2020-06-14 00:00:00', 4, 'veal-tenderloin-untrimmed', 89.46),
+        (53, 'Mushroom - Crimini', 'ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur', 42.13, 58, '2021-01-19 00:00:00', 3, 'mushroom-crimini', 42.13),
+        (54, 'Parsley Italian - Fresh', 'rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis', 85.92, 93, '2021-04-24 00:00:00', 3, 'parsley-italian-fresh', 85.92),
+        (55, 'Tart - Pecan Butter Squares', 'in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 91.98, 43, '2020-09-06 00:00:00', 4, 'tart-pecan-butter-squares', 91.98),
+        (56, 'Vinegar - Tarragon', 'orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum', 7.30, 60, '2021-05-09 00:00:00', 5, 'vinegar-tarragon', 7.30),
+        (57, 'Beef - Tender Tips', 'nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum', 8.83, 5, '2021-01-01 00:00:00', 3, 'beef-tender-tips', 8.83),
+        (58, 'Chicken - Whole Roasting', 'id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 47.43, 11, '2021-04-07 00:00:00', 3, 'chicken-whole-roasting', 47.43),
+        (59, 'Water - Tonic', 'sit amet eleifend pede libero quis orci nullam molestie nibh', 36.84, 13, '2020-08-14 00:00:00', 6, 'water-tonic', 36.84),
+        (60, 'Shrimp - Tiger 21/25', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 64.38, 100, '2020-07-21 00:00:00', 4, 'shrimp-tiger-2125', 64.38),
+        (61, 'Hagen Daza - Dk Choocolate', 'sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 37.63, 43, '2020-09-25 00:00:00', 6, 'hagen-daza-dk-choocolate', 37.63),
+        (62, 'Grenadillo', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius', 14.57, 34, '2020-10-14 00:00:00', 6, 'grenadillo', 14.57),
+        (63, 'Coffee - 10oz Cup 92961', 'quam fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet', 26.36, 34, '2020-09-22 00:00:00', 5, 'coffee-10oz-cup-92961', 26.36),
+        (64, 'Seabream Whole Farmed', 'interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis', 59.91, 32, '2021-02-13 00:00:00', 5, 'seabream-whole-farmed', 59.91),
+        (65, 'Coconut Milk - Unsweetened', 'felis eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque', 79.79, 12, '2021-03-10 00:00:00', 4, 'coconut-milk-unsweetened', 79.79),
+        (66, 'Soap - Mr.clean Floor Soap', 'consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum', 38.03, 31, '2020-06-13 00:00:00', 5, 'soap-mrclean-floor-soap', 38.03),
+        (67, 'Cheese - Cambozola', 'tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc', 19.49, 33, '2021-01-13 00:00:00', 5, 'cheese-cambozola-2', 19.49),
+        (68, 'Soup Campbells Mexicali Tortilla', 'pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat', 93.16, 7, '2021-04-14 00:00:00', 5, 'soup-campbells-mexicali-tortilla', 93.16),
+        (69, 'Apron', 'amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse', 4.66, 6, '2021-02-10 00:00:00', 4, 'apron', 4.66),
+        (70, 'Wine - Penfolds Koonuga Hill', 'aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut', 1.27, 15, '2020-12-10 00:00:00', 3, 'wine-penfolds-koonuga-hill', 1.27),
+        (71, 'Milk - Chocolate 250 Ml', 'gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio cras', 1.88, 25, '2020-08-19 00:00:00', 5, 'milk-chocolate-250-ml', 1.88),
+        (72, 'Beer - Paulaner Hefeweisse', 'lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 36.96, 43, '2020-10-10 00:00:00', 4, 'beer-paulaner-hefeweisse', 36.96),
+        (73, 'Chocolate - Feathers', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris', 65.35, 50, '2020-11-02 00:00:00', 4, 'chocolate-feathers', 65.35),
+        (74, 'Club Soda - Schweppes, 355 Ml', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at', 90.39, 72, '2021-04-13 00:00:00', 3, 'club-soda-schweppes-355-ml', 90.39),
+        (75, 'Corn Kernels - Frozen', 'odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum', 98.61, 53, '2020-10-12 00:00:00', 4, 'corn-kernels-frozen', 98.61),
+        (76, 'Cheese Cloth No 60', 'posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet', 66.25, 72, '2020-12-08 00:00:00', 3, 'cheese-cloth-no-60', 66.25),
+        (77, 'Chips - Assorted', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 86.36, 93, '2020-07-06 00:00:00', 3, 'chips-assorted', 86.36),
+        (78, 'Bagelers', 'eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim', 82.37, 39, '2020-08-29 00:00:00', 4, 'bagelers', 82.37),
+        (79, 'Corn - Cream, Canned', 'in consequat ut nulla sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque', 85.46, 24, '2021-05-13 00:00:00', 3, 'corn-cream-canned', 85.46),
+        (80, 'Bread - Raisin', 'donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis', 8.70, 70, '2020-07-09 00:00:00', 4, 'bread-raisin', 8.70),
+        (81, 'Soup - Campbells', 'turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci', 8.13, 29, '2020-12-15 00:00:00', 5, 'soup-campbells', 8.13),
+        (82, 'Ecolab - Hobart Washarm End Cap', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt', 83.36, 67, '2020-10-25 00:00:00', 5, 'ecolab-hobart-washarm-end-cap', 83.36),
+        (83, 'Asparagus - White, Canned', 'in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 71.01, 17, '2020-07-27 00:00:00', 3, 'asparagus-white-canned', 71.01),
+        (84, 'Muffin Mix - Lemon Cranberry', 'ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo', 47.63, 11, '2020-12-23 00:00:00', 6, 'muffin-mix-lemon-cranberry', 47.63),
+        (85, 'Shrimp - 16/20, Peeled Deviened', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor', 1.08, 58, '2021-06-07 00:00:00', 5, 'shrimp-1620-peeled-deviened', 1.08),
+        (86, 'Soda Water - Club Soda, 355 Ml', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus', 90.06, 88, '2021-05-04 00:00:00', 3, 'soda-water-club-soda-355-ml', 90.06),
+        (87, 'Napkin White - Starched', 'quam nec dui luctus rutrum nulla tellus in sagittis dui', 30.95, 52, '2020-10-10 00:00:00', 5, 'napkin-white-starched', 30.95),
+        (88, 'Beer - Steamwhistle', 'nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet', 11.89, 59, '2020-06-20 00:00:00', 3, 'beer-steamwhistle', 11.89),
+        (89, 'Pail For Lid 1537', 'in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 35.85, 92, '2020-10-11 00:00:00', 6, 'pail-for-lid-1537', 35.85),
+        (90, 'Chinese Foods - Chicken Wing', 'purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 28.87, 48, '2020-12-28 00:00:00', 3, 'chinese-foods-chicken-wing', 28.87),
+        (91, 'Spice - Montreal Steak Spice', 'donec dapibus duis at velit eu est congue elementum in', 35.71, 32, '2021-05-15 00:00:00', 5, 'spice-montreal-steak-spice', 35.71),
+        (92, 'Juice - Grapefruit, 341 Ml', 'vestibulum proin eu mi nulla ac enim in tempor turpis nec', 33.37, 26, '2020-07-16 00:00:00', 5, 'juice-grapefruit-341-ml', 33.37),
+        (93, 'Wine - Wyndham Estate Bin 777', 'pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus', 3.34, 87, '2020-12-29 00:00:00', 5, 'wine-wyndham-estate-bin-777', 3.34),
+        (94, 'Water - Mineral, Natural', 'pretium quis lectus suspendisse potenti in eleifend quam a odio in hac', 61.59, 71, '2020-07-16 00:00:00', 5, 'water-mineral-natural', 61.59),
+        (95, 'Chicken - Leg, Boneless', 'eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero nam dui proin', 84.83, 15, '2020-06-21 00:00:00', 3, 'chicken-leg-boneless', 84.83),
+        (96, 'Sunflower Seed Raw', 'volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat', 28.16, 2, '2020-10-19 00:00:00', 3, 'sunflower-seed-raw', 28.16),
+        (97, 'Energy Drink Bawls', 'risus praesent lectus vestibulum quam sapien varius ut blandit non', 87.65, 31, '2021-02-23 00:00:00', 6, 'energy-drink-bawls', 87.65),
+        (98, 'Tarragon - Primerba, Paste', 'non quam nec dui luctus rutrum nulla tellus in sagittis', 20.87, 38, '2020-08-11 00:00:00', 3, 'tarragon-primerba-paste', 20.87),
+        (99, 'Table Cloth 62x120 Colour', 'et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis', 27.91, 96, '2021-03-20 00:00:00', 3, 'table-cloth-62x120-colour', 27.91),
+        (100, 'Lamb - Loin Chops', 'praesent id massa id nisl venenatis lacinia aenean sit amet justo', 87.47, 40, '2021-02-20 00:00:00', 3, 'lamb-loin-chops', 87.47),
+        (101, 'Sherry - Dry', 'morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit', 70.52, 32, '2020-06-27 00:00:00', 6, 'sherry-dry', 70.52),
+        (102, 'Chickensplit Half', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue', 93.81, 66, '2021-03-02 00:00:00', 4, 'chickensplit-half', 93.81),
+        (103, 'Tea - Orange Pekoe', 'vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus', 12.71, 77, '2020-07-12 00:00:00', 3, 'tea-orange-pekoe', 12.71),
+        (104, 'Sauce - Caesar Dressing', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis', 98.89, 62, '2020-09-03 00:00:00', 3, 'sauce-caesar-dressing', 98.89),
+        (105, 'Rice - Brown', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra', 83.88, 24, '2020-06-20 00:00:00', 6, 'rice-brown', 83.88),
+        (106, 'Soup - Knorr, Ministrone', 'rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia', 4.88, 22, '2020-07-30 00:00:00', 5, 'soup-knorr-ministrone', 4.88),
+        (107, 'Wine - Cotes Du Rhone Parallele', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam', 13.89, 10, '2021-04-13 00:00:00', 3, 'wine-cotes-du-rhone-parallele', 13.89),
+        (108, 'Chips Potato All Dressed - 43g', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi', 35.65, 13, '2020-10-23 00:00:00', 3, 'chips-potato-all-dressed-43g', 35.65),
+        (109, 'Sugar - Crumb', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea', 5.07, 95, '2021-01-08 00:00:00', 3, 'sugar-crumb', 5.07),
+        (110, 'Ice Cream - Strawberry', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel', 22.63, 7, '2021-04-06 00:00:00', 4, 'ice-cream-strawberry', 22.63),
+        (111, 'Paper Cocktail Umberlla 80 - 180', 'sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 94.11, 94, '2021-04-14 00:00:00', 3, 'paper-cocktail-umberlla-80-180', 94.11),
+        (112, 'Salmon - Canned', 'est quam pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et', 80.67, 59, '2021-02-26 00:00:00', 6, 'salmon-canned', 80.67),
+        (113, 'Seedlings - Buckwheat, Organic', 'vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 44.29, 80, '2020-08-14 00:00:00', 5, 'seedlings-buckwheat-organic', 44.29),
+        (114, 'Cheese - Brie, Triple Creme', 'sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus', 46.60, 66, '2020-08-06 00:00:00', 3, 'cheese-brie-triple-creme', 46.60),
+        (115, 'Phyllo Dough', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula', 35.53, 45, '2021-02-03 00:00:00', 3, 'phyllo-dough', 35.53),
+        (116, 'Pastry - Banana Muffin - Mini', 'vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa', 85.57, 59, '2020-12-29 00:00:00', 4, 'pastry-banana-muffin-mini', 85.57),
+        (117, 'Jameson - Irish Whiskey', 'non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel', 65.52, 97, '2020-11-25 00:00:00', 3, 'jameson-irish-whiskey', 65.52),
+        (118, 'Praline Paste', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 57.27, 3, '2021-04-02 00:00:00', 3, 'praline-paste', 57.27),
+        (119, 'Flour - Fast / Rapid', 'suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 77.83, 79, '2020-11-03 00:00:00', 5, 'flour-fast-rapid', 77.83),
+        (120, 'Sausage - Meat', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem', 49.77, 44, '2020-06-22 00:00:00', 6, 'sausage-meat', 49.77),
+        (121, 'Wine - Vovray Sec Domaine Huet', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 2.20, 84, '2021-01-11 00:00:00', 4, 'wine-vovray-sec-domaine-huet', 2.20),
+        (122, 'Ecolab - Hand Soap Form Antibac', 'amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut', 44.58, 96, '2020-09-17 00:00:00', 4, 'ecolab-hand-soap-form-antibac', 44.58),
+        (123, 'Melon - Honey Dew', 'quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse', 57.94, 55, '2021-04-24 00:00:00', 4, 'melon-honey-dew', 57.94),
+        (124, 'Dill - Primerba, Paste', 'ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl', 97.81, 72, '2020-11-11 00:00:00', 6, 'dill-primerba-paste', 97.81),
+        (125, 'Pork - Ham, Virginia', 'sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus', 97.58, 74, '2021-03-06 00:00:00', 3, 'pork-ham-virginia', 97.58),
+        (126, 'Pasta - Cannelloni, Sheets, Fresh', 'mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis', 86.27, 5, '2021-01-20 00:00:00', 3, 'pasta-cannelloni-sheets-fresh', 86.27),
+        (127, 'Apple - Macintosh', 'volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus', 19.96, 45, '2021-01-07 00:00:00', 6, 'apple-macintosh', 19.96),
+        (128, 'Vodka - Moskovskaya', 'ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 43.45, 74, '2021-04-19 00:00:00', 6, 'vodka-moskovskaya', 43.45),
+        (129, 'Curry Powder', 'vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum', 32.31, 42, '2021-01-30 00:00:00', 4, 'curry-powder', 32.31),
+        (130, 'Sauce - Vodka Blush', 'a suscipit nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 53.31, 27, '2020-07-20 00:00:00', 6, 'sauce-vodka-blush', 53.31),
+        (131, 'Venison - Ground', 'vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in', 15.76, 26, '2021-05-13 00:00:00', 4, 'venison-ground', 15.76),
+        (132, 'Doilies - 8, Paper', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros', 46.59, 79, '2020-09-09 00:00:00', 6, 'doilies-8-paper', 46.59),
+        (133, 'Vaccum Bag - 14x20', 'vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae', 57.26, 15, '2021-01-08 00:00:00', 6, 'vaccum-bag-14x20', 57.26),
+        (134, 'Gherkin', 'nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 8.68, 94, '2020-08-20 00:00:00', 3, 'gherkin', 8.68),
+        (135, 'Water - Mineral, Natural', 'morbi odio odio elementum eu interdum eu tincidunt in leo', 58.27, 17, '2021-05-13 00:00:00', 3, 'water-mineral-natural-2', 58.27),
+        (136, 'Ecolab - Solid Fusion', 'magna at nunc commodo placerat praesent blandit nam nulla integer', 94.84, 71, '2021-03-22 00:00:00', 5, 'ecolab-solid-fusion', 94.84),
+        (137, 'Bar - Sweet And Salty Chocolate', 'erat volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus', 50.15, 46, '2020-07-03 00:00:00', 3, 'bar-sweet-and-salty-chocolate', 50.15),
+        (138, 'Spice - Peppercorn Melange', 'dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 86.52, 58, '2020-12-29 00:00:00', 4, 'spice-peppercorn-melange', 86.52),
+        (139, 'Chicken Breast Wing On', 'fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet', 42.81, 31, '2020-06-21 00:00:00', 5, 'chicken-breast-wing-on', 42.81),
+        (140, 'Sauce - Roasted Red Pepper', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 39.14, 35, '2021-01-13 00:00:00', 5, 'sauce-roasted-red-pepper', 39.14),
+        (141, 'Mackerel Whole Fresh', 'at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante', 24.36, 98, '2021-02-08 00:00:00', 3, 'mackerel-whole-fresh', 24.36),
+        (142, 'Glass Clear 8 Oz', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu', 4.34, 97, '2020-08-11 00:00:00', 6, 'glass-clear-8-oz', 4.34),
+        (143, 'Soup - Campbells, Spinach Crm', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 15.47, 18, '2021-01-03 00:00:00', 3, 'soup-campbells-spinach-crm', 15.47),
+        (144, 'Pork Salted Bellies', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus', 61.50, 50, '2021-04-14 00:00:00', 6, 'pork-salted-bellies', 61.50),
+        (145, 'Juice - Pineapple, 48 Oz', 'accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in', 73.24, 31, '2020-09-08 00:00:00', 4, 'juice-pineapple-48-oz', 73.24),
+        (146, 'Cheese - Comtomme', 'fermentum justo nec condimentum neque sapien placerat ante nulla justo', 20.58, 65, '2020-11-27 00:00:00', 6, 'cheese-comtomme', 20.58),
+        (147, 'Cookie Dough - Peanut Butter', 'consequat nulla nisl nunc nisl duis bibendum felis sed interdum', 49.25, 71, '2020-07-14 00:00:00', 5, 'cookie-dough-peanut-butter', 49.25),
+        (148, 'Paste - Black Olive', 'sit amet justo morbi ut odio cras mi pede malesuada', 55.51, 49, '2020-10-17 00:00:00', 3, 'paste-black-olive', 55.51),
+        (149, 'Lettuce - Treviso', 'malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor', 56.29, 92, '2020-08-21 00:00:00', 3, 'lettuce-treviso', 56.29),
+        (150, 'Tea - Lemon Green Tea', 'commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id', 70.09, 10, '2020-09-16 00:00:00', 3, 'tea-lemon-green-tea', 70.09),
+        (151, 'Lettuce - Curly Endive', 'maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 60.41, 27, '2021-04-19 00:00:00', 5, 'lettuce-curly-endive', 60.41),
+        (152, 'Vinegar - Balsamic', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis', 8.40, 15, '2020-07-17 00:00:00', 6, 'vinegar-balsamic', 8.40),
+        (153, 'Cheese - Brie Roitelet', 'in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 80.45, 69, '2021-06-07 00:00:00', 4, 'cheese-brie-roitelet', 80.45),
+        (154, 'Tomatoes - Diced, Canned', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum', 47.43, 41, '2020-07-31 00:00:00', 4, 'tomatoes-diced-canned', 47.43),
+        (155, 'Muffin Mix - Morning Glory', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 62.77, 56, '2020-09-05 00:00:00', 3, 'muffin-mix-morning-glory', 62.77),
+        (156, 'Yogurt - Cherry, 175 Gr', 'mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in', 27.78, 86, '2020-08-18 00:00:00', 6, 'yogurt-cherry-175-gr', 27.78),
+        (157, 'Food Colouring - Green', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 69.86, 29, '2020-09-25 00:00:00', 4, 'food-colouring-green', 69.86),
+        (158, 'Eel Fresh', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 40.25, 28, '2021-02-06 00:00:00', 5, 'eel-fresh', 40.25),
+        (159, 'Lemonade - Strawberry, 591 Ml', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna', 7.04, 7, '2020-10-02 00:00:00', 6, 'lemonade-strawberry-591-ml', 7.04),
+        (160, 'Cod - Salted, Boneless', 'magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien', 37.31, 91, '2021-01-25 00:00:00', 4, 'cod-salted-boneless', 37.31),
+        (161, 'Jam - Strawberry, 20 Ml Jar', 'elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy', 25.74, 10, '2020-08-10 00:00:00', 3, 'jam-strawberry-20-ml-jar', 25.74),
+        (162, 'Veal - Inside Round / Top, Lean', 'ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et', 72.51, 85, '2021-05-19 00:00:00', 6, 'veal-inside-round-top-lean', 72.51),
+        (163, 'Lemonade - Pineapple Passion', 'nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique', 14.67, 8, '2021-04-23 00:00:00', 3, 'lemonade-pineapple-passion', 14.67),
+        (164, 'Peach - Fresh', 'non sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi', 74.71, 51, '2021-06-08 00:00:00', 5, 'peach-fresh-2', 74.71),
+        (165, 'Garlic', 'nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id', 85.06, 64, '2021-01-18 00:00:00', 4, 'garlic', 85.06),
+        (166, 'Artichoke - Fresh', 'pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing', 70.35, 100, '2020-09-27 00:00:00', 6, 'artichoke-fresh', 70.35),
+        (167, 'Sauce - Thousand Island', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis', 35.45, 64, '2021-03-02 00:00:00', 3, 'sauce-thousand-island', 35.45),
+        (168, 'Sparkling Wine - Rose, Freixenet', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed', 73.38, 45, '2020-11-28 00:00:00', 4, 'sparkling-wine-rose-freixenet', 73.38),
+        (169, 'Cheese - Cheddar, Medium', 'tempus sit amet sem fusce consequat nulla nisl nunc nisl duis', 80.33, 95, '2020-11-09 00:00:00', 3, 'cheese-cheddar-medium', 80.33),
+        (170, 'Yeast Dry - Fleischman', 'adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien', 46.37, 39, '2020-06-17 00:00:00', 4, 'yeast-dry-fleischman', 46.37),
+        (171, 'Chips - Potato Jalapeno', 'augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis', 30.96, 9, '2021-03-07 00:00:00', 4, 'chips-potato-jalapeno', 30.96),
+        (172, 'Shallots', 'sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 84.84, 87, '2021-02-25 00:00:00', 4, 'shallots', 84.84),
+        (173, 'Coke - Diet, 355 Ml', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 89.46, 52, '2020-07-20 00:00:00', 3, 'coke-diet-355-ml', 89.46),
+        (174, 'Pernod', 'condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est', 68.59, 78, '2021-05-24 00:00:00', 5, 'pernod', 68.59),
+        (175, 'Pate - Cognac', 'eu est congue elementum in hac habitasse platea dictumst morbi', 87.37, 3, '2021-05-06 00:00:00', 6, 'pate-cognac', 87.37),
+        (176, 'Wine - Penfolds Koonuga Hill', 'vestibulum sit amet cursus id turpis integer aliquet massa id', 43.99, 34, '2020-08-03 00:00:00', 5, 'wine-penfolds-koonuga-hill-2', 43.99),
+        (177, 'Shrimp - Tiger 21/25', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat', 59.91, 4, '2020-07-23 00:00:00', 3, 'shrimp-tiger-2125-2', 59.91),
+        (178, 'Watercress', 'blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 25.40, 94, '2021-04-14 00:00:00', 4, 'watercress', 25.40),
+        (179, 'Flour - Chickpea', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum', 11.58, 20, '2021-05-25 00:00:00', 6, 'flour-chickpea', 11.58),
+        (180, 'Tea Leaves - Oolong', 'varius ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 9.86, 92, '2021-03-14 00:00:00', 4, 'tea-leaves-oolong', 9.86),
+        (181, 'Wine - Hardys Bankside Shiraz', 'vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc', 98.46, 69, '2020-12-29 00:00:00', 3, 'wine-hardys-bankside-shiraz', 98.46),
+        (182, 'Magnotta - Bel Paese White', 'mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit', 87.08, 65, '2021-04-24 00:00:00', 5, 'magnotta-bel-paese-white', 87.08),
+        (183, 'Beef - Montreal Smoked Brisket', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 65.66, 68, '2021-02-25 00:00:00', 5, 'beef-montreal-smoked-brisket', 65.66),
+        (184, 'Doilies - 7, Paper', 'nunc purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 6.42, 9, '2021-05-09 00:00:00', 4, 'doilies-7-paper', 6.42),
+        (185, 'Venison - Striploin', 'vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis', 85.15, 88, '2021-02-20 00:00:00', 6, 'venison-striploin', 85.15),
+        (186, 'Turnip - Mini', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque', 80.88, 67, '2021-02-06 00:00:00', 6, 'turnip-mini-2', 80.88),
+        (187, 'Peach - Halves', 'non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus', 12.87, 76, '2021-01-01 00:00:00', 3, 'peach-halves', 12.87),
+        (188, 'Glaze - Clear', 'quam a odio in hac habitasse platea dictumst maecenas ut massa', 19.86, 1, '2020-11-12 00:00:00', 3, 'glaze-clear', 19.86),
+        (189, 'Wine - Red, Concha Y Toro', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 65.45, 24, '2020-11-01 00:00:00', 5, 'wine-red-concha-y-toro', 65.45),
+        (190, 'Wine - Ej Gallo Sonoma', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor', 91.58, 6, '2021-02-17 00:00:00', 4, 'wine-ej-gallo-sonoma', 91.58),
+        (191, 'Pickles - Gherkins', 'lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis', 68.10, 18, '2020-12-12 00:00:00', 3, 'pickles-gherkins', 68.10),
+        (192, 'Butter Sweet', 'fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 39.80, 72, '2020-10-04 00:00:00', 6, 'butter-sweet', 39.80),
+        (193, 'Onions - Red Pearl', 'magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 35.52, 51, '2021-05-31 00:00:00', 3, 'onions-red-pearl', 35.52),
+        (194, 'Seedlings - Mix, Organic', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris', 6.23, 51, '2020-11-29 00:00:00', 5, 'seedlings-mix-organic', 6.23),
+        (195, 'Bread - Calabrese Baguette', 'enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu est congue', 80.51, 43, '2020-07-18 00:00:00', 3, 'bread-calabrese-baguette', 80.51),
+        (196, 'Lamb - Loin Chops', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan', 94.45, 2, '2020-08-07 00:00:00', 5, 'lamb-loin-chops-2', 94.45),
+        (197, 'Peas Snow', 'egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend', 18.05, 93, '2021-06-07 00:00:00', 5, 'peas-snow', 18.05),
+        (198, 'Blueberries', 'a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante', 74.23, 11, '2021-06-06 00:00:00', 5, 'blueberries', 74.23),
+        (199, 'Cookie - Dough Variety', 'parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id', 37.39, 79, '2021-04-17 00:00:00', 4, 'cookie-dough-variety', 37.39),
+        (200, 'Extract - Almond', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 9.97, 86, '2021-02-14 00:00:00', 5, 'extract-almond', 9.97),
+        (201, 'Pastry - Banana Muffin - Mini', 'convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante', 34.27, 98, '2021-03-05 00:00:00', 4, 'pastry-banana-muffin-mini-2', 34.27),
+        (202, 'Food Colouring - Orange', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 74.11, 20, '2021-01-31 00:00:00', 5, 'food-colouring-orange', 74.11),
+        (203, 'Split Peas - Green, Dry', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 2.51, 77, '2020-08-02 00:00:00', 4, 'split-peas-green-dry', 2.51),
+        (204, 'Lid Coffee Cup 8oz Blk', 'mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt', 26.97, 71, '2020-08-27 00:00:00', 3, 'lid-coffee-cup-8oz-blk', 26.97),
+        (205, 'Truffle Cups Green', 'proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 88.95, 38, '2021-01-20 00:00:00', 3, 'truffle-cups-green', 88.95),
+        (206, 'Cheese - Sheep Milk', 'risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in', 64.43, 87, '2020-11-21 00:00:00', 3, 'cheese-sheep-milk', 64.43),
+        (207, 'Oil - Shortening - All - Purpose', 'ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere', 68.52, 78, '2021-06-09 00:00:00', 6, 'oil-shortening-all-purpose', 68.52),
+        (208, 'Pepper - Chillies, Crushed', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie', 17.08, 77, '2020-11-08 00:00:00', 5, 'pepper-chillies-crushed', 17.08),
+        (209, 'Chicken - Whole Roasting', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 95.44, 9, '2021-05-06 00:00:00', 5, 'chicken-whole-roasting-2', 95.44),
+        (210, 'Wiberg Cure', 'vel est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis', 52.18, 6, '2021-04-09 00:00:00', 6, 'wiberg-cure', 52.18),
+        (211, 'Cleaner - Lime Away', 'ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 78.25, 95, '2020-09-06 00:00:00', 6, 'cleaner-lime-away', 78.25),
+        (212, 'Puree - Kiwi', 'ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 49.93, 80, '2020-09-11 00:00:00', 4, 'puree-kiwi', 49.93),
+        (213, 'Pineapple - Canned, Rings', 'ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec nisi', 19.07, 23, '2020-07-19 00:00:00', 3, 'pineapple-canned-rings', 19.07),
+        (214, 'Turkey - Oven Roast Breast', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 85.71, 10, '2021-03-31 00:00:00', 3, 'turkey-oven-roast-breast', 85.71),
+        (215, 'Hand Towel', 'suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla nisl', 36.16, 54, '2020-09-25 00:00:00', 4, 'hand-towel', 36.16),
+        (216, 'Pork - Sausage, Medium', 'vitae quam suspendisse potenti nullam porttitor lacus at turpis donec', 68.06, 25, '2020-10-31 00:00:00', 3, 'pork-sausage-medium', 68.06),
+        (217, 'Cheese Cloth No 100', 'id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 11.95, 52, '2020-12-31 00:00:00', 3, 'cheese-cloth-no-100', 11.95),
+        (218, 'Sobe - Tropical Energy', 'purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 24.26, 34, '2021-04-07 00:00:00', 6, 'sobe-tropical-energy', 24.26),
+        (219, 'Beef - Rib Roast, Capless', 'accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 85.39, 41, '2020-10-28 00:00:00', 5, 'beef-rib-roast-capless', 85.39),
+        (220, 'Beans - Turtle, Black, Dry', 'turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 40.72, 30, '2020-09-23 00:00:00', 6, 'beans-turtle-black-dry', 40.72),
+        (221, 'Cookie - Oatmeal', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 55.05, 33, '2021-03-08 00:00:00', 4, 'cookie-oatmeal', 55.05),
+        (222, 'Lettuce - Escarole', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac', 94.97, 46, '2020-11-13 00:00:00', 5, 'lettuce-escarole', 94.97),
+        (223, 'Bread - Bistro White', 'scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor', 36.65, 30, '2021-04-14 00:00:00', 3, 'bread-bistro-white', 36.65),
+        (224, 'English Muffin', 'sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices', 99.65, 46, '2021-05-24 00:00:00', 6, 'english-muffin', 99.65),
+        (225, 'Table Cloth 54x54 White', 'ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue', 37.58, 54, '2021-03-19 00:00:00', 3, 'table-cloth-54x54-white', 37.58),
+        (226, 'Melon - Watermelon, Seedless', 'sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar', 57.44, 26, '2021-05-15 00:00:00', 3, 'melon-watermelon-seedless', 57.44),
+        (227, 'Dill Weed - Dry', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit', 99.51, 40, '2020-10-26 00:00:00', 3, 'dill-weed-dry', 99.51),
+        (228, 'Pepper Squash', 'pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum', 11.07, 45, '2021-02-14 00:00:00', 5, 'pepper-squash', 11.07),
+        (229, 'Flavouring - Orange', 'elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 6.83, 95, '2021-04-06 00:00:00', 5, 'flavouring-orange', 6.83),
+        (230, 'Spice - Peppercorn Melange', 'felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices', 56.29, 49, '2021-05-13 00:00:00', 5, 'spice-peppercorn-melange-2', 56.29),
+        (231, 'Sprouts - Onion', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat', 5.68, 67, '2021-01-14 00:00:00', 4, 'sprouts-onion', 5.68),
+        (232, 'Wine - Magnotta - Cab Franc', 'lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit', 52.31, 50, '2020-11-21 00:00:00', 4, 'wine-magnotta-cab-franc', 52.31),
+        (233, 'Cup - 6oz, Foam', 'imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in', 92.28, 97, '2021-04-02 00:00:00', 6, 'cup-6oz-foam', 92.28),
+        (234, 'Cake - Dulce De Leche', 'dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet', 6.62, 54, '2021-02-01 00:00:00', 3, 'cake-dulce-de-leche', 6.62),
+        (235, 'Greens Mustard', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel', 67.25, 74, '2020-11-28 00:00:00', 3, 'greens-mustard', 67.25),
+        (236, 'Kiwano', 'volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in', 27.60, 13, '2020-10-22 00:00:00', 6, 'kiwano', 27.60),
+        (237, 'Carbonated Water - Wildberry', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 54.57, 22, '2020-12-24 00:00:00', 6, 'carbonated-water-wildberry', 54.57),
+        (238, 'Cheese - St. Paulin', 'convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut', 23.35, 98, '2020-08-11 00:00:00', 3, 'cheese-st-paulin', 23.35),
+        (239, 'Wine - Jaboulet Cotes Du Rhone', 'eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat', 14.43, 48, '2020-07-13 00:00:00', 5, 'wine-jaboulet-cotes-du-rhone', 14.43),
+        (240, 'Pie Box - Cello Window 2.5', 'ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit', 46.42, 94, '2021-03-30 00:00:00', 4, 'pie-box-cello-window-25', 46.42),
+        (241, 'Brandy - Bar', 'pellentesque ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue', 72.33, 96, '2020-09-08 00:00:00', 4, 'brandy-bar', 72.33),
+        (242, 'Veal - Slab Bacon', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna', 74.61, 69, '2020-11-07 00:00:00', 3, 'veal-slab-bacon', 74.61),
+        (243, 'Duck - Whole', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin', 25.38, 73, '2021-05-16 00:00:00', 4, 'duck-whole', 25.38),
+        (244, 'Bagelers', 'id pretium iaculis diam erat fermentum justo nec condimentum neque sapien', 57.79, 92, '2020-08-28 00:00:00', 4, 'bagelers-2', 57.79),
+        (245, 'Pepper - Pablano', 'porttitor lacus at turpis donec posuere metus vitae ipsum aliquam', 62.55, 71, '2021-04-19 00:00:00', 6, 'pepper-pablano', 62.55),
+        (246, 'Mustard - Seed', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit', 88.31, 65, '2021-02-08 00:00:00', 4, 'mustard-seed', 88.31),
+        (247, 'Strawberries', 'libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum', 43.48, 97, '2020-11-12 00:00:00', 3, 'strawberries', 43.48),
+        (248, 'Cup - Translucent 7 Oz Clear', 'dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla', 54.28, 78, '2021-02-11 00:00:00', 6, 'cup-translucent-7-oz-clear', 54.28),
+        (249, 'Jameson Irish Whiskey', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis', 52.91, 54, '2021-02-17 00:00:00', 4, 'jameson-irish-whiskey-2', 52.91),
+        (250, 'Beef - Eye Of Round', 'magna at nunc commodo placerat praesent blandit nam nulla integer pede justo', 48.84, 7, '2020-10-22 00:00:00', 3, 'beef-eye-of-round', 48.84),
+        (251, 'The Pop Shoppe - Grape', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 18.35, 5, '2021-04-01 00:00:00', 6, 'the-pop-shoppe-grape', 18.35),
+        (252, 'Cheese - Cheddar, Medium', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis', 92.34, 85, '2020-06-10 00:00:00', 3, 'cheese-cheddar-medium-2', 92.34),
+        (253, 'Tomatoes Tear Drop Yellow', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis', 10.60, 0, '2021-02-08 00:00:00', 3, 'tomatoes-tear-drop-yellow', 10.60),
+        (254, 'Extract Vanilla Pure', 'mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh', 10.05, 87, '2021-01-22 00:00:00', 6, 'extract-vanilla-pure', 10.05),
+        (255, 'Ham - Smoked, Bone - In', 'vel est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia', 83.75, 93, '2020-12-29 00:00:00', 3, 'ham-smoked-bone-in', 83.75),
+        (256, 'Burger Veggie', 'vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 53.73, 44, '2020-10-09 00:00:00', 3, 'burger-veggie', 53.73),
+        (257, 'Appetizer - Sausage Rolls', 'at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id', 96.43, 84, '2021-01-14 00:00:00', 5, 'appetizer-sausage-rolls', 96.43),
+        (258, 'Wine - Magnotta - Pinot Gris Sr', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 26.42, 2, '2021-02-17 00:00:00', 4, 'wine-magnotta-pinot-gris-sr', 26.42),
+        (259, 'Melon - Watermelon Yellow', 'sit amet justo morbi ut odio cras mi pede malesuada in', 60.34, 15, '2021-04-09 00:00:00', 6, 'melon-watermelon-yellow', 60.34),
+        (260, 'Cheese - Brie, Triple Creme', 'tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim', 17.75, 88, '2021-05-25 00:00:00', 4, 'cheese-brie-triple-creme-2', 17.75),
+        (261, 'Table Cloth 54x72 White', 'turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget', 44.88, 48, '2020-07-07 00:00:00', 4, 'table-cloth-54x72-white', 44.88),
+        (262, 'Chocolate Bar - Oh Henry', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu', 67.60, 99, '2020-07-16 00:00:00', 5, 'chocolate-bar-oh-henry', 67.60),
+        (263, 'Cheese - Camembert', 'semper porta volutpat quam pede lobortis ligula sit amet eleifend', 23.20, 27, '2021-01-20 00:00:00', 5, 'cheese-camembert', 23.20),
+        (264, 'Soup - Campbells, Spinach Crm', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 31.98, 100, '2021-05-13 00:00:00', 3, 'soup-campbells-spinach-crm-2', 31.98),
+        (265, 'Tea - Herbal Orange Spice', 'a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla', 80.89, 86, '2021-03-03 00:00:00', 5, 'tea-herbal-orange-spice', 80.89),
+        (266, 'Berry Brulee', 'praesent id massa id nisl venenatis lacinia aenean sit amet justo', 37.42, 5, '2021-05-21 00:00:00', 4, 'berry-brulee', 37.42),
+        (267, 'Bar - Sweet And Salty Chocolate', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi', 22.84, 26, '2020-12-21 00:00:00', 5, 'bar-sweet-and-salty-chocolate-2', 22.84),
+        (268, 'Gherkin', 'at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes', 57.02, 86, '2021-04-16 00:00:00', 4, 'gherkin-2', 57.02),
+        (269, 'Lady Fingers', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet', 75.55, 59, '2020-08-07 00:00:00', 5, 'lady-fingers', 75.55),
+        (270, 'Beer - Upper Canada Light', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 40.14, 56, '2020-12-07 00:00:00', 5, 'beer-upper-canada-light', 40.14),
+        (271, 'Cocoa Powder - Dutched', 'est congue elementum in hac habitasse platea dictumst morbi vestibulum velit', 13.36, 84, '2021-05-01 00:00:00', 4, 'cocoa-powder-dutched', 13.36),
+        (272, 'Spice - Montreal Steak Spice', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 45.15, 81, '2020-11-29 00:00:00', 5, 'spice-montreal-steak-spice-2', 45.15),
+        (273, 'Jicama', 'in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor', 47.77, 92, '2021-03-29 00:00:00', 4, 'jicama', 47.77),
+        (274, 'Bar Mix - Lime', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 49.72, 80, '2020-10-10 00:00:00', 6, 'bar-mix-lime', 49.72),
+        (275, 'Macaroons - Two Bite Choc', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at', 80.59, 50, '2021-05-23 00:00:00', 5, 'macaroons-two-bite-choc-2', 80.59),
+        (276, 'Bandage - Fexible 1x3', 'nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non', 63.84, 93, '2021-05-15 00:00:00', 6, 'bandage-fexible-1x3', 63.84),
+        (277, 'V8 - Tropical Blend', 'in tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum', 87.59, 70, '2020-12-29 00:00:00', 6, 'v8-tropical-blend', 87.59),
+        (278, 'Yoplait Drink', 'tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non', 59.28, 16, '2020-08-03 00:00:00', 4, 'yoplait-drink', 59.28),
+        (279, 'Sugar - Invert', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor', 69.37, 87, '2020-06-28 00:00:00', 5, 'sugar-invert', 69.37),
+        (280, 'Doilies - 10, Paper', 'mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla', 99.19, 24, '2021-05-08 00:00:00', 4, 'doilies-10-paper', 99.19),
+        (281, 'Shrimp, Dried, Small / Lb', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 24.32, 34, '2020-08-29 00:00:00', 3, 'shrimp-dried-small-lb', 24.32),
+        (282, 'Vinegar - Tarragon', 'auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio', 16.87, 63, '2021-05-17 00:00:00', 5, 'vinegar-tarragon-2', 16.87),
+        (283, 'Cheese - La Sauvagine', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et', 82.33, 81, '2021-01-31 00:00:00', 3, 'cheese-la-sauvagine', 82.33),
+        (284, 'Yucca', 'erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam', 14.26, 67, '2020-10-19 00:00:00', 4, 'yucca', 14.26),
+        (285, 'Beef - Shank', 'at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra', 18.74, 25, '2020-11-03 00:00:00', 4, 'beef-shank', 18.74),
+        (286, 'Potatoes - Mini White 3 Oz', 'sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia', 4.00, 13, '2020-12-24 00:00:00', 5, 'potatoes-mini-white-3-oz', 4.00),
+        (287, 'Cup - 6oz, Foam', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 2.83, 38, '2021-01-11 00:00:00', 5, 'cup-6oz-foam-2', 2.83),
+        (288, 'Allspice - Jamaican', 'rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis', 46.53, 71, '2021-04-05 00:00:00', 4, 'allspice-jamaican', 46.53),
+        (289, 'Spice - Peppercorn Melange', 'ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem', 32.25, 8, '2021-02-24 00:00:00', 5, 'spice-peppercorn-melange-3', 32.25),
+        (290, 'Ham Black Forest', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 2.97, 68, '2020-12-13 00:00:00', 6, 'ham-black-forest', 2.97),
+        (291, 'Chocolate - Chips Compound', 'interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu est', 10.59, 95, '2020-08-11 00:00:00', 5, 'chocolate-chips-compound', 10.59),
+        (292, 'Lamb - Shanks', 'accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum', 85.78, 91, '2021-05-30 00:00:00', 3, 'lamb-shanks', 85.78),
+        (293, 'Wine - Chianti Classico Riserva', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum', 42.08, 82, '2021-01-20 00:00:00', 6, 'wine-chianti-classico-riserva', 42.08),
+        (294, 'Coffee - Colombian, Portioned', 'felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed', 5.99, 48, '2020-08-15 00:00:00', 3, 'coffee-colombian-portioned', 5.99),
+        (295, 'Pasta - Fettuccine, Egg, Fresh', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis', 12.85, 16, '2020-06-12 00:00:00', 6, 'pasta-fettuccine-egg-fresh', 12.85),
+        (296, 'Tequila Rose Cream Liquor', 'molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac', 94.35, 28, '2020-12-03 00:00:00', 3, 'tequila-rose-cream-liquor', 94.35),
+        (297, 'Eggwhite Frozen', 'faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat', 64.40, 80, '2021-02-24 00:00:00', 5, 'eggwhite-frozen', 64.40),
+        (298, 'Pate - Liver', 'sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc', 87.14, 86, '2021-03-26 00:00:00', 4, 'pate-liver', 87.14),
+        (299, 'Thyme - Fresh', 'lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 13.95, 80, '2020-10-30 00:00:00', 5, 'thyme-fresh', 13.95),
+        (300, 'Ice Cream - Strawberry', 'purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam', 78.47, 75, '2020-11-13 00:00:00', 6, 'ice-cream-strawberry-2', 78.47),
+        (301, 'Steampan - Lid For Half Size', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam', 29.54, 95, '2020-07-30 00:00:00', 4, 'steampan-lid-for-half-size', 29.54),
+        (302, 'Oats Large Flake', 'fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio', 99.60, 100, '2020-08-02 00:00:00', 3, 'oats-large-flake', 99.60),
+        (303, 'Mcguinness - Blue Curacao', 'convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim', 30.76, 42, '2020-08-22 00:00:00', 5, 'mcguinness-blue-curacao', 30.76),
+        (304, 'Sauce - Salsa', 'a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum', 82.29, 24, '2020-12-09 00:00:00', 5, 'sauce-salsa', 82.29),
+        (305, 'Frangelico', 'ante ipsum primis in faucibus orci luctus et ultrices posuere', 8.45, 20, '2021-04-12 00:00:00', 5, 'frangelico', 8.45),
+        (306, 'Wine - Blue Nun Qualitatswein', 'neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo', 67.43, 65, '2020-07-17 00:00:00', 4, 'wine-blue-nun-qualitatswein', 67.43),
+        (307, 'Bread - Calabrese Baguette', 'est donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est', 40.96, 5, '2020-11-04 00:00:00', 5, 'bread-calabrese-baguette-2', 40.96),
+        (308, 'Soup - Campbells', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet', 70.29, 81, '2021-05-08 00:00:00', 4, 'soup-campbells-2', 70.29),
+        (309, 'Doilies - 8, Paper', 'pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo', 49.70, 80, '2021-04-30 00:00:00', 4, 'doilies-8-paper-2', 49.70),
+        (310, 'Taro Leaves', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus', 64.75, 87, '2020-12-12 00:00:00', 5, 'taro-leaves', 64.75),
+        (311, 'Tumeric', 'volutpat erat quisque erat eros viverra eget congue eget semper rutrum', 17.35, 70, '2020-07-25 00:00:00', 6, 'tumeric', 17.35),
+        (312, 'Coconut - Creamed, Pure', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet', 52.81, 80, '2021-03-02 00:00:00', 5, 'coconut-creamed-pure', 52.81),
+        (313, 'Bread - Olive Dinner Roll', 'ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor', 88.96, 61, '2021-02-12 00:00:00', 3, 'bread-olive-dinner-roll', 88.96),
+        (314, 'Wine - Fat Bastard Merlot', 'nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum integer', 73.55, 14, '2020-12-04 00:00:00', 3, 'wine-fat-bastard-merlot', 73.55),
+        (315, 'Beef - Tenderloin', 'nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo', 52.03, 10, '2020-08-02 00:00:00', 3, 'beef-tenderloin', 52.03),
+        (316, 'Bread - White Epi Baguette', 'morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu', 2.21, 48, '2021-05-03 00:00:00', 6, 'bread-white-epi-baguette', 2.21),
+        (317, 'Soup - Campbells, Creamy', 'hac habitasse platea dictumst maecenas ut massa quis augue luctus', 14.16, 67, '2020-10-20 00:00:00', 3, 'soup-campbells-creamy', 14.16),
+        (318, 'Dasheen', 'donec dapibus duis at velit eu est congue elementum in hac habitasse', 33.04, 88, '2021-02-18 00:00:00', 3, 'dasheen', 33.04),
+        (319, 'Towel - Roll White', 'mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci', 36.51, 11, '2021-01-30 00:00:00', 6, 'towel-roll-white', 36.51),
+        (320, 'Juice - Orange 1.89l', 'elit proin risus praesent lectus vestibulum quam sapien varius ut blandit', 85.16, 7, '2021-02-12 00:00:00', 3, 'juice-orange-189l', 85.16),
+        (321, 'Vermouth - White, Cinzano', 'molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue', 46.15, 35, '2020-09-13 00:00:00', 5, 'vermouth-white-cinzano', 46.15),
+        (322, 'Bread - French Baquette', 'mi in porttitor pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac', 30.31, 38, '2020-08-24 00:00:00', 5, 'bread-french-baquette', 30.31),
+        (323, 'Chinese Foods - Plain Fried Rice', 'pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu', 24.39, 6, '2021-02-07 00:00:00', 4, 'chinese-foods-plain-fried-rice', 24.39),
+        (324, 'Sausage - Chorizo', 'magnis dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis', 72.17, 62, '2021-03-31 00:00:00', 6, 'sausage-chorizo', 72.17),
+        (325, 'Lotus Root', 'mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis', 16.48, 55, '2021-03-12 00:00:00', 3, 'lotus-root', 16.48),
+        (326, 'Ecolab - Solid Fusion', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate', 78.05, 98, '2021-03-17 00:00:00', 5, 'ecolab-solid-fusion-2', 78.05),
+        (327, 'Chicken - Thigh, Bone In', 'nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu', 61.95, 100, '2020-08-15 00:00:00', 6, 'chicken-thigh-bone-in', 61.95),
+        (328, 'Pepper - Red Chili', 'suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus', 5.21, 96, '2020-09-12 00:00:00', 4, 'pepper-red-chili', 5.21),
+        (329, 'Soup - Beef, Base Mix', 'amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus', 41.99, 89, '2020-10-20 00:00:00', 6, 'soup-beef-base-mix', 41.99),
+        (330, 'Wine - Magnotta - Cab Franc', 'ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 13.21, 43, '2021-05-16 00:00:00', 6, 'wine-magnotta-cab-franc-2', 13.21),
+        (331, 'Red Currant Jelly', 'at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat', 44.53, 95, '2020-07-08 00:00:00', 6, 'red-currant-jelly', 44.53),
+        (332, 'Soup - Knorr, Country Bean', 'consequat metus sapien ut nunc vestibulum ante ipsum primis in', 75.74, 54, '2021-02-20 00:00:00', 3, 'soup-knorr-country-bean', 75.74),
+        (333, 'Cafe Royale', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus', 77.72, 73, '2021-01-27 00:00:00', 4, 'cafe-royale', 77.72),
+        (334, 'Napkin White', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at', 41.16, 75, '2021-05-24 00:00:00', 5, 'napkin-white', 41.16),
+        (335, 'Cheese - Provolone', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo in', 54.32, 19, '2021-02-04 00:00:00', 3, 'cheese-provolone', 54.32),
+        (336, 'Vermacelli - Sprinkles, Assorted', 'id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at', 33.79, 46, '2020-06-10 00:00:00', 6, 'vermacelli-sprinkles-assorted', 33.79),
+        (337, 'Creme De Cacao White', 'condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales', 30.59, 29, '2020-10-29 00:00:00', 5, 'creme-de-cacao-white', 30.59),
+        (338, 'Mushroom - Lg - Cello', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 29.11, 29, '2021-05-23 00:00:00', 4, 'mushroom-lg-cello', 29.11),
+        (339, 'Assorted Desserts', 'phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 16.77, 97, '2020-06-23 00:00:00', 6, 'assorted-desserts', 16.77),
+        (340, 'Pork - Suckling Pig', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis', 76.52, 73, '2021-02-17 00:00:00', 4, 'pork-suckling-pig', 76.52),
+        (341, 'Wine - Hardys Bankside Shiraz', 'dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti', 65.85, 72, '2020-10-04 00:00:00', 4, 'wine-hardys-bankside-shiraz-2', 65.85),
+        (342, 'Tart Shells - Savory, 3', 'rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 64.88, 44, '2020-08-26 00:00:00', 3, 'tart-shells-savory-3', 64.88),
+        (343, 'Cheese - Gouda', 'pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis', 98.07, 44, '2021-03-11 00:00:00', 4, 'cheese-gouda', 98.07),
+        (344, 'Beef - Tenderloin - Aa', 'ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 36.69, 9, '2020-11-28 00:00:00', 4, 'beef-tenderloin-aa', 36.69),
+        (345, 'Pork - Ham, Virginia', 'consequat morbi a ipsum integer a nibh in quis justo maecenas', 58.53, 79, '2021-03-01 00:00:00', 6, 'pork-ham-virginia-2', 58.53),
+        (346, 'Lid Tray - 16in Dome', 'accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean', 30.96, 32, '2021-01-29 00:00:00', 6, 'lid-tray-16in-dome', 30.96),
+        (347, 'Beer - Corona', 'morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 93.68, 84, '2020-06-14 00:00:00', 5, 'beer-corona', 93.68),
+        (348, 'Milkettes - 2%', 'dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 86.05, 64, '2020-09-23 00:00:00', 3, 'milkettes-2', 86.05),
+        (349, 'Five Alive Citrus', 'orci pede venenatis non sodales sed tincidunt eu felis fusce', 27.86, 59, '2021-05-12 00:00:00', 4, 'five-alive-citrus', 27.86),
+        (350, 'Pasta - Canelloni, Single Serve', 'nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 20.21, 19, '2020-08-27 00:00:00', 5, 'pasta-canelloni-single-serve', 20.21),
+        (351, 'Juice - Cranberry 284ml', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede', 13.05, 56, '2021-05-11 00:00:00', 5, 'juice-cranberry-284ml', 13.05),
+        (352, 'Wine - Vineland Estate Semi - Dry', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque', 33.35, 71, '2021-05-18 00:00:00', 3, 'wine-vineland-estate-semi-dry', 33.35),
+        (353, 'Syrup - Monin - Passion Fruit', 'non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 64.58, 56, '2020-09-25 00:00:00', 5, 'syrup-monin-passion-fruit', 64.58),
+        (354, 'Marsala - Sperone, Fine, D.o.c.', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus', 71.21, 80, '2021-04-09 00:00:00', 4, 'marsala-sperone-fine-doc', 71.21),
+        (355, 'Bowl 12 Oz - Showcase 92012', 'quis lectus suspendisse potenti in eleifend quam a odio in', 7.67, 33, '2020-07-20 00:00:00', 6, 'bowl-12-oz-showcase-92012', 7.67),
+        (356, 'Cod - Salted, Boneless', 'est risus auctor sed tristique in tempus sit amet sem fusce consequat', 26.71, 12, '2020-07-28 00:00:00', 5, 'cod-salted-boneless-2', 26.71),
+        (357, 'Lemonade - Kiwi, 591 Ml', 'tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse', 43.40, 41, '2020-10-11 00:00:00', 5, 'lemonade-kiwi-591-ml', 43.40),
+        (358, 'Yeast Dry - Fleischman', 'tellus nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas', 44.77, 32, '2020-08-19 00:00:00', 4, 'yeast-dry-fleischman-2', 44.77),
+        (359, 'Beef - Striploin', 'sapien non mi integer ac neque duis bibendum morbi non quam nec dui luctus', 77.01, 95, '2021-05-13 00:00:00', 4, 'beef-striploin', 77.01),
+        (360, 'Plate Pie Foil', 'lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse', 6.97, 84, '2020-08-05 00:00:00', 5, 'plate-pie-foil', 6.97),
+        (361, 'Madeira', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus', 28.66, 89, '2020-11-30 00:00:00', 4, 'madeira', 28.66),
+        (362, 'Broccoli - Fresh', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 84.58, 93, '2020-11-20 00:00:00', 4, 'broccoli-fresh', 84.58),
+        (363, 'Wine - Rubyport', 'turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu', 98.70, 92, '2020-08-10 00:00:00', 4, 'wine-rubyport', 98.70),
+        (364, 'Bread Base - Italian', 'lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi', 19.74, 28, '2021-06-03 00:00:00', 6, 'bread-base-italian', 19.74),
+        (365, 'Flour - Corn, Fine', 'curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer', 32.55, 68, '2021-04-02 00:00:00', 5, 'flour-corn-fine', 32.55),
+        (366, 'Bread Cranberry Foccacia', 'nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed', 95.08, 76, '2020-10-24 00:00:00', 3, 'bread-cranberry-foccacia', 95.08),
+        (367, 'Lettuce - Boston Bib - Organic', 'elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus', 41.65, 31, '2021-03-17 00:00:00', 4, 'lettuce-boston-bib-organic', 41.65),
+        (368, 'Beef - Tenderlion, Center Cut', 'quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus', 3.45, 36, '2020-09-08 00:00:00', 5, 'beef-tenderlion-center-cut', 3.45),
+        (369, 'Squeeze Bottle', 'consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 75.90, 17, '2020-12-27 00:00:00', 5, 'squeeze-bottle', 75.90),
+        (370, 'Muffin - Zero Transfat', 'quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at', 15.91, 65, '2020-07-21 00:00:00', 6, 'muffin-zero-transfat', 15.91),
+        (371, 'Worcestershire Sauce', 'cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus', 45.93, 61, '2020-12-06 00:00:00', 5, 'worcestershire-sauce', 45.93),
+        (372, 'Lid Coffee Cup 8oz Blk', 'sit amet erat nulla tempus vivamus in felis eu sapien cursus', 52.14, 21, '2021-02-18 00:00:00', 3, 'lid-coffee-cup-8oz-blk-2', 52.14),
+        (373, 'Yoplait Drink', 'eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit', 20.55, 67, '2021-04-18 00:00:00', 6, 'yoplait-drink-2', 20.55),
+        (374, 'Sausage - Liver', 'lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi', 58.67, 39, '2020-10-20 00:00:00', 4, 'sausage-liver', 58.67),
+        (375, 'Snapple Lemon Tea', 'interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie', 42.45, 43, '2020-11-02 00:00:00', 4, 'snapple-lemon-tea', 42.45),
+        (376, 'Salmon - Atlantic, No Skin', 'dis parturient montes nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus', 38.85, 15, '2020-10-31 00:00:00', 3, 'salmon-atlantic-no-skin', 38.85),
+        (377, 'Black Currants', 'accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean', 76.68, 63, '2020-09-21 00:00:00', 4, 'black-currants', 76.68),
+        (378, 'Food Colouring - Red', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum', 52.70, 87, '2020-08-17 00:00:00', 4, 'food-colouring-red', 52.70),
+        (379, 'Chocolate - White', 'id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit', 1.92, 69, '2021-04-02 00:00:00', 4, 'chocolate-white', 1.92),
+        (380, 'Calaloo', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 8.55, 76, '2020-08-03 00:00:00', 5, 'calaloo', 8.55),
+        (381, 'Cherries - Fresh', 'nulla nunc purus phasellus in felis donec semper sapien a', 31.41, 45, '2020-09-04 00:00:00', 3, 'cherries-fresh', 31.41),
+        (382, 'Muffin Orange Individual', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 54.18, 13, '2020-07-09 00:00:00', 3, 'muffin-orange-individual', 54.18),
+        (383, 'Soup - French Can Pea', 'sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla', 76.57, 85, '2021-04-17 00:00:00', 4, 'soup-french-can-pea', 76.57),
+        (384, 'Nectarines', 'arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 11.16, 30, '2020-10-26 00:00:00', 4, 'nectarines', 11.16),
+        (385, 'Shrimp - 21/25, Peel And Deviened', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat', 68.55, 65, '2020-11-14 00:00:00', 5, 'shrimp-2125-peel-and-deviened-2', 68.55),
+        (386, 'Salmon - Smoked, Sliced', 'suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 50.50, 100, '2021-03-27 00:00:00', 3, 'salmon-smoked-sliced', 50.50),
+        (387, 'Quail - Jumbo Boneless', 'ligula vehicula consequat morbi a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus', 20.37, 97, '2020-08-19 00:00:00', 4, 'quail-jumbo-boneless', 20.37),
+        (388, 'Water - Spring Water, 355 Ml', 'diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et', 11.69, 75, '2021-02-04 00:00:00', 4, 'water-spring-water-355-ml', 11.69),
+        (389, 'Pastry - Choclate Baked', 'purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat', 70.65, 11, '2020-12-27 00:00:00', 3, 'pastry-choclate-baked-2', 70.65),
+        (390, 'Banana Turning', 'ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 17.12, 36, '2020-12-24 00:00:00', 5, 'banana-turning', 17.12),
+        (391, 'Flavouring Vanilla Artificial', 'sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor', 9.47, 59, '2021-01-21 00:00:00', 3, 'flavouring-vanilla-artificial', 9.47),
+        (392, 'Lotus Rootlets - Canned', 'pede justo lacinia eget tincidunt eget tempus vel pede morbi', 72.76, 8, '2021-05-06 00:00:00', 5, 'lotus-rootlets-canned', 72.76),
+        (393, 'Filter - Coffee', 'convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat', 85.17, 51, '2021-04-10 00:00:00', 4, 'filter-coffee', 85.17),
+        (394, 'Appetizer - Smoked Salmon / Dill', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate', 32.16, 11, '2020-11-08 00:00:00', 5, 'appetizer-smoked-salmon-dill', 32.16),
+        (395, 'Macaroons - Two Bite Choc', 'eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 68.07, 19, '2020-08-08 00:00:00', 3, 'macaroons-two-bite-choc-3', 68.07),
+        (396, 'Lamb - Bones', 'pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 36.67, 24, '2021-05-13 00:00:00', 6, 'lamb-bones', 36.67),
+        (397, 'Mousse - Mango', 'nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem', 84.22, 91, '2020-08-03 00:00:00', 3, 'mousse-mango', 84.22),
+        (398, 'Truffle Shells - Semi - Sweet', 'maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis eu sapien', 72.09, 19, '2020-08-17 00:00:00', 5, 'truffle-shells-semi-sweet', 72.09),
+        (399, 'Pork - Tenderloin, Frozen', 'eu felis fusce posuere felis sed lacus morbi sem mauris', 52.90, 8, '2020-10-29 00:00:00', 4, 'pork-tenderloin-frozen', 52.90),
+        (400, 'Chilli Paste, Ginger Garlic', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 50.47, 3, '2021-03-12 00:00:00', 3, 'chilli-paste-ginger-garlic', 50.47),
+        (401, 'Creme De Menth - White', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 23.97, 49, '2021-01-05 00:00:00', 5, 'creme-de-menth-white', 23.97),
+        (402, 'Thyme - Dried', 'semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 85.99, 96, '2020-11-26 00:00:00', 4, 'thyme-dried', 85.99),
+        (403, 'Pasta - Lasagna, Dry', 'eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien', 37.80, 49, '2020-11-12 00:00:00', 4, 'pasta-lasagna-dry', 37.80),
+        (404, 'Eggplant Italian', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque', 80.68, 52, '2021-05-13 00:00:00', 5, 'eggplant-italian', 80.68),
+        (405, 'V8 - Vegetable Cocktail', 'ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi', 26.62, 14, '2021-04-16 00:00:00', 3, 'v8-vegetable-cocktail', 26.62),
+        (406, 'Tray - 16in Rnd Blk', 'nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit', 20.69, 46, '2021-04-09 00:00:00', 6, 'tray-16in-rnd-blk', 20.69),
+        (407, 'Juice Peach Nectar', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit', 47.08, 11, '2020-11-07 00:00:00', 4, 'juice-peach-nectar', 47.08),
+        (408, 'Shrimp - Baby, Warm Water', 'magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed', 21.07, 14, '2021-04-10 00:00:00', 6, 'shrimp-baby-warm-water', 21.07),
+        (409, 'Chicken - Whole Fryers', 'ac lobortis vel dapibus at diam nam tristique tortor eu', 60.39, 59, '2020-09-25 00:00:00', 6, 'chicken-whole-fryers', 60.39),
+        (410, 'Gatorade - Orange', 'ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia', 98.40, 58, '2020-11-18 00:00:00', 5, 'gatorade-orange', 98.40),
+        (411, 'Fib N9 - Prague Powder', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 53.53, 91, '2020-11-21 00:00:00', 5, 'fib-n9-prague-powder', 53.53),
+        (412, 'Mushroom - Enoki, Fresh', 'adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at', 39.73, 44, '2021-03-23 00:00:00', 5, 'mushroom-enoki-fresh', 39.73),
+        (413, 'Sauce - Hp', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a odio in hac habitasse platea', 57.26, 35, '2021-01-23 00:00:00', 4, 'sauce-hp', 57.26),
+        (414, 'Beer - Paulaner Hefeweisse', 'duis consequat dui nec nisi volutpat eleifend donec ut dolor', 95.30, 68, '2020-12-15 00:00:00', 3, 'beer-paulaner-hefeweisse-2', 95.30),
+        (415, 'Nut - Pecan, Halves', 'fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus', 81.11, 48, '2021-05-16 00:00:00', 4, 'nut-pecan-halves', 81.11),
+        (416, 'Vodka - Smirnoff', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 24.05, 62, '2020-08-07 00:00:00', 3, 'vodka-smirnoff', 24.05),
+        (417, 'Wine - Port Late Bottled Vintage', 'suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 27.91, 95, '2021-04-25 00:00:00', 6, 'wine-port-late-bottled-vintage', 27.91),
+        (418, 'Kiwi Gold Zespri', 'id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget', 28.83, 92, '2020-12-31 00:00:00', 3, 'kiwi-gold-zespri', 28.83),
+        (419, 'Soup - Chicken And Wild Rice', 'primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 74.76, 96, '2020-12-04 00:00:00', 5, 'soup-chicken-and-wild-rice', 74.76),
+        (420, 'Cream Of Tartar', 'suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 4.22, 42, '2021-02-15 00:00:00', 3, 'cream-of-tartar', 4.22),
+        (421, 'Pasta - Cheese / Spinach Bauletti', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 81.91, 12, '2020-10-23 00:00:00', 3, 'pasta-cheese-spinach-bauletti', 81.91),
+        (422, 'Yucca', 'augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 7.39, 34, '2020-09-13 00:00:00', 4, 'yucca-2', 7.39),
+        (423, 'Zucchini - Yellow', 'in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis', 55.25, 83, '2020-07-31 00:00:00', 6, 'zucchini-yellow', 55.25),
+        (424, 'Transfer Sheets', 'ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus', 91.43, 95, '2021-01-26 00:00:00', 6, 'transfer-sheets', 91.43),
+        (425, 'Beef - Cooked, Corned', 'ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit', 24.65, 65, '2021-01-02 00:00:00', 6, 'beef-cooked-corned', 24.65),
+        (426, 'Bar Bran Honey Nut', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 68.49, 30, '2021-04-14 00:00:00', 6, 'bar-bran-honey-nut', 68.49),
+        (427, 'Quail - Whole, Bone - In', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare', 41.85, 30, '2021-01-11 00:00:00', 6, 'quail-whole-bone-in', 41.85),
+        (428, 'Pepper - Julienne, Frozen', 'tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus', 22.56, 65, '2021-05-14 00:00:00', 5, 'pepper-julienne-frozen', 22.56),
+        (429, 'Radish - Pickled', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel', 91.52, 79, '2020-12-09 00:00:00', 5, 'radish-pickled', 91.52),
+        (430, 'Chocolate Eclairs', 'dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 75.55, 30, '2021-05-11 00:00:00', 5, 'chocolate-eclairs', 75.55),
+        (431, 'Godiva White Chocolate', 'velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis', 36.17, 73, '2020-09-08 00:00:00', 5, 'godiva-white-chocolate', 36.17),
+        (432, 'Sauce - Soya, Light', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 81.10, 48, '2021-04-24 00:00:00', 6, 'sauce-soya-light', 81.10),
+        (433, 'Sherry - Dry', 'natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 78.54, 9, '2020-12-18 00:00:00', 5, 'sherry-dry-2', 78.54),
+        (434, 'Potatoes - Peeled', 'at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam', 82.59, 76, '2021-02-02 00:00:00', 6, 'potatoes-peeled', 82.59),
+        (435, 'Wine - Two Oceans Cabernet', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 33.55, 86, '2020-10-16 00:00:00', 4, 'wine-two-oceans-cabernet', 33.55),
+        (436, 'Appetizer - Southwestern', 'amet sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor', 38.94, 77, '2021-04-27 00:00:00', 4, 'appetizer-southwestern', 38.94),
+        (437, 'Wine - Penfolds Koonuga Hill', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus', 50.05, 11, '2021-01-22 00:00:00', 5, 'wine-penfolds-koonuga-hill-3', 50.05),
+        (438, 'Appetizer - Shrimp Puff', 'viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 65.45, 30, '2020-12-04 00:00:00', 4, 'appetizer-shrimp-puff', 65.45),
+        (439, 'Isomalt', 'sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum', 33.57, 93, '2020-09-06 00:00:00', 5, 'isomalt', 33.57),
+        (440, 'Beans - Soya Bean', 'id turpis integer aliquet massa id lobortis convallis tortor risus', 88.40, 29, '2021-05-20 00:00:00', 4, 'beans-soya-bean', 88.40),
+        (441, 'Beef - Shank', 'volutpat in congue etiam justo etiam pretium iaculis justo in hac habitasse platea', 58.80, 99, '2020-10-19 00:00:00', 3, 'beef-shank-2', 58.80),
+        (442, 'Oil - Shortening - All - Purpose', 'congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec', 15.47, 51, '2021-01-27 00:00:00', 3, 'oil-shortening-all-purpose-2', 15.47),
+        (443, 'Pepper - Chilli Seeds Mild', 'nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla', 39.69, 35, '2020-10-03 00:00:00', 6, 'pepper-chilli-seeds-mild', 39.69),
+        (444, 'Pasta - Fusili, Dry', 'pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante', 17.95, 19, '2020-11-17 00:00:00', 3, 'pasta-fusili-dry', 17.95),
+        (445, 'Flower - Leather Leaf Fern', 'bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem', 69.96, 83, '2021-01-24 00:00:00', 5, 'flower-leather-leaf-fern', 69.96),
+        (446, 'Black Currants', 'lacus purus aliquet at feugiat non pretium quis lectus suspendisse', 8.73, 8, '2020-07-28 00:00:00', 6, 'black-currants-2', 8.73),
+        (447, 'Sword Pick Asst', 'ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi', 32.29, 16, '2021-01-21 00:00:00', 5, 'sword-pick-asst-2', 32.29),
+        (448, 'Soup - Campbells, Lentil', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 48.58, 76, '2021-01-27 00:00:00', 5, 'soup-campbells-lentil', 48.58),
+        (449, 'Roe - Lump Fish, Red', 'non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 84.19, 65, '2021-04-04 00:00:00', 4, 'roe-lump-fish-red', 84.19),
+        (450, 'Sauce - Demi Glace', 'ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa', 81.03, 90, '2020-09-09 00:00:00', 4, 'sauce-demi-glace', 81.03),
+        (451, 'Coffee Cup 8oz 5338cd', 'vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl', 73.11, 71, '2021-02-15 00:00:00', 6, 'coffee-cup-8oz-5338cd', 73.11),
+        (452, 'Salmon - Smoked, Sliced', 'rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi', 30.55, 11, '2020-10-09 00:00:00', 4, 'salmon-smoked-sliced-2', 30.55),
+        (453, 'Veal - Osso Bucco', 'ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo', 93.75, 23, '2020-10-31 00:00:00', 4, 'veal-osso-bucco', 93.75),
+        (454, 'Sole - Dover, Whole, Fresh', 'nunc donec quis orci eget orci vehicula condimentum curabitur in libero', 14.14, 29, '2021-06-05 00:00:00', 6, 'sole-dover-whole-fresh', 14.14),
+        (455, 'Vaccum Bag - 14x20', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed', 56.18, 92, '2021-03-26 00:00:00', 3, 'vaccum-bag-14x20-2', 56.18),
+        (456, 'Sausage - Liver', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 87.44, 25, '2020-08-01 00:00:00', 6, 'sausage-liver-2', 87.44),
+        (457, 'Wine - Magnotta, White', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien', 96.03, 34, '2021-01-30 00:00:00', 5, 'wine-magnotta-white', 96.03),
+        (458, 'Ham - Virginia', 'hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem', 93.87, 87, '2021-04-08 00:00:00', 4, 'ham-virginia', 93.87),
+        (459, 'Onion - Dried', 'semper porta volutpat quam pede lobortis ligula sit amet eleifend', 5.80, 5, '2020-09-24 00:00:00', 4, 'onion-dried', 5.80),
+        (460, 'Coffee - Decafenated', 'mi sit amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam', 35.38, 32, '2020-09-29 00:00:00', 3, 'coffee-decafenated', 35.38),
+        (461, 'Sauce - Plum', 'platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 8.77, 35, '2020-07-03 00:00:00', 4, 'sauce-plum', 8.77),
+        (462, 'Yogurt - Raspberry, 175 Gr', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque', 74.58, 100, '2020-12-08 00:00:00', 4, 'yogurt-raspberry-175-gr', 74.58),
+        (463, 'Orange - Tangerine', 'ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra', 91.78, 85, '2020-06-19 00:00:00', 5, 'orange-tangerine', 91.78),
+        (464, 'Chicken - Soup Base', 'nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula', 11.88, 55, '2020-08-20 00:00:00', 4, 'chicken-soup-base', 11.88),
+        (465, 'Ecolab - Lime - A - Way 4/4 L', 'nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum', 88.85, 93, '2021-05-27 00:00:00', 3, 'ecolab-lime-a-way-44-l', 88.85),
+        (466, 'Cheese - Parmigiano Reggiano', 'morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non', 77.72, 82, '2020-08-17 00:00:00', 3, 'cheese-parmigiano-reggiano', 77.72),
+        (467, 'Beef - Chuck, Boneless', 'viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec', 85.88, 22, '2020-10-21 00:00:00', 5, 'beef-chuck-boneless', 85.88),
+        (468, 'Raisin - Golden', 'duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim', 94.29, 51, '2020-12-04 00:00:00', 4, 'raisin-golden', 94.29),
+        (469, 'Molasses - Fancy', 'ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 1.13, 8, '2021-02-25 00:00:00', 3, 'molasses-fancy', 1.13),
+        (470, 'Pork - Ground', 'vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus', 96.62, 34, '2020-07-19 00:00:00', 6, 'pork-ground', 96.62),
+        (471, 'Bread - White, Unsliced', 'donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna', 83.52, 51, '2021-01-17 00:00:00', 4, 'bread-white-unsliced', 83.52),
+        (472, 'Versatainer Nc - 8288', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia', 23.04, 81, '2020-07-13 00:00:00', 5, 'versatainer-nc-8288', 23.04),
+        (473, 'Lambcasing', 'nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in', 78.97, 70, '2020-06-16 00:00:00', 6, 'lambcasing', 78.97),
+        (474, 'Beef - Ox Tongue', 'augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat', 27.92, 79, '2020-11-05 00:00:00', 4, 'beef-ox-tongue', 27.92),
+        (475, 'Pepper - Green, Chili', 'eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in', 95.20, 61, '2021-01-13 00:00:00', 6, 'pepper-green-chili', 95.20),
+        (476, 'Beer - Tetleys', 'dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 34.41, 16, '2020-12-14 00:00:00', 3, 'beer-tetleys', 34.41),
+        (477, 'Yogurt - Cherry, 175 Gr', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut', 52.89, 80, '2020-08-05 00:00:00', 3, 'yogurt-cherry-175-gr-2', 52.89),
+        (478, 'Sole - Fillet', 'interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis at velit eu', 28.28, 35, '2021-04-26 00:00:00', 5, 'sole-fillet', 28.28),
+        (479, 'Turnip - White, Organic', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam tristique', 50.07, 25, '2021-02-09 00:00:00', 5, 'turnip-white-organic', 50.07),
+        (480, 'Dip - Tapenade', 'tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium', 45.11, 41, '2020-08-11 00:00:00', 6, 'dip-tapenade', 45.11),
+        (481, 'Coffee - 10oz Cup 92961', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros', 21.42, 93, '2021-05-01 00:00:00', 4, 'coffee-10oz-cup-92961-2', 21.42),
+        (482, 'Pasta - Elbows, Macaroni, Dry', 'faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus', 37.30, 87, '2021-04-08 00:00:00', 6, 'pasta-elbows-macaroni-dry', 37.30),
+        (483, 'Wine - White, Colubia Cresh', 'lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a', 1.59, 42, '2020-06-24 00:00:00', 4, 'wine-white-colubia-cresh', 1.59),
+        (484, 'Soup - Beef Conomme, Dry', 'ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec', 92.54, 75, '2021-01-05 00:00:00', 4, 'soup-beef-conomme-dry', 92.54),
+        (485, 'Soup - Campbells Mushroom', 'eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus', 32.67, 17, '2020-09-27 00:00:00', 4, 'soup-campbells-mushroom', 32.67),
+        (486, 'Potatoes - Mini Red', 'purus phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 57.24, 21, '2021-03-14 00:00:00', 5, 'potatoes-mini-red', 57.24),
+        (487, 'Cheese - Havarti, Salsa', 'blandit non interdum in ante vestibulum ante ipsum primis in', 31.03, 75, '2020-12-06 00:00:00', 6, 'cheese-havarti-salsa', 31.03),
+        (488, 'Shrimp - 21/25, Peel And Deviened', 'sed tristique in tempus sit amet sem fusce consequat nulla', 83.12, 20, '2020-07-09 00:00:00', 4, 'shrimp-2125-peel-and-deviened-3', 83.12),
+        (489, 'Propel Sport Drink', 'aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum', 50.37, 18, '2020-08-03 00:00:00', 4, 'propel-sport-drink', 50.37),
+        (490, 'Chicken - White Meat With Tender', 'vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis', 39.47, 64, '2020-12-23 00:00:00', 6, 'chicken-white-meat-with-tender', 39.47),
+        (491, 'Guinea Fowl', 'erat fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis', 84.54, 43, '2020-11-04 00:00:00', 5, 'guinea-fowl', 84.54),
+        (492, 'Bowl 12 Oz - Showcase 92012', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo', 29.71, 13, '2021-02-04 00:00:00', 4, 'bowl-12-oz-showcase-92012-2', 29.71),
+        (493, 'Yeast Dry - Fermipan', 'libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 10.79, 86, '2021-05-11 00:00:00', 3, 'yeast-dry-fermipan', 10.79),
+        (494, 'Mushroom - Chantrelle, Fresh', 'amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 23.61, 39, '2020-09-12 00:00:00', 5, 'mushroom-chantrelle-fresh', 23.61),
+        (495, 'Beer - Steamwhistle', 'sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit', 7.39, 82, '2021-03-12 00:00:00', 4, 'beer-steamwhistle-2', 7.39),
+        (496, 'Lettuce - Belgian Endive', 'libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate', 40.96, 59, '2020-09-30 00:00:00', 3, 'lettuce-belgian-endive', 40.96),
+        (497, 'Jello - Assorted', 'in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu', 13.53, 97, '2021-02-22 00:00:00', 5, 'jello-assorted', 13.53),
+        (498, 'Garlic Powder', 'morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec', 2.19, 3, '2020-08-27 00:00:00', 6, 'garlic-powder', 2.19),
+        (499, 'Pickle - Dill', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 31.52, 77, '2020-09-20 00:00:00', 6, 'pickle-dill', 31.52),
+        (500, 'Flour Dark Rye', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel', 37.41, 75, '2020-10-22 00:00:00', 5, 'flour-dark-rye', 37.41),
+        (501, 'Compound - Pear', 'potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus', 93.42, 51, '2021-06-07 00:00:00', 6, 'compound-pear', 93.42),
+        (502, 'Cookie Chocolate Chip With', 'libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 66.30, 29, '2020-07-25 00:00:00', 3, 'cookie-chocolate-chip-with', 66.30),
+        (503, 'Cloves - Ground', 'nulla nunc purus phasellus in felis donec semper sapien a libero', 26.06, 15, '2020-11-08 00:00:00', 5, 'cloves-ground', 26.06),
+        (504, 'Sauce - Thousand Island', 'congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 60.11, 46, '2020-09-27 00:00:00', 4, 'sauce-thousand-island-2', 60.11),
+        (505, 'Yogurt - Assorted Pack', 'suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 12.44, 67, '2020-07-25 00:00:00', 3, 'yogurt-assorted-pack', 12.44),
+        (506, 'Dooleys Toffee', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 71.19, 52, '2021-05-26 00:00:00', 6, 'dooleys-toffee', 71.19),
+        (507, 'Marzipan 50/50', 'felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 89.05, 58, '2021-03-25 00:00:00', 3, 'marzipan-5050', 89.05),
+        (508, 'Flavouring - Raspberry', 'tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est', 72.89, 40, '2021-02-28 00:00:00', 6, 'flavouring-raspberry', 72.89),
+        (509, 'Lamb - Bones', 'aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa', 1.44, 80, '2021-04-09 00:00:00', 5, 'lamb-bones-2', 1.44),
+        (510, 'Pineapple - Canned, Rings', 'aliquam sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed', 14.96, 77, '2021-04-04 00:00:00', 3, 'pineapple-canned-rings-2', 14.96),
+        (511, 'Chicken - Whole Roasting', 'sagittis nam congue risus semper porta volutpat quam pede lobortis ligula', 54.87, 44, '2021-02-10 00:00:00', 4, 'chicken-whole-roasting-3', 54.87),
+        (512, 'Scallops - U - 10', 'blandit non interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae', 88.21, 100, '2021-04-25 00:00:00', 4, 'scallops-u-10', 88.21),
+        (513, 'Container - Clear 32 Oz', 'quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea', 5.78, 30, '2021-03-04 00:00:00', 6, 'container-clear-32-oz', 5.78),
+        (514, 'Juice - Orange 1.89l', 'eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis', 54.45, 65, '2020-10-04 00:00:00', 4, 'juice-orange-189l-2', 54.45),
+        (515, 'Sparkling Wine - Rose, Freixenet', 'justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue', 95.18, 44, '2020-12-24 00:00:00', 3, 'sparkling-wine-rose-freixenet-2', 95.18),
+        (516, 'Sultanas', 'maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum', 48.75, 64, '2020-08-27 00:00:00', 3, 'sultanas', 48.75),
+        (517, 'Pasta - Cheese / Spinach Bauletti', 'primis in faucibus orci luctus et ultrices posuere cubilia curae donec', 93.85, 21, '2021-03-28 00:00:00', 4, 'pasta-cheese-spinach-bauletti-2', 93.85),
+        (518, 'Tart - Pecan Butter Squares', 'ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 4.75, 43, '2021-04-23 00:00:00', 4, 'tart-pecan-butter-squares-2', 4.75),
+        (519, 'Tarts Assorted', 'pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla', 68.34, 87, '2021-04-21 00:00:00', 6, 'tarts-assorted', 68.34),
+        (520, 'Appetizer - Asian Shrimp Roll', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan', 92.58, 47, '2021-03-15 00:00:00', 6, 'appetizer-asian-shrimp-roll', 92.58),
+        (521, 'Pork - Smoked Back Bacon', 'primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 14.00, 1, '2021-05-13 00:00:00', 5, 'pork-smoked-back-bacon', 14.00),
+        (522, 'Vodka - Smirnoff', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in', 66.15, 38, '2020-09-15 00:00:00', 4, 'vodka-smirnoff-2', 66.15),
+        (523, 'Cake - Miini Cheesecake Cherry', 'potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non', 57.35, 37, '2020-11-19 00:00:00', 6, 'cake-miini-cheesecake-cherry', 57.35),
+        (524, 'Tia Maria', 'dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam', 57.76, 82, '2021-01-29 00:00:00', 6, 'tia-maria-2', 57.76),
+        (525, 'Banana Turning', 'augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam sit amet turpis elementum', 90.39, 64, '2020-07-10 00:00:00', 6, 'banana-turning-2', 90.39),
+        (526, 'Rice - Brown', 'eget vulputate ut ultrices vel augue vestibulum ante ipsum primis', 57.03, 54, '2020-10-04 00:00:00', 5, 'rice-brown-2', 57.03),
+        (527, 'Potatoes - Fingerling 4 Oz', 'commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem', 32.99, 89, '2021-02-07 00:00:00', 6, 'potatoes-fingerling-4-oz', 32.99),
+        (528, 'Shrimp - Tiger 21/25', 'fermentum justo nec condimentum neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris', 79.68, 71, '2021-03-27 00:00:00', 6, 'shrimp-tiger-2125-3', 79.68),
+        (529, 'Lamb - Shanks', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus', 17.39, 29, '2020-07-01 00:00:00', 6, 'lamb-shanks-2', 17.39),
+        (530, 'Wine - Red, Cabernet Merlot', 'platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum', 89.73, 57, '2020-12-11 00:00:00', 4, 'wine-red-cabernet-merlot', 89.73),
+        (531, 'Bread - Sour Batard', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien', 57.33, 6, '2021-05-04 00:00:00', 3, 'bread-sour-batard', 57.33),
+        (532, 'Ginger - Crystalized', 'turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at turpis a', 8.17, 88, '2020-08-25 00:00:00', 3, 'ginger-crystalized', 8.17),
+        (533, 'Eggplant - Asian', 'lectus in est risus auctor sed tristique in tempus sit amet sem', 50.50, 69, '2020-12-26 00:00:00', 3, 'eggplant-asian', 50.50),
+        (534, 'Wine - Malbec Trapiche Reserve', 'dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst', 90.41, 61, '2020-11-10 00:00:00', 5, 'wine-malbec-trapiche-reserve', 90.41),
+        (535, 'Coffee Cup 16oz Foam', 'justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus', 2.94, 82, '2021-02-04 00:00:00', 6, 'coffee-cup-16oz-foam', 2.94),
+        (536, 'Coconut Milk - Unsweetened', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 66.22, 90, '2020-11-09 00:00:00', 6, 'coconut-milk-unsweetened-2', 66.22),
+        (537, 'Squid Ink', 'suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae ipsum aliquam', 32.21, 65, '2020-06-20 00:00:00', 3, 'squid-ink', 32.21),
+        (538, 'Wine - Bouchard La Vignee Pinot', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum', 90.55, 70, '2020-06-24 00:00:00', 6, 'wine-bouchard-la-vignee-pinot', 90.55),
+        (539, 'Guinea Fowl', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque', 4.85, 97, '2020-08-02 00:00:00', 3, 'guinea-fowl-2', 4.85),
+        (540, 'Remy Red', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate', 67.10, 41, '2021-04-05 00:00:00', 6, 'remy-red', 67.10),
+        (541, 'Cookie Dough - Chocolate Chip', 'erat fermentum justo nec condimentum neque sapien placerat ante nulla justo', 16.48, 11, '2020-09-09 00:00:00', 3, 'cookie-dough-chocolate-chip', 16.48),
+        (542, 'Fennel', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis', 2.73, 15, '2021-01-15 00:00:00', 4, 'fennel', 2.73),
+        (543, 'Nacho Chips', 'massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh', 57.42, 97, '2021-04-09 00:00:00', 6, 'nacho-chips', 57.42),
+        (544, 'Sugar - Invert', 'eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient montes', 23.54, 77, '2020-12-25 00:00:00', 6, 'sugar-invert-2', 23.54),
+        (545, 'Tarts Assorted', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna', 79.79, 51, '2020-11-02 00:00:00', 3, 'tarts-assorted-2', 79.79),
+        (546, 'Mushroom Morel Fresh', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 27.00, 52, '2020-10-21 00:00:00', 3, 'mushroom-morel-fresh', 27.00),
+        (547, 'Hersey Shakes', 'sem fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis', 47.61, 23, '2020-12-19 00:00:00', 6, 'hersey-shakes', 47.61),
+        (548, 'Tomatoes - Heirloom', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero nam dui proin', 74.60, 84, '2021-01-14 00:00:00', 5, 'tomatoes-heirloom', 74.60),
+        (549, 'Tea - Herbal Orange Spice', 'vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in', 68.15, 1, '2021-04-13 00:00:00', 3, 'tea-herbal-orange-spice-2', 68.15),
+        (550, 'Pork - Bacon Cooked Slcd', 'nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 2.24, 94, '2020-09-04 00:00:00', 6, 'pork-bacon-cooked-slcd', 2.24),
+        (551, 'Mint - Fresh', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue', 84.18, 45, '2020-10-01 00:00:00', 5, 'mint-fresh', 84.18),
+        (552, 'Bread - Bistro Sour', 'nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer', 99.35, 69, '2021-01-13 00:00:00', 3, 'bread-bistro-sour', 99.35),
+        (553, 'Wine - Magnotta - Red, Baco', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices', 27.60, 71, '2021-02-14 00:00:00', 5, 'wine-magnotta-red-baco', 27.60),
+        (554, 'Chicken - Leg, Fresh', 'leo odio condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam', 11.50, 2, '2021-06-02 00:00:00', 4, 'chicken-leg-fresh', 11.50),
+        (555, 'Soup - French Onion, Dry', 'libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit amet nunc', 66.46, 37, '2021-01-24 00:00:00', 6, 'soup-french-onion-dry', 66.46),
+        (556, 'Sachet', 'faucibus cursus urna ut tellus nulla ut erat id mauris', 74.35, 81, '2021-03-21 00:00:00', 3, 'sachet', 74.35),
+        (557, 'Carrots - Purple, Organic', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus in felis', 12.34, 48, '2021-06-02 00:00:00', 5, 'carrots-purple-organic', 12.34),
+        (558, 'Yogurt - Raspberry, 175 Gr', 'sodales sed tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet', 73.13, 32, '2021-05-07 00:00:00', 6, 'yogurt-raspberry-175-gr-2', 73.13),
+        (559, 'Chocolate - Chips Compound', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim', 91.36, 13, '2020-11-17 00:00:00', 4, 'chocolate-chips-compound-2', 91.36),
+        (560, 'Sponge Cake Mix - Chocolate', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam pede', 77.66, 75, '2020-07-28 00:00:00', 4, 'sponge-cake-mix-chocolate', 77.66),
+        (561, 'Flower - Potmums', 'justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id', 62.42, 82, '2020-09-22 00:00:00', 5, 'flower-potmums', 62.42),
+        (562, 'Glass Clear 7 Oz Xl', 'sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus', 97.10, 97, '2020-11-03 00:00:00', 4, 'glass-clear-7-oz-xl', 97.10),
+        (563, 'Flour - Strong Pizza', 'justo morbi ut odio cras mi pede malesuada in imperdiet et commodo', 2.22, 15, '2020-08-01 00:00:00', 6, 'flour-strong-pizza', 2.22),
+        (564, 'Glass Clear 7 Oz Xl', 'tellus nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit', 45.75, 85, '2020-09-28 00:00:00', 5, 'glass-clear-7-oz-xl-2', 45.75),
+        (565, 'Taro Leaves', 'rutrum nulla nunc purus phasellus in felis donec semper sapien a libero', 56.91, 58, '2020-12-01 00:00:00', 3, 'taro-leaves-2', 56.91),
+        (566, 'Bread Bowl Plain', 'eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et', 11.53, 77, '2021-04-04 00:00:00', 5, 'bread-bowl-plain', 11.53),
+        (567, 'Cheese - Cambozola', 'nibh fusce lacus purus aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend', 52.08, 44, '2020-07-02 00:00:00', 6, 'cheese-cambozola-3', 52.08),
+        (568, 'Lettuce - Spring Mix', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 14.24, 50, '2020-08-29 00:00:00', 5, 'lettuce-spring-mix', 14.24),
+        (569, 'Crab - Claws, 26 - 30', 'congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero', 60.21, 78, '2021-02-22 00:00:00', 3, 'crab-claws-26-30', 60.21),
+        (570, 'Stock - Chicken, White', 'velit eu est congue elementum in hac habitasse platea dictumst', 48.55, 24, '2021-04-15 00:00:00', 6, 'stock-chicken-white', 48.55),
+        (571, 'Latex Rubber Gloves Size 9', 'proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 1.13, 44, '2021-01-19 00:00:00', 3, 'latex-rubber-gloves-size-9', 1.13),
+        (572, 'Wine - White Cab Sauv.on', 'amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh in', 34.66, 27, '2020-12-06 00:00:00', 6, 'wine-white-cab-sauvon', 34.66),
+        (573, 'Cheese - Brie, Cups 125g', 'nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur', 36.30, 32, '2020-06-12 00:00:00', 5, 'cheese-brie-cups-125g', 36.30),
+        (574, 'Flour - All Purpose', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam', 5.11, 41, '2021-03-28 00:00:00', 4, 'flour-all-purpose', 5.11),
+        (575, 'Lemon Balm - Fresh', 'quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi odio odio', 24.68, 64, '2021-04-24 00:00:00', 3, 'lemon-balm-fresh', 24.68),
+        (576, 'Tomatoes - Roma', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 10.38, 89, '2020-07-05 00:00:00', 4, 'tomatoes-roma-2', 10.38),
+        (577, 'Soup - Campbells, Classic Chix', 'eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem', 24.59, 48, '2020-12-10 00:00:00', 5, 'soup-campbells-classic-chix', 24.59),
+        (578, 'Beer - Upper Canada Light', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper', 98.21, 66, '2020-10-11 00:00:00', 4, 'beer-upper-canada-light-2', 98.21),
+        (579, 'Hersey Shakes', 'at nulla suspendisse potenti cras in purus eu magna vulputate luctus', 79.61, 74, '2020-09-16 00:00:00', 5, 'hersey-shakes-2', 79.61),
+        (580, 'Extract - Rum', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in', 23.37, 62, '2021-03-02 00:00:00', 3, 'extract-rum', 23.37),
+        (581, 'Yams', 'elit ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum', 12.88, 40, '2020-10-05 00:00:00', 4, 'yams', 12.88),
+        (582, 'Water - Spring 1.5lit', 'vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 99.96, 49, '2021-03-18 00:00:00', 4, 'water-spring-15lit', 99.96),
+        (583, 'Skirt - 24 Foot', 'eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis', 92.67, 7, '2021-03-20 00:00:00', 5, 'skirt-24-foot', 92.67),
+        (584, 'Flour Dark Rye', 'nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in', 52.70, 69, '2020-08-17 00:00:00', 6, 'flour-dark-rye-2', 52.70),
+        (585, 'Coffee - Almond Amaretto', 'lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna', 97.09, 82, '2020-09-17 00:00:00', 4, 'coffee-almond-amaretto', 97.09),
+        (586, 'Bread - Rolls, Rye', 'erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi', 80.76, 76, '2021-02-01 00:00:00', 4, 'bread-rolls-rye', 80.76),
+        (587, 'Salmon - Fillets', 'euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam convallis nunc proin at turpis', 68.90, 8, '2021-03-12 00:00:00', 3, 'salmon-fillets', 68.90),
+        (588, 'Cheese - Brick With Onion', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla', 52.21, 63, '2020-07-31 00:00:00', 6, 'cheese-brick-with-onion', 52.21),
+        (589, 'Tray - 16in Rnd Blk', 'libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis', 32.03, 89, '2021-04-15 00:00:00', 5, 'tray-16in-rnd-blk-2', 32.03),
+        (590, 'Pike - Frozen Fillet', 'consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 6.97, 5, '2021-01-12 00:00:00', 3, 'pike-frozen-fillet', 6.97),
+        (591, 'Kirsch - Schloss', 'dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat', 42.90, 44, '2021-03-09 00:00:00', 6, 'kirsch-schloss', 42.90),
+        (592, 'Ham - Procutinni', 'ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan tortor', 41.48, 56, '2020-08-29 00:00:00', 5, 'ham-procutinni', 41.48),
+        (593, 'Lettuce - Curly Endive', 'lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit', 2.38, 74, '2020-10-14 00:00:00', 4, 'lettuce-curly-endive-2', 2.38),
+        (594, 'Black Currants', 'morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus', 17.39, 52, '2021-05-24 00:00:00', 6, 'black-currants-3', 17.39),
+        (595, 'Doilies - 5, Paper', 'vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl venenatis lacinia aenean sit amet justo morbi', 1.06, 86, '2020-07-15 00:00:00', 6, 'doilies-5-paper', 1.06),
+        (596, 'Gelatine Powder', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat', 60.24, 100, '2020-08-11 00:00:00', 6, 'gelatine-powder', 60.24),
+        (597, 'Noodles - Steamed Chow Mein', 'venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 10.56, 49, '2021-03-02 00:00:00', 5, 'noodles-steamed-chow-mein', 10.56),
+        (598, 'Yogurt - Raspberry, 175 Gr', 'mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel', 9.79, 35, '2020-09-23 00:00:00', 4, 'yogurt-raspberry-175-gr-3', 9.79),
+        (599, 'Tarts Assorted', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus', 84.04, 27, '2020-09-04 00:00:00', 4, 'tarts-assorted-3', 84.04),
+        (600, 'Icecream - Dstk Super Cone', 'pede lobortis ligula sit amet eleifend pede libero quis orci', 50.84, 96, '2020-11-30 00:00:00', 3, 'icecream-dstk-super-cone', 50.84),
+        (601, 'Wine - Rhine Riesling Wolf Blass', 'ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue', 11.87, 17, '2021-04-27 00:00:00', 3, 'wine-rhine-riesling-wolf-blass', 11.87),
+        (602, 'Beans - Fine', 'sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla', 54.25, 84, '2021-01-09 00:00:00', 4, 'beans-fine', 54.25),
+        (603, 'Wine - Cousino Macul Antiguas', 'purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 33.22, 48, '2020-12-12 00:00:00', 4, 'wine-cousino-macul-antiguas', 33.22),
+        (604, 'Appetizer - Sausage Rolls', 'luctus et ultrices posuere cubilia curae mauris viverra diam vitae', 91.63, 13, '2020-06-18 00:00:00', 6, 'appetizer-sausage-rolls-2', 91.63),
+        (605, 'Russian Prince', 'donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam', 72.46, 49, '2020-08-25 00:00:00', 6, 'russian-prince', 72.46),
+        (606, 'Cabbage - Nappa', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae', 74.35, 2, '2021-04-13 00:00:00', 4, 'cabbage-nappa', 74.35),
+        (607, 'Syrup - Monin - Passion Fruit', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 14.17, 55, '2020-06-10 00:00:00', 4, 'syrup-monin-passion-fruit-2', 14.17),
+        (608, 'Jack Daniels', 'vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla', 63.09, 30, '2020-10-25 00:00:00', 4, 'jack-daniels', 63.09),
+        (609, 'Beef - Ground, Extra Lean, Fresh', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at', 88.73, 35, '2021-04-12 00:00:00', 6, 'beef-ground-extra-lean-fresh', 88.73),
+        (610, 'Icecream - Dstk Cml And Fdg', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien', 78.11, 81, '2020-11-13 00:00:00', 3, 'icecream-dstk-cml-and-fdg', 78.11),
+        (611, 'Beer - Muskoka Cream Ale', 'diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 95.62, 10, '2021-02-15 00:00:00', 5, 'beer-muskoka-cream-ale', 95.62),
+        (612, 'Wine - Acient Coast Caberne', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 86.89, 7, '2020-10-04 00:00:00', 6, 'wine-acient-coast-caberne', 86.89),
+        (613, 'Shrimp - Baby, Warm Water', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi', 37.16, 33, '2020-07-26 00:00:00', 5, 'shrimp-baby-warm-water-2', 37.16),
+        (614, 'Quiche Assorted', 'sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo in hac', 25.19, 57, '2021-05-03 00:00:00', 6, 'quiche-assorted', 25.19),
+        (615, 'Appetizer - Sausage Rolls', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 93.60, 94, '2021-04-02 00:00:00', 4, 'appetizer-sausage-rolls-3', 93.60),
+        (616, 'Ecolab - Ster Bac', 'donec semper sapien a libero nam dui proin leo odio porttitor id consequat', 93.16, 79, '2020-12-05 00:00:00', 6, 'ecolab-ster-bac', 93.16),
+        (617, 'Olives - Black, Pitted', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est', 67.08, 76, '2021-06-04 00:00:00', 3, 'olives-black-pitted', 67.08),
+        (618, 'Napkin - Beverge, White 2 - Ply', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu', 73.73, 36, '2020-11-27 00:00:00', 4, 'napkin-beverge-white-2-ply', 73.73),
+        (619, 'Wine - Charddonnay Errazuriz', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam', 16.29, 33, '2020-09-02 00:00:00', 5, 'wine-charddonnay-errazuriz', 16.29),
+        (620, 'Oil - Safflower', 'orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel', 7.67, 95, '2021-06-08 00:00:00', 4, 'oil-safflower', 7.67),
+        (621, 'Bread - Dark Rye', 'pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 65.31, 77, '2021-05-31 00:00:00', 6, 'bread-dark-rye', 65.31),
+        (622, 'Ginger - Ground', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae', 71.12, 14, '2020-07-12 00:00:00', 3, 'ginger-ground', 71.12),
+        (623, 'Cucumber - English', 'cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et', 82.68, 68, '2021-01-19 00:00:00', 5, 'cucumber-english', 82.68),
+        (624, 'Sterno - Chafing Dish Fuel', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus', 52.77, 48, '2021-01-20 00:00:00', 4, 'sterno-chafing-dish-fuel', 52.77),
+        (625, 'Soup - Knorr, Chicken Noodle', 'ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 50.07, 30, '2021-04-23 00:00:00', 3, 'soup-knorr-chicken-noodle', 50.07),
+        (626, 'Rum - Light, Captain Morgan', 'tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 90.20, 52, '2020-11-17 00:00:00', 5, 'rum-light-captain-morgan', 90.20),
+        (627, 'Wine - Zinfandel California 2002', 'hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum', 55.71, 38, '2020-07-04 00:00:00', 4, 'wine-zinfandel-california-2002', 55.71),
+        (628, 'Pasta - Linguini, Dry', 'ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus', 78.66, 35, '2020-09-30 00:00:00', 4, 'pasta-linguini-dry', 78.66),
+        (629, 'Juice Peach Nectar', 'elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 25.05, 66, '2020-06-21 00:00:00', 3, 'juice-peach-nectar-2', 25.05),
+        (630, 'Beef - Roasted, Cooked', 'eros elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 81.59, 13, '2021-02-13 00:00:00', 4, 'beef-roasted-cooked', 81.59),
+        (631, 'Icecream Cone - Areo Chocolate', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet nullam', 82.33, 89, '2020-09-14 00:00:00', 5, 'icecream-cone-areo-chocolate', 82.33),
+        (632, 'Wine - Maipo Valle Cabernet', 'eget nunc donec quis orci eget orci vehicula condimentum curabitur', 16.52, 92, '2020-06-14 00:00:00', 3, 'wine-maipo-valle-cabernet', 16.52),
+        (633, 'Lamb Rack Frenched Australian', 'et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat', 95.50, 12, '2021-01-07 00:00:00', 4, 'lamb-rack-frenched-australian', 95.50),
+        (634, 'Wine - Spumante Bambino White', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 99.09, 30, '2021-02-06 00:00:00', 5, 'wine-spumante-bambino-white', 99.09),
+        (635, 'Sauce - White, Mix', 'ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui', 90.02, 54, '2021-05-22 00:00:00', 3, 'sauce-white-mix', 90.02),
+        (636, 'Calypso - Black Cherry Lemonade', 'nullam orci pede venenatis non sodales sed tincidunt eu felis fusce', 28.12, 42, '2021-01-12 00:00:00', 5, 'calypso-black-cherry-lemonade', 28.12),
+        (637, 'Flour - Strong Pizza', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor', 10.05, 85, '2021-04-15 00:00:00', 6, 'flour-strong-pizza-2', 10.05),
+        (638, 'Ecolab - Hand Soap Form Antibac', 'nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et', 89.15, 74, '2021-05-31 00:00:00', 4, 'ecolab-hand-soap-form-antibac-2', 89.15),
+        (639, 'Nori Sea Weed', 'imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam', 82.66, 91, '2021-03-05 00:00:00', 6, 'nori-sea-weed', 82.66),
+        (640, 'Bread - Calabrese Baguette', 'ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac', 25.38, 43, '2020-10-03 00:00:00', 5, 'bread-calabrese-baguette-3', 25.38),
+        (641, 'Tea - Earl Grey', 'nibh ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere', 95.08, 31, '2020-09-13 00:00:00', 3, 'tea-earl-grey', 95.08),
+        (642, 'Capicola - Hot', 'ac est lacinia nisi venenatis tristique fusce congue diam id', 90.60, 55, '2020-06-27 00:00:00', 3, 'capicola-hot', 90.60),
+        (643, 'Chinese Foods - Chicken', 'sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis ut', 4.77, 76, '2020-12-19 00:00:00', 6, 'chinese-foods-chicken', 4.77),
+        (644, 'Bread - French Stick', 'convallis morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus', 94.19, 21, '2021-04-02 00:00:00', 5, 'bread-french-stick', 94.19),
+        (645, 'Sprouts - Onion', 'nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget', 80.48, 64, '2020-07-06 00:00:00', 5, 'sprouts-onion-2', 80.48),
+        (646, 'Pastry - French Mini Assorted', 'lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat', 53.14, 42, '2020-10-31 00:00:00', 6, 'pastry-french-mini-assorted', 53.14),
+        (647, 'Star Anise, Whole', 'luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur', 23.01, 78, '2020-06-13 00:00:00', 5, 'star-anise-whole', 23.01),
+        (648, '7up Diet, 355 Ml', 'tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est', 79.07, 82, '2020-07-16 00:00:00', 5, '7up-diet-355-ml', 79.07),
+        (649, 'Rabbit - Saddles', 'cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 93.25, 69, '2021-02-08 00:00:00', 4, 'rabbit-saddles', 93.25),
+        (650, 'Sour Puss - Tangerine', 'cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris', 40.35, 89, '2021-01-11 00:00:00', 6, 'sour-puss-tangerine', 40.35),
+        (651, 'Potato - Sweet', 'et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 85.45, 82, '2021-02-12 00:00:00', 4, 'potato-sweet', 85.45),
+        (652, 'Nantucket - Kiwi Berry Cktl.', 'morbi ut odio cras mi pede malesuada in imperdiet et commodo vulputate justo in blandit ultrices', 59.74, 98, '2020-09-07 00:00:00', 6, 'nantucket-kiwi-berry-cktl', 59.74),
+        (653, 'Wine - Ej Gallo Sierra Valley', 'nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis', 28.12, 21, '2021-02-16 00:00:00', 5, 'wine-ej-gallo-sierra-valley', 28.12),
+        (654, 'Onions - Red Pearl', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien', 2.23, 93, '2021-05-01 00:00:00', 5, 'onions-red-pearl-2', 2.23),
+        (655, 'Soy Protein', 'in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 94.42, 14, '2020-08-07 00:00:00', 4, 'soy-protein', 94.42),
+        (656, 'Sauce - Marinara', 'enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur', 5.62, 14, '2020-11-06 00:00:00', 4, 'sauce-marinara', 5.62),
+        (657, 'Salt - Sea', 'justo morbi ut odio cras mi pede malesuada in imperdiet', 25.91, 95, '2020-11-25 00:00:00', 3, 'salt-sea', 25.91),
+        (658, 'Wine - Jafflin Bourgongone', 'erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget', 91.01, 21, '2020-10-09 00:00:00', 4, 'wine-jafflin-bourgongone', 91.01),
+        (659, 'Hot Choc Vending', 'sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam', 52.05, 76, '2020-09-06 00:00:00', 4, 'hot-choc-vending', 52.05),
+        (660, 'Amaretto', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id', 96.34, 57, '2020-06-19 00:00:00', 4, 'amaretto', 96.34),
+        (661, 'Garlic - Primerba, Paste', 'pede justo eu massa donec dapibus duis at velit eu est congue elementum in hac habitasse platea dictumst morbi', 16.36, 31, '2020-09-19 00:00:00', 4, 'garlic-primerba-paste', 16.36),
+        (662, 'Ecolab Silver Fusion', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla', 88.79, 83, '2020-08-01 00:00:00', 3, 'ecolab-silver-fusion', 88.79),
+        (663, 'Raisin - Golden', 'nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam', 58.76, 97, '2020-08-25 00:00:00', 5, 'raisin-golden-2', 58.76),
+        (664, 'Lettuce - Sea / Sea Asparagus', 'orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec', 41.73, 8, '2020-09-12 00:00:00', 5, 'lettuce-sea-sea-asparagus', 41.73),
+        (665, 'Wine - Red, Gamay Noir', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 6.72, 23, '2020-06-18 00:00:00', 3, 'wine-red-gamay-noir', 6.72),
+        (666, 'Coffee - Decafenated', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula', 21.93, 74, '2020-07-09 00:00:00', 5, 'coffee-decafenated-2', 21.93),
+        (667, 'Mix - Cocktail Strawberry Daiquiri', 'pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis', 52.74, 53, '2021-06-08 00:00:00', 6, 'mix-cocktail-strawberry-daiquiri', 52.74),
+        (668, 'Carbonated Water - Strawberry', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque', 40.86, 44, '2021-05-27 00:00:00', 3, 'carbonated-water-strawberry', 40.86),
+        (669, 'Pepper - Red Bell', 'turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet', 25.64, 41, '2020-07-12 00:00:00', 6, 'pepper-red-bell', 25.64),
+        (670, 'Ham - Black Forest', 'et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 87.40, 56, '2021-05-19 00:00:00', 3, 'ham-black-forest-2', 87.40),
+        (671, 'Cakes Assorted', 'et tempus semper est quam pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis', 31.81, 79, '2020-08-03 00:00:00', 5, 'cakes-assorted', 31.81),
+        (672, 'Wine - Domaine Boyar Royal', 'congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam', 25.10, 31, '2021-05-23 00:00:00', 3, 'wine-domaine-boyar-royal-2', 25.10),
+        (673, 'Cheese - Brie,danish', 'elementum pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper', 91.06, 42, '2020-12-13 00:00:00', 6, 'cheese-briedanish', 91.06),
+        (674, 'Bread - Kimel Stick Poly', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus', 79.45, 60, '2021-02-09 00:00:00', 6, 'bread-kimel-stick-poly', 79.45),
+        (675, 'Tomato - Green', 'integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 38.98, 18, '2020-10-01 00:00:00', 4, 'tomato-green', 38.98),
+        (676, 'Extract - Lemon', 'suspendisse potenti in eleifend quam a odio in hac habitasse', 78.16, 5, '2021-05-04 00:00:00', 6, 'extract-lemon', 78.16),
+        (677, 'Tea - Orange Pekoe', 'id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat', 13.80, 5, '2021-04-09 00:00:00', 6, 'tea-orange-pekoe-2', 13.80),
+        (678, 'Langers - Mango Nectar', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 75.50, 24, '2020-12-08 00:00:00', 6, 'langers-mango-nectar', 75.50),
+        (679, 'Apple - Delicious, Red', 'primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis duis', 74.54, 58, '2020-06-20 00:00:00', 6, 'apple-delicious-red', 74.54),
+        (680, 'Cleaner - Bleach', 'duis at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam', 59.18, 88, '2021-04-28 00:00:00', 5, 'cleaner-bleach', 59.18),
+        (681, 'Spinach - Packaged', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus', 24.33, 13, '2021-06-06 00:00:00', 3, 'spinach-packaged', 24.33),
+        (682, 'Bacardi Breezer - Strawberry', 'in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie', 37.22, 97, '2021-05-29 00:00:00', 6, 'bacardi-breezer-strawberry', 37.22),
+        (683, 'Sobe - Green Tea', 'dui luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce', 52.08, 13, '2020-08-29 00:00:00', 5, 'sobe-green-tea', 52.08),
+        (684, 'Butter - Salted, Micro', 'convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 14.83, 68, '2021-05-04 00:00:00', 6, 'butter-salted-micro', 14.83),
+        (685, 'Spic And Span All Purpose', 'et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor', 5.57, 77, '2021-01-19 00:00:00', 5, 'spic-and-span-all-purpose', 5.57),
+        (686, 'Milkettes - 2%', 'vel augue vestibulum rutrum rutrum neque aenean auctor gravida sem praesent id massa id nisl', 11.77, 32, '2021-06-06 00:00:00', 6, 'milkettes-2-2', 11.77),
+        (687, 'Quail Eggs - Canned', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac neque', 72.23, 82, '2020-12-07 00:00:00', 6, 'quail-eggs-canned', 72.23),
+        (688, 'Soap - Pine Sol Floor Cleaner', 'quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 97.73, 0, '2021-04-12 00:00:00', 4, 'soap-pine-sol-floor-cleaner', 97.73),
+        (689, 'Pail - 15l White, With Handle', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 73.84, 49, '2020-08-17 00:00:00', 3, 'pail-15l-white-with-handle', 73.84),
+        (690, 'Flounder - Fresh', 'ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec diam', 47.02, 23, '2020-11-28 00:00:00', 4, 'flounder-fresh', 47.02),
+        (691, 'Vol Au Vents', 'congue eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 25.05, 52, '2020-06-11 00:00:00', 3, 'vol-au-vents-2', 25.05),
+        (692, 'Tea - Honey Green Tea', 'nascetur ridiculus mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus', 9.78, 93, '2021-03-28 00:00:00', 3, 'tea-honey-green-tea', 9.78),
+        (693, 'Nectarines', 'velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat', 53.85, 11, '2021-05-23 00:00:00', 6, 'nectarines-2', 53.85),
+        (694, 'Bagels Poppyseed', 'id luctus nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 77.76, 52, '2020-07-28 00:00:00', 5, 'bagels-poppyseed', 77.76),
+        (695, 'Table Cloth 53x69 White', 'habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 92.17, 67, '2021-01-03 00:00:00', 3, 'table-cloth-53x69-white', 92.17),
+        (696, 'Wine - Balbach Riverside', 'purus phasellus in felis donec semper sapien a libero nam dui proin', 45.95, 47, '2020-10-24 00:00:00', 4, 'wine-balbach-riverside', 45.95),
+        (697, 'Bread Country Roll', 'nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula', 48.85, 46, '2020-07-07 00:00:00', 3, 'bread-country-roll', 48.85),
+        (698, 'Wine - Tio Pepe Sherry Fino', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 58.48, 75, '2020-11-02 00:00:00', 5, 'wine-tio-pepe-sherry-fino', 58.48),
+        (699, 'Curry Paste - Madras', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 50.49, 14, '2020-07-15 00:00:00', 6, 'curry-paste-madras', 50.49),
+        (700, 'Lime Cordial - Roses', 'ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit', 4.09, 98, '2020-07-20 00:00:00', 5, 'lime-cordial-roses', 4.09),
+        (701, 'Fish - Halibut, Cold Smoked', 'congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed', 4.66, 44, '2020-11-18 00:00:00', 4, 'fish-halibut-cold-smoked', 4.66),
+        (702, 'Veal - Ground', 'ut nunc vestibulum ante ipsum primis in faucibus orci luctus et', 61.72, 36, '2020-09-10 00:00:00', 5, 'veal-ground', 61.72),
+        (703, 'Marsala - Sperone, Fine, D.o.c.', 'viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 75.52, 94, '2020-11-26 00:00:00', 3, 'marsala-sperone-fine-doc-2', 75.52),
+        (704, 'Tabasco Sauce, 2 Oz', 'praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 47.85, 76, '2020-12-17 00:00:00', 3, 'tabasco-sauce-2-oz', 47.85),
+        (705, 'Uniform Linen Charge', 'rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue', 53.02, 4, '2020-09-14 00:00:00', 5, 'uniform-linen-charge', 53.02),
+        (706, 'Soup - Campbells Beef Noodle', 'pellentesque ultrices mattis odio donec vitae nisi nam ultrices libero non mattis pulvinar nulla', 28.68, 41, '2020-08-26 00:00:00', 4, 'soup-campbells-beef-noodle', 28.68),
+        (707, 'Salmon - Atlantic, No Skin', 'metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean', 23.02, 44, '2020-11-26 00:00:00', 3, 'salmon-atlantic-no-skin-2', 23.02),
+        (708, 'Rice - Jasmine Sented', 'dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida nisi at nibh', 5.20, 58, '2020-09-15 00:00:00', 6, 'rice-jasmine-sented', 5.20),
+        (709, 'Wine La Vielle Ferme Cote Du', 'rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 23.11, 28, '2020-11-02 00:00:00', 6, 'wine-la-vielle-ferme-cote-du', 23.11),
+        (710, 'Juice - Apple, 341 Ml', 'risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis', 73.52, 35, '2020-07-18 00:00:00', 4, 'juice-apple-341-ml', 73.52),
+        (711, 'Lemon Balm - Fresh', 'pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 66.85, 68, '2020-09-04 00:00:00', 6, 'lemon-balm-fresh-2', 66.85),
+        (712, 'Garlic - Primerba, Paste', 'sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 22.25, 89, '2020-07-08 00:00:00', 5, 'garlic-primerba-paste-2', 22.25),
+        (713, 'Chocolate - Milk, Callets', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel', 15.33, 75, '2020-07-17 00:00:00', 6, 'chocolate-milk-callets', 15.33),
+        (714, 'Dill Weed - Dry', 'faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae', 32.07, 72, '2021-01-26 00:00:00', 3, 'dill-weed-dry-2', 32.07),
+        (715, 'Beef - Montreal Smoked Brisket', 'elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 68.72, 7, '2020-11-05 00:00:00', 5, 'beef-montreal-smoked-brisket-2', 68.72),
+        (716, 'Vaccum Bag - 14x20', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus', 41.39, 17, '2021-04-13 00:00:00', 6, 'vaccum-bag-14x20-3', 41.39),
+        (717, 'Soap - Mr.clean Floor Soap', 'lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 98.67, 4, '2020-07-29 00:00:00', 6, 'soap-mrclean-floor-soap-2', 98.67),
+        (718, 'Sauce - Apple, Unsweetened', 'mauris vulputate elementum nullam varius nulla facilisi cras non velit', 35.30, 12, '2020-12-27 00:00:00', 4, 'sauce-apple-unsweetened', 35.30),
+        (719, 'Crush - Grape, 355 Ml', 'nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac', 2.04, 49, '2020-12-14 00:00:00', 4, 'crush-grape-355-ml', 2.04),
+        (720, 'Cornstarch', 'vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum', 58.32, 4, '2020-08-26 00:00:00', 3, 'cornstarch', 58.32),
+        (721, 'Dip - Tapenade', 'platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at', 81.86, 91, '2021-02-22 00:00:00', 6, 'dip-tapenade-2', 81.86),
+        (722, 'Chicken - Livers', 'in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus', 19.45, 44, '2021-03-26 00:00:00', 4, 'chicken-livers', 19.45),
+        (723, 'Wine - Casillero Deldiablo', 'quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus', 30.36, 17, '2021-04-06 00:00:00', 4, 'wine-casillero-deldiablo', 30.36),
+        (724, 'Lambcasing', 'pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique in tempus sit amet', 55.42, 76, '2020-10-27 00:00:00', 6, 'lambcasing-2', 55.42),
+        (725, 'Salmon Steak - Cohoe 8 Oz', 'sapien a libero nam dui proin leo odio porttitor id consequat in', 38.96, 21, '2020-09-10 00:00:00', 6, 'salmon-steak-cohoe-8-oz', 38.96),
+        (726, 'Cheese - Fontina', 'praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia', 22.05, 85, '2021-03-25 00:00:00', 4, 'cheese-fontina', 22.05),
+        (727, 'Pails With Lids', 'nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in tempor turpis nec', 3.75, 52, '2020-10-04 00:00:00', 5, 'pails-with-lids', 3.75),
+        (728, 'Pork - Smoked Kassler', 'duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis dui vel nisl duis', 30.41, 4, '2021-01-18 00:00:00', 3, 'pork-smoked-kassler', 30.41),
+        (729, 'Juice - Cranberry, 341 Ml', 'in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non', 3.74, 48, '2020-12-19 00:00:00', 5, 'juice-cranberry-341-ml', 3.74),
+        (730, 'Lettuce - Red Leaf', 'sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 62.54, 39, '2021-02-25 00:00:00', 4, 'lettuce-red-leaf', 62.54),
+        (731, 'Garbag Bags - Black', 'convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum', 10.00, 83, '2020-12-30 00:00:00', 3, 'garbag-bags-black', 10.00),
+        (732, 'Mustard - Individual Pkg', 'dui proin leo odio porttitor id consequat in consequat ut nulla sed', 39.85, 82, '2020-08-09 00:00:00', 6, 'mustard-individual-pkg-2', 39.85),
+        (733, 'Wine - White, Gewurtzraminer', 'sapien non mi integer ac neque duis bibendum morbi non quam', 20.81, 38, '2020-09-15 00:00:00', 4, 'wine-white-gewurtzraminer', 20.81),
+        (734, 'Tea - Black Currant', 'sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 87.59, 82, '2021-03-25 00:00:00', 5, 'tea-black-currant', 87.59),
+        (735, 'Chicken - Whole Fryers', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 92.72, 44, '2020-08-23 00:00:00', 6, 'chicken-whole-fryers-2', 92.72),
+        (736, 'Iced Tea - Lemon, 460 Ml', 'cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue vestibulum', 10.87, 93, '2020-11-11 00:00:00', 6, 'iced-tea-lemon-460-ml', 10.87),
+        (737, 'Anchovy Paste - 56 G Tube', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed', 91.27, 73, '2021-03-02 00:00:00', 6, 'anchovy-paste-56-g-tube', 91.27),
+        (738, 'Spice - Chili Powder Mexican', 'nulla eget eros elementum pellentesque quisque porta volutpat erat quisque', 81.19, 46, '2021-01-15 00:00:00', 5, 'spice-chili-powder-mexican', 81.19),
+        (739, 'Milk - Buttermilk', 'ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu', 51.96, 46, '2020-07-09 00:00:00', 4, 'milk-buttermilk', 51.96),
+        (740, 'Teriyaki Sauce', 'in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem', 74.90, 6, '2021-01-19 00:00:00', 6, 'teriyaki-sauce', 74.90),
+        (741, 'Mcgillicuddy Vanilla Schnap', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed', 6.59, 8, '2021-04-25 00:00:00', 6, 'mcgillicuddy-vanilla-schnap', 6.59),
+        (742, 'Syrup - Monin - Blue Curacao', 'elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel nulla', 4.21, 0, '2020-10-24 00:00:00', 5, 'syrup-monin-blue-curacao', 4.21),
+        (743, 'Bagels Poppyseed', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 41.27, 46, '2020-07-05 00:00:00', 6, 'bagels-poppyseed-2', 41.27),
+        (744, 'Bread - Focaccia Quarter', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut', 97.63, 63, '2020-10-21 00:00:00', 5, 'bread-focaccia-quarter', 97.63),
+        (745, 'Quinoa', 'consequat lectus in est risus auctor sed tristique in tempus sit amet sem fusce consequat nulla', 98.74, 75, '2020-06-20 00:00:00', 4, 'quinoa', 98.74),
+        (746, 'Eggplant - Regular', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo', 17.56, 26, '2020-12-02 00:00:00', 6, 'eggplant-regular', 17.56),
+        (747, 'Bagels Poppyseed', 'sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 53.78, 22, '2020-08-26 00:00:00', 6, 'bagels-poppyseed-3', 53.78),
+        (748, 'Bread - Hamburger Buns', 'ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae', 23.54, 93, '2020-09-13 00:00:00', 6, 'bread-hamburger-buns-2', 23.54),
+        (749, 'Bread - Roll, Calabrese', 'ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros', 85.75, 49, '2021-04-09 00:00:00', 5, 'bread-roll-calabrese', 85.75),
+        (750, 'Apricots - Dried', 'ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis', 38.67, 81, '2021-02-06 00:00:00', 3, 'apricots-dried', 38.67),
+        (751, 'Tea - Mint', 'hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris vulputate elementum nullam', 24.54, 17, '2020-12-27 00:00:00', 3, 'tea-mint', 24.54),
+        (752, 'Beef - Shank', 'ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies', 34.42, 24, '2021-04-20 00:00:00', 4, 'beef-shank-3', 34.42),
+        (753, 'Soup - Beef, Base Mix', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut', 42.17, 81, '2020-11-25 00:00:00', 4, 'soup-beef-base-mix-2', 42.17),
+        (754, 'Horseradish - Prepared', 'at velit eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id', 58.71, 3, '2020-07-23 00:00:00', 5, 'horseradish-prepared', 58.71),
+        (755, 'Snapple Raspberry Tea', 'odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut', 53.58, 53, '2020-12-12 00:00:00', 5, 'snapple-raspberry-tea', 53.58),
+        (756, 'Pastry - Apple Muffins - Mini', 'sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis', 39.85, 93, '2021-05-06 00:00:00', 3, 'pastry-apple-muffins-mini', 39.85),
+        (757, 'Cheese - Cheddar, Old White', 'libero nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis', 89.36, 78, '2020-08-03 00:00:00', 6, 'cheese-cheddar-old-white', 89.36),
+        (758, 'Syrup - Monin - Granny Smith', 'id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit', 8.14, 3, '2020-10-04 00:00:00', 5, 'syrup-monin-granny-smith', 8.14),
+        (759, 'Cinnamon Rolls', 'tortor duis mattis egestas metus aenean fermentum donec ut mauris', 62.92, 78, '2021-02-19 00:00:00', 4, 'cinnamon-rolls', 62.92),
+        (760, 'Sparkling Wine - Rose, Freixenet', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet', 67.78, 32, '2020-06-25 00:00:00', 5, 'sparkling-wine-rose-freixenet-3', 67.78),
+        (761, 'Sultanas', 'erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit', 7.33, 1, '2020-10-26 00:00:00', 6, 'sultanas-2', 7.33),
+        (762, 'Pepper - Green', 'in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus', 97.54, 5, '2021-04-24 00:00:00', 3, 'pepper-green', 97.54),
+        (763, 'Cheese - Ricotta', 'eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet', 25.22, 35, '2021-01-27 00:00:00', 4, 'cheese-ricotta', 25.22),
+        (764, 'Hot Choc Vending', 'et eros vestibulum ac est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium', 82.25, 74, '2021-06-01 00:00:00', 6, 'hot-choc-vending-2', 82.25),
+        (765, 'Tomato - Tricolor Cherry', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus vivamus', 21.61, 34, '2020-11-17 00:00:00', 3, 'tomato-tricolor-cherry', 21.61),
+        (766, 'Cookie Double Choco', 'leo rhoncus sed vestibulum sit amet cursus id turpis integer aliquet massa', 72.75, 90, '2021-05-26 00:00:00', 4, 'cookie-double-choco', 72.75),
+        (767, 'Frangelico', 'orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus', 59.70, 81, '2021-05-18 00:00:00', 4, 'frangelico-2', 59.70),
+        (768, 'Wine - Muscadet Sur Lie', 'turpis adipiscing lorem vitae mattis nibh ligula nec sem duis aliquam', 22.25, 89, '2020-07-21 00:00:00', 5, 'wine-muscadet-sur-lie', 22.25),
+        (769, 'Steel Wool', 'mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh', 20.32, 55, '2021-01-27 00:00:00', 5, 'steel-wool', 20.32),
+        (770, 'Olives - Morracan Dired', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam', 32.72, 10, '2021-02-28 00:00:00', 4, 'olives-morracan-dired', 32.72),
+        (771, 'Tomato Puree', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in', 55.37, 37, '2020-10-27 00:00:00', 3, 'tomato-puree', 55.37),
+        (772, 'Sobe - Orange Carrot', 'sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 84.76, 80, '2021-01-08 00:00:00', 5, 'sobe-orange-carrot', 84.76),
+        (773, 'Beef Wellington', 'amet lobortis sapien sapien non mi integer ac neque duis bibendum morbi non quam nec', 20.72, 18, '2020-08-09 00:00:00', 4, 'beef-wellington', 20.72),
+        (774, 'Table Cloth 90x90 Colour', 'placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 70.40, 12, '2021-01-13 00:00:00', 3, 'table-cloth-90x90-colour', 70.40),
+        (775, 'Flour - Semolina', 'fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede', 40.01, 63, '2020-12-07 00:00:00', 6, 'flour-semolina', 40.01),
+        (776, 'Sobe - Berry Energy', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi', 14.85, 70, '2021-01-10 00:00:00', 4, 'sobe-berry-energy', 14.85),
+        (777, 'Mcguinness - Blue Curacao', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque', 94.68, 60, '2020-06-13 00:00:00', 4, 'mcguinness-blue-curacao-2', 94.68),
+        (778, 'Bag Stand', 'nisi at nibh in hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer', 63.02, 22, '2021-01-18 00:00:00', 4, 'bag-stand', 63.02),
+        (779, 'Waffle Stix', 'vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor', 88.15, 18, '2020-12-13 00:00:00', 3, 'waffle-stix', 88.15),
+        (780, 'Bread - Frozen Basket Variety', 'nec molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas tristique est et', 89.47, 2, '2020-12-25 00:00:00', 6, 'bread-frozen-basket-variety', 89.47),
+        (781, 'Wine - Shiraz South Eastern', 'sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque', 62.23, 47, '2021-01-16 00:00:00', 6, 'wine-shiraz-south-eastern', 62.23),
+        (782, 'Wine - Jaboulet Cotes Du Rhone', 'eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at', 84.37, 43, '2021-06-07 00:00:00', 5, 'wine-jaboulet-cotes-du-rhone-2', 84.37),
+        (783, 'Bandage - Finger Cots', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices', 28.05, 64, '2021-03-20 00:00:00', 4, 'bandage-finger-cots', 28.05),
+        (784, 'Bread Ww Cluster', 'nulla elit ac nulla sed vel enim sit amet nunc viverra dapibus', 24.96, 71, '2020-11-28 00:00:00', 5, 'bread-ww-cluster-2', 24.96),
+        (785, 'Sauce - Plum', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante ipsum primis', 4.87, 26, '2020-10-15 00:00:00', 5, 'sauce-plum-2', 4.87),
+        (786, 'Salmon - Atlantic, Skin On', 'quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in', 40.60, 57, '2020-11-03 00:00:00', 4, 'salmon-atlantic-skin-on', 40.60),
+        (787, 'Tea - Decaf Lipton', 'in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem', 99.45, 87, '2020-11-30 00:00:00', 5, 'tea-decaf-lipton', 99.45),
+        (788, 'Cake - Cake Sheet Macaroon', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque', 25.66, 63, '2021-05-25 00:00:00', 6, 'cake-cake-sheet-macaroon', 25.66),
+        (789, 'Wine - Magnotta, Merlot Sr Vqa', 'mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam vel augue', 95.54, 61, '2021-04-21 00:00:00', 4, 'wine-magnotta-merlot-sr-vqa', 95.54),
+        (790, 'Apples - Spartan', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio', 40.39, 47, '2020-09-02 00:00:00', 6, 'apples-spartan', 40.39),
+        (791, 'Pie Box - Cello Window 2.5', 'donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit ac', 84.34, 68, '2020-09-12 00:00:00', 3, 'pie-box-cello-window-25-2', 84.34),
+        (792, 'Spice - Peppercorn Melange', 'at turpis a pede posuere nonummy integer non velit donec', 63.42, 53, '2021-04-23 00:00:00', 6, 'spice-peppercorn-melange-4', 63.42),
+        (793, 'Cherries - Bing, Canned', 'nunc commodo placerat praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget', 7.50, 74, '2021-05-20 00:00:00', 6, 'cherries-bing-canned', 7.50),
+        (794, 'Bread - English Muffin', 'platea dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis', 20.67, 70, '2020-09-26 00:00:00', 6, 'bread-english-muffin', 20.67),
+        (795, 'Trueblue - Blueberry', 'cubilia curae mauris viverra diam vitae quam suspendisse potenti nullam porttitor', 93.86, 81, '2021-04-24 00:00:00', 3, 'trueblue-blueberry', 93.86),
+        (796, 'Longos - Penne With Pesto', 'turpis integer aliquet massa id lobortis convallis tortor risus dapibus', 95.72, 53, '2020-10-24 00:00:00', 5, 'longos-penne-with-pesto', 95.72),
+        (797, 'Lamb - Loin, Trimmed, Boneless', 'eget semper rutrum nulla nunc purus phasellus in felis donec semper sapien a', 38.98, 97, '2020-09-04 00:00:00', 6, 'lamb-loin-trimmed-boneless', 38.98),
+        (798, 'Wine - Rioja Campo Viejo', 'nulla ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi', 95.76, 84, '2021-02-17 00:00:00', 3, 'wine-rioja-campo-viejo', 95.76),
+        (799, 'Loquat', 'eu est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 26.98, 66, '2020-09-15 00:00:00', 3, 'loquat', 26.98),
+        (800, 'Hold Up Tool Storage Rack', 'nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in', 4.35, 89, '2020-10-28 00:00:00', 3, 'hold-up-tool-storage-rack', 4.35),
+        (801, 'Parsley - Dried', 'morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar', 4.62, 61, '2020-07-25 00:00:00', 4, 'parsley-dried', 4.62),
+        (802, 'Plasticforkblack', 'nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed', 50.81, 58, '2020-12-23 00:00:00', 6, 'plasticforkblack', 50.81),
+        (803, 'Potato - Sweet', 'a odio in hac habitasse platea dictumst maecenas ut massa quis augue luctus tincidunt nulla', 63.85, 59, '2020-12-09 00:00:00', 4, 'potato-sweet-2', 63.85),
+        (804, 'Coffee - Cafe Moreno', 'ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt in leo', 15.59, 91, '2021-01-02 00:00:00', 6, 'coffee-cafe-moreno', 15.59),
+        (805, 'Wine - Red, Colio Cabernet', 'lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium', 96.99, 59, '2021-03-23 00:00:00', 3, 'wine-red-colio-cabernet', 96.99),
+        (806, 'Ostrich - Fan Fillet', 'orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio', 60.59, 23, '2020-11-23 00:00:00', 4, 'ostrich-fan-fillet', 60.59),
+        (807, 'Green Tea Refresher', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec vitae', 57.25, 90, '2021-05-04 00:00:00', 3, 'green-tea-refresher', 57.25),
+        (808, 'Flour - Rye', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor', 88.01, 18, '2021-02-03 00:00:00', 6, 'flour-rye', 88.01),
+        (809, 'Sugar Thermometer', 'eu orci mauris lacinia sapien quis libero nullam sit amet', 97.85, 81, '2020-09-11 00:00:00', 6, 'sugar-thermometer', 97.85),
+        (810, 'Wine - Tio Pepe Sherry Fino', 'molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget', 47.11, 67, '2021-02-20 00:00:00', 3, 'wine-tio-pepe-sherry-fino-2', 47.11),
+        (811, 'Cassis', 'ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et', 94.98, 96, '2021-01-17 00:00:00', 3, 'cassis', 94.98),
+        (812, 'Ice Cream - Super Sandwich', 'tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien', 15.08, 84, '2021-01-19 00:00:00', 6, 'ice-cream-super-sandwich', 15.08),
+        (813, 'Sauce - Salsa', 'lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras', 88.19, 73, '2021-05-26 00:00:00', 3, 'sauce-salsa-2', 88.19),
+        (814, 'Jerusalem Artichoke', 'faucibus cursus urna ut tellus nulla ut erat id mauris vulputate', 60.16, 87, '2021-03-05 00:00:00', 3, 'jerusalem-artichoke', 60.16),
+        (815, 'Juice - Prune', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus', 70.29, 45, '2020-06-22 00:00:00', 6, 'juice-prune', 70.29),
+        (816, 'Lamb - Sausage Casings', 'justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec', 52.51, 89, '2020-09-05 00:00:00', 5, 'lamb-sausage-casings', 52.51),
+        (817, 'Cleaner - Lime Away', 'nulla integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula suspendisse', 24.67, 39, '2021-02-14 00:00:00', 4, 'cleaner-lime-away-2', 24.67),
+        (818, 'Flour Dark Rye', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed', 99.45, 93, '2020-08-20 00:00:00', 4, 'flour-dark-rye-3', 99.45),
+        (819, 'Chef Hat 20cm', 'justo sit amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus', 53.60, 55, '2021-01-16 00:00:00', 3, 'chef-hat-20cm', 53.60),
+        (820, 'Pork - Sausage, Medium', 'in congue etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus', 56.86, 26, '2021-02-25 00:00:00', 4, 'pork-sausage-medium-2', 56.86),
+        (821, 'Iced Tea - Lemon, 460 Ml', 'tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia', 3.29, 68, '2021-03-20 00:00:00', 5, 'iced-tea-lemon-460-ml-2', 3.29),
+        (822, 'Lobak', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia', 82.45, 27, '2021-01-28 00:00:00', 5, 'lobak', 82.45),
+        (823, 'Juice - Apple, 500 Ml', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce', 47.96, 50, '2021-04-02 00:00:00', 3, 'juice-apple-500-ml', 47.96),
+        (824, 'Cheese - La Sauvagine', 'amet sapien dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus', 76.15, 61, '2021-01-17 00:00:00', 4, 'cheese-la-sauvagine-2', 76.15),
+        (825, 'Plasticknivesblack', 'nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio', 46.41, 62, '2020-07-28 00:00:00', 5, 'plasticknivesblack', 46.41),
+        (826, 'Broom - Push', 'morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra', 65.92, 65, '2020-10-29 00:00:00', 3, 'broom-push', 65.92),
+        (827, 'Cookies - Assorted', 'diam in magna bibendum imperdiet nullam orci pede venenatis non sodales sed tincidunt eu felis fusce posuere felis sed lacus', 2.58, 66, '2020-06-30 00:00:00', 6, 'cookies-assorted', 2.58),
+        (828, 'Shrimp - 150 - 250', 'sit amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus', 72.34, 29, '2021-04-27 00:00:00', 5, 'shrimp-150-250', 72.34),
+        (829, 'Toamtoes 6x7 Select', 'est lacinia nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 74.25, 44, '2020-11-05 00:00:00', 6, 'toamtoes-6x7-select', 74.25),
+        (830, 'Duck - Breast', 'consequat ut nulla sed accumsan felis ut at dolor quis odio', 93.37, 100, '2020-10-04 00:00:00', 5, 'duck-breast', 93.37),
+        (831, 'Spice - Chili Powder Mexican', 'sapien a libero nam dui proin leo odio porttitor id', 7.24, 68, '2020-07-25 00:00:00', 3, 'spice-chili-powder-mexican-2', 7.24),
+        (832, 'Mushroom - Chanterelle Frozen', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 9.80, 27, '2020-10-01 00:00:00', 5, 'mushroom-chanterelle-frozen', 9.80),
+        (833, 'Wine - Red, Gallo, Merlot', 'pede libero quis orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus', 49.76, 31, '2021-05-31 00:00:00', 6, 'wine-red-gallo-merlot', 49.76),
+        (834, 'Wine - Puligny Montrachet A.', 'nulla ut erat id mauris vulputate elementum nullam varius nulla', 88.48, 10, '2020-11-18 00:00:00', 3, 'wine-puligny-montrachet-a', 88.48),
+        (835, 'Sole - Dover, Whole, Fresh', 'in faucibus orci luctus et ultrices posuere cubilia curae mauris viverra diam vitae quam suspendisse potenti', 54.55, 42, '2020-07-22 00:00:00', 5, 'sole-dover-whole-fresh-2', 54.55),
+        (836, 'Pork Ham Prager', 'adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut blandit', 35.20, 15, '2021-02-16 00:00:00', 6, 'pork-ham-prager', 35.20),
+        (837, 'Beef - Sushi Flat Iron Steak', 'pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat metus sapien ut nunc', 24.61, 9, '2020-12-17 00:00:00', 6, 'beef-sushi-flat-iron-steak', 24.61),
+        (838, 'General Purpose Trigger', 'lacus morbi quis tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus', 57.76, 89, '2020-07-24 00:00:00', 4, 'general-purpose-trigger', 57.76),
+        (839, 'Chicken - White Meat With Tender', 'tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec', 43.96, 64, '2020-11-13 00:00:00', 6, 'chicken-white-meat-with-tender-2', 43.96),
+        (840, 'Veal - Osso Bucco', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat', 47.20, 48, '2020-11-23 00:00:00', 4, 'veal-osso-bucco-2', 47.20),
+        (841, 'Soup - Beef Conomme, Dry', 'lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat praesent blandit nam', 81.56, 86, '2020-07-17 00:00:00', 5, 'soup-beef-conomme-dry-2', 81.56),
+        (842, 'Aromat Spice / Seasoning', 'nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus', 53.24, 43, '2021-01-16 00:00:00', 5, 'aromat-spice-seasoning', 53.24),
+        (843, 'Veal - Loin', 'fringilla rhoncus mauris enim leo rhoncus sed vestibulum sit amet cursus id turpis', 15.52, 66, '2021-04-07 00:00:00', 3, 'veal-loin', 15.52),
+        (844, 'Beef - Cooked, Corned', 'dictumst aliquam augue quam sollicitudin vitae consectetuer eget rutrum at lorem integer tincidunt', 62.21, 56, '2021-04-29 00:00:00', 5, 'beef-cooked-corned-2', 62.21),
+        (845, 'Crawfish', 'malesuada in imperdiet et commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet', 8.68, 26, '2020-09-06 00:00:00', 6, 'crawfish', 8.68),
+        (846, 'Pastry - Mini French Pastries', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi', 30.74, 66, '2021-01-12 00:00:00', 3, 'pastry-mini-french-pastries', 30.74),
+        (847, 'Food Colouring - Green', 'quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse', 64.27, 12, '2020-12-22 00:00:00', 3, 'food-colouring-green-2', 64.27),
+        (848, 'Chicken - Breast, 5 - 7 Oz', 'vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 32.82, 72, '2021-03-25 00:00:00', 6, 'chicken-breast-5-7-oz', 32.82),
+        (849, 'Brownies - Two Bite, Chocolate', 'ultrices libero non mattis pulvinar nulla pede ullamcorper augue a', 69.04, 69, '2021-05-03 00:00:00', 6, 'brownies-two-bite-chocolate', 69.04),
+        (850, 'Peppercorns - Green', 'vitae ipsum aliquam non mauris morbi non lectus aliquam sit amet diam in magna bibendum imperdiet', 59.43, 11, '2020-07-11 00:00:00', 6, 'peppercorns-green', 59.43),
+        (851, 'Beef Dry Aged Tenderloin Aaa', 'morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui', 55.63, 31, '2020-11-26 00:00:00', 5, 'beef-dry-aged-tenderloin-aaa', 55.63),
+        (852, 'Soup - Cream Of Potato / Leek', 'ut nulla sed accumsan felis ut at dolor quis odio consequat varius integer ac leo', 4.49, 52, '2020-10-27 00:00:00', 4, 'soup-cream-of-potato-leek', 4.49),
+        (853, 'Corn - On The Cob', 'ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque', 98.90, 51, '2020-09-02 00:00:00', 4, 'corn-on-the-cob', 98.90),
+        (854, 'Cream - 18%', 'integer pede justo lacinia eget tincidunt eget tempus vel pede morbi porttitor', 37.33, 74, '2021-05-03 00:00:00', 5, 'cream-18', 37.33),
+        (855, 'Lobster - Cooked', 'interdum in ante vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 9.93, 91, '2021-04-03 00:00:00', 6, 'lobster-cooked', 9.93),
+        (856, 'Pork - Hock And Feet Attached', 'ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id', 47.68, 26, '2021-06-07 00:00:00', 3, 'pork-hock-and-feet-attached', 47.68),
+        (857, 'Wine - Red, Marechal Foch', 'phasellus in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in', 78.94, 77, '2021-04-02 00:00:00', 3, 'wine-red-marechal-foch', 78.94),
+        (858, 'Salmon Steak - Cohoe 8 Oz', 'aliquet at feugiat non pretium quis lectus suspendisse potenti in eleifend quam a', 3.38, 98, '2021-05-23 00:00:00', 6, 'salmon-steak-cohoe-8-oz-2', 3.38),
+        (859, 'Salmon Steak - Cohoe 8 Oz', 'mi in porttitor pede justo eu massa donec dapibus duis at', 61.72, 11, '2021-03-24 00:00:00', 4, 'salmon-steak-cohoe-8-oz-3', 61.72),
+        (860, 'Onions - Vidalia', 'maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas', 7.96, 24, '2020-07-21 00:00:00', 6, 'onions-vidalia', 7.96),
+        (861, 'Cheese - Brick With Onion', 'eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa quis', 83.98, 12, '2020-08-29 00:00:00', 3, 'cheese-brick-with-onion-2', 83.98),
+        (862, 'Juice - Apple, 500 Ml', 'ligula in lacus curabitur at ipsum ac tellus semper interdum', 91.83, 41, '2020-06-20 00:00:00', 6, 'juice-apple-500-ml-2', 91.83),
+        (863, 'Coffee Cup 12oz 5342cd', 'mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at diam nam tristique', 91.88, 60, '2021-04-28 00:00:00', 6, 'coffee-cup-12oz-5342cd', 91.88),
+        (864, 'Appetizer - Crab And Brie', 'metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices', 77.29, 94, '2021-04-30 00:00:00', 5, 'appetizer-crab-and-brie', 77.29),
+        (865, 'Heavy Duty Dust Pan', 'ligula nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit donec', 97.70, 6, '2020-07-25 00:00:00', 6, 'heavy-duty-dust-pan', 97.70),
+        (866, 'Devonshire Cream', 'mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis', 28.21, 6, '2021-01-04 00:00:00', 4, 'devonshire-cream', 28.21),
+        (867, 'Soup - Chicken And Wild Rice', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis justo', 36.20, 74, '2020-07-29 00:00:00', 5, 'soup-chicken-and-wild-rice-2', 36.20),
+        (868, 'Lamb - Ground', 'nulla sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at', 67.34, 34, '2021-05-09 00:00:00', 5, 'lamb-ground', 67.34),
+        (869, 'Nut - Walnut, Pieces', 'praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante vestibulum ante', 90.88, 63, '2021-02-24 00:00:00', 4, 'nut-walnut-pieces', 90.88),
+        (870, 'Pail With Metal Handle 16l White', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus semper', 67.41, 96, '2020-10-12 00:00:00', 4, 'pail-with-metal-handle-16l-white', 67.41),
+        (871, 'Cheese - Stilton', 'porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis', 54.74, 84, '2021-05-24 00:00:00', 3, 'cheese-stilton', 54.74),
+        (872, 'Edible Flower - Mixed', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat', 17.58, 50, '2020-12-08 00:00:00', 3, 'edible-flower-mixed', 17.58),
+        (873, 'Vinegar - Rice', 'volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus', 13.34, 60, '2021-01-25 00:00:00', 4, 'vinegar-rice', 13.34),
+        (874, 'Jameson - Irish Whiskey', 'ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor', 70.75, 42, '2021-04-23 00:00:00', 4, 'jameson-irish-whiskey-3', 70.75),
+        (875, 'Milk - Condensed', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy', 72.56, 57, '2020-06-30 00:00:00', 3, 'milk-condensed', 72.56),
+        (876, 'Coffee - Beans, Whole', 'cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 38.07, 31, '2021-05-06 00:00:00', 5, 'coffee-beans-whole', 38.07),
+        (877, 'Tea - Honey Green Tea', 'hac habitasse platea dictumst aliquam augue quam sollicitudin vitae consectetuer eget', 34.94, 59, '2020-07-15 00:00:00', 4, 'tea-honey-green-tea-2', 34.94),
+        (878, 'Mountain Dew', 'sollicitudin ut suscipit a feugiat et eros vestibulum ac est lacinia nisi venenatis tristique fusce', 72.29, 78, '2020-06-18 00:00:00', 3, 'mountain-dew', 72.29),
+        (879, 'Dehydrated Kelp Kombo', 'posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet pulvinar sed nisl', 19.22, 42, '2020-11-24 00:00:00', 4, 'dehydrated-kelp-kombo', 19.22),
+        (880, 'Ham - Cooked Italian', 'porttitor lacus at turpis donec posuere metus vitae ipsum aliquam non mauris morbi non lectus aliquam', 69.17, 36, '2020-09-03 00:00:00', 4, 'ham-cooked-italian', 69.17),
+        (881, 'Pasta - Penne, Rigate, Dry', 'sed vel enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 68.17, 14, '2020-07-24 00:00:00', 3, 'pasta-penne-rigate-dry', 68.17),
+        (882, 'Vinegar - White Wine', 'ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque viverra pede ac diam', 1.41, 95, '2021-01-02 00:00:00', 4, 'vinegar-white-wine', 1.41),
+        (883, 'Chicken - Leg / Back Attach', 'sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 62.32, 8, '2020-12-06 00:00:00', 3, 'chicken-leg-back-attach', 62.32),
+        (884, 'Dc Hikiage Hira Huba', 'duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa donec dapibus duis', 86.10, 88, '2020-12-31 00:00:00', 3, 'dc-hikiage-hira-huba', 86.10),
+        (885, 'Beets', 'morbi odio odio elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est', 4.77, 79, '2020-09-19 00:00:00', 5, 'beets', 4.77),
+        (886, 'Cinnamon Buns Sticky', 'neque sapien placerat ante nulla justo aliquam quis turpis eget elit sodales scelerisque mauris sit amet eros suspendisse accumsan', 84.08, 81, '2020-09-06 00:00:00', 4, 'cinnamon-buns-sticky', 84.08),
+        (887, 'Bagels Poppyseed', 'massa id nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet et commodo', 24.20, 32, '2021-03-19 00:00:00', 6, 'bagels-poppyseed-4', 24.20),
+        (888, 'Pork - Loin, Boneless', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam', 30.54, 31, '2021-01-31 00:00:00', 3, 'pork-loin-boneless', 30.54),
+        (889, 'Broom And Broom Rack White', 'aenean fermentum donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu nibh quisque', 65.63, 63, '2020-07-16 00:00:00', 5, 'broom-and-broom-rack-white', 65.63),
+        (890, 'Filo Dough', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan', 29.75, 8, '2021-01-31 00:00:00', 4, 'filo-dough', 29.75),
+        (891, 'Mushroom - Morels, Dry', 'tellus nulla ut erat id mauris vulputate elementum nullam varius', 93.01, 99, '2021-05-05 00:00:00', 5, 'mushroom-morels-dry', 93.01),
+        (892, 'Milkettes - 2%', 'ut erat id mauris vulputate elementum nullam varius nulla facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt', 39.56, 27, '2021-01-25 00:00:00', 6, 'milkettes-2-3', 39.56),
+        (893, 'Flour - Buckwheat, Dark', 'pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 63.49, 73, '2021-02-23 00:00:00', 5, 'flour-buckwheat-dark', 63.49),
+        (894, 'Lemonade - Island Tea, 591 Ml', 'massa id lobortis convallis tortor risus dapibus augue vel accumsan', 87.53, 17, '2020-07-29 00:00:00', 5, 'lemonade-island-tea-591-ml', 87.53),
+        (895, 'Cup - 8oz Coffee Perforated', 'integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue vestibulum', 4.99, 51, '2021-03-24 00:00:00', 5, 'cup-8oz-coffee-perforated', 4.99),
+        (896, 'Wine - Periguita Fonseca', 'in felis donec semper sapien a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla', 28.30, 60, '2021-01-09 00:00:00', 5, 'wine-periguita-fonseca', 28.30),
+        (897, 'Sour Puss - Tangerine', 'nisi venenatis tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu sed augue', 2.28, 23, '2021-03-14 00:00:00', 4, 'sour-puss-tangerine-2', 2.28),
+        (898, 'Pie Shells 10', 'dui nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus sed', 93.69, 5, '2020-07-03 00:00:00', 4, 'pie-shells-10', 93.69),
+        (899, 'Steampan Lid', 'accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend donec ut dolor morbi', 74.10, 70, '2020-09-23 00:00:00', 6, 'steampan-lid', 74.10),
+        (900, 'Flower - Leather Leaf Fern', 'elementum eu interdum eu tincidunt in leo maecenas pulvinar lobortis est', 74.87, 40, '2020-11-21 00:00:00', 4, 'flower-leather-leaf-fern-2', 74.87),
+        (901, 'Tea - Grapefruit Green Tea', 'mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 55.42, 40, '2021-03-10 00:00:00', 5, 'tea-grapefruit-green-tea', 55.42),
+        (902, 'Nacho Chips', 'pharetra magna ac consequat metus sapien ut nunc vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia', 8.37, 22, '2020-12-20 00:00:00', 5, 'nacho-chips-2', 8.37),
+        (903, 'Apples - Spartan', 'dignissim vestibulum vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere', 45.92, 93, '2021-02-24 00:00:00', 3, 'apples-spartan-2', 45.92),
+        (904, 'Salami - Genova', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 13.74, 97, '2020-07-16 00:00:00', 4, 'salami-genova', 13.74),
+        (905, 'Absolut Citron', 'dapibus dolor vel est donec odio justo sollicitudin ut suscipit a feugiat et eros', 88.20, 32, '2020-10-23 00:00:00', 4, 'absolut-citron', 88.20),
+        (906, 'Lumpfish Black', 'tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo', 56.77, 62, '2020-07-17 00:00:00', 5, 'lumpfish-black', 56.77),
+        (907, 'Lamb - Whole, Frozen', 'duis aliquam convallis nunc proin at turpis a pede posuere nonummy integer non velit', 16.64, 39, '2020-11-10 00:00:00', 5, 'lamb-whole-frozen', 16.64),
+        (908, 'Soup - Campbells', 'sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non pretium quis', 58.28, 78, '2020-12-13 00:00:00', 4, 'soup-campbells-3', 58.28),
+        (909, 'Bread - Mini Hamburger Bun', 'eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare consequat lectus in est risus auctor sed tristique', 3.98, 56, '2021-05-10 00:00:00', 4, 'bread-mini-hamburger-bun', 3.98),
+        (910, 'Beef - Top Butt Aaa', 'ut suscipit a feugiat et eros vestibulum ac est lacinia nisi', 70.60, 93, '2020-10-23 00:00:00', 5, 'beef-top-butt-aaa', 70.60),
+        (911, 'The Pop Shoppe - Root Beer', 'vestibulum sagittis sapien cum sociis natoque penatibus et magnis dis parturient montes nascetur ridiculus mus etiam', 81.50, 97, '2020-11-28 00:00:00', 3, 'the-pop-shoppe-root-beer', 81.50),
+        (912, 'Wine - Niagara Peninsula Vqa', 'erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc purus phasellus in felis donec semper', 77.05, 87, '2021-03-31 00:00:00', 6, 'wine-niagara-peninsula-vqa', 77.05),
+        (913, 'Wine - Red, Mouton Cadet', 'nec sem duis aliquam convallis nunc proin at turpis a pede posuere nonummy', 16.96, 32, '2020-12-05 00:00:00', 5, 'wine-red-mouton-cadet', 16.96),
+        (914, 'Longos - Chicken Cordon Bleu', 'interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat', 64.01, 90, '2020-06-21 00:00:00', 4, 'longos-chicken-cordon-bleu', 64.01),
+        (915, 'Lamb - Ground', 'metus aenean fermentum donec ut mauris eget massa tempor convallis nulla', 73.04, 92, '2020-11-07 00:00:00', 3, 'lamb-ground-2', 73.04),
+        (916, 'Sour Puss Sour Apple', 'nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta volutpat erat quisque erat eros', 59.71, 1, '2021-05-21 00:00:00', 4, 'sour-puss-sour-apple', 59.71),
+        (917, 'Gingerale - Diet - Schweppes', 'enim sit amet nunc viverra dapibus nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper', 80.01, 96, '2020-12-21 00:00:00', 4, 'gingerale-diet-schweppes', 80.01),
+        (918, 'Soup - Base Broth Chix', 'nulla suscipit ligula in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus', 1.82, 45, '2020-08-03 00:00:00', 4, 'soup-base-broth-chix', 1.82),
+        (919, 'Bread - French Stick', 'mauris viverra diam vitae quam suspendisse potenti nullam porttitor lacus at turpis donec posuere metus vitae', 62.49, 73, '2020-09-18 00:00:00', 4, 'bread-french-stick-2', 62.49),
+        (920, 'Turnip - White, Organic', 'nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel nulla eget eros elementum pellentesque quisque porta', 43.91, 63, '2021-05-30 00:00:00', 5, 'turnip-white-organic-2', 43.91),
+        (921, 'Flour - Semolina', 'accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 25.44, 16, '2020-12-17 00:00:00', 5, 'flour-semolina-2', 25.44),
+        (922, 'Snapple Lemon Tea', 'nec nisi volutpat eleifend donec ut dolor morbi vel lectus in quam fringilla rhoncus', 92.30, 49, '2020-12-06 00:00:00', 6, 'snapple-lemon-tea-2', 92.30),
+        (923, 'Chocolate - Semi Sweet', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut', 93.91, 46, '2020-11-12 00:00:00', 3, 'chocolate-semi-sweet', 93.91),
+        (924, 'Apple - Fuji', 'ut tellus nulla ut erat id mauris vulputate elementum nullam varius', 82.27, 22, '2020-12-08 00:00:00', 6, 'apple-fuji-2', 82.27),
+        (925, 'Oil - Grapeseed Oil', 'luctus et ultrices posuere cubilia curae duis faucibus accumsan odio', 11.68, 87, '2020-09-05 00:00:00', 5, 'oil-grapeseed-oil', 11.68),
+        (926, 'Ham - Cooked', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat morbi a ipsum', 57.01, 16, '2021-02-10 00:00:00', 4, 'ham-cooked', 57.01),
+        (927, 'Blackberries', 'aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat convallis morbi', 22.24, 17, '2020-07-21 00:00:00', 4, 'blackberries', 22.24),
+        (928, 'Onions - Spanish', 'tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor convallis nulla neque', 99.83, 15, '2021-06-09 00:00:00', 3, 'onions-spanish', 99.83),
+        (929, 'Wheat - Soft Kernal Of Wheat', 'non velit donec diam neque vestibulum eget vulputate ut ultrices vel', 38.36, 28, '2020-08-18 00:00:00', 5, 'wheat-soft-kernal-of-wheat', 38.36),
+        (930, 'Tandoori Curry Paste', 'sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc nisl duis bibendum', 15.51, 7, '2021-04-03 00:00:00', 4, 'tandoori-curry-paste', 15.51),
+        (931, 'Ice Cream Bar - Oreo Sandwich', 'eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus', 29.51, 43, '2020-09-09 00:00:00', 4, 'ice-cream-bar-oreo-sandwich', 29.51),
+        (932, 'Instant Coffee', 'adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus', 67.65, 26, '2021-03-16 00:00:00', 4, 'instant-coffee', 67.65),
+        (933, 'Yogurt - Blueberry, 175 Gr', 'tincidunt eu felis fusce posuere felis sed lacus morbi sem mauris laoreet ut rhoncus aliquet', 93.57, 8, '2020-09-07 00:00:00', 5, 'yogurt-blueberry-175-gr', 93.57),
+        (934, 'Juice - Orange 1.89l', 'habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum justo nec condimentum neque sapien placerat ante nulla', 24.33, 63, '2020-07-20 00:00:00', 4, 'juice-orange-189l-3', 24.33),
+        (935, 'Clams - Littleneck, Whole', 'ut dolor morbi vel lectus in quam fringilla rhoncus mauris', 80.37, 45, '2020-08-19 00:00:00', 4, 'clams-littleneck-whole', 80.37),
+        (936, 'Chicken - Whole Fryers', 'ut rhoncus aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam', 59.14, 59, '2021-01-09 00:00:00', 3, 'chicken-whole-fryers-3', 59.14),
+        (937, 'Tart - Lemon', 'sem fusce consequat nulla nisl nunc nisl duis bibendum felis', 56.34, 88, '2020-10-06 00:00:00', 6, 'tart-lemon', 56.34),
+        (938, 'Pesto - Primerba, Paste', 'lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum curabitur in libero ut massa volutpat', 85.67, 27, '2021-01-16 00:00:00', 6, 'pesto-primerba-paste', 85.67),
+        (939, 'Apple - Granny Smith', 'convallis nunc proin at turpis a pede posuere nonummy integer non', 77.92, 68, '2020-09-30 00:00:00', 4, 'apple-granny-smith', 77.92),
+        (940, 'Cranberries - Dry', 'pellentesque volutpat dui maecenas tristique est et tempus semper est', 50.45, 87, '2020-08-14 00:00:00', 5, 'cranberries-dry', 50.45),
+        (941, 'Sponge Cake Mix - Chocolate', 'eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 72.18, 84, '2021-03-04 00:00:00', 5, 'sponge-cake-mix-chocolate-2', 72.18),
+        (942, 'Daikon Radish', 'a ipsum integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis', 12.90, 47, '2021-05-30 00:00:00', 6, 'daikon-radish', 12.90),
+        (943, 'Bread - Roll, Whole Wheat', 'orci luctus et ultrices posuere cubilia curae donec pharetra magna vestibulum', 85.47, 95, '2020-09-05 00:00:00', 6, 'bread-roll-whole-wheat', 85.47),
+        (944, 'Wine - White, French Cross', 'convallis nulla neque libero convallis eget eleifend luctus ultricies eu', 19.88, 88, '2021-01-06 00:00:00', 3, 'wine-white-french-cross', 19.88),
+        (945, 'Numi - Assorted Teas', 'hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc', 29.59, 7, '2020-12-22 00:00:00', 3, 'numi-assorted-teas', 29.59),
+        (946, 'Longos - Chicken Cordon Bleu', 'vitae consectetuer eget rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc', 46.23, 46, '2021-05-26 00:00:00', 5, 'longos-chicken-cordon-bleu-2', 46.23),
+        (947, 'Spice - Pepper Portions', 'nunc proin at turpis a pede posuere nonummy integer non', 7.48, 100, '2020-08-29 00:00:00', 4, 'spice-pepper-portions', 7.48),
+        (948, 'Pastry - Cheese Baked Scones', 'rutrum at lorem integer tincidunt ante vel ipsum praesent blandit lacinia erat vestibulum sed magna at nunc commodo placerat', 48.37, 3, '2020-08-19 00:00:00', 3, 'pastry-cheese-baked-scones', 48.37),
+        (949, 'Sprouts - Pea', 'urna pretium nisl ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium', 76.76, 82, '2021-02-02 00:00:00', 3, 'sprouts-pea', 76.76),
+        (950, 'Yoghurt Tubes', 'sapien sapien non mi integer ac neque duis bibendum morbi non', 97.98, 34, '2020-10-01 00:00:00', 4, 'yoghurt-tubes', 97.98),
+        (951, 'Ginger - Pickled', 'cras in purus eu magna vulputate luctus cum sociis natoque penatibus et magnis dis parturient', 49.31, 56, '2020-06-28 00:00:00', 4, 'ginger-pickled', 49.31),
+        (952, 'Salmon Steak - Cohoe 6 Oz', 'vel accumsan tellus nisi eu orci mauris lacinia sapien quis libero nullam', 16.26, 35, '2020-06-18 00:00:00', 3, 'salmon-steak-cohoe-6-oz', 16.26),
+        (953, 'Loaf Pan - 2 Lb, Foil', 'in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices', 31.72, 85, '2020-08-29 00:00:00', 5, 'loaf-pan-2-lb-foil', 31.72),
+        (954, 'Pastry - Choclate Baked', 'at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices vel augue', 64.81, 65, '2021-02-08 00:00:00', 3, 'pastry-choclate-baked-3', 64.81),
+        (955, 'Mustard - Seed', 'pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut ultrices', 21.70, 7, '2021-03-09 00:00:00', 4, 'mustard-seed-2', 21.70),
+        (956, 'Mushroom - Enoki, Fresh', 'curae duis faucibus accumsan odio curabitur convallis duis consequat dui nec nisi volutpat eleifend', 94.14, 36, '2021-06-03 00:00:00', 6, 'mushroom-enoki-fresh-2', 94.14),
+        (957, 'Coffee - Colombian, Portioned', 'enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis nibh', 30.80, 88, '2020-11-29 00:00:00', 4, 'coffee-colombian-portioned-2', 30.80),
+        (958, 'Juice - Ocean Spray Cranberry', 'pellentesque quisque porta volutpat erat quisque erat eros viverra eget congue eget semper rutrum nulla nunc', 33.25, 93, '2020-06-14 00:00:00', 6, 'juice-ocean-spray-cranberry', 33.25),
+        (959, 'Tomato Puree', 'quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris', 87.22, 46, '2020-07-29 00:00:00', 4, 'tomato-puree-2', 87.22),
+        (960, 'Wine - Rosso Del Veronese Igt', 'elit proin risus praesent lectus vestibulum quam sapien varius ut blandit non interdum in ante', 78.05, 45, '2021-05-28 00:00:00', 3, 'wine-rosso-del-veronese-igt', 78.05),
+        (961, 'Wine - Fume Blanc Fetzer', 'aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non mi integer ac', 1.16, 46, '2020-10-25 00:00:00', 4, 'wine-fume-blanc-fetzer', 1.16),
+        (962, 'Goldschalger', 'erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam', 37.26, 91, '2021-03-16 00:00:00', 4, 'goldschalger', 37.26),
+        (963, 'Wine - Manischewitz Concord', 'id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 48.87, 53, '2021-04-20 00:00:00', 4, 'wine-manischewitz-concord', 48.87),
+        (964, 'Beets - Golden', 'integer a nibh in quis justo maecenas rhoncus aliquam lacus morbi quis tortor id nulla ultrices aliquet maecenas', 42.69, 72, '2020-09-11 00:00:00', 5, 'beets-golden', 42.69),
+        (965, 'Oysters - Smoked', 'sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean', 41.69, 0, '2021-04-29 00:00:00', 3, 'oysters-smoked', 41.69),
+        (966, 'Salmon Atl.whole 8 - 10 Lb', 'dictumst maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem quisque ut erat curabitur gravida', 30.31, 74, '2021-01-03 00:00:00', 6, 'salmon-atlwhole-8-10-lb', 30.31),
+        (967, 'Rolled Oats', 'quam a odio in hac habitasse platea dictumst maecenas ut massa quis augue', 30.25, 62, '2020-09-07 00:00:00', 4, 'rolled-oats', 30.25),
+        (968, 'Monkfish - Fresh', 'ultrices posuere cubilia curae donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 71.71, 98, '2020-10-16 00:00:00', 6, 'monkfish-fresh', 71.71),
+        (969, 'Carbonated Water - Blackcherry', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien', 62.44, 94, '2021-04-21 00:00:00', 5, 'carbonated-water-blackcherry', 62.44),
+        (970, 'Pur Source', 'maecenas ut massa quis augue luctus tincidunt nulla mollis molestie lorem', 35.58, 28, '2020-08-21 00:00:00', 3, 'pur-source', 35.58),
+        (971, 'Pie Filling - Pumpkin', 'tortor id nulla ultrices aliquet maecenas leo odio condimentum id luctus nec molestie sed justo pellentesque', 1.38, 46, '2020-12-01 00:00:00', 5, 'pie-filling-pumpkin', 1.38),
+        (972, 'Wonton Wrappers', 'primis in faucibus orci luctus et ultrices posuere cubilia curae donec pharetra magna', 61.63, 19, '2020-09-26 00:00:00', 3, 'wonton-wrappers', 61.63),
+        (973, 'Straw - Regular', 'luctus rutrum nulla tellus in sagittis dui vel nisl duis ac nibh fusce lacus purus aliquet at feugiat non', 14.67, 3, '2021-03-24 00:00:00', 4, 'straw-regular-2', 14.67),
+        (974, 'Sparkling Wine - Rose, Freixenet', 'congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium iaculis diam erat fermentum', 56.63, 66, '2020-08-07 00:00:00', 3, 'sparkling-wine-rose-freixenet-4', 56.63),
+        (975, 'Galliano', 'semper rutrum nulla nunc purus phasellus in felis donec semper sapien a libero', 93.29, 90, '2021-01-29 00:00:00', 5, 'galliano', 93.29),
+        (976, 'Passion Fruit', 'habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla', 64.48, 35, '2020-11-27 00:00:00', 4, 'passion-fruit', 64.48),
+        (977, 'Neckerchief Blck', 'eu interdum eu tincidunt in leo maecenas pulvinar lobortis est phasellus sit amet erat nulla tempus', 90.31, 100, '2020-07-14 00:00:00', 6, 'neckerchief-blck', 90.31),
+        (978, 'Sugar - Crumb', 'eget rutrum at lorem integer tincidunt ante vel ipsum praesent', 87.45, 0, '2021-02-17 00:00:00', 6, 'sugar-crumb-2', 87.45),
+        (979, 'Oats Large Flake', 'tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis', 53.35, 82, '2020-09-17 00:00:00', 3, 'oats-large-flake-2', 53.35),
+        (980, 'Gelatine Leaves - Envelopes', 'orci mauris lacinia sapien quis libero nullam sit amet turpis elementum ligula vehicula consequat', 74.18, 91, '2020-11-19 00:00:00', 5, 'gelatine-leaves-envelopes', 74.18),
+        (981, 'Chicken - Leg / Back Attach', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in faucibus orci', 54.26, 65, '2020-08-12 00:00:00', 3, 'chicken-leg-back-attach-2', 54.26),
+        (982, 'Cheese - Comte', 'curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque', 75.97, 42, '2020-09-08 00:00:00', 3, 'cheese-comte', 75.97),
+        (983, 'Vinegar - Champagne', 'nulla dapibus dolor vel est donec odio justo sollicitudin ut suscipit', 86.92, 81, '2020-06-20 00:00:00', 5, 'vinegar-champagne', 86.92),
+        (984, 'Kiwi', 'nascetur ridiculus mus etiam vel augue vestibulum rutrum rutrum neque aenean', 79.46, 99, '2021-02-24 00:00:00', 6, 'kiwi', 79.46),
+        (985, 'Kohlrabi', 'est congue elementum in hac habitasse platea dictumst morbi vestibulum velit id pretium', 48.16, 77, '2021-03-12 00:00:00', 3, 'kohlrabi', 48.16),
+        (986, 'Brandy Cherry - Mcguinness', 'ac nibh fusce lacus purus aliquet at feugiat non pretium quis lectus', 9.64, 57, '2021-01-20 00:00:00', 3, 'brandy-cherry-mcguinness', 9.64),
+        (987, 'Sultanas', 'sed accumsan felis ut at dolor quis odio consequat varius integer ac leo pellentesque ultrices mattis odio donec', 62.10, 1, '2020-06-20 00:00:00', 3, 'sultanas-3', 62.10),
+        (988, 'V8 - Berry Blend', 'ipsum ac tellus semper interdum mauris ullamcorper purus sit amet nulla quisque arcu libero rutrum ac lobortis vel dapibus at', 15.77, 64, '2020-07-16 00:00:00', 5, 'v8-berry-blend', 15.77),
+        (989, 'Soup - Campbells, Creamy', 'pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien sapien non', 22.70, 30, '2021-01-06 00:00:00', 3, 'soup-campbells-creamy-2', 22.70),
+        (990, 'Creamers - 10%', 'suspendisse potenti in eleifend quam a odio in hac habitasse platea dictumst maecenas ut massa', 71.17, 53, '2021-01-05 00:00:00', 5, 'creamers-10', 71.17),
+        (991, 'Mushroom - Porcini, Dry', 'turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum donec ut mauris eget massa tempor', 41.43, 36, '2020-07-08 00:00:00', 4, 'mushroom-porcini-dry', 41.43),
+        (992, 'Cake - Miini Cheesecake Cherry', 'lacinia eget tincidunt eget tempus vel pede morbi porttitor lorem id ligula', 53.99, 59, '2020-10-27 00:00:00', 6, 'cake-miini-cheesecake-cherry-2', 53.99),
+        (993, 'Carbonated Water - Raspberry', 'proin eu mi nulla ac enim in tempor turpis nec euismod scelerisque quam turpis adipiscing lorem vitae mattis', 32.22, 51, '2021-04-20 00:00:00', 3, 'carbonated-water-raspberry', 32.22),
+        (994, 'Cream Of Tartar', 'sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend', 35.22, 44, '2020-08-31 00:00:00', 4, 'cream-of-tartar-2', 35.22),
+        (995, 'Club Soda - Schweppes, 355 Ml', 'sed tristique in tempus sit amet sem fusce consequat nulla nisl nunc nisl', 8.32, 61, '2021-03-19 00:00:00', 3, 'club-soda-schweppes-355-ml-2', 8.32),
+        (996, 'Beef - Rib Roast, Capless', 'sem sed sagittis nam congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci', 52.90, 68, '2020-06-20 00:00:00', 6, 'beef-rib-roast-capless-2', 52.90),
+        (997, 'Salt - Table', 'etiam justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat', 37.51, 7, '2021-05-02 00:00:00', 6, 'salt-table', 37.51),
+        (998, 'Muffin Hinge 117n', 'mauris non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at vulputate', 59.84, 98, '2020-06-29 00:00:00', 3, 'muffin-hinge-117n', 59.84),
+        (999, 'Chicken - Wieners', 'eget tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 58.57, 5, '2020-08-16 00:00:00', 6, 'chicken-wieners', 58.57),
+        (1000, 'Dried Peach', 'in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec odio justo sollicitudin', 41.22, 39, '2020-12-12 00:00:00', 4, 'dried-peach', 41.22);
 
 insert into shop_customers (id, first_name, last_name, email, phone, birth_date, membership)
 values  (1, 'Faydra', 'Corhard', 'fcorhard0@dot.gov', '897-661-9039', '2020-10-28', 'G'),
@@ -2013,1007 +2013,1007 @@ values  (1, 'Faydra', 'Corhard', 'fcorhard0@dot.gov', '897-661-9039', '2020-10-2
         (999, 'Deni', 'Moylane', 'dmoylanerq@hibu.com', '376-776-9321', '2020-12-15', 'S'),
         (1000, 'Rosene', 'Deetch', 'rdeetchrr@japanpost.jp', '710-123-3374', '2021-03-06', 'G');
 
-insert into shop_order (id, placed_at, payment_status, customer_id)
-values  (1, '2021-04-03 00:00:00', 'P', 207),
-        (2, '2021-06-07 00:00:00', 'P', 241),
-        (3, '2021-02-03 00:00:00', 'P', 432),
-        (4, '2020-07-17 00:00:00', 'F', 49),
-        (5, '2021-03-25 00:00:00', 'F', 347),
-        (6, '2020-08-03 00:00:00', 'F', 189),
-        (7, '2021-05-18 00:00:00', 'P', 88),
-        (8, '2021-01-16 00:00:00', 'C', 217),
-        (9, '2020-10-01 00:00:00', 'C', 7),
-        (10, '2020-08-22 00:00:00', 'P', 75),
-        (11, '2020-07-18 00:00:00', 'F', 200),
-        (12, '2020-10-08 00:00:00', 'F', 294),
-        (13, '2020-09-09 00:00:00', 'C', 370),
-        (14, '2021-03-26 00:00:00', 'F', 242),
-        (15, '2021-03-18 00:00:00', 'P', 139),
-        (16, '2020-07-29 00:00:00', 'F', 137),
-        (17, '2021-04-29 00:00:00', 'F', 167),
-        (18, '2020-08-10 00:00:00', 'F', 328),
-        (19, '2021-05-12 00:00:00', 'C', 408),
-        (20, '2020-10-18 00:00:00', 'P', 189),
-        (21, '2020-06-12 00:00:00', 'C', 469),
-        (22, '2020-12-29 00:00:00', 'P', 417),
-        (23, '2020-09-04 00:00:00', 'F', 345),
-        (24, '2020-08-23 00:00:00', 'F', 335),
-        (25, '2020-12-10 00:00:00', 'C', 284),
-        (26, '2020-10-05 00:00:00', 'F', 178),
-        (27, '2021-01-23 00:00:00', 'F', 359),
-        (28, '2020-07-19 00:00:00', 'F', 203),
-        (29, '2021-03-18 00:00:00', 'F', 486),
-        (30, '2021-04-05 00:00:00', 'F', 219),
-        (31, '2021-02-17 00:00:00', 'F', 253),
-        (32, '2021-05-24 00:00:00', 'C', 173),
-        (33, '2021-03-03 00:00:00', 'F', 226),
-        (34, '2021-06-04 00:00:00', 'P', 108),
-        (35, '2021-06-06 00:00:00', 'P', 133),
-        (36, '2021-04-18 00:00:00', 'P', 402),
-        (37, '2020-06-30 00:00:00', 'P', 377),
-        (38, '2020-07-28 00:00:00', 'F', 499),
-        (39, '2020-12-01 00:00:00', 'F', 384),
-        (40, '2020-09-11 00:00:00', 'P', 484),
-        (41, '2020-06-28 00:00:00', 'P', 274),
-        (42, '2020-10-18 00:00:00', 'C', 425),
-        (43, '2020-07-09 00:00:00', 'C', 358),
-        (44, '2020-10-08 00:00:00', 'P', 92),
-        (45, '2020-12-07 00:00:00', 'F', 455),
-        (46, '2020-07-04 00:00:00', 'P', 304),
-        (47, '2020-12-24 00:00:00', 'C', 216),
-        (48, '2021-05-16 00:00:00', 'C', 280),
-        (49, '2021-02-24 00:00:00', 'C', 371),
-        (50, '2020-09-19 00:00:00', 'F', 136),
-        (51, '2020-08-28 00:00:00', 'F', 105),
-        (52, '2020-06-14 00:00:00', 'C', 107),
-        (53, '2020-09-18 00:00:00', 'C', 375),
-        (54, '2021-02-21 00:00:00', 'C', 45),
-        (55, '2020-11-17 00:00:00', 'C', 388),
-        (56, '2021-01-03 00:00:00', 'C', 267),
-        (57, '2021-04-04 00:00:00', 'P', 462),
-        (58, '2021-06-04 00:00:00', 'P', 475),
-        (59, '2020-06-26 00:00:00', 'F', 411),
-        (60, '2020-07-10 00:00:00', 'P', 89),
-        (61, '2020-06-18 00:00:00', 'F', 113),
-        (62, '2020-11-02 00:00:00', 'C', 397),
-        (63, '2021-05-11 00:00:00', 'F', 399),
-        (64, '2020-08-21 00:00:00', 'C', 488),
-        (65, '2021-03-04 00:00:00', 'F', 6),
-        (66, '2020-12-10 00:00:00', 'F', 438),
-        (67, '2020-10-27 00:00:00', 'C', 482),
-        (68, '2020-06-25 00:00:00', 'C', 369),
-        (69, '2020-12-21 00:00:00', 'F', 225),
-        (70, '2020-10-14 00:00:00', 'P', 428),
-        (71, '2020-12-03 00:00:00', 'F', 74),
-        (72, '2021-03-08 00:00:00', 'P', 429),
-        (73, '2020-11-06 00:00:00', 'P', 92),
-        (74, '2020-08-19 00:00:00', 'P', 14),
-        (75, '2020-10-16 00:00:00', 'F', 436),
-        (76, '2021-05-14 00:00:00', 'P', 367),
-        (77, '2021-06-02 00:00:00', 'P', 276),
-        (78, '2021-03-13 00:00:00', 'F', 373),
-        (79, '2020-08-21 00:00:00', 'P', 178),
-        (80, '2021-02-21 00:00:00', 'C', 263),
-        (81, '2020-10-28 00:00:00', 'C', 266),
-        (82, '2020-08-08 00:00:00', 'C', 415),
-        (83, '2020-07-27 00:00:00', 'P', 89),
-        (84, '2021-06-02 00:00:00', 'C', 345),
-        (85, '2021-04-24 00:00:00', 'P', 167),
-        (86, '2020-11-02 00:00:00', 'P', 150),
-        (87, '2020-09-05 00:00:00', 'P', 157),
-        (88, '2021-02-09 00:00:00', 'F', 52),
-        (89, '2021-03-06 00:00:00', 'P', 286),
-        (90, '2020-10-14 00:00:00', 'F', 134),
-        (91, '2021-05-08 00:00:00', 'F', 452),
-        (92, '2021-02-07 00:00:00', 'F', 370),
-        (93, '2021-01-12 00:00:00', 'F', 105),
-        (94, '2021-04-04 00:00:00', 'C', 354),
-        (95, '2020-09-13 00:00:00', 'C', 91),
-        (96, '2021-02-23 00:00:00', 'P', 172),
-        (97, '2021-05-16 00:00:00', 'F', 287),
-        (98, '2020-12-23 00:00:00', 'C', 401),
-        (99, '2020-07-12 00:00:00', 'F', 245),
-        (100, '2021-02-24 00:00:00', 'P', 208),
-        (101, '2020-07-29 00:00:00', 'C', 286),
-        (102, '2020-08-27 00:00:00', 'F', 258),
-        (103, '2020-11-19 00:00:00', 'C', 339),
-        (104, '2021-02-10 00:00:00', 'P', 337),
-        (105, '2020-07-13 00:00:00', 'C', 437),
-        (106, '2020-10-15 00:00:00', 'P', 436),
-        (107, '2021-04-01 00:00:00', 'P', 347),
-        (108, '2021-02-01 00:00:00', 'P', 110),
-        (109, '2020-11-13 00:00:00', 'P', 180),
-        (110, '2021-05-13 00:00:00', 'C', 410),
-        (111, '2020-11-29 00:00:00', 'C', 482),
-        (112, '2020-11-18 00:00:00', 'C', 356),
-        (113, '2020-06-26 00:00:00', 'F', 182),
-        (114, '2021-02-23 00:00:00', 'P', 77),
-        (115, '2021-01-31 00:00:00', 'P', 29),
-        (116, '2020-10-14 00:00:00', 'F', 86),
-        (117, '2021-01-02 00:00:00', 'F', 33),
-        (118, '2020-10-10 00:00:00', 'F', 299),
-        (119, '2021-01-28 00:00:00', 'P', 75),
-        (120, '2020-07-05 00:00:00', 'P', 473),
-        (121, '2020-08-07 00:00:00', 'F', 476),
-        (122, '2020-07-29 00:00:00', 'F', 273),
-        (123, '2020-09-08 00:00:00', 'P', 467),
-        (124, '2021-03-22 00:00:00', 'C', 192),
-        (125, '2020-12-27 00:00:00', 'P', 169),
-        (126, '2020-10-04 00:00:00', 'F', 92),
-        (127, '2020-07-26 00:00:00', 'F', 300),
-        (128, '2020-07-08 00:00:00', 'F', 44),
-        (129, '2020-08-21 00:00:00', 'P', 199),
-        (130, '2021-03-17 00:00:00', 'F', 206),
-        (131, '2020-12-03 00:00:00', 'F', 14),
-        (132, '2020-07-16 00:00:00', 'C', 219),
-        (133, '2021-01-12 00:00:00', 'F', 288),
-        (134, '2020-11-12 00:00:00', 'P', 490),
-        (135, '2021-05-26 00:00:00', 'F', 105),
-        (136, '2020-09-01 00:00:00', 'F', 224),
-        (137, '2021-04-19 00:00:00', 'F', 327),
-        (138, '2020-07-16 00:00:00', 'F', 151),
-        (139, '2021-05-03 00:00:00', 'P', 184),
-        (140, '2020-10-22 00:00:00', 'P', 61),
-        (141, '2021-05-22 00:00:00', 'F', 393),
-        (142, '2020-11-11 00:00:00', 'C', 221),
-        (143, '2021-01-23 00:00:00', 'F', 37),
-        (144, '2020-11-27 00:00:00', 'P', 222),
-        (145, '2021-04-22 00:00:00', 'C', 222),
-        (146, '2021-04-12 00:00:00', 'P', 341),
-        (147, '2020-08-19 00:00:00', 'P', 134),
-        (148, '2020-06-26 00:00:00', 'F', 404),
-        (149, '2020-12-20 00:00:00', 'P', 108),
-        (150, '2020-06-24 00:00:00', 'P', 402),
-        (151, '2021-02-27 00:00:00', 'F', 105),
-        (152, '2020-11-27 00:00:00', 'F', 158),
-        (153, '2020-08-23 00:00:00', 'F', 123),
-        (154, '2020-07-09 00:00:00', 'C', 134),
-        (155, '2020-07-23 00:00:00', 'C', 258),
-        (156, '2021-01-24 00:00:00', 'P', 473),
-        (157, '2020-11-14 00:00:00', 'F', 363),
-        (158, '2020-09-08 00:00:00', 'P', 370),
-        (159, '2020-07-05 00:00:00', 'P', 31),
-        (160, '2020-11-04 00:00:00', 'P', 419),
-        (161, '2021-01-15 00:00:00', 'C', 271),
-        (162, '2021-05-17 00:00:00', 'P', 437),
-        (163, '2020-12-12 00:00:00', 'F', 424),
-        (164, '2021-03-27 00:00:00', 'F', 201),
-        (165, '2020-11-18 00:00:00', 'C', 25),
-        (166, '2020-07-15 00:00:00', 'P', 187),
-        (167, '2020-11-18 00:00:00', 'F', 81),
-        (168, '2021-05-24 00:00:00', 'F', 257),
-        (169, '2020-09-19 00:00:00', 'P', 457),
-        (170, '2020-10-08 00:00:00', 'P', 117),
-        (171, '2020-10-26 00:00:00', 'F', 8),
-        (172, '2020-10-08 00:00:00', 'P', 121),
-        (173, '2021-04-14 00:00:00', 'C', 94),
-        (174, '2020-09-07 00:00:00', 'F', 327),
-        (175, '2020-12-29 00:00:00', 'F', 206),
-        (176, '2020-08-09 00:00:00', 'C', 419),
-        (177, '2020-12-03 00:00:00', 'P', 445),
-        (178, '2020-09-23 00:00:00', 'P', 135),
-        (179, '2021-04-25 00:00:00', 'C', 495),
-        (180, '2020-07-08 00:00:00', 'P', 300),
-        (181, '2020-10-22 00:00:00', 'F', 343),
-        (182, '2020-06-13 00:00:00', 'F', 347),
-        (183, '2020-07-11 00:00:00', 'F', 39),
-        (184, '2021-02-10 00:00:00', 'F', 279),
-        (185, '2021-06-03 00:00:00', 'F', 127),
-        (186, '2020-11-17 00:00:00', 'F', 447),
-        (187, '2021-01-31 00:00:00', 'F', 458),
-        (188, '2021-03-11 00:00:00', 'F', 462),
-        (189, '2020-10-06 00:00:00', 'C', 458),
-        (190, '2020-08-29 00:00:00', 'C', 339),
-        (191, '2020-06-18 00:00:00', 'P', 21),
-        (192, '2021-04-14 00:00:00', 'F', 290),
-        (193, '2020-08-10 00:00:00', 'F', 264),
-        (194, '2020-11-12 00:00:00', 'F', 498),
-        (195, '2021-04-13 00:00:00', 'P', 389),
-        (196, '2020-10-10 00:00:00', 'F', 201),
-        (197, '2021-04-25 00:00:00', 'C', 241),
-        (198, '2021-04-22 00:00:00', 'F', 393),
-        (199, '2021-02-05 00:00:00', 'C', 244),
-        (200, '2020-11-13 00:00:00', 'F', 330),
-        (201, '2020-08-24 00:00:00', 'P', 224),
-        (202, '2021-03-30 00:00:00', 'C', 364),
-        (203, '2021-06-01 00:00:00', 'F', 258),
-        (204, '2020-07-27 00:00:00', 'F', 334),
-        (205, '2021-02-04 00:00:00', 'P', 214),
-        (206, '2020-08-28 00:00:00', 'F', 158),
-        (207, '2021-01-16 00:00:00', 'P', 394),
-        (208, '2020-09-07 00:00:00', 'F', 285),
-        (209, '2020-12-23 00:00:00', 'C', 21),
-        (210, '2020-11-04 00:00:00', 'P', 407),
-        (211, '2021-01-14 00:00:00', 'P', 487),
-        (212, '2021-02-27 00:00:00', 'C', 101),
-        (213, '2020-12-18 00:00:00', 'F', 403),
-        (214, '2020-10-26 00:00:00', 'P', 15),
-        (215, '2020-07-04 00:00:00', 'F', 129),
-        (216, '2021-01-22 00:00:00', 'P', 312),
-        (217, '2021-01-30 00:00:00', 'F', 489),
-        (218, '2020-08-08 00:00:00', 'F', 102),
-        (219, '2021-05-22 00:00:00', 'F', 390),
-        (220, '2021-05-18 00:00:00', 'F', 77),
-        (221, '2021-03-14 00:00:00', 'C', 424),
-        (222, '2020-12-31 00:00:00', 'F', 473),
-        (223, '2021-05-05 00:00:00', 'F', 90),
-        (224, '2021-01-13 00:00:00', 'F', 389),
-        (225, '2020-12-09 00:00:00', 'F', 342),
-        (226, '2020-12-31 00:00:00', 'F', 477),
-        (227, '2021-05-14 00:00:00', 'C', 436),
-        (228, '2021-03-31 00:00:00', 'C', 359),
-        (229, '2021-05-11 00:00:00', 'F', 129),
-        (230, '2020-06-21 00:00:00', 'F', 496),
-        (231, '2020-08-13 00:00:00', 'F', 139),
-        (232, '2020-10-20 00:00:00', 'P', 279),
-        (233, '2020-06-19 00:00:00', 'F', 211),
-        (234, '2021-05-07 00:00:00', 'F', 234),
-        (235, '2021-03-23 00:00:00', 'F', 116),
-        (236, '2021-04-03 00:00:00', 'F', 64),
-        (237, '2020-06-19 00:00:00', 'F', 116),
-        (238, '2020-07-26 00:00:00', 'C', 358),
-        (239, '2021-03-13 00:00:00', 'P', 352),
-        (240, '2020-06-25 00:00:00', 'C', 313),
-        (241, '2021-03-14 00:00:00', 'P', 413),
-        (242, '2020-06-24 00:00:00', 'C', 56),
-        (243, '2021-05-28 00:00:00', 'F', 70),
-        (244, '2021-04-03 00:00:00', 'P', 465),
-        (245, '2020-12-23 00:00:00', 'F', 222),
-        (246, '2020-07-01 00:00:00', 'C', 16),
-        (247, '2020-11-13 00:00:00', 'C', 127),
-        (248, '2021-06-07 00:00:00', 'P', 404),
-        (249, '2021-02-03 00:00:00', 'F', 49),
-        (250, '2021-03-09 00:00:00', 'F', 307),
-        (251, '2021-05-02 00:00:00', 'F', 364),
-        (252, '2021-02-01 00:00:00', 'C', 208),
-        (253, '2021-01-13 00:00:00', 'F', 279),
-        (254, '2020-10-14 00:00:00', 'F', 17),
-        (255, '2020-11-04 00:00:00', 'F', 15),
-        (256, '2020-07-12 00:00:00', 'F', 136),
-        (257, '2020-09-19 00:00:00', 'C', 465),
-        (258, '2020-06-26 00:00:00', 'F', 436),
-        (259, '2020-08-04 00:00:00', 'C', 255),
-        (260, '2020-09-25 00:00:00', 'F', 81),
-        (261, '2020-08-27 00:00:00', 'C', 11),
-        (262, '2020-07-16 00:00:00', 'F', 161),
-        (263, '2020-07-18 00:00:00', 'C', 395),
-        (264, '2020-09-02 00:00:00', 'C', 436),
-        (265, '2021-01-25 00:00:00', 'F', 404),
-        (266, '2020-06-10 00:00:00', 'F', 133),
-        (267, '2020-11-02 00:00:00', 'P', 392),
-        (268, '2021-01-16 00:00:00', 'F', 230),
-        (269, '2021-03-09 00:00:00', 'F', 155),
-        (270, '2021-03-26 00:00:00', 'F', 372),
-        (271, '2020-09-01 00:00:00', 'P', 386),
-        (272, '2020-09-16 00:00:00', 'F', 364),
-        (273, '2020-11-10 00:00:00', 'P', 294),
-        (274, '2020-09-05 00:00:00', 'C', 403),
-        (275, '2020-10-30 00:00:00', 'C', 158),
-        (276, '2021-02-15 00:00:00', 'P', 151),
-        (277, '2020-07-17 00:00:00', 'F', 114),
-        (278, '2020-06-10 00:00:00', 'F', 413),
-        (279, '2020-09-24 00:00:00', 'C', 59),
-        (280, '2020-10-14 00:00:00', 'F', 396),
-        (281, '2021-02-18 00:00:00', 'C', 254),
-        (282, '2021-02-03 00:00:00', 'P', 346),
-        (283, '2020-09-13 00:00:00', 'P', 382),
-        (284, '2021-01-19 00:00:00', 'F', 225),
-        (285, '2020-07-24 00:00:00', 'F', 13),
-        (286, '2020-08-22 00:00:00', 'P', 86),
-        (287, '2021-02-19 00:00:00', 'F', 85),
-        (288, '2020-10-06 00:00:00', 'C', 199),
-        (289, '2020-08-15 00:00:00', 'P', 201),
-        (290, '2020-06-12 00:00:00', 'F', 435),
-        (291, '2020-09-12 00:00:00', 'F', 85),
-        (292, '2021-04-21 00:00:00', 'P', 315),
-        (293, '2020-10-07 00:00:00', 'F', 276),
-        (294, '2020-12-24 00:00:00', 'P', 389),
-        (295, '2021-01-04 00:00:00', 'C', 355),
-        (296, '2020-10-17 00:00:00', 'F', 297),
-        (297, '2021-02-14 00:00:00', 'F', 425),
-        (298, '2020-07-30 00:00:00', 'C', 261),
-        (299, '2021-05-06 00:00:00', 'P', 79),
-        (300, '2021-03-27 00:00:00', 'C', 304),
-        (301, '2021-03-17 00:00:00', 'F', 6),
-        (302, '2021-05-09 00:00:00', 'F', 134),
-        (303, '2021-06-03 00:00:00', 'C', 56),
-        (304, '2020-07-04 00:00:00', 'P', 346),
-        (305, '2021-01-18 00:00:00', 'F', 45),
-        (306, '2020-12-26 00:00:00', 'F', 302),
-        (307, '2021-02-15 00:00:00', 'C', 177),
-        (308, '2021-04-13 00:00:00', 'P', 221),
-        (309, '2021-04-26 00:00:00', 'C', 136),
-        (310, '2020-10-21 00:00:00', 'F', 315),
-        (311, '2020-10-02 00:00:00', 'F', 165),
-        (312, '2021-04-18 00:00:00', 'P', 82),
-        (313, '2021-04-01 00:00:00', 'F', 153),
-        (314, '2020-12-21 00:00:00', 'F', 257),
-        (315, '2021-04-18 00:00:00', 'C', 381),
-        (316, '2021-05-12 00:00:00', 'C', 68),
-        (317, '2021-02-10 00:00:00', 'F', 10),
-        (318, '2020-06-25 00:00:00', 'C', 83),
-        (319, '2020-08-09 00:00:00', 'F', 499),
-        (320, '2020-12-16 00:00:00', 'P', 11),
-        (321, '2021-03-17 00:00:00', 'F', 1),
-        (322, '2020-09-06 00:00:00', 'F', 263),
-        (323, '2021-01-31 00:00:00', 'P', 102),
-        (324, '2020-09-05 00:00:00', 'F', 216),
-        (325, '2020-12-27 00:00:00', 'P', 286),
-        (326, '2021-06-01 00:00:00', 'F', 195),
-        (327, '2021-06-07 00:00:00', 'P', 22),
-        (328, '2020-09-22 00:00:00', 'C', 285),
-        (329, '2020-08-15 00:00:00', 'F', 461),
-        (330, '2021-02-27 00:00:00', 'F', 491),
-        (331, '2021-03-03 00:00:00', 'F', 366),
-        (332, '2020-09-09 00:00:00', 'P', 146),
-        (333, '2020-08-14 00:00:00', 'P', 277),
-        (334, '2021-01-15 00:00:00', 'F', 181),
-        (335, '2020-06-18 00:00:00', 'F', 270),
-        (336, '2021-04-26 00:00:00', 'C', 304),
-        (337, '2020-07-01 00:00:00', 'F', 134),
-        (338, '2021-02-14 00:00:00', 'C', 489),
-        (339, '2020-10-26 00:00:00', 'P', 409),
-        (340, '2020-08-18 00:00:00', 'C', 81),
-        (341, '2020-08-26 00:00:00', 'P', 493),
-        (342, '2021-02-25 00:00:00', 'F', 246),
-        (343, '2021-05-17 00:00:00', 'C', 431),
-        (344, '2021-05-01 00:00:00', 'F', 261),
-        (345, '2021-03-04 00:00:00', 'P', 168),
-        (346, '2021-04-25 00:00:00', 'F', 302),
-        (347, '2020-07-19 00:00:00', 'P', 436),
-        (348, '2020-12-03 00:00:00', 'F', 20),
-        (349, '2021-04-11 00:00:00', 'C', 448),
-        (350, '2021-02-12 00:00:00', 'F', 455),
-        (351, '2021-04-06 00:00:00', 'P', 397),
-        (352, '2020-11-03 00:00:00', 'C', 255),
-        (353, '2021-04-05 00:00:00', 'F', 491),
-        (354, '2021-05-06 00:00:00', 'P', 246),
-        (355, '2020-12-04 00:00:00', 'F', 172),
-        (356, '2021-02-12 00:00:00', 'C', 221),
-        (357, '2020-09-21 00:00:00', 'P', 289),
-        (358, '2021-02-25 00:00:00', 'P', 162),
-        (359, '2021-02-01 00:00:00', 'F', 90),
-        (360, '2020-09-06 00:00:00', 'F', 87),
-        (361, '2021-02-03 00:00:00', 'F', 123),
-        (362, '2020-10-26 00:00:00', 'F', 466),
-        (363, '2021-01-24 00:00:00', 'P', 191),
-        (364, '2020-07-06 00:00:00', 'F', 60),
-        (365, '2020-09-09 00:00:00', 'F', 396),
-        (366, '2021-04-16 00:00:00', 'F', 395),
-        (367, '2020-11-02 00:00:00', 'C', 295),
-        (368, '2021-02-27 00:00:00', 'F', 348),
-        (369, '2021-02-07 00:00:00', 'F', 53),
-        (370, '2021-04-01 00:00:00', 'P', 213),
-        (371, '2020-11-06 00:00:00', 'F', 271),
-        (372, '2020-10-20 00:00:00', 'F', 304),
-        (373, '2020-07-06 00:00:00', 'P', 351),
-        (374, '2021-01-09 00:00:00', 'C', 126),
-        (375, '2021-03-09 00:00:00', 'F', 379),
-        (376, '2021-03-12 00:00:00', 'F', 455),
-        (377, '2021-03-27 00:00:00', 'P', 279),
-        (378, '2020-09-17 00:00:00', 'C', 22),
-        (379, '2021-03-01 00:00:00', 'P', 129),
-        (380, '2021-05-14 00:00:00', 'F', 145),
-        (381, '2020-12-04 00:00:00', 'P', 182),
-        (382, '2021-05-27 00:00:00', 'C', 214),
-        (383, '2020-09-12 00:00:00', 'F', 31),
-        (384, '2020-12-13 00:00:00', 'P', 99),
-        (385, '2021-05-20 00:00:00', 'C', 209),
-        (386, '2021-03-20 00:00:00', 'P', 275),
-        (387, '2021-01-16 00:00:00', 'F', 27),
-        (388, '2021-03-28 00:00:00', 'F', 27),
-        (389, '2020-11-30 00:00:00', 'C', 332),
-        (390, '2020-12-26 00:00:00', 'F', 306),
-        (391, '2020-07-31 00:00:00', 'F', 72),
-        (392, '2020-12-25 00:00:00', 'C', 3),
-        (393, '2020-07-11 00:00:00', 'C', 446),
-        (394, '2020-07-08 00:00:00', 'P', 18),
-        (395, '2021-04-29 00:00:00', 'F', 268),
-        (396, '2020-12-15 00:00:00', 'F', 58),
-        (397, '2020-12-20 00:00:00', 'C', 70),
-        (398, '2020-06-21 00:00:00', 'P', 439),
-        (399, '2021-04-15 00:00:00', 'P', 367),
-        (400, '2021-01-12 00:00:00', 'F', 405),
-        (401, '2020-12-13 00:00:00', 'P', 482),
-        (402, '2021-01-12 00:00:00', 'F', 286),
-        (403, '2021-02-25 00:00:00', 'P', 1),
-        (404, '2021-04-13 00:00:00', 'F', 384),
-        (405, '2020-07-31 00:00:00', 'C', 417),
-        (406, '2020-08-04 00:00:00', 'F', 37),
-        (407, '2020-09-03 00:00:00', 'F', 420),
-        (408, '2021-06-09 00:00:00', 'C', 121),
-        (409, '2021-01-28 00:00:00', 'P', 304),
-        (410, '2021-05-29 00:00:00', 'C', 113),
-        (411, '2020-11-06 00:00:00', 'P', 314),
-        (412, '2020-12-03 00:00:00', 'P', 395),
-        (413, '2021-02-28 00:00:00', 'F', 8),
-        (414, '2021-05-16 00:00:00', 'C', 120),
-        (415, '2020-09-07 00:00:00', 'F', 89),
-        (416, '2021-05-15 00:00:00', 'F', 212),
-        (417, '2020-07-18 00:00:00', 'C', 367),
-        (418, '2020-08-14 00:00:00', 'P', 110),
-        (419, '2020-08-21 00:00:00', 'P', 239),
-        (420, '2020-12-13 00:00:00', 'C', 472),
-        (421, '2020-11-29 00:00:00', 'C', 113),
-        (422, '2020-08-26 00:00:00', 'F', 385),
-        (423, '2020-10-23 00:00:00', 'F', 200),
-        (424, '2021-02-17 00:00:00', 'F', 457),
-        (425, '2021-05-20 00:00:00', 'P', 258),
-        (426, '2021-01-29 00:00:00', 'P', 420),
-        (427, '2020-07-13 00:00:00', 'F', 175),
-        (428, '2020-07-31 00:00:00', 'F', 438),
-        (429, '2020-12-22 00:00:00', 'F', 274),
-        (430, '2021-01-08 00:00:00', 'F', 210),
-        (431, '2021-04-11 00:00:00', 'C', 450),
-        (432, '2021-05-21 00:00:00', 'F', 72),
-        (433, '2020-09-30 00:00:00', 'F', 452),
-        (434, '2021-04-06 00:00:00', 'P', 108),
-        (435, '2021-04-22 00:00:00', 'F', 191),
-        (436, '2020-12-02 00:00:00', 'F', 342),
-        (437, '2021-04-16 00:00:00', 'F', 301),
-        (438, '2021-04-08 00:00:00', 'C', 203),
-        (439, '2020-11-07 00:00:00', 'P', 169),
-        (440, '2020-11-09 00:00:00', 'F', 248),
-        (441, '2020-11-16 00:00:00', 'P', 410),
-        (442, '2020-09-14 00:00:00', 'C', 157),
-        (443, '2021-04-21 00:00:00', 'F', 289),
-        (444, '2020-10-17 00:00:00', 'F', 299),
-        (445, '2021-01-27 00:00:00', 'P', 104),
-        (446, '2020-06-21 00:00:00', 'C', 455),
-        (447, '2021-03-05 00:00:00', 'F', 280),
-        (448, '2020-08-08 00:00:00', 'F', 8),
-        (449, '2021-01-19 00:00:00', 'F', 321),
-        (450, '2020-10-16 00:00:00', 'F', 189),
-        (451, '2020-11-10 00:00:00', 'C', 48),
-        (452, '2021-03-12 00:00:00', 'C', 222),
-        (453, '2020-08-04 00:00:00', 'P', 231),
-        (454, '2021-06-01 00:00:00', 'P', 447),
-        (455, '2021-04-09 00:00:00', 'F', 218),
-        (456, '2020-07-07 00:00:00', 'P', 33),
-        (457, '2020-07-17 00:00:00', 'P', 189),
-        (458, '2021-01-12 00:00:00', 'C', 141),
-        (459, '2020-08-30 00:00:00', 'P', 212),
-        (460, '2021-05-18 00:00:00', 'C', 163),
-        (461, '2020-07-14 00:00:00', 'P', 371),
-        (462, '2021-01-20 00:00:00', 'C', 55),
-        (463, '2020-09-23 00:00:00', 'F', 89),
-        (464, '2021-04-11 00:00:00', 'P', 16),
-        (465, '2020-06-22 00:00:00', 'C', 431),
-        (466, '2021-05-26 00:00:00', 'F', 247),
-        (467, '2020-07-30 00:00:00', 'C', 158),
-        (468, '2020-09-04 00:00:00', 'P', 149),
-        (469, '2020-09-30 00:00:00', 'F', 128),
-        (470, '2020-09-03 00:00:00', 'F', 265),
-        (471, '2021-04-21 00:00:00', 'C', 230),
-        (472, '2021-02-14 00:00:00', 'C', 126),
-        (473, '2020-11-26 00:00:00', 'P', 432),
-        (474, '2020-12-21 00:00:00', 'C', 184),
-        (475, '2020-07-18 00:00:00', 'F', 332),
-        (476, '2020-08-30 00:00:00', 'C', 111),
-        (477, '2021-03-02 00:00:00', 'F', 355),
-        (478, '2021-04-22 00:00:00', 'C', 155),
-        (479, '2020-12-14 00:00:00', 'F', 455),
-        (480, '2020-10-16 00:00:00', 'C', 408),
-        (481, '2021-01-03 00:00:00', 'F', 262),
-        (482, '2020-12-11 00:00:00', 'F', 423),
-        (483, '2020-08-20 00:00:00', 'F', 166),
-        (484, '2021-03-31 00:00:00', 'P', 114),
-        (485, '2021-02-16 00:00:00', 'C', 40),
-        (486, '2021-04-04 00:00:00', 'F', 100),
-        (487, '2021-03-18 00:00:00', 'P', 138),
-        (488, '2020-09-26 00:00:00', 'F', 421),
-        (489, '2020-08-12 00:00:00', 'F', 103),
-        (490, '2021-02-07 00:00:00', 'C', 84),
-        (491, '2020-11-27 00:00:00', 'F', 30),
-        (492, '2020-08-01 00:00:00', 'C', 177),
-        (493, '2020-08-16 00:00:00', 'F', 300),
-        (494, '2020-11-10 00:00:00', 'P', 78),
-        (495, '2021-03-16 00:00:00', 'P', 326),
-        (496, '2021-02-09 00:00:00', 'P', 328),
-        (497, '2020-07-30 00:00:00', 'F', 485),
-        (498, '2020-12-13 00:00:00', 'F', 346),
-        (499, '2021-05-04 00:00:00', 'C', 92),
-        (500, '2020-08-18 00:00:00', 'F', 74),
-        (501, '2021-04-08 00:00:00', 'P', 326),
-        (502, '2020-12-02 00:00:00', 'F', 77),
-        (503, '2021-03-13 00:00:00', 'F', 64),
-        (504, '2021-05-07 00:00:00', 'F', 393),
-        (505, '2021-04-21 00:00:00', 'P', 278),
-        (506, '2021-04-12 00:00:00', 'C', 311),
-        (507, '2021-01-06 00:00:00', 'F', 7),
-        (508, '2020-10-26 00:00:00', 'F', 327),
-        (509, '2020-12-06 00:00:00', 'C', 408),
-        (510, '2021-03-14 00:00:00', 'F', 247),
-        (511, '2020-10-23 00:00:00', 'F', 388),
-        (512, '2021-03-13 00:00:00', 'F', 158),
-        (513, '2021-06-08 00:00:00', 'C', 298),
-        (514, '2020-08-22 00:00:00', 'C', 62),
-        (515, '2020-12-03 00:00:00', 'F', 395),
-        (516, '2021-04-22 00:00:00', 'F', 18),
-        (517, '2021-03-23 00:00:00', 'C', 152),
-        (518, '2021-05-16 00:00:00', 'C', 103),
-        (519, '2021-05-12 00:00:00', 'C', 72),
-        (520, '2020-09-18 00:00:00', 'F', 109),
-        (521, '2021-03-27 00:00:00', 'C', 265),
-        (522, '2021-03-10 00:00:00', 'F', 376),
-        (523, '2021-03-04 00:00:00', 'C', 87),
-        (524, '2020-06-15 00:00:00', 'C', 316),
-        (525, '2020-10-03 00:00:00', 'P', 405),
-        (526, '2020-09-02 00:00:00', 'C', 237),
-        (527, '2020-12-22 00:00:00', 'P', 212),
-        (528, '2020-12-29 00:00:00', 'P', 234),
-        (529, '2021-04-14 00:00:00', 'P', 191),
-        (530, '2020-11-12 00:00:00', 'F', 100),
-        (531, '2020-11-01 00:00:00', 'F', 360),
-        (532, '2020-07-04 00:00:00', 'F', 50),
-        (533, '2021-02-05 00:00:00', 'F', 218),
-        (534, '2021-03-13 00:00:00', 'P', 96),
-        (535, '2021-05-01 00:00:00', 'C', 381),
-        (536, '2021-05-18 00:00:00', 'P', 363),
-        (537, '2020-06-10 00:00:00', 'F', 208),
-        (538, '2020-12-27 00:00:00', 'F', 307),
-        (539, '2021-04-01 00:00:00', 'P', 171),
-        (540, '2020-08-25 00:00:00', 'F', 1),
-        (541, '2021-04-09 00:00:00', 'C', 315),
-        (542, '2020-10-19 00:00:00', 'F', 252),
-        (543, '2021-06-03 00:00:00', 'F', 397),
-        (544, '2020-10-31 00:00:00', 'F', 1),
-        (545, '2020-06-13 00:00:00', 'F', 180),
-        (546, '2020-09-19 00:00:00', 'F', 276),
-        (547, '2021-02-11 00:00:00', 'F', 258),
-        (548, '2020-07-12 00:00:00', 'F', 139),
-        (549, '2020-06-14 00:00:00', 'F', 446),
-        (550, '2021-05-24 00:00:00', 'C', 343),
-        (551, '2020-11-06 00:00:00', 'F', 383),
-        (552, '2020-11-11 00:00:00', 'F', 139),
-        (553, '2021-04-06 00:00:00', 'F', 322),
-        (554, '2021-02-12 00:00:00', 'F', 172),
-        (555, '2020-06-23 00:00:00', 'F', 14),
-        (556, '2020-12-04 00:00:00', 'C', 36),
-        (557, '2020-12-05 00:00:00', 'P', 424),
-        (558, '2021-01-21 00:00:00', 'F', 383),
-        (559, '2020-08-05 00:00:00', 'C', 237),
-        (560, '2020-06-11 00:00:00', 'P', 474),
-        (561, '2021-02-26 00:00:00', 'F', 126),
-        (562, '2020-10-25 00:00:00', 'P', 226),
-        (563, '2021-05-30 00:00:00', 'F', 230),
-        (564, '2021-05-25 00:00:00', 'P', 126),
-        (565, '2020-12-09 00:00:00', 'C', 132),
-        (566, '2020-06-26 00:00:00', 'C', 2),
-        (567, '2020-09-01 00:00:00', 'P', 154),
-        (568, '2021-04-26 00:00:00', 'C', 497),
-        (569, '2020-11-27 00:00:00', 'F', 246),
-        (570, '2020-12-27 00:00:00', 'C', 279),
-        (571, '2021-01-03 00:00:00', 'P', 66),
-        (572, '2021-02-20 00:00:00', 'F', 207),
-        (573, '2021-02-21 00:00:00', 'F', 362),
-        (574, '2021-01-03 00:00:00', 'F', 429),
-        (575, '2021-05-08 00:00:00', 'F', 128),
-        (576, '2020-08-17 00:00:00', 'F', 405),
-        (577, '2021-06-02 00:00:00', 'C', 323),
-        (578, '2021-02-02 00:00:00', 'P', 370),
-        (579, '2021-03-24 00:00:00', 'C', 179),
-        (580, '2021-02-22 00:00:00', 'C', 308),
-        (581, '2020-11-26 00:00:00', 'F', 363),
-        (582, '2020-11-10 00:00:00', 'P', 50),
-        (583, '2021-04-19 00:00:00', 'F', 403),
-        (584, '2020-11-21 00:00:00', 'P', 387),
-        (585, '2021-03-03 00:00:00', 'F', 61),
-        (586, '2021-02-18 00:00:00', 'C', 369),
-        (587, '2021-03-26 00:00:00', 'F', 309),
-        (588, '2020-09-18 00:00:00', 'C', 139),
-        (589, '2020-06-23 00:00:00', 'F', 419),
-        (590, '2020-10-14 00:00:00', 'F', 46),
-        (591, '2021-04-12 00:00:00', 'P', 304),
-        (592, '2021-06-01 00:00:00', 'P', 172),
-        (593, '2021-04-14 00:00:00', 'F', 103),
-        (594, '2021-03-02 00:00:00', 'F', 382),
-        (595, '2021-02-22 00:00:00', 'F', 287),
-        (596, '2020-07-29 00:00:00', 'F', 228),
-        (597, '2020-11-24 00:00:00', 'F', 351),
-        (598, '2021-03-12 00:00:00', 'F', 273),
-        (599, '2020-06-17 00:00:00', 'C', 150),
-        (600, '2020-08-02 00:00:00', 'P', 415),
-        (601, '2020-10-26 00:00:00', 'F', 465),
-        (602, '2021-02-26 00:00:00', 'F', 26),
-        (603, '2020-11-21 00:00:00', 'F', 97),
-        (604, '2021-04-16 00:00:00', 'F', 489),
-        (605, '2021-05-23 00:00:00', 'C', 447),
-        (606, '2020-07-12 00:00:00', 'F', 442),
-        (607, '2021-03-17 00:00:00', 'C', 406),
-        (608, '2020-06-12 00:00:00', 'P', 376),
-        (609, '2021-05-17 00:00:00', 'P', 119),
-        (610, '2021-02-02 00:00:00', 'F', 155),
-        (611, '2020-09-21 00:00:00', 'F', 211),
-        (612, '2020-12-22 00:00:00', 'F', 442),
-        (613, '2021-02-23 00:00:00', 'P', 180),
-        (614, '2021-02-24 00:00:00', 'F', 424),
-        (615, '2020-08-04 00:00:00', 'F', 28),
-        (616, '2020-07-25 00:00:00', 'P', 107),
-        (617, '2020-08-14 00:00:00', 'F', 146),
-        (618, '2020-12-13 00:00:00', 'C', 49),
-        (619, '2020-10-03 00:00:00', 'F', 11),
-        (620, '2021-02-27 00:00:00', 'P', 27),
-        (621, '2021-02-24 00:00:00', 'F', 418),
-        (622, '2020-07-12 00:00:00', 'F', 379),
-        (623, '2020-11-25 00:00:00', 'F', 191),
-        (624, '2021-05-20 00:00:00', 'C', 179),
-        (625, '2020-10-26 00:00:00', 'P', 54),
-        (626, '2020-06-11 00:00:00', 'F', 148),
-        (627, '2020-08-11 00:00:00', 'F', 156),
-        (628, '2020-11-03 00:00:00', 'F', 374),
-        (629, '2021-05-31 00:00:00', 'C', 430),
-        (630, '2020-06-23 00:00:00', 'F', 472),
-        (631, '2020-12-08 00:00:00', 'P', 257),
-        (632, '2020-11-21 00:00:00', 'F', 128),
-        (633, '2021-05-12 00:00:00', 'F', 46),
-        (634, '2021-03-23 00:00:00', 'F', 92),
-        (635, '2020-12-02 00:00:00', 'F', 49),
-        (636, '2021-04-12 00:00:00', 'P', 340),
-        (637, '2020-07-12 00:00:00', 'C', 293),
-        (638, '2021-05-10 00:00:00', 'C', 260),
-        (639, '2020-08-25 00:00:00', 'F', 451),
-        (640, '2021-06-06 00:00:00', 'F', 401),
-        (641, '2021-02-24 00:00:00', 'F', 240),
-        (642, '2020-08-22 00:00:00', 'F', 308),
-        (643, '2021-05-20 00:00:00', 'C', 255),
-        (644, '2021-06-02 00:00:00', 'F', 74),
-        (645, '2021-04-04 00:00:00', 'F', 85),
-        (646, '2021-01-25 00:00:00', 'C', 65),
-        (647, '2020-08-02 00:00:00', 'F', 447),
-        (648, '2020-10-16 00:00:00', 'F', 312),
-        (649, '2021-03-27 00:00:00', 'F', 403),
-        (650, '2021-03-16 00:00:00', 'P', 41),
-        (651, '2020-09-10 00:00:00', 'C', 318),
-        (652, '2020-08-10 00:00:00', 'F', 284),
-        (653, '2020-10-02 00:00:00', 'P', 243),
-        (654, '2020-09-29 00:00:00', 'P', 218),
-        (655, '2021-05-08 00:00:00', 'F', 339),
-        (656, '2020-11-01 00:00:00', 'F', 227),
-        (657, '2020-10-13 00:00:00', 'C', 284),
-        (658, '2021-03-04 00:00:00', 'F', 445),
-        (659, '2020-08-17 00:00:00', 'F', 431),
-        (660, '2020-07-17 00:00:00', 'F', 94),
-        (661, '2021-04-17 00:00:00', 'C', 275),
-        (662, '2020-09-14 00:00:00', 'F', 444),
-        (663, '2020-08-29 00:00:00', 'C', 326),
-        (664, '2020-09-10 00:00:00', 'C', 37),
-        (665, '2021-01-17 00:00:00', 'F', 105),
-        (666, '2020-10-07 00:00:00', 'F', 323),
-        (667, '2020-06-16 00:00:00', 'P', 54),
-        (668, '2021-04-17 00:00:00', 'C', 274),
-        (669, '2020-10-20 00:00:00', 'F', 143),
-        (670, '2021-04-28 00:00:00', 'P', 221),
-        (671, '2020-11-24 00:00:00', 'F', 228),
-        (672, '2021-04-25 00:00:00', 'P', 80),
-        (673, '2021-04-17 00:00:00', 'F', 190),
-        (674, '2020-11-25 00:00:00', 'F', 19),
-        (675, '2021-05-15 00:00:00', 'P', 56),
-        (676, '2021-05-26 00:00:00', 'F', 309),
-        (677, '2021-06-01 00:00:00', 'P', 482),
-        (678, '2020-12-07 00:00:00', 'F', 112),
-        (679, '2021-04-23 00:00:00', 'C', 492),
-        (680, '2021-05-12 00:00:00', 'P', 169),
-        (681, '2020-11-06 00:00:00', 'F', 277),
-        (682, '2021-05-17 00:00:00', 'F', 425),
-        (683, '2021-05-09 00:00:00', 'F', 208),
-        (684, '2020-10-05 00:00:00', 'F', 158),
-        (685, '2021-01-17 00:00:00', 'F', 360),
-        (686, '2021-03-25 00:00:00', 'F', 498),
-        (687, '2021-05-18 00:00:00', 'F', 288),
-        (688, '2020-10-18 00:00:00', 'P', 439),
-        (689, '2021-03-21 00:00:00', 'F', 444),
-        (690, '2020-12-18 00:00:00', 'C', 76),
-        (691, '2020-11-27 00:00:00', 'F', 492),
-        (692, '2021-04-24 00:00:00', 'F', 355),
-        (693, '2021-01-05 00:00:00', 'P', 244),
-        (694, '2021-06-03 00:00:00', 'C', 176),
-        (695, '2021-04-18 00:00:00', 'F', 60),
-        (696, '2020-09-28 00:00:00', 'F', 479),
-        (697, '2020-08-08 00:00:00', 'F', 469),
-        (698, '2020-06-11 00:00:00', 'C', 269),
-        (699, '2020-07-17 00:00:00', 'F', 467),
-        (700, '2021-01-04 00:00:00', 'C', 324),
-        (701, '2021-02-18 00:00:00', 'C', 377),
-        (702, '2021-01-29 00:00:00', 'F', 69),
-        (703, '2020-12-10 00:00:00', 'F', 95),
-        (704, '2021-02-08 00:00:00', 'F', 42),
-        (705, '2020-11-12 00:00:00', 'F', 23),
-        (706, '2021-04-14 00:00:00', 'F', 314),
-        (707, '2020-07-28 00:00:00', 'F', 30),
-        (708, '2020-12-13 00:00:00', 'F', 208),
-        (709, '2020-08-02 00:00:00', 'F', 396),
-        (710, '2021-04-27 00:00:00', 'C', 132),
-        (711, '2021-06-08 00:00:00', 'F', 103),
-        (712, '2021-02-25 00:00:00', 'F', 46),
-        (713, '2020-08-21 00:00:00', 'C', 98),
-        (714, '2020-10-10 00:00:00', 'F', 346),
-        (715, '2020-11-09 00:00:00', 'C', 255),
-        (716, '2020-11-08 00:00:00', 'P', 209),
-        (717, '2021-03-10 00:00:00', 'P', 435),
-        (718, '2020-10-30 00:00:00', 'P', 205),
-        (719, '2021-02-05 00:00:00', 'F', 454),
-        (720, '2021-05-29 00:00:00', 'F', 262),
-        (721, '2021-04-28 00:00:00', 'C', 182),
-        (722, '2020-12-29 00:00:00', 'F', 125),
-        (723, '2020-07-01 00:00:00', 'P', 79),
-        (724, '2020-06-28 00:00:00', 'F', 85),
-        (725, '2020-08-26 00:00:00', 'F', 383),
-        (726, '2020-09-13 00:00:00', 'F', 16),
-        (727, '2020-08-09 00:00:00', 'P', 466),
-        (728, '2021-05-07 00:00:00', 'C', 276),
-        (729, '2021-05-21 00:00:00', 'C', 261),
-        (730, '2021-03-18 00:00:00', 'F', 166),
-        (731, '2020-10-26 00:00:00', 'F', 239),
-        (732, '2021-01-01 00:00:00', 'F', 133),
-        (733, '2021-04-29 00:00:00', 'F', 244),
-        (734, '2021-01-22 00:00:00', 'F', 364),
-        (735, '2021-01-06 00:00:00', 'F', 15),
-        (736, '2021-05-12 00:00:00', 'F', 356),
-        (737, '2021-03-27 00:00:00', 'F', 496),
-        (738, '2021-01-15 00:00:00', 'C', 494),
-        (739, '2021-02-22 00:00:00', 'F', 85),
-        (740, '2020-08-07 00:00:00', 'C', 466),
-        (741, '2020-10-09 00:00:00', 'P', 39),
-        (742, '2020-06-23 00:00:00', 'P', 319),
-        (743, '2021-04-13 00:00:00', 'F', 498),
-        (744, '2021-05-23 00:00:00', 'C', 19),
-        (745, '2020-07-20 00:00:00', 'F', 329),
-        (746, '2021-01-31 00:00:00', 'F', 302),
-        (747, '2020-09-22 00:00:00', 'F', 95),
-        (748, '2020-10-19 00:00:00', 'F', 478),
-        (749, '2020-10-13 00:00:00', 'P', 409),
-        (750, '2020-12-28 00:00:00', 'F', 339),
-        (751, '2020-06-21 00:00:00', 'C', 334),
-        (752, '2021-02-04 00:00:00', 'P', 194),
-        (753, '2021-05-16 00:00:00', 'F', 46),
-        (754, '2020-08-09 00:00:00', 'P', 318),
-        (755, '2020-08-30 00:00:00', 'F', 223),
-        (756, '2021-04-03 00:00:00', 'F', 155),
-        (757, '2021-03-19 00:00:00', 'F', 9),
-        (758, '2020-08-25 00:00:00', 'F', 73),
-        (759, '2020-12-17 00:00:00', 'F', 481),
-        (760, '2021-04-18 00:00:00', 'C', 406),
-        (761, '2020-08-11 00:00:00', 'P', 254),
-        (762, '2020-07-13 00:00:00', 'F', 128),
-        (763, '2020-10-15 00:00:00', 'P', 261),
-        (764, '2020-12-02 00:00:00', 'P', 365),
-        (765, '2021-05-25 00:00:00', 'F', 130),
-        (766, '2021-06-07 00:00:00', 'F', 127),
-        (767, '2020-10-30 00:00:00', 'P', 394),
-        (768, '2021-04-21 00:00:00', 'C', 387),
-        (769, '2020-07-01 00:00:00', 'F', 160),
-        (770, '2020-07-04 00:00:00', 'P', 183),
-        (771, '2021-02-03 00:00:00', 'F', 405),
-        (772, '2021-03-08 00:00:00', 'F', 488),
-        (773, '2021-03-19 00:00:00', 'F', 418),
-        (774, '2021-02-03 00:00:00', 'P', 121),
-        (775, '2021-01-24 00:00:00', 'F', 491),
-        (776, '2021-03-11 00:00:00', 'F', 382),
-        (777, '2021-01-29 00:00:00', 'F', 382),
-        (778, '2021-04-03 00:00:00', 'F', 175),
-        (779, '2021-05-29 00:00:00', 'P', 62),
-        (780, '2021-01-08 00:00:00', 'C', 351),
-        (781, '2021-03-02 00:00:00', 'P', 206),
-        (782, '2021-05-21 00:00:00', 'F', 184),
-        (783, '2020-08-26 00:00:00', 'F', 11),
-        (784, '2020-06-11 00:00:00', 'P', 279),
-        (785, '2021-01-09 00:00:00', 'F', 105),
-        (786, '2021-03-30 00:00:00', 'F', 113),
-        (787, '2020-10-03 00:00:00', 'F', 382),
-        (788, '2021-04-10 00:00:00', 'F', 284),
-        (789, '2021-05-12 00:00:00', 'F', 42),
-        (790, '2021-02-18 00:00:00', 'F', 361),
-        (791, '2020-11-27 00:00:00', 'C', 111),
-        (792, '2020-07-28 00:00:00', 'C', 378),
-        (793, '2020-09-05 00:00:00', 'F', 204),
-        (794, '2020-09-18 00:00:00', 'C', 317),
-        (795, '2020-09-17 00:00:00', 'P', 186),
-        (796, '2020-11-02 00:00:00', 'F', 74),
-        (797, '2020-11-19 00:00:00', 'F', 406),
-        (798, '2020-12-11 00:00:00', 'F', 67),
-        (799, '2021-01-31 00:00:00', 'C', 8),
-        (800, '2020-08-22 00:00:00', 'F', 6),
-        (801, '2020-11-07 00:00:00', 'P', 361),
-        (802, '2020-06-17 00:00:00', 'F', 14),
-        (803, '2020-10-01 00:00:00', 'C', 122),
-        (804, '2021-03-28 00:00:00', 'C', 88),
-        (805, '2020-09-27 00:00:00', 'C', 461),
-        (806, '2020-09-04 00:00:00', 'P', 64),
-        (807, '2020-10-09 00:00:00', 'F', 437),
-        (808, '2021-04-05 00:00:00', 'P', 379),
-        (809, '2020-08-25 00:00:00', 'P', 86),
-        (810, '2020-12-21 00:00:00', 'F', 465),
-        (811, '2021-02-28 00:00:00', 'P', 242),
-        (812, '2021-04-28 00:00:00', 'P', 447),
-        (813, '2020-09-12 00:00:00', 'P', 106),
-        (814, '2020-09-24 00:00:00', 'F', 154),
-        (815, '2021-02-22 00:00:00', 'P', 302),
-        (816, '2021-03-12 00:00:00', 'F', 449),
-        (817, '2020-12-30 00:00:00', 'P', 262),
-        (818, '2020-06-24 00:00:00', 'P', 30),
-        (819, '2020-07-29 00:00:00', 'C', 496),
-        (820, '2021-03-06 00:00:00', 'F', 292),
-        (821, '2020-12-18 00:00:00', 'F', 338),
-        (822, '2020-10-10 00:00:00', 'F', 72),
-        (823, '2020-06-26 00:00:00', 'C', 383),
-        (824, '2020-10-31 00:00:00', 'P', 389),
-        (825, '2020-11-25 00:00:00', 'F', 290),
-        (826, '2020-08-23 00:00:00', 'F', 228),
-        (827, '2020-11-03 00:00:00', 'F', 188),
-        (828, '2020-07-06 00:00:00', 'F', 476),
-        (829, '2020-09-24 00:00:00', 'F', 325),
-        (830, '2021-03-28 00:00:00', 'F', 254),
-        (831, '2020-07-08 00:00:00', 'F', 56),
-        (832, '2020-08-23 00:00:00', 'P', 377),
-        (833, '2021-04-29 00:00:00', 'C', 368),
-        (834, '2021-01-01 00:00:00', 'C', 23),
-        (835, '2021-04-29 00:00:00', 'F', 191),
-        (836, '2020-10-02 00:00:00', 'C', 139),
-        (837, '2020-10-10 00:00:00', 'P', 416),
-        (838, '2020-11-15 00:00:00', 'C', 217),
-        (839, '2021-01-11 00:00:00', 'F', 449),
-        (840, '2020-06-28 00:00:00', 'F', 277),
-        (841, '2020-09-14 00:00:00', 'P', 164),
-        (842, '2020-08-28 00:00:00', 'C', 17),
-        (843, '2020-11-30 00:00:00', 'F', 218),
-        (844, '2020-09-19 00:00:00', 'F', 170),
-        (845, '2020-11-19 00:00:00', 'C', 56),
-        (846, '2020-08-01 00:00:00', 'F', 406),
-        (847, '2021-02-19 00:00:00', 'P', 484),
-        (848, '2021-03-30 00:00:00', 'F', 99),
-        (849, '2020-07-21 00:00:00', 'C', 380),
-        (850, '2020-06-22 00:00:00', 'F', 154),
-        (851, '2020-10-01 00:00:00', 'C', 288),
-        (852, '2020-10-19 00:00:00', 'C', 193),
-        (853, '2020-06-27 00:00:00', 'C', 87),
-        (854, '2020-10-17 00:00:00', 'C', 271),
-        (855, '2020-07-18 00:00:00', 'F', 317),
-        (856, '2021-02-24 00:00:00', 'F', 370),
-        (857, '2020-09-01 00:00:00', 'F', 323),
-        (858, '2020-09-25 00:00:00', 'C', 345),
-        (859, '2021-03-15 00:00:00', 'P', 67),
-        (860, '2020-06-13 00:00:00', 'C', 435),
-        (861, '2021-03-28 00:00:00', 'P', 456),
-        (862, '2021-01-13 00:00:00', 'C', 351),
-        (863, '2020-11-16 00:00:00', 'C', 62),
-        (864, '2020-12-01 00:00:00', 'F', 343),
-        (865, '2020-11-24 00:00:00', 'C', 402),
-        (866, '2021-01-29 00:00:00', 'F', 427),
-        (867, '2020-09-21 00:00:00', 'C', 24),
-        (868, '2020-12-24 00:00:00', 'P', 333),
-        (869, '2021-03-06 00:00:00', 'P', 164),
-        (870, '2021-02-06 00:00:00', 'F', 306),
-        (871, '2021-02-19 00:00:00', 'F', 254),
-        (872, '2020-09-10 00:00:00', 'F', 335),
-        (873, '2021-02-24 00:00:00', 'F', 42),
-        (874, '2020-08-04 00:00:00', 'F', 10),
-        (875, '2020-06-20 00:00:00', 'F', 58),
-        (876, '2020-10-22 00:00:00', 'C', 157),
-        (877, '2020-09-07 00:00:00', 'C', 40),
-        (878, '2020-10-05 00:00:00', 'F', 263),
-        (879, '2020-08-12 00:00:00', 'C', 149),
-        (880, '2021-01-18 00:00:00', 'C', 483),
-        (881, '2021-05-10 00:00:00', 'F', 391),
-        (882, '2021-03-14 00:00:00', 'C', 261),
-        (883, '2020-12-26 00:00:00', 'C', 94),
-        (884, '2020-08-04 00:00:00', 'C', 11),
-        (885, '2020-10-28 00:00:00', 'F', 426),
-        (886, '2021-01-11 00:00:00', 'C', 390),
-        (887, '2020-12-14 00:00:00', 'F', 398),
-        (888, '2020-12-21 00:00:00', 'C', 146),
-        (889, '2021-04-09 00:00:00', 'F', 355),
-        (890, '2020-11-22 00:00:00', 'P', 214),
-        (891, '2020-08-02 00:00:00', 'P', 255),
-        (892, '2021-06-05 00:00:00', 'P', 82),
-        (893, '2021-01-03 00:00:00', 'P', 41),
-        (894, '2021-04-12 00:00:00', 'C', 142),
-        (895, '2020-06-10 00:00:00', 'P', 322),
-        (896, '2020-11-13 00:00:00', 'F', 235),
-        (897, '2021-04-15 00:00:00', 'F', 335),
-        (898, '2020-09-09 00:00:00', 'F', 455),
-        (899, '2021-05-11 00:00:00', 'F', 378),
-        (900, '2020-08-11 00:00:00', 'P', 202),
-        (901, '2020-09-21 00:00:00', 'C', 382),
-        (902, '2021-04-16 00:00:00', 'F', 127),
-        (903, '2020-07-21 00:00:00', 'C', 251),
-        (904, '2020-09-07 00:00:00', 'F', 241),
-        (905, '2020-12-12 00:00:00', 'F', 85),
-        (906, '2020-07-21 00:00:00', 'P', 375),
-        (907, '2020-08-14 00:00:00', 'F', 222),
-        (908, '2020-10-23 00:00:00', 'F', 200),
-        (909, '2020-10-04 00:00:00', 'C', 474),
-        (910, '2021-04-26 00:00:00', 'F', 471),
-        (911, '2021-01-23 00:00:00', 'F', 493),
-        (912, '2021-05-01 00:00:00', 'P', 8),
-        (913, '2021-05-06 00:00:00', 'F', 176),
-        (914, '2020-06-21 00:00:00', 'P', 80),
-        (915, '2021-05-16 00:00:00', 'P', 83),
-        (916, '2021-01-30 00:00:00', 'C', 424),
-        (917, '2020-08-30 00:00:00', 'P', 29),
-        (918, '2021-05-20 00:00:00', 'F', 135),
-        (919, '2020-12-04 00:00:00', 'F', 417),
-        (920, '2020-12-23 00:00:00', 'C', 151),
-        (921, '2021-03-09 00:00:00', 'P', 400),
-        (922, '2020-06-30 00:00:00', 'F', 327),
-        (923, '2020-08-22 00:00:00', 'F', 369),
-        (924, '2020-10-25 00:00:00', 'F', 369),
-        (925, '2021-01-26 00:00:00', 'P', 33),
-        (926, '2020-06-13 00:00:00', 'F', 258),
-        (927, '2020-10-01 00:00:00', 'F', 231),
-        (928, '2020-07-06 00:00:00', 'C', 64),
-        (929, '2020-07-20 00:00:00', 'F', 11),
-        (930, '2020-10-15 00:00:00', 'P', 475),
-        (931, '2020-12-19 00:00:00', 'C', 1),
-        (932, '2020-09-03 00:00:00', 'C', 459),
-        (933, '2020-12-14 00:00:00', 'P', 469),
-        (934, '2021-05-09 00:00:00', 'F', 121),
-        (935, '2020-09-30 00:00:00', 'F', 322),
-        (936, '2020-06-15 00:00:00', 'P', 214),
-        (937, '2021-04-22 00:00:00', 'F', 181),
-        (938, '2021-05-01 00:00:00', 'F', 109),
-        (939, '2020-07-01 00:00:00', 'P', 288),
-        (940, '2020-12-02 00:00:00', 'P', 115),
-        (941, '2020-07-22 00:00:00', 'P', 11),
-        (942, '2020-12-22 00:00:00', 'F', 180),
-        (943, '2020-10-08 00:00:00', 'C', 162),
-        (944, '2021-04-22 00:00:00', 'F', 447),
-        (945, '2021-02-12 00:00:00', 'P', 148),
-        (946, '2021-05-15 00:00:00', 'F', 195),
-        (947, '2021-04-21 00:00:00', 'P', 194),
-        (948, '2021-02-27 00:00:00', 'P', 225),
-        (949, '2021-03-26 00:00:00', 'P', 443),
-        (950, '2020-10-05 00:00:00', 'C', 465),
-        (951, '2021-06-01 00:00:00', 'F', 47),
-        (952, '2021-04-04 00:00:00', 'P', 290),
-        (953, '2021-02-04 00:00:00', 'F', 329),
-        (954, '2020-11-16 00:00:00', 'F', 214),
-        (955, '2021-05-04 00:00:00', 'C', 324),
-        (956, '2021-02-05 00:00:00', 'F', 121),
-        (957, '2021-03-01 00:00:00', 'C', 418),
-        (958, '2020-07-28 00:00:00', 'P', 411),
-        (959, '2021-05-12 00:00:00', 'F', 441),
-        (960, '2021-04-16 00:00:00', 'F', 28),
-        (961, '2021-04-06 00:00:00', 'F', 452),
-        (962, '2020-10-01 00:00:00', 'C', 157),
-        (963, '2020-12-18 00:00:00', 'F', 103),
-        (964, '2020-08-07 00:00:00', 'F', 32),
-        (965, '2021-02-12 00:00:00', 'P', 353),
-        (966, '2020-10-26 00:00:00', 'C', 414),
-        (967, '2020-09-07 00:00:00', 'F', 362),
-        (968, '2021-05-04 00:00:00', 'F', 447),
-        (969, '2020-09-29 00:00:00', 'C', 398),
-        (970, '2020-08-09 00:00:00', 'F', 64),
-        (971, '2020-06-17 00:00:00', 'F', 219),
-        (972, '2020-08-15 00:00:00', 'F', 13),
-        (973, '2021-02-17 00:00:00', 'F', 490),
-        (974, '2020-12-05 00:00:00', 'F', 498),
-        (975, '2020-07-12 00:00:00', 'P', 365),
-        (976, '2020-06-12 00:00:00', 'F', 190),
-        (977, '2020-12-21 00:00:00', 'P', 123),
-        (978, '2020-11-14 00:00:00', 'C', 333),
-        (979, '2020-09-03 00:00:00', 'F', 462),
-        (980, '2021-02-24 00:00:00', 'P', 169),
-        (981, '2021-01-20 00:00:00', 'F', 123),
-        (982, '2020-07-07 00:00:00', 'P', 47),
-        (983, '2020-12-03 00:00:00', 'F', 408),
-        (984, '2020-06-17 00:00:00', 'F', 376),
-        (985, '2021-02-17 00:00:00', 'F', 39),
-        (986, '2020-06-14 00:00:00', 'P', 239),
-        (987, '2021-02-01 00:00:00', 'P', 45),
-        (988, '2020-06-23 00:00:00', 'C', 342),
-        (989, '2020-09-11 00:00:00', 'F', 183),
-        (990, '2020-06-28 00:00:00', 'C', 399),
-        (991, '2020-11-03 00:00:00', 'F', 96),
-        (992, '2021-01-26 00:00:00', 'P', 433),
-        (993, '2020-06-19 00:00:00', 'F', 57),
-        (994, '2020-10-06 00:00:00', 'P', 378),
-        (995, '2020-06-14 00:00:00', 'P', 179),
-        (996, '2020-07-05 00:00:00', 'C', 106),
-        (997, '2020-08-28 00:00:00', 'F', 356),
-        (998, '2020-08-03 00:00:00', 'F', 408),
-        (999, '2020-08-25 00:00:00', 'C', 107),
-        (1000, '2021-04-25 00:00:00', 'C', 76);
+insert into shop_order (id, placed_at, payment_status, customer_id, total)
+values  (1, '2021-04-03 00:00:00', 'P', 207, 0),
+        (2, '2021-06-07 00:00:00', 'P', 241, 0),
+        (3, '2021-02-03 00:00:00', 'P', 432, 0),
+        (4, '2020-07-17 00:00:00', 'F', 49, 0),
+        (5, '2021-03-25 00:00:00', 'F', 347, 0),
+        (6, '2020-08-03 00:00:00', 'F', 189, 0),
+        (7, '2021-05-18 00:00:00', 'P', 88, 0),
+        (8, '2021-01-16 00:00:00', 'C', 217, 0),
+        (9, '2020-10-01 00:00:00', 'C', 7, 0),
+        (10, '2020-08-22 00:00:00', 'P', 75, 0),
+        (11, '2020-07-18 00:00:00', 'F', 200, 0),
+        (12, '2020-10-08 00:00:00', 'F', 294, 0),
+        (13, '2020-09-09 00:00:00', 'C', 370, 0),
+        (14, '2021-03-26 00:00:00', 'F', 242, 0),
+        (15, '2021-03-18 00:00:00', 'P', 139, 0),
+        (16, '2020-07-29 00:00:00', 'F', 137, 0),
+        (17, '2021-04-29 00:00:00', 'F', 167, 0),
+        (18, '2020-08-10 00:00:00', 'F', 328, 0),
+        (19, '2021-05-12 00:00:00', 'C', 408, 0),
+        (20, '2020-10-18 00:00:00', 'P', 189, 0),
+        (21, '2020-06-12 00:00:00', 'C', 469, 0),
+        (22, '2020-12-29 00:00:00', 'P', 417, 0),
+        (23, '2020-09-04 00:00:00', 'F', 345, 0),
+        (24, '2020-08-23 00:00:00', 'F', 335, 0),
+        (25, '2020-12-10 00:00:00', 'C', 284, 0),
+        (26, '2020-10-05 00:00:00', 'F', 178, 0),
+        (27, '2021-01-23 00:00:00', 'F', 359, 0),
+        (28, '2020-07-19 00:00:00', 'F', 203, 0),
+        (29, '2021-03-18 00:00:00', 'F', 486, 0),
+        (30, '2021-04-05 00:00:00', 'F', 219, 0),
+        (31, '2021-02-17 00:00:00', 'F', 253, 0),
+        (32, '2021-05-24 00:00:00', 'C', 173, 0),
+        (33, '2021-03-03 00:00:00', 'F', 226, 0),
+        (34, '2021-06-04 00:00:00', 'P', 108, 0),
+        (35, '2021-06-06 00:00:00', 'P', 133, 0),
+        (36, '2021-04-18 00:00:00', 'P', 402, 0),
+        (37, '2020-06-30 00:00:00', 'P', 377, 0),
+        (38, '2020-07-28 00:00:00', 'F', 499, 0),
+        (39, '2020-12-01 00:00:00', 'F', 384, 0),
+        (40, '2020-09-11 00:00:00', 'P', 484, 0),
+        (41, '2020-06-28 00:00:00', 'P', 274, 0),
+        (42, '2020-10-18 00:00:00', 'C', 425, 0),
+        (43, '2020-07-09 00:00:00', 'C', 358, 0),
+        (44, '2020-10-08 00:00:00', 'P', 92, 0),
+        (45, '2020-12-07 00:00:00', 'F', 455, 0),
+        (46, '2020-07-04 00:00:00', 'P', 304, 0),
+        (47, '2020-12-24 00:00:00', 'C', 216, 0),
+        (48, '2021-05-16 00:00:00', 'C', 280, 0),
+        (49, '2021-02-24 00:00:00', 'C', 371, 0),
+        (50, '2020-09-19 00:00:00', 'F', 136, 0),
+        (51, '2020-08-28 00:00:00', 'F', 105, 0),
+        (52, '2020-06-14 00:00:00', 'C', 107, 0),
+        (53, '2020-09-18 00:00:00', 'C', 375, 0),
+        (54, '2021-02-21 00:00:00', 'C', 45, 0),
+        (55, '2020-11-17 00:00:00', 'C', 388, 0),
+        (56, '2021-01-03 00:00:00', 'C', 267, 0),
+        (57, '2021-04-04 00:00:00', 'P', 462, 0),
+        (58, '2021-06-04 00:00:00', 'P', 475, 0),
+        (59, '2020-06-26 00:00:00', 'F', 411, 0),
+        (60, '2020-07-10 00:00:00', 'P', 89, 0),
+        (61, '2020-06-18 00:00:00', 'F', 113, 0),
+        (62, '2020-11-02 00:00:00', 'C', 397, 0),
+        (63, '2021-05-11 00:00:00', 'F', 399, 0),
+        (64, '2020-08-21 00:00:00', 'C', 488, 0),
+        (65, '2021-03-04 00:00:00', 'F', 6, 0),
+        (66, '2020-12-10 00:00:00', 'F', 438, 0),
+        (67, '2020-10-27 00:00:00', 'C', 482, 0),
+        (68, '2020-06-25 00:00:00', 'C', 369, 0),
+        (69, '2020-12-21 00:00:00', 'F', 225, 0),
+        (70, '2020-10-14 00:00:00', 'P', 428, 0),
+        (71, '2020-12-03 00:00:00', 'F', 74, 0),
+        (72, '2021-03-08 00:00:00', 'P', 429, 0),
+        (73, '2020-11-06 00:00:00', 'P', 92, 0),
+        (74, '2020-08-19 00:00:00', 'P', 14, 0),
+        (75, '2020-10-16 00:00:00', 'F', 436, 0),
+        (76, '2021-05-14 00:00:00', 'P', 367, 0),
+        (77, '2021-06-02 00:00:00', 'P', 276, 0),
+        (78, '2021-03-13 00:00:00', 'F', 373, 0),
+        (79, '2020-08-21 00:00:00', 'P', 178, 0),
+        (80, '2021-02-21 00:00:00', 'C', 263, 0),
+        (81, '2020-10-28 00:00:00', 'C', 266, 0),
+        (82, '2020-08-08 00:00:00', 'C', 415, 0),
+        (83, '2020-07-27 00:00:00', 'P', 89, 0),
+        (84, '2021-06-02 00:00:00', 'C', 345, 0),
+        (85, '2021-04-24 00:00:00', 'P', 167, 0),
+        (86, '2020-11-02 00:00:00', 'P', 150, 0),
+        (87, '2020-09-05 00:00:00', 'P', 157, 0),
+        (88, '2021-02-09 00:00:00', 'F', 52, 0),
+        (89, '2021-03-06 00:00:00', 'P', 286, 0),
+        (90, '2020-10-14 00:00:00', 'F', 134, 0),
+        (91, '2021-05-08 00:00:00', 'F', 452, 0),
+        (92, '2021-02-07 00:00:00', 'F', 370, 0),
+        (93, '2021-01-12 00:00:00', 'F', 105, 0),
+        (94, '2021-04-04 00:00:00', 'C', 354, 0),
+        (95, '2020-09-13 00:00:00', 'C', 91, 0),
+        (96, '2021-02-23 00:00:00', 'P', 172, 0),
+        (97, '2021-05-16 00:00:00', 'F', 287, 0),
+        (98, '2020-12-23 00:00:00', 'C', 401, 0),
+        (99, '2020-07-12 00:00:00', 'F', 245, 0),
+        (100, '2021-02-24 00:00:00', 'P', 208, 0),
+        (101, '2020-07-29 00:00:00', 'C', 286, 0),
+        (102, '2020-08-27 00:00:00', 'F', 258, 0),
+        (103, '2020-11-19 00:00:00', 'C', 339, 0),
+        (104, '2021-02-10 00:00:00', 'P', 337, 0),
+        (105, '2020-07-13 00:00:00', 'C', 437, 0),
+        (106, '2020-10-15 00:00:00', 'P', 436, 0),
+        (107, '2021-04-01 00:00:00', 'P', 347, 0),
+        (108, '2021-02-01 00:00:00', 'P', 110, 0),
+        (109, '2020-11-13 00:00:00', 'P', 180, 0),
+        (110, '2021-05-13 00:00:00', 'C', 410, 0),
+        (111, '2020-11-29 00:00:00', 'C', 482, 0),
+        (112, '2020-11-18 00:00:00', 'C', 356, 0),
+        (113, '2020-06-26 00:00:00', 'F', 182, 0),
+        (114, '2021-02-23 00:00:00', 'P', 77, 0),
+        (115, '2021-01-31 00:00:00', 'P', 29, 0),
+        (116, '2020-10-14 00:00:00', 'F', 86, 0),
+        (117, '2021-01-02 00:00:00', 'F', 33, 0),
+        (118, '2020-10-10 00:00:00', 'F', 299, 0),
+        (119, '2021-01-28 00:00:00', 'P', 75, 0),
+        (120, '2020-07-05 00:00:00', 'P', 473, 0),
+        (121, '2020-08-07 00:00:00', 'F', 476, 0),
+        (122, '2020-07-29 00:00:00', 'F', 273, 0),
+        (123, '2020-09-08 00:00:00', 'P', 467, 0),
+        (124, '2021-03-22 00:00:00', 'C', 192, 0),
+        (125, '2020-12-27 00:00:00', 'P', 169, 0),
+        (126, '2020-10-04 00:00:00', 'F', 92, 0),
+        (127, '2020-07-26 00:00:00', 'F', 300, 0),
+        (128, '2020-07-08 00:00:00', 'F', 44, 0),
+        (129, '2020-08-21 00:00:00', 'P', 199, 0),
+        (130, '2021-03-17 00:00:00', 'F', 206, 0),
+        (131, '2020-12-03 00:00:00', 'F', 14, 0),
+        (132, '2020-07-16 00:00:00', 'C', 219, 0),
+        (133, '2021-01-12 00:00:00', 'F', 288, 0),
+        (134, '2020-11-12 00:00:00', 'P', 490, 0),
+        (135, '2021-05-26 00:00:00', 'F', 105, 0),
+        (136, '2020-09-01 00:00:00', 'F', 224, 0),
+        (137, '2021-04-19 00:00:00', 'F', 327, 0),
+        (138, '2020-07-16 00:00:00', 'F', 151, 0),
+        (139, '2021-05-03 00:00:00', 'P', 184, 0),
+        (140, '2020-10-22 00:00:00', 'P', 61, 0),
+        (141, '2021-05-22 00:00:00', 'F', 393, 0),
+        (142, '2020-11-11 00:00:00', 'C', 221, 0),
+        (143, '2021-01-23 00:00:00', 'F', 37, 0),
+        (144, '2020-11-27 00:00:00', 'P', 222, 0),
+        (145, '2021-04-22 00:00:00', 'C', 222, 0),
+        (146, '2021-04-12 00:00:00', 'P', 341, 0),
+        (147, '2020-08-19 00:00:00', 'P', 134, 0),
+        (148, '2020-06-26 00:00:00', 'F', 404, 0),
+        (149, '2020-12-20 00:00:00', 'P', 108, 0),
+        (150, '2020-06-24 00:00:00', 'P', 402, 0),
+        (151, '2021-02-27 00:00:00', 'F', 105, 0),
+        (152, '2020-11-27 00:00:00', 'F', 158, 0),
+        (153, '2020-08-23 00:00:00', 'F', 123, 0),
+        (154, '2020-07-09 00:00:00', 'C', 134, 0),
+        (155, '2020-07-23 00:00:00', 'C', 258, 0),
+        (156, '2021-01-24 00:00:00', 'P', 473, 0),
+        (157, '2020-11-14 00:00:00', 'F', 363, 0),
+        (158, '2020-09-08 00:00:00', 'P', 370, 0),
+        (159, '2020-07-05 00:00:00', 'P', 31, 0),
+        (160, '2020-11-04 00:00:00', 'P', 419, 0),
+        (161, '2021-01-15 00:00:00', 'C', 271, 0),
+        (162, '2021-05-17 00:00:00', 'P', 437, 0),
+        (163, '2020-12-12 00:00:00', 'F', 424, 0),
+        (164, '2021-03-27 00:00:00', 'F', 201, 0),
+        (165, '2020-11-18 00:00:00', 'C', 25, 0),
+        (166, '2020-07-15 00:00:00', 'P', 187, 0),
+        (167, '2020-11-18 00:00:00', 'F', 81, 0),
+        (168, '2021-05-24 00:00:00', 'F', 257, 0),
+        (169, '2020-09-19 00:00:00', 'P', 457, 0),
+        (170, '2020-10-08 00:00:00', 'P', 117, 0),
+        (171, '2020-10-26 00:00:00', 'F', 8, 0),
+        (172, '2020-10-08 00:00:00', 'P', 121, 0),
+        (173, '2021-04-14 00:00:00', 'C', 94, 0),
+        (174, '2020-09-07 00:00:00', 'F', 327, 0),
+        (175, '2020-12-29 00:00:00', 'F', 206, 0),
+        (176, '2020-08-09 00:00:00', 'C', 419, 0),
+        (177, '2020-12-03 00:00:00', 'P', 445, 0),
+        (178, '2020-09-23 00:00:00', 'P', 135, 0),
+        (179, '2021-04-25 00:00:00', 'C', 495, 0),
+        (180, '2020-07-08 00:00:00', 'P', 300, 0),
+        (181, '2020-10-22 00:00:00', 'F', 343, 0),
+        (182, '2020-06-13 00:00:00', 'F', 347, 0),
+        (183, '2020-07-11 00:00:00', 'F', 39, 0),
+        (184, '2021-02-10 00:00:00', 'F', 279, 0),
+        (185, '2021-06-03 00:00:00', 'F', 127, 0),
+        (186, '2020-11-17 00:00:00', 'F', 447, 0),
+        (187, '2021-01-31 00:00:00', 'F', 458, 0),
+        (188, '2021-03-11 00:00:00', 'F', 462, 0),
+        (189, '2020-10-06 00:00:00', 'C', 458, 0),
+        (190, '2020-08-29 00:00:00', 'C', 339, 0),
+        (191, '2020-06-18 00:00:00', 'P', 21, 0),
+        (192, '2021-04-14 00:00:00', 'F', 290, 0),
+        (193, '2020-08-10 00:00:00', 'F', 264, 0),
+        (194, '2020-11-12 00:00:00', 'F', 498, 0),
+        (195, '2021-04-13 00:00:00', 'P', 389, 0),
+        (196, '2020-10-10 00:00:00', 'F', 201, 0),
+        (197, '2021-04-25 00:00:00', 'C', 241, 0),
+        (198, '2021-04-22 00:00:00', 'F', 393, 0),
+        (199, '2021-02-05 00:00:00', 'C', 244, 0),
+        (200, '2020-11-13 00:00:00', 'F', 330, 0),
+        (201, '2020-08-24 00:00:00', 'P', 224, 0),
+        (202, '2021-03-30 00:00:00', 'C', 364, 0),
+        (203, '2021-06-01 00:00:00', 'F', 258, 0),
+        (204, '2020-07-27 00:00:00', 'F', 334, 0),
+        (205, '2021-02-04 00:00:00', 'P', 214, 0),
+        (206, '2020-08-28 00:00:00', 'F', 158, 0),
+        (207, '2021-01-16 00:00:00', 'P', 394, 0),
+        (208, '2020-09-07 00:00:00', 'F', 285, 0),
+        (209, '2020-12-23 00:00:00', 'C', 21, 0),
+        (210, '2020-11-04 00:00:00', 'P', 407, 0),
+        (211, '2021-01-14 00:00:00', 'P', 487, 0),
+        (212, '2021-02-27 00:00:00', 'C', 101, 0),
+        (213, '2020-12-18 00:00:00', 'F', 403, 0),
+        (214, '2020-10-26 00:00:00', 'P', 15, 0),
+        (215, '2020-07-04 00:00:00', 'F', 129, 0),
+        (216, '2021-01-22 00:00:00', 'P', 312, 0),
+        (217, '2021-01-30 00:00:00', 'F', 489, 0),
+        (218, '2020-08-08 00:00:00', 'F', 102, 0),
+        (219, '2021-05-22 00:00:00', 'F', 390, 0),
+        (220, '2021-05-18 00:00:00', 'F', 77, 0),
+        (221, '2021-03-14 00:00:00', 'C', 424, 0),
+        (222, '2020-12-31 00:00:00', 'F', 473, 0),
+        (223, '2021-05-05 00:00:00', 'F', 90, 0),
+        (224, '2021-01-13 00:00:00', 'F', 389, 0),
+        (225, '2020-12-09 00:00:00', 'F', 342, 0),
+        (226, '2020-12-31 00:00:00', 'F', 477, 0),
+        (227, '2021-05-14 00:00:00', 'C', 436, 0),
+        (228, '2021-03-31 00:00:00', 'C', 359, 0),
+        (229, '2021-05-11 00:00:00', 'F', 129, 0),
+        (230, '2020-06-21 00:00:00', 'F', 496, 0),
+        (231, '2020-08-13 00:00:00', 'F', 139, 0),
+        (232, '2020-10-20 00:00:00', 'P', 279, 0),
+        (233, '2020-06-19 00:00:00', 'F', 211, 0),
+        (234, '2021-05-07 00:00:00', 'F', 234, 0),
+        (235, '2021-03-23 00:00:00', 'F', 116, 0),
+        (236, '2021-04-03 00:00:00', 'F', 64, 0),
+        (237, '2020-06-19 00:00:00', 'F', 116, 0),
+        (238, '2020-07-26 00:00:00', 'C', 358, 0),
+        (239, '2021-03-13 00:00:00', 'P', 352, 0),
+        (240, '2020-06-25 00:00:00', 'C', 313, 0),
+        (241, '2021-03-14 00:00:00', 'P', 413, 0),
+        (242, '2020-06-24 00:00:00', 'C', 56, 0),
+        (243, '2021-05-28 00:00:00', 'F', 70, 0),
+        (244, '2021-04-03 00:00:00', 'P', 465, 0),
+        (245, '2020-12-23 00:00:00', 'F', 222, 0),
+        (246, '2020-07-01 00:00:00', 'C', 16, 0),
+        (247, '2020-11-13 00:00:00', 'C', 127, 0),
+        (248, '2021-06-07 00:00:00', 'P', 404, 0),
+        (249, '2021-02-03 00:00:00', 'F', 49, 0),
+        (250, '2021-03-09 00:00:00', 'F', 307, 0),
+        (251, '2021-05-02 00:00:00', 'F', 364, 0),
+        (252, '2021-02-01 00:00:00', 'C', 208, 0),
+        (253, '2021-01-13 00:00:00', 'F', 279, 0),
+        (254, '2020-10-14 00:00:00', 'F', 17, 0),
+        (255, '2020-11-04 00:00:00', 'F', 15, 0),
+        (256, '2020-07-12 00:00:00', 'F', 136, 0),
+        (257, '2020-09-19 00:00:00', 'C', 465, 0),
+        (258, '2020-06-26 00:00:00', 'F', 436, 0),
+        (259, '2020-08-04 00:00:00', 'C', 255, 0),
+        (260, '2020-09-25 00:00:00', 'F', 81, 0),
+        (261, '2020-08-27 00:00:00', 'C', 11, 0),
+        (262, '2020-07-16 00:00:00', 'F', 161, 0),
+        (263, '2020-07-18 00:00:00', 'C', 395, 0),
+        (264, '2020-09-02 00:00:00', 'C', 436, 0),
+        (265, '2021-01-25 00:00:00', 'F', 404, 0),
+        (266, '2020-06-10 00:00:00', 'F', 133, 0),
+        (267, '2020-11-02 00:00:00', 'P', 392, 0),
+        (268, '2021-01-16 00:00:00', 'F', 230, 0),
+        (269, '2021-03-09 00:00:00', 'F', 155, 0),
+        (270, '2021-03-26 00:00:00', 'F', 372, 0),
+        (271, '2020-09-01 00:00:00', 'P', 386, 0),
+        (272, '2020-09-16 00:00:00', 'F', 364, 0),
+        (273, '2020-11-10 00:00:00', 'P', 294, 0),
+        (274, '2020-09-05 00:00:00', 'C', 403, 0),
+        (275, '2020-10-30 00:00:00', 'C', 158, 0),
+        (276, '2021-02-15 00:00:00', 'P', 151, 0),
+        (277, '2020-07-17 00:00:00', 'F', 114, 0),
+        (278, '2020-06-10 00:00:00', 'F', 413, 0),
+        (279, '2020-09-24 00:00:00', 'C', 59, 0),
+        (280, '2020-10-14 00:00:00', 'F', 396, 0),
+        (281, '2021-02-18 00:00:00', 'C', 254, 0),
+        (282, '2021-02-03 00:00:00', 'P', 346, 0),
+        (283, '2020-09-13 00:00:00', 'P', 382, 0),
+        (284, '2021-01-19 00:00:00', 'F', 225, 0),
+        (285, '2020-07-24 00:00:00', 'F', 13, 0),
+        (286, '2020-08-22 00:00:00', 'P', 86, 0),
+        (287, '2021-02-19 00:00:00', 'F', 85, 0),
+        (288, '2020-10-06 00:00:00', 'C', 199, 0),
+        (289, '2020-08-15 00:00:00', 'P', 201, 0),
+        (290, '2020-06-12 00:00:00', 'F', 435, 0),
+        (291, '2020-09-12 00:00:00', 'F', 85, 0),
+        (292, '2021-04-21 00:00:00', 'P', 315, 0),
+        (293, '2020-10-07 00:00:00', 'F', 276, 0),
+        (294, '2020-12-24 00:00:00', 'P', 389, 0),
+        (295, '2021-01-04 00:00:00', 'C', 355, 0),
+        (296, '2020-10-17 00:00:00', 'F', 297, 0),
+        (297, '2021-02-14 00:00:00', 'F', 425, 0),
+        (298, '2020-07-30 00:00:00', 'C', 261, 0),
+        (299, '2021-05-06 00:00:00', 'P', 79, 0),
+        (300, '2021-03-27 00:00:00', 'C', 304, 0),
+        (301, '2021-03-17 00:00:00', 'F', 6, 0),
+        (302, '2021-05-09 00:00:00', 'F', 134, 0),
+        (303, '2021-06-03 00:00:00', 'C', 56, 0),
+        (304, '2020-07-04 00:00:00', 'P', 346, 0),
+        (305, '2021-01-18 00:00:00', 'F', 45, 0),
+        (306, '2020-12-26 00:00:00', 'F', 302, 0),
+        (307, '2021-02-15 00:00:00', 'C', 177, 0),
+        (308, '2021-04-13 00:00:00', 'P', 221, 0),
+        (309, '2021-04-26 00:00:00', 'C', 136, 0),
+        (310, '2020-10-21 00:00:00', 'F', 315, 0),
+        (311, '2020-10-02 00:00:00', 'F', 165, 0),
+        (312, '2021-04-18 00:00:00', 'P', 82, 0),
+        (313, '2021-04-01 00:00:00', 'F', 153, 0),
+        (314, '2020-12-21 00:00:00', 'F', 257, 0),
+        (315, '2021-04-18 00:00:00', 'C', 381, 0),
+        (316, '2021-05-12 00:00:00', 'C', 68, 0),
+        (317, '2021-02-10 00:00:00', 'F', 10, 0),
+        (318, '2020-06-25 00:00:00', 'C', 83, 0),
+        (319, '2020-08-09 00:00:00', 'F', 499, 0),
+        (320, '2020-12-16 00:00:00', 'P', 11, 0),
+        (321, '2021-03-17 00:00:00', 'F', 1, 0),
+        (322, '2020-09-06 00:00:00', 'F', 263, 0),
+        (323, '2021-01-31 00:00:00', 'P', 102, 0),
+        (324, '2020-09-05 00:00:00', 'F', 216, 0),
+        (325, '2020-12-27 00:00:00', 'P', 286, 0),
+        (326, '2021-06-01 00:00:00', 'F', 195, 0),
+        (327, '2021-06-07 00:00:00', 'P', 22, 0),
+        (328, '2020-09-22 00:00:00', 'C', 285, 0),
+        (329, '2020-08-15 00:00:00', 'F', 461, 0),
+        (330, '2021-02-27 00:00:00', 'F', 491, 0),
+        (331, '2021-03-03 00:00:00', 'F', 366, 0),
+        (332, '2020-09-09 00:00:00', 'P', 146, 0),
+        (333, '2020-08-14 00:00:00', 'P', 277, 0),
+        (334, '2021-01-15 00:00:00', 'F', 181, 0),
+        (335, '2020-06-18 00:00:00', 'F', 270, 0),
+        (336, '2021-04-26 00:00:00', 'C', 304, 0),
+        (337, '2020-07-01 00:00:00', 'F', 134, 0),
+        (338, '2021-02-14 00:00:00', 'C', 489, 0),
+        (339, '2020-10-26 00:00:00', 'P', 409, 0),
+        (340, '2020-08-18 00:00:00', 'C', 81, 0),
+        (341, '2020-08-26 00:00:00', 'P', 493, 0),
+        (342, '2021-02-25 00:00:00', 'F', 246, 0),
+        (343, '2021-05-17 00:00:00', 'C', 431, 0),
+        (344, '2021-05-01 00:00:00', 'F', 261, 0),
+        (345, '2021-03-04 00:00:00', 'P', 168, 0),
+        (346, '2021-04-25 00:00:00', 'F', 302, 0),
+        (347, '2020-07-19 00:00:00', 'P', 436, 0),
+        (348, '2020-12-03 00:00:00', 'F', 20, 0),
+        (349, '2021-04-11 00:00:00', 'C', 448, 0),
+        (350, '2021-02-12 00:00:00', 'F', 455, 0),
+        (351, '2021-04-06 00:00:00', 'P', 397, 0),
+        (352, '2020-11-03 00:00:00', 'C', 255, 0),
+        (353, '2021-04-05 00:00:00', 'F', 491, 0),
+        (354, '2021-05-06 00:00:00', 'P', 246, 0),
+        (355, '2020-12-04 00:00:00', 'F', 172, 0),
+        (356, '2021-02-12 00:00:00', 'C', 221, 0),
+        (357, '2020-09-21 00:00:00', 'P', 289, 0),
+        (358, '2021-02-25 00:00:00', 'P', 162, 0),
+        (359, '2021-02-01 00:00:00', 'F', 90, 0),
+        (360, '2020-09-06 00:00:00', 'F', 87, 0),
+        (361, '2021-02-03 00:00:00', 'F', 123, 0),
+        (362, '2020-10-26 00:00:00', 'F', 466, 0),
+        (363, '2021-01-24 00:00:00', 'P', 191, 0),
+        (364, '2020-07-06 00:00:00', 'F', 60, 0),
+        (365, '2020-09-09 00:00:00', 'F', 396, 0),
+        (366, '2021-04-16 00:00:00', 'F', 395, 0),
+        (367, '2020-11-02 00:00:00', 'C', 295, 0),
+        (368, '2021-02-27 00:00:00', 'F', 348, 0),
+        (369, '2021-02-07 00:00:00', 'F', 53, 0),
+        (370, '2021-04-01 00:00:00', 'P', 213, 0),
+        (371, '2020-11-06 00:00:00', 'F', 271, 0),
+        (372, '2020-10-20 00:00:00', 'F', 304, 0),
+        (373, '2020-07-06 00:00:00', 'P', 351, 0),
+        (374, '2021-01-09 00:00:00', 'C', 126, 0),
+        (375, '2021-03-09 00:00:00', 'F', 379, 0),
+        (376, '2021-03-12 00:00:00', 'F', 455, 0),
+        (377, '2021-03-27 00:00:00', 'P', 279, 0),
+        (378, '2020-09-17 00:00:00', 'C', 22, 0),
+        (379, '2021-03-01 00:00:00', 'P', 129, 0),
+        (380, '2021-05-14 00:00:00', 'F', 145, 0),
+        (381, '2020-12-04 00:00:00', 'P', 182, 0),
+        (382, '2021-05-27 00:00:00', 'C', 214, 0),
+        (383, '2020-09-12 00:00:00', 'F', 31, 0),
+        (384, '2020-12-13 00:00:00', 'P', 99, 0),
+        (385, '2021-05-20 00:00:00', 'C', 209, 0),
+        (386, '2021-03-20 00:00:00', 'P', 275, 0),
+        (387, '2021-01-16 00:00:00', 'F', 27, 0),
+        (388, '2021-03-28 00:00:00', 'F', 27, 0),
+        (389, '2020-11-30 00:00:00', 'C', 332, 0),
+        (390, '2020-12-26 00:00:00', 'F', 306, 0),
+        (391, '2020-07-31 00:00:00', 'F', 72, 0),
+        (392, '2020-12-25 00:00:00', 'C', 3, 0),
+        (393, '2020-07-11 00:00:00', 'C', 446, 0),
+        (394, '2020-07-08 00:00:00', 'P', 18, 0),
+        (395, '2021-04-29 00:00:00', 'F', 268, 0),
+        (396, '2020-12-15 00:00:00', 'F', 58, 0),
+        (397, '2020-12-20 00:00:00', 'C', 70, 0),
+        (398, '2020-06-21 00:00:00', 'P', 439, 0),
+        (399, '2021-04-15 00:00:00', 'P', 367, 0),
+        (400, '2021-01-12 00:00:00', 'F', 405, 0),
+        (401, '2020-12-13 00:00:00', 'P', 482, 0),
+        (402, '2021-01-12 00:00:00', 'F', 286, 0),
+        (403, '2021-02-25 00:00:00', 'P', 1, 0),
+        (404, '2021-04-13 00:00:00', 'F', 384, 0),
+        (405, '2020-07-31 00:00:00', 'C', 417, 0),
+        (406, '2020-08-04 00:00:00', 'F', 37, 0),
+        (407, '2020-09-03 00:00:00', 'F', 420, 0),
+        (408, '2021-06-09 00:00:00', 'C', 121, 0),
+        (409, '2021-01-28 00:00:00', 'P', 304, 0),
+        (410, '2021-05-29 00:00:00', 'C', 113, 0),
+        (411, '2020-11-06 00:00:00', 'P', 314, 0),
+        (412, '2020-12-03 00:00:00', 'P', 395, 0),
+        (413, '2021-02-28 00:00:00', 'F', 8, 0),
+        (414, '2021-05-16 00:00:00', 'C', 120, 0),
+        (415, '2020-09-07 00:00:00', 'F', 89, 0),
+        (416, '2021-05-15 00:00:00', 'F', 212, 0),
+        (417, '2020-07-18 00:00:00', 'C', 367, 0),
+        (418, '2020-08-14 00:00:00', 'P', 110, 0),
+        (419, '2020-08-21 00:00:00', 'P', 239, 0),
+        (420, '2020-12-13 00:00:00', 'C', 472, 0),
+        (421, '2020-11-29 00:00:00', 'C', 113, 0),
+        (422, '2020-08-26 00:00:00', 'F', 385, 0),
+        (423, '2020-10-23 00:00:00', 'F', 200, 0),
+        (424, '2021-02-17 00:00:00', 'F', 457, 0),
+        (425, '2021-05-20 00:00:00', 'P', 258, 0),
+        (426, '2021-01-29 00:00:00', 'P', 420, 0),
+        (427, '2020-07-13 00:00:00', 'F', 175, 0),
+        (428, '2020-07-31 00:00:00', 'F', 438, 0),
+        (429, '2020-12-22 00:00:00', 'F', 274, 0),
+        (430, '2021-01-08 00:00:00', 'F', 210, 0),
+        (431, '2021-04-11 00:00:00', 'C', 450, 0),
+        (432, '2021-05-21 00:00:00', 'F', 72, 0),
+        (433, '2020-09-30 00:00:00', 'F', 452, 0),
+        (434, '2021-04-06 00:00:00', 'P', 108, 0),
+        (435, '2021-04-22 00:00:00', 'F', 191, 0),
+        (436, '2020-12-02 00:00:00', 'F', 342, 0),
+        (437, '2021-04-16 00:00:00', 'F', 301, 0),
+        (438, '2021-04-08 00:00:00', 'C', 203, 0),
+        (439, '2020-11-07 00:00:00', 'P', 169, 0),
+        (440, '2020-11-09 00:00:00', 'F', 248, 0),
+        (441, '2020-11-16 00:00:00', 'P', 410, 0),
+        (442, '2020-09-14 00:00:00', 'C', 157, 0),
+        (443, '2021-04-21 00:00:00', 'F', 289, 0),
+        (444, '2020-10-17 00:00:00', 'F', 299, 0),
+        (445, '2021-01-27 00:00:00', 'P', 104, 0),
+        (446, '2020-06-21 00:00:00', 'C', 455, 0),
+        (447, '2021-03-05 00:00:00', 'F', 280, 0),
+        (448, '2020-08-08 00:00:00', 'F', 8, 0),
+        (449, '2021-01-19 00:00:00', 'F', 321, 0),
+        (450, '2020-10-16 00:00:00', 'F', 189, 0),
+        (451, '2020-11-10 00:00:00', 'C', 48, 0),
+        (452, '2021-03-12 00:00:00', 'C', 222, 0),
+        (453, '2020-08-04 00:00:00', 'P', 231, 0),
+        (454, '2021-06-01 00:00:00', 'P', 447, 0),
+        (455, '2021-04-09 00:00:00', 'F', 218, 0),
+        (456, '2020-07-07 00:00:00', 'P', 33, 0),
+        (457, '2020-07-17 00:00:00', 'P', 189, 0),
+        (458, '2021-01-12 00:00:00', 'C', 141, 0),
+        (459, '2020-08-30 00:00:00', 'P', 212, 0),
+        (460, '2021-05-18 00:00:00', 'C', 163, 0),
+        (461, '2020-07-14 00:00:00', 'P', 371, 0),
+        (462, '2021-01-20 00:00:00', 'C', 55, 0),
+        (463, '2020-09-23 00:00:00', 'F', 89, 0),
+        (464, '2021-04-11 00:00:00', 'P', 16, 0),
+        (465, '2020-06-22 00:00:00', 'C', 431, 0),
+        (466, '2021-05-26 00:00:00', 'F', 247, 0),
+        (467, '2020-07-30 00:00:00', 'C', 158, 0),
+        (468, '2020-09-04 00:00:00', 'P', 149, 0),
+        (469, '2020-09-30 00:00:00', 'F', 128, 0),
+        (470, '2020-09-03 00:00:00', 'F', 265, 0),
+        (471, '2021-04-21 00:00:00', 'C', 230, 0),
+        (472, '2021-02-14 00:00:00', 'C', 126, 0),
+        (473, '2020-11-26 00:00:00', 'P', 432, 0),
+        (474, '2020-12-21 00:00:00', 'C', 184, 0),
+        (475, '2020-07-18 00:00:00', 'F', 332, 0),
+        (476, '2020-08-30 00:00:00', 'C', 111, 0),
+        (477, '2021-03-02 00:00:00', 'F', 355, 0),
+        (478, '2021-04-22 00:00:00', 'C', 155, 0),
+        (479, '2020-12-14 00:00:00', 'F', 455, 0),
+        (480, '2020-10-16 00:00:00', 'C', 408, 0),
+        (481, '2021-01-03 00:00:00', 'F', 262, 0),
+        (482, '2020-12-11 00:00:00', 'F', 423, 0),
+        (483, '2020-08-20 00:00:00', 'F', 166, 0),
+        (484, '2021-03-31 00:00:00', 'P', 114, 0),
+        (485, '2021-02-16 00:00:00', 'C', 40, 0),
+        (486, '2021-04-04 00:00:00', 'F', 100, 0),
+        (487, '2021-03-18 00:00:00', 'P', 138, 0),
+        (488, '2020-09-26 00:00:00', 'F', 421, 0),
+        (489, '2020-08-12 00:00:00', 'F', 103, 0),
+        (490, '2021-02-07 00:00:00', 'C', 84, 0),
+        (491, '2020-11-27 00:00:00', 'F', 30, 0),
+        (492, '2020-08-01 00:00:00', 'C', 177, 0),
+        (493, '2020-08-16 00:00:00', 'F', 300, 0),
+        (494, '2020-11-10 00:00:00', 'P', 78, 0),
+        (495, '2021-03-16 00:00:00', 'P', 326, 0),
+        (496, '2021-02-09 00:00:00', 'P', 328, 0),
+        (497, '2020-07-30 00:00:00', 'F', 485, 0),
+        (498, '2020-12-13 00:00:00', 'F', 346, 0),
+        (499, '2021-05-04 00:00:00', 'C', 92, 0),
+        (500, '2020-08-18 00:00:00', 'F', 74, 0),
+        (501, '2021-04-08 00:00:00', 'P', 326, 0),
+        (502, '2020-12-02 00:00:00', 'F', 77, 0),
+        (503, '2021-03-13 00:00:00', 'F', 64, 0),
+        (504, '2021-05-07 00:00:00', 'F', 393, 0),
+        (505, '2021-04-21 00:00:00', 'P', 278, 0),
+        (506, '2021-04-12 00:00:00', 'C', 311, 0),
+        (507, '2021-01-06 00:00:00', 'F', 7, 0),
+        (508, '2020-10-26 00:00:00', 'F', 327, 0),
+        (509, '2020-12-06 00:00:00', 'C', 408, 0),
+        (510, '2021-03-14 00:00:00', 'F', 247, 0),
+        (511, '2020-10-23 00:00:00', 'F', 388, 0),
+        (512, '2021-03-13 00:00:00', 'F', 158, 0),
+        (513, '2021-06-08 00:00:00', 'C', 298, 0),
+        (514, '2020-08-22 00:00:00', 'C', 62, 0),
+        (515, '2020-12-03 00:00:00', 'F', 395, 0),
+        (516, '2021-04-22 00:00:00', 'F', 18, 0),
+        (517, '2021-03-23 00:00:00', 'C', 152, 0),
+        (518, '2021-05-16 00:00:00', 'C', 103, 0),
+        (519, '2021-05-12 00:00:00', 'C', 72, 0),
+        (520, '2020-09-18 00:00:00', 'F', 109, 0),
+        (521, '2021-03-27 00:00:00', 'C', 265, 0),
+        (522, '2021-03-10 00:00:00', 'F', 376, 0),
+        (523, '2021-03-04 00:00:00', 'C', 87, 0),
+        (524, '2020-06-15 00:00:00', 'C', 316, 0),
+        (525, '2020-10-03 00:00:00', 'P', 405, 0),
+        (526, '2020-09-02 00:00:00', 'C', 237, 0),
+        (527, '2020-12-22 00:00:00', 'P', 212, 0),
+        (528, '2020-12-29 00:00:00', 'P', 234, 0),
+        (529, '2021-04-14 00:00:00', 'P', 191, 0),
+        (530, '2020-11-12 00:00:00', 'F', 100, 0),
+        (531, '2020-11-01 00:00:00', 'F', 360, 0),
+        (532, '2020-07-04 00:00:00', 'F', 50, 0),
+        (533, '2021-02-05 00:00:00', 'F', 218, 0),
+        (534, '2021-03-13 00:00:00', 'P', 96, 0),
+        (535, '2021-05-01 00:00:00', 'C', 381, 0),
+        (536, '2021-05-18 00:00:00', 'P', 363, 0),
+        (537, '2020-06-10 00:00:00', 'F', 208, 0),
+        (538, '2020-12-27 00:00:00', 'F', 307, 0),
+        (539, '2021-04-01 00:00:00', 'P', 171, 0),
+        (540, '2020-08-25 00:00:00', 'F', 1, 0),
+        (541, '2021-04-09 00:00:00', 'C', 315, 0),
+        (542, '2020-10-19 00:00:00', 'F', 252, 0),
+        (543, '2021-06-03 00:00:00', 'F', 397, 0),
+        (544, '2020-10-31 00:00:00', 'F', 1, 0),
+        (545, '2020-06-13 00:00:00', 'F', 180, 0),
+        (546, '2020-09-19 00:00:00', 'F', 276, 0),
+        (547, '2021-02-11 00:00:00', 'F', 258, 0),
+        (548, '2020-07-12 00:00:00', 'F', 139, 0),
+        (549, '2020-06-14 00:00:00', 'F', 446, 0),
+        (550, '2021-05-24 00:00:00', 'C', 343, 0),
+        (551, '2020-11-06 00:00:00', 'F', 383, 0),
+        (552, '2020-11-11 00:00:00', 'F', 139, 0),
+        (553, '2021-04-06 00:00:00', 'F', 322, 0),
+        (554, '2021-02-12 00:00:00', 'F', 172, 0),
+        (555, '2020-06-23 00:00:00', 'F', 14, 0),
+        (556, '2020-12-04 00:00:00', 'C', 36, 0),
+        (557, '2020-12-05 00:00:00', 'P', 424, 0),
+        (558, '2021-01-21 00:00:00', 'F', 383, 0),
+        (559, '2020-08-05 00:00:00', 'C', 237, 0),
+        (560, '2020-06-11 00:00:00', 'P', 474, 0),
+        (561, '2021-02-26 00:00:00', 'F', 126, 0),
+        (562, '2020-10-25 00:00:00', 'P', 226, 0),
+        (563, '2021-05-30 00:00:00', 'F', 230, 0),
+        (564, '2021-05-25 00:00:00', 'P', 126, 0),
+        (565, '2020-12-09 00:00:00', 'C', 132, 0),
+        (566, '2020-06-26 00:00:00', 'C', 2, 0),
+        (567, '2020-09-01 00:00:00', 'P', 154, 0),
+        (568, '2021-04-26 00:00:00', 'C', 497, 0),
+        (569, '2020-11-27 00:00:00', 'F', 246, 0),
+        (570, '2020-12-27 00:00:00', 'C', 279, 0),
+        (571, '2021-01-03 00:00:00', 'P', 66, 0),
+        (572, '2021-02-20 00:00:00', 'F', 207, 0),
+        (573, '2021-02-21 00:00:00', 'F', 362, 0),
+        (574, '2021-01-03 00:00:00', 'F', 429, 0),
+        (575, '2021-05-08 00:00:00', 'F', 128, 0),
+        (576, '2020-08-17 00:00:00', 'F', 405, 0),
+        (577, '2021-06-02 00:00:00', 'C', 323, 0),
+        (578, '2021-02-02 00:00:00', 'P', 370, 0),
+        (579, '2021-03-24 00:00:00', 'C', 179, 0),
+        (580, '2021-02-22 00:00:00', 'C', 308, 0),
+        (581, '2020-11-26 00:00:00', 'F', 363, 0),
+        (582, '2020-11-10 00:00:00', 'P', 50, 0),
+        (583, '2021-04-19 00:00:00', 'F', 403, 0),
+        (584, '2020-11-21 00:00:00', 'P', 387, 0),
+        (585, '2021-03-03 00:00:00', 'F', 61, 0),
+        (586, '2021-02-18 00:00:00', 'C', 369, 0),
+        (587, '2021-03-26 00:00:00', 'F', 309, 0),
+        (588, '2020-09-18 00:00:00', 'C', 139, 0),
+        (589, '2020-06-23 00:00:00', 'F', 419, 0),
+        (590, '2020-10-14 00:00:00', 'F', 46, 0),
+        (591, '2021-04-12 00:00:00', 'P', 304, 0),
+        (592, '2021-06-01 00:00:00', 'P', 172, 0),
+        (593, '2021-04-14 00:00:00', 'F', 103, 0),
+        (594, '2021-03-02 00:00:00', 'F', 382, 0),
+        (595, '2021-02-22 00:00:00', 'F', 287, 0),
+        (596, '2020-07-29 00:00:00', 'F', 228, 0),
+        (597, '2020-11-24 00:00:00', 'F', 351, 0),
+        (598, '2021-03-12 00:00:00', 'F', 273, 0),
+        (599, '2020-06-17 00:00:00', 'C', 150, 0),
+        (600, '2020-08-02 00:00:00', 'P', 415, 0),
+        (601, '2020-10-26 00:00:00', 'F', 465, 0),
+        (602, '2021-02-26 00:00:00', 'F', 26, 0),
+        (603, '2020-11-21 00:00:00', 'F', 97, 0),
+        (604, '2021-04-16 00:00:00', 'F', 489, 0),
+        (605, '2021-05-23 00:00:00', 'C', 447, 0),
+        (606, '2020-07-12 00:00:00', 'F', 442, 0),
+        (607, '2021-03-17 00:00:00', 'C', 406, 0),
+        (608, '2020-06-12 00:00:00', 'P', 376, 0),
+        (609, '2021-05-17 00:00:00', 'P', 119, 0),
+        (610, '2021-02-02 00:00:00', 'F', 155, 0),
+        (611, '2020-09-21 00:00:00', 'F', 211, 0),
+        (612, '2020-12-22 00:00:00', 'F', 442, 0),
+        (613, '2021-02-23 00:00:00', 'P', 180, 0),
+        (614, '2021-02-24 00:00:00', 'F', 424, 0),
+        (615, '2020-08-04 00:00:00', 'F', 28, 0),
+        (616, '2020-07-25 00:00:00', 'P', 107, 0),
+        (617, '2020-08-14 00:00:00', 'F', 146, 0),
+        (618, '2020-12-13 00:00:00', 'C', 49, 0),
+        (619, '2020-10-03 00:00:00', 'F', 11, 0),
+        (620, '2021-02-27 00:00:00', 'P', 27, 0),
+        (621, '2021-02-24 00:00:00', 'F', 418, 0),
+        (622, '2020-07-12 00:00:00', 'F', 379, 0),
+        (623, '2020-11-25 00:00:00', 'F', 191, 0),
+        (624, '2021-05-20 00:00:00', 'C', 179, 0),
+        (625, '2020-10-26 00:00:00', 'P', 54, 0),
+        (626, '2020-06-11 00:00:00', 'F', 148, 0),
+        (627, '2020-08-11 00:00:00', 'F', 156, 0),
+        (628, '2020-11-03 00:00:00', 'F', 374, 0),
+        (629, '2021-05-31 00:00:00', 'C', 430, 0),
+        (630, '2020-06-23 00:00:00', 'F', 472, 0),
+        (631, '2020-12-08 00:00:00', 'P', 257, 0),
+        (632, '2020-11-21 00:00:00', 'F', 128, 0),
+        (633, '2021-05-12 00:00:00', 'F', 46, 0),
+        (634, '2021-03-23 00:00:00', 'F', 92, 0),
+        (635, '2020-12-02 00:00:00', 'F', 49, 0),
+        (636, '2021-04-12 00:00:00', 'P', 340, 0),
+        (637, '2020-07-12 00:00:00', 'C', 293, 0),
+        (638, '2021-05-10 00:00:00', 'C', 260, 0),
+        (639, '2020-08-25 00:00:00', 'F', 451, 0),
+        (640, '2021-06-06 00:00:00', 'F', 401, 0),
+        (641, '2021-02-24 00:00:00', 'F', 240, 0),
+        (642, '2020-08-22 00:00:00', 'F', 308, 0),
+        (643, '2021-05-20 00:00:00', 'C', 255, 0),
+        (644, '2021-06-02 00:00:00', 'F', 74, 0),
+        (645, '2021-04-04 00:00:00', 'F', 85, 0),
+        (646, '2021-01-25 00:00:00', 'C', 65, 0),
+        (647, '2020-08-02 00:00:00', 'F', 447, 0),
+        (648, '2020-10-16 00:00:00', 'F', 312, 0),
+        (649, '2021-03-27 00:00:00', 'F', 403, 0),
+        (650, '2021-03-16 00:00:00', 'P', 41, 0),
+        (651, '2020-09-10 00:00:00', 'C', 318, 0),
+        (652, '2020-08-10 00:00:00', 'F', 284, 0),
+        (653, '2020-10-02 00:00:00', 'P', 243, 0),
+        (654, '2020-09-29 00:00:00', 'P', 218, 0),
+        (655, '2021-05-08 00:00:00', 'F', 339, 0),
+        (656, '2020-11-01 00:00:00', 'F', 227, 0),
+        (657, '2020-10-13 00:00:00', 'C', 284, 0),
+        (658, '2021-03-04 00:00:00', 'F', 445, 0),
+        (659, '2020-08-17 00:00:00', 'F', 431, 0),
+        (660, '2020-07-17 00:00:00', 'F', 94, 0),
+        (661, '2021-04-17 00:00:00', 'C', 275, 0),
+        (662, '2020-09-14 00:00:00', 'F', 444, 0),
+        (663, '2020-08-29 00:00:00', 'C', 326, 0),
+        (664, '2020-09-10 00:00:00', 'C', 37, 0),
+        (665, '2021-01-17 00:00:00', 'F', 105, 0),
+        (666, '2020-10-07 00:00:00', 'F', 323, 0),
+        (667, '2020-06-16 00:00:00', 'P', 54, 0),
+        (668, '2021-04-17 00:00:00', 'C', 274, 0),
+        (669, '2020-10-20 00:00:00', 'F', 143, 0),
+        (670, '2021-04-28 00:00:00', 'P', 221, 0),
+        (671, '2020-11-24 00:00:00', 'F', 228, 0),
+        (672, '2021-04-25 00:00:00', 'P', 80, 0),
+        (673, '2021-04-17 00:00:00', 'F', 190, 0),
+        (674, '2020-11-25 00:00:00', 'F', 19, 0),
+        (675, '2021-05-15 00:00:00', 'P', 56, 0),
+        (676, '2021-05-26 00:00:00', 'F', 309, 0),
+        (677, '2021-06-01 00:00:00', 'P', 482, 0),
+        (678, '2020-12-07 00:00:00', 'F', 112, 0),
+        (679, '2021-04-23 00:00:00', 'C', 492, 0),
+        (680, '2021-05-12 00:00:00', 'P', 169, 0),
+        (681, '2020-11-06 00:00:00', 'F', 277, 0),
+        (682, '2021-05-17 00:00:00', 'F', 425, 0),
+        (683, '2021-05-09 00:00:00', 'F', 208, 0),
+        (684, '2020-10-05 00:00:00', 'F', 158, 0),
+        (685, '2021-01-17 00:00:00', 'F', 360, 0),
+        (686, '2021-03-25 00:00:00', 'F', 498, 0),
+        (687, '2021-05-18 00:00:00', 'F', 288, 0),
+        (688, '2020-10-18 00:00:00', 'P', 439, 0),
+        (689, '2021-03-21 00:00:00', 'F', 444, 0),
+        (690, '2020-12-18 00:00:00', 'C', 76, 0),
+        (691, '2020-11-27 00:00:00', 'F', 492, 0),
+        (692, '2021-04-24 00:00:00', 'F', 355, 0),
+        (693, '2021-01-05 00:00:00', 'P', 244, 0),
+        (694, '2021-06-03 00:00:00', 'C', 176, 0),
+        (695, '2021-04-18 00:00:00', 'F', 60, 0),
+        (696, '2020-09-28 00:00:00', 'F', 479, 0),
+        (697, '2020-08-08 00:00:00', 'F', 469, 0),
+        (698, '2020-06-11 00:00:00', 'C', 269, 0),
+        (699, '2020-07-17 00:00:00', 'F', 467, 0),
+        (700, '2021-01-04 00:00:00', 'C', 324, 0),
+        (701, '2021-02-18 00:00:00', 'C', 377, 0),
+        (702, '2021-01-29 00:00:00', 'F', 69, 0),
+        (703, '2020-12-10 00:00:00', 'F', 95, 0),
+        (704, '2021-02-08 00:00:00', 'F', 42, 0),
+        (705, '2020-11-12 00:00:00', 'F', 23, 0),
+        (706, '2021-04-14 00:00:00', 'F', 314, 0),
+        (707, '2020-07-28 00:00:00', 'F', 30, 0),
+        (708, '2020-12-13 00:00:00', 'F', 208, 0),
+        (709, '2020-08-02 00:00:00', 'F', 396, 0),
+        (710, '2021-04-27 00:00:00', 'C', 132, 0),
+        (711, '2021-06-08 00:00:00', 'F', 103, 0),
+        (712, '2021-02-25 00:00:00', 'F', 46, 0),
+        (713, '2020-08-21 00:00:00', 'C', 98, 0),
+        (714, '2020-10-10 00:00:00', 'F', 346, 0),
+        (715, '2020-11-09 00:00:00', 'C', 255, 0),
+        (716, '2020-11-08 00:00:00', 'P', 209, 0),
+        (717, '2021-03-10 00:00:00', 'P', 435, 0),
+        (718, '2020-10-30 00:00:00', 'P', 205, 0),
+        (719, '2021-02-05 00:00:00', 'F', 454, 0),
+        (720, '2021-05-29 00:00:00', 'F', 262, 0),
+        (721, '2021-04-28 00:00:00', 'C', 182, 0),
+        (722, '2020-12-29 00:00:00', 'F', 125, 0),
+        (723, '2020-07-01 00:00:00', 'P', 79, 0),
+        (724, '2020-06-28 00:00:00', 'F', 85, 0),
+        (725, '2020-08-26 00:00:00', 'F', 383, 0),
+        (726, '2020-09-13 00:00:00', 'F', 16, 0),
+        (727, '2020-08-09 00:00:00', 'P', 466, 0),
+        (728, '2021-05-07 00:00:00', 'C', 276, 0),
+        (729, '2021-05-21 00:00:00', 'C', 261, 0),
+        (730, '2021-03-18 00:00:00', 'F', 166, 0),
+        (731, '2020-10-26 00:00:00', 'F', 239, 0),
+        (732, '2021-01-01 00:00:00', 'F', 133, 0),
+        (733, '2021-04-29 00:00:00', 'F', 244, 0),
+        (734, '2021-01-22 00:00:00', 'F', 364, 0),
+        (735, '2021-01-06 00:00:00', 'F', 15, 0),
+        (736, '2021-05-12 00:00:00', 'F', 356, 0),
+        (737, '2021-03-27 00:00:00', 'F', 496, 0),
+        (738, '2021-01-15 00:00:00', 'C', 494, 0),
+        (739, '2021-02-22 00:00:00', 'F', 85, 0),
+        (740, '2020-08-07 00:00:00', 'C', 466, 0),
+        (741, '2020-10-09 00:00:00', 'P', 39, 0),
+        (742, '2020-06-23 00:00:00', 'P', 319, 0),
+        (743, '2021-04-13 00:00:00', 'F', 498, 0),
+        (744, '2021-05-23 00:00:00', 'C', 19, 0),
+        (745, '2020-07-20 00:00:00', 'F', 329, 0),
+        (746, '2021-01-31 00:00:00', 'F', 302, 0),
+        (747, '2020-09-22 00:00:00', 'F', 95, 0),
+        (748, '2020-10-19 00:00:00', 'F', 478, 0),
+        (749, '2020-10-13 00:00:00', 'P', 409, 0),
+        (750, '2020-12-28 00:00:00', 'F', 339, 0),
+        (751, '2020-06-21 00:00:00', 'C', 334, 0),
+        (752, '2021-02-04 00:00:00', 'P', 194, 0),
+        (753, '2021-05-16 00:00:00', 'F', 46, 0),
+        (754, '2020-08-09 00:00:00', 'P', 318, 0),
+        (755, '2020-08-30 00:00:00', 'F', 223, 0),
+        (756, '2021-04-03 00:00:00', 'F', 155, 0),
+        (757, '2021-03-19 00:00:00', 'F', 9, 0),
+        (758, '2020-08-25 00:00:00', 'F', 73, 0),
+        (759, '2020-12-17 00:00:00', 'F', 481, 0),
+        (760, '2021-04-18 00:00:00', 'C', 406, 0),
+        (761, '2020-08-11 00:00:00', 'P', 254, 0),
+        (762, '2020-07-13 00:00:00', 'F', 128, 0),
+        (763, '2020-10-15 00:00:00', 'P', 261, 0),
+        (764, '2020-12-02 00:00:00', 'P', 365, 0),
+        (765, '2021-05-25 00:00:00', 'F', 130, 0),
+        (766, '2021-06-07 00:00:00', 'F', 127, 0),
+        (767, '2020-10-30 00:00:00', 'P', 394, 0),
+        (768, '2021-04-21 00:00:00', 'C', 387, 0),
+        (769, '2020-07-01 00:00:00', 'F', 160, 0),
+        (770, '2020-07-04 00:00:00', 'P', 183, 0),
+        (771, '2021-02-03 00:00:00', 'F', 405, 0),
+        (772, '2021-03-08 00:00:00', 'F', 488, 0),
+        (773, '2021-03-19 00:00:00', 'F', 418, 0),
+        (774, '2021-02-03 00:00:00', 'P', 121, 0),
+        (775, '2021-01-24 00:00:00', 'F', 491, 0),
+        (776, '2021-03-11 00:00:00', 'F', 382, 0),
+        (777, '2021-01-29 00:00:00', 'F', 382, 0),
+        (778, '2021-04-03 00:00:00', 'F', 175, 0),
+        (779, '2021-05-29 00:00:00', 'P', 62, 0),
+        (780, '2021-01-08 00:00:00', 'C', 351, 0),
+        (781, '2021-03-02 00:00:00', 'P', 206, 0),
+        (782, '2021-05-21 00:00:00', 'F', 184, 0),
+        (783, '2020-08-26 00:00:00', 'F', 11, 0),
+        (784, '2020-06-11 00:00:00', 'P', 279, 0),
+        (785, '2021-01-09 00:00:00', 'F', 105, 0),
+        (786, '2021-03-30 00:00:00', 'F', 113, 0),
+        (787, '2020-10-03 00:00:00', 'F', 382, 0),
+        (788, '2021-04-10 00:00:00', 'F', 284, 0),
+        (789, '2021-05-12 00:00:00', 'F', 42, 0),
+        (790, '2021-02-18 00:00:00', 'F', 361, 0),
+        (791, '2020-11-27 00:00:00', 'C', 111, 0),
+        (792, '2020-07-28 00:00:00', 'C', 378, 0),
+        (793, '2020-09-05 00:00:00', 'F', 204, 0),
+        (794, '2020-09-18 00:00:00', 'C', 317, 0),
+        (795, '2020-09-17 00:00:00', 'P', 186, 0),
+        (796, '2020-11-02 00:00:00', 'F', 74, 0),
+        (797, '2020-11-19 00:00:00', 'F', 406, 0),
+        (798, '2020-12-11 00:00:00', 'F', 67, 0),
+        (799, '2021-01-31 00:00:00', 'C', 8, 0),
+        (800, '2020-08-22 00:00:00', 'F', 6, 0),
+        (801, '2020-11-07 00:00:00', 'P', 361, 0),
+        (802, '2020-06-17 00:00:00', 'F', 14, 0),
+        (803, '2020-10-01 00:00:00', 'C', 122, 0),
+        (804, '2021-03-28 00:00:00', 'C', 88, 0),
+        (805, '2020-09-27 00:00:00', 'C', 461, 0),
+        (806, '2020-09-04 00:00:00', 'P', 64, 0),
+        (807, '2020-10-09 00:00:00', 'F', 437, 0),
+        (808, '2021-04-05 00:00:00', 'P', 379, 0),
+        (809, '2020-08-25 00:00:00', 'P', 86, 0),
+        (810, '2020-12-21 00:00:00', 'F', 465, 0),
+        (811, '2021-02-28 00:00:00', 'P', 242, 0),
+        (812, '2021-04-28 00:00:00', 'P', 447, 0),
+        (813, '2020-09-12 00:00:00', 'P', 106, 0),
+        (814, '2020-09-24 00:00:00', 'F', 154, 0),
+        (815, '2021-02-22 00:00:00', 'P', 302, 0),
+        (816, '2021-03-12 00:00:00', 'F', 449, 0),
+        (817, '2020-12-30 00:00:00', 'P', 262, 0),
+        (818, '2020-06-24 00:00:00', 'P', 30, 0),
+        (819, '2020-07-29 00:00:00', 'C', 496, 0),
+        (820, '2021-03-06 00:00:00', 'F', 292, 0),
+        (821, '2020-12-18 00:00:00', 'F', 338, 0),
+        (822, '2020-10-10 00:00:00', 'F', 72, 0),
+        (823, '2020-06-26 00:00:00', 'C', 383, 0),
+        (824, '2020-10-31 00:00:00', 'P', 389, 0),
+        (825, '2020-11-25 00:00:00', 'F', 290, 0),
+        (826, '2020-08-23 00:00:00', 'F', 228, 0),
+        (827, '2020-11-03 00:00:00', 'F', 188, 0),
+        (828, '2020-07-06 00:00:00', 'F', 476, 0),
+        (829, '2020-09-24 00:00:00', 'F', 325, 0),
+        (830, '2021-03-28 00:00:00', 'F', 254, 0),
+        (831, '2020-07-08 00:00:00', 'F', 56, 0),
+        (832, '2020-08-23 00:00:00', 'P', 377, 0),
+        (833, '2021-04-29 00:00:00', 'C', 368, 0),
+        (834, '2021-01-01 00:00:00', 'C', 23, 0),
+        (835, '2021-04-29 00:00:00', 'F', 191, 0),
+        (836, '2020-10-02 00:00:00', 'C', 139, 0),
+        (837, '2020-10-10 00:00:00', 'P', 416, 0),
+        (838, '2020-11-15 00:00:00', 'C', 217, 0),
+        (839, '2021-01-11 00:00:00', 'F', 449, 0),
+        (840, '2020-06-28 00:00:00', 'F', 277, 0),
+        (841, '2020-09-14 00:00:00', 'P', 164, 0),
+        (842, '2020-08-28 00:00:00', 'C', 17, 0),
+        (843, '2020-11-30 00:00:00', 'F', 218, 0),
+        (844, '2020-09-19 00:00:00', 'F', 170, 0),
+        (845, '2020-11-19 00:00:00', 'C', 56, 0),
+        (846, '2020-08-01 00:00:00', 'F', 406, 0),
+        (847, '2021-02-19 00:00:00', 'P', 484, 0),
+        (848, '2021-03-30 00:00:00', 'F', 99, 0),
+        (849, '2020-07-21 00:00:00', 'C', 380, 0),
+        (850, '2020-06-22 00:00:00', 'F', 154, 0),
+        (851, '2020-10-01 00:00:00', 'C', 288, 0),
+        (852, '2020-10-19 00:00:00', 'C', 193, 0),
+        (853, '2020-06-27 00:00:00', 'C', 87, 0),
+        (854, '2020-10-17 00:00:00', 'C', 271, 0),
+        (855, '2020-07-18 00:00:00', 'F', 317, 0),
+        (856, '2021-02-24 00:00:00', 'F', 370, 0),
+        (857, '2020-09-01 00:00:00', 'F', 323, 0),
+        (858, '2020-09-25 00:00:00', 'C', 345, 0),
+        (859, '2021-03-15 00:00:00', 'P', 67, 0),
+        (860, '2020-06-13 00:00:00', 'C', 435, 0),
+        (861, '2021-03-28 00:00:00', 'P', 456, 0),
+        (862, '2021-01-13 00:00:00', 'C', 351, 0),
+        (863, '2020-11-16 00:00:00', 'C', 62, 0),
+        (864, '2020-12-01 00:00:00', 'F', 343, 0),
+        (865, '2020-11-24 00:00:00', 'C', 402, 0),
+        (866, '2021-01-29 00:00:00', 'F', 427, 0),
+        (867, '2020-09-21 00:00:00', 'C', 24, 0),
+        (868, '2020-12-24 00:00:00', 'P', 333, 0),
+        (869, '2021-03-06 00:00:00', 'P', 164, 0),
+        (870, '2021-02-06 00:00:00', 'F', 306, 0),
+        (871, '2021-02-19 00:00:00', 'F', 254, 0),
+        (872, '2020-09-10 00:00:00', 'F', 335, 0),
+        (873, '2021-02-24 00:00:00', 'F', 42, 0),
+        (874, '2020-08-04 00:00:00', 'F', 10, 0),
+        (875, '2020-06-20 00:00:00', 'F', 58, 0),
+        (876, '2020-10-22 00:00:00', 'C', 157, 0),
+        (877, '2020-09-07 00:00:00', 'C', 40, 0),
+        (878, '2020-10-05 00:00:00', 'F', 263, 0),
+        (879, '2020-08-12 00:00:00', 'C', 149, 0),
+        (880, '2021-01-18 00:00:00', 'C', 483, 0),
+        (881, '2021-05-10 00:00:00', 'F', 391, 0),
+        (882, '2021-03-14 00:00:00', 'C', 261, 0),
+        (883, '2020-12-26 00:00:00', 'C', 94, 0),
+        (884, '2020-08-04 00:00:00', 'C', 11, 0),
+        (885, '2020-10-28 00:00:00', 'F', 426, 0),
+        (886, '2021-01-11 00:00:00', 'C', 390, 0),
+        (887, '2020-12-14 00:00:00', 'F', 398, 0),
+        (888, '2020-12-21 00:00:00', 'C', 146, 0),
+        (889, '2021-04-09 00:00:00', 'F', 355, 0),
+        (890, '2020-11-22 00:00:00', 'P', 214, 0),
+        (891, '2020-08-02 00:00:00', 'P', 255, 0),
+        (892, '2021-06-05 00:00:00', 'P', 82, 0),
+        (893, '2021-01-03 00:00:00', 'P', 41, 0),
+        (894, '2021-04-12 00:00:00', 'C', 142, 0),
+        (895, '2020-06-10 00:00:00', 'P', 322, 0),
+        (896, '2020-11-13 00:00:00', 'F', 235, 0),
+        (897, '2021-04-15 00:00:00', 'F', 335, 0),
+        (898, '2020-09-09 00:00:00', 'F', 455, 0),
+        (899, '2021-05-11 00:00:00', 'F', 378, 0),
+        (900, '2020-08-11 00:00:00', 'P', 202, 0),
+        (901, '2020-09-21 00:00:00', 'C', 382, 0),
+        (902, '2021-04-16 00:00:00', 'F', 127, 0),
+        (903, '2020-07-21 00:00:00', 'C', 251, 0),
+        (904, '2020-09-07 00:00:00', 'F', 241, 0),
+        (905, '2020-12-12 00:00:00', 'F', 85, 0),
+        (906, '2020-07-21 00:00:00', 'P', 375, 0),
+        (907, '2020-08-14 00:00:00', 'F', 222, 0),
+        (908, '2020-10-23 00:00:00', 'F', 200, 0),
+        (909, '2020-10-04 00:00:00', 'C', 474, 0),
+        (910, '2021-04-26 00:00:00', 'F', 471, 0),
+        (911, '2021-01-23 00:00:00', 'F', 493, 0),
+        (912, '2021-05-01 00:00:00', 'P', 8, 0),
+        (913, '2021-05-06 00:00:00', 'F', 176, 0),
+        (914, '2020-06-21 00:00:00', 'P', 80, 0),
+        (915, '2021-05-16 00:00:00', 'P', 83, 0),
+        (916, '2021-01-30 00:00:00', 'C', 424, 0),
+        (917, '2020-08-30 00:00:00', 'P', 29, 0),
+        (918, '2021-05-20 00:00:00', 'F', 135, 0),
+        (919, '2020-12-04 00:00:00', 'F', 417, 0),
+        (920, '2020-12-23 00:00:00', 'C', 151, 0),
+        (921, '2021-03-09 00:00:00', 'P', 400, 0),
+        (922, '2020-06-30 00:00:00', 'F', 327, 0),
+        (923, '2020-08-22 00:00:00', 'F', 369, 0),
+        (924, '2020-10-25 00:00:00', 'F', 369, 0),
+        (925, '2021-01-26 00:00:00', 'P', 33, 0),
+        (926, '2020-06-13 00:00:00', 'F', 258, 0),
+        (927, '2020-10-01 00:00:00', 'F', 231, 0),
+        (928, '2020-07-06 00:00:00', 'C', 64, 0),
+        (929, '2020-07-20 00:00:00', 'F', 11, 0),
+        (930, '2020-10-15 00:00:00', 'P', 475, 0),
+        (931, '2020-12-19 00:00:00', 'C', 1, 0),
+        (932, '2020-09-03 00:00:00', 'C', 459, 0),
+        (933, '2020-12-14 00:00:00', 'P', 469, 0),
+        (934, '2021-05-09 00:00:00', 'F', 121, 0),
+        (935, '2020-09-30 00:00:00', 'F', 322, 0),
+        (936, '2020-06-15 00:00:00', 'P', 214, 0),
+        (937, '2021-04-22 00:00:00', 'F', 181, 0),
+        (938, '2021-05-01 00:00:00', 'F', 109, 0),
+        (939, '2020-07-01 00:00:00', 'P', 288, 0),
+        (940, '2020-12-02 00:00:00', 'P', 115, 0),
+        (941, '2020-07-22 00:00:00', 'P', 11, 0),
+        (942, '2020-12-22 00:00:00', 'F', 180, 0),
+        (943, '2020-10-08 00:00:00', 'C', 162, 0),
+        (944, '2021-04-22 00:00:00', 'F', 447, 0),
+        (945, '2021-02-12 00:00:00', 'P', 148, 0),
+        (946, '2021-05-15 00:00:00', 'F', 195, 0),
+        (947, '2021-04-21 00:00:00', 'P', 194, 0),
+        (948, '2021-02-27 00:00:00', 'P', 225, 0),
+        (949, '2021-03-26 00:00:00', 'P', 443, 0),
+        (950, '2020-10-05 00:00:00', 'C', 465, 0),
+        (951, '2021-06-01 00:00:00', 'F', 47, 0),
+        (952, '2021-04-04 00:00:00', 'P', 290, 0),
+        (953, '2021-02-04 00:00:00', 'F', 329, 0),
+        (954, '2020-11-16 00:00:00', 'F', 214, 0),
+        (955, '2021-05-04 00:00:00', 'C', 324, 0),
+        (956, '2021-02-05 00:00:00', 'F', 121, 0),
+        (957, '2021-03-01 00:00:00', 'C', 418, 0),
+        (958, '2020-07-28 00:00:00', 'P', 411, 0),
+        (959, '2021-05-12 00:00:00', 'F', 441, 0),
+        (960, '2021-04-16 00:00:00', 'F', 28, 0),
+        (961, '2021-04-06 00:00:00', 'F', 452, 0),
+        (962, '2020-10-01 00:00:00', 'C', 157, 0),
+        (963, '2020-12-18 00:00:00', 'F', 103, 0),
+        (964, '2020-08-07 00:00:00', 'F', 32, 0),
+        (965, '2021-02-12 00:00:00', 'P', 353, 0),
+        (966, '2020-10-26 00:00:00', 'C', 414, 0),
+        (967, '2020-09-07 00:00:00', 'F', 362, 0),
+        (968, '2021-05-04 00:00:00', 'F', 447, 0),
+        (969, '2020-09-29 00:00:00', 'C', 398, 0),
+        (970, '2020-08-09 00:00:00', 'F', 64, 0),
+        (971, '2020-06-17 00:00:00', 'F', 219, 0),
+        (972, '2020-08-15 00:00:00', 'F', 13, 0),
+        (973, '2021-02-17 00:00:00', 'F', 490, 0),
+        (974, '2020-12-05 00:00:00', 'F', 498, 0),
+        (975, '2020-07-12 00:00:00', 'P', 365, 0),
+        (976, '2020-06-12 00:00:00', 'F', 190, 0),
+        (977, '2020-12-21 00:00:00', 'P', 123, 0),
+        (978, '2020-11-14 00:00:00', 'C', 333, 0),
+        (979, '2020-09-03 00:00:00', 'F', 462, 0),
+        (980, '2021-02-24 00:00:00', 'P', 169, 0),
+        (981, '2021-01-20 00:00:00', 'F', 123, 0),
+        (982, '2020-07-07 00:00:00', 'P', 47, 0),
+        (983, '2020-12-03 00:00:00', 'F', 408, 0),
+        (984, '2020-06-17 00:00:00', 'F', 376, 0),
+        (985, '2021-02-17 00:00:00', 'F', 39, 0),
+        (986, '2020-06-14 00:00:00', 'P', 239, 0),
+        (987, '2021-02-01 00:00:00', 'P', 45, 0),
+        (988, '2020-06-23 00:00:00', 'C', 342, 0),
+        (989, '2020-09-11 00:00:00', 'F', 183, 0),
+        (990, '2020-06-28 00:00:00', 'C', 399, 0),
+        (991, '2020-11-03 00:00:00', 'F', 96, 0),
+        (992, '2021-01-26 00:00:00', 'P', 433, 0),
+        (993, '2020-06-19 00:00:00', 'F', 57, 0),
+        (994, '2020-10-06 00:00:00', 'P', 378, 0),
+        (995, '2020-06-14 00:00:00', 'P', 179, 0),
+        (996, '2020-07-05 00:00:00', 'C', 106, 0),
+        (997, '2020-08-28 00:00:00', 'F', 356, 0),
+        (998, '2020-08-03 00:00:00', 'F', 408, 0),
+        (999, '2020-08-25 00:00:00', 'C', 107, 0),
+        (1000, '2021-04-25 00:00:00', 'C', 76, 0);
 
 insert into shop_orderitems (id, quantity, unitPrice, order_id, products_id)
 values  (1, 3, 81.61, 357, 751),
@@ -4015,4 +4015,10 @@ values  (1, 3, 81.61, 357, 751),
         (997, 4, 29.10, 589, 867),
         (998, 4, 80.82, 725, 25),
         (999, 5, 99.80, 573, 834),
-        (1000, 4, 93.80, 380, 188);                  
\ No newline at end of file
+        (1000, 4, 93.80, 380, 188);
+
+update shop_collection
+set product_count = (select count(*) from shop_product where shop_product.collection_id = shop_collection.id);
+
+update shop_order
+set total = coalesce((select sum(quantity * unitPrice) from shop_orderitems where shop_orderitems.order_id = shop_order.id), 0);
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+# Like / unlike deltas are buffered per (content_type_id, object_id) and written in one go,
+# so a burst of likes on a popular product turns into a single UPDATE instead of one per click.
+# The buffer is written once it holds LIKE_COUNTER_FLUSH_SIZE objects or its oldest delta is
+# LIKE_COUNTER_FLUSH_INTERVAL seconds old; reads in this process add it on in memory meanwhile.
+_pending = Counter()
+_lock = threading.Lock()
+_oldest = None
+
+
+def flush_size():
+    return getattr(settings, 'LIKE_COUNTER_FLUSH_SIZE', 100)
+
+
+def flush_interval():
+    return getattr(settings, 'LIKE_COUNTER_FLUSH_INTERVAL', 10)
+
+
+def record(content_type_id, object_id, delta):
+    global _oldest
+    with _lock:
+        _pending[(content_type_id, object_id)] += delta
+        if _oldest is None:
+            _oldest = time.monotonic()
+    flush_if_due()
+
+
+def pending_for(content_type_id, object_ids):
+    # {object_id: delta} for the objects with unwritten likes
+    with _lock:
+        return {
+            object_id: _pending[(content_type_id, object_id)]
+            for object_id in object_ids if _pending.get((content_type_id, object_id))
+        }
+
+
+def flush_if_due():
+    # Called after every like and at the end of every request (see likes.signals)
+    with _lock:
+        due = len(_pending) >= flush_size() or \
+            (_oldest is not None and time.monotonic() - _oldest >= flush_interval())
+    if due:
+        flush()
+
+
+def flush():
+    global _oldest
+    with _lock:
+        pending = {key: delta for key, delta in _pending.items() if delta}
+        _pending.clear()
+        _oldest = None
+    if not pending:
+        return
+
+    from .models import LikeCount
+    try:
+        with transaction.atomic():
+            # Make sure every row exists, then apply the deltas with F() so concurrent
+            # flushes from other processes add up instead of overwriting each other
+            LikeCount.objects.bulk_create(
+                [LikeCount(content_type_id=ct_id, object_id=obj_id) for ct_id, obj_id in pending],
+                ignore_conflicts=True,
+            )
+            for (content_type_id, object_id), delta in pending.items():
+                LikeCount.objects.\
+                    filter(content_type_id=content_type_id, object_id=object_id).\
+                    update(count=F('count') + delta)
+    except Exception:
+        # Nothing was written, keep the deltas for the next flush
+        with _lock:
+            _pending.update(pending)
+            if _oldest is None:
+                _oldest = time.monotonic()
+        raise
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from likes.models import LikeCount, Likes
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the LikeCount table from the raw Likes rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        # Deltas still buffered in the web processes are already in Likes and get added again
+        # when they are written, so this is for a quiet moment: a process writes its buffer at
+        # most LIKE_COUNTER_FLUSH_INTERVAL seconds after its last like.
+        totals = Likes.objects.\
+            values('content_type_id', 'object_id').\
+            annotate(count=Count('id')).\
+            order_by()
+        with transaction.atomic():
+            LikeCount.objects.all().delete()
+            rebuilt = LikeCount.objects.bulk_create(
+                (LikeCount(**row) for row in totals.iterator()),
+                batch_size=options['batch_size'],
+            )
+        self.stdout.write(f'Rebuilt like counts for {len(rebuilt)} objects')
@@ -9,4 +9,35 @@ class Likes(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveBigIntegerField()
-    content_object = GenericForeignKey()
\ No newline at end of file
+    content_object = GenericForeignKey()
+
+
+class LikeCountManager(models.Manager):
+    def like_counts_for(self, obj_type, obj_ids):
+        # Returns {object_id: count} for every id in a single query, objects nobody liked get 0.
+        # Likes this process hasn't written yet are added on top.
+        from . import counters
+        content_type = ContentType.objects.get_for_model(obj_type)
+        counts = dict.fromkeys(obj_ids, 0)
+        counts.update(
+            self.filter(content_type = content_type, object_id__in = obj_ids).
+            values_list('object_id', 'count')
+        )
+        for object_id, delta in counters.pending_for(content_type.id, counts).items():
+            counts[object_id] += delta
+        return counts
+
+
+# Denormalized Likes count per object, kept up to date by likes.counters
+# and rebuilt from the Likes rows by `manage.py reconcile_like_counts`
+class LikeCount(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    count = models.IntegerField(default=0)
+
+    objects = LikeCountManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields = ['content_type', 'object_id'], name = 'unique_like_count_object')
+        ]
@@ -0,0 +1,40 @@
+import logging
+
+from django.core.signals import request_finished
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import counters
+from .models import Likes
+
+logger = logging.getLogger(__name__)
+
+
+def record(content_type_id, object_id, delta):
+    # Runs once the like is committed, so a failed flush must not fail the request that made it.
+    # counters.flush keeps the deltas buffered when it fails, the next flush writes them.
+    try:
+        counters.record(content_type_id, object_id, delta)
+    except Exception:
+        logger.exception('Flushing like counts failed')
+
+
+@receiver(post_save, sender=Likes)
+def count_like(sender, instance, created, **kwargs):
+    if created:
+        # Only count likes that actually get committed
+        transaction.on_commit(lambda: record(instance.content_type_id, instance.object_id, 1))
+
+
+@receiver(post_delete, sender=Likes)
+def count_unlike(sender, instance, **kwargs):
+    transaction.on_commit(lambda: record(instance.content_type_id, instance.object_id, -1))
+
+
+@receiver(request_finished)
+def flush_like_counts(sender, **kwargs):
+    try:
+        counters.flush_if_due()
+    except Exception:
+        logger.exception('Flushing like counts failed')
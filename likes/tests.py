@@ -1,3 +1,80 @@
-from django.test import TestCase
+import io
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from . import counters
+from .models import LikeCount, Likes
+
 
 # Create your tests here.
+@override_settings(LIKE_COUNTER_FLUSH_SIZE=3, LIKE_COUNTER_FLUSH_INTERVAL=60)
+class LikeCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user_type = ContentType.objects.get_for_model(User)
+        cls.users = User.objects.bulk_create([User(username=f'shopper{number}') for number in range(4)])
+
+    def setUp(self):
+        # Leftovers from other tests are written into this test's transaction and rolled back
+        counters.flush()
+
+    def like(self, user, object_id):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Likes.objects.create(user=user, content_type=self.user_type, object_id=object_id)
+
+    def counts(self, ids):
+        return LikeCount.objects.like_counts_for(User, ids)
+
+    def stored(self):
+        return dict(LikeCount.objects.values_list('object_id', 'count'))
+
+    def test_buffers_until_the_size_limit(self):
+        like = self.like(self.users[0], 1)
+        self.like(self.users[1], 1)
+        self.like(self.users[0], 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            like.delete()
+        self.assertEqual(self.stored(), {})
+        # Reads add what is still buffered without writing it
+        with self.assertNumQueries(1):
+            self.assertEqual(self.counts([1, 2, 3]), {1: 1, 2: 1, 3: 0})
+
+        self.like(self.users[0], 3)
+        self.assertEqual(self.stored(), {1: 1, 2: 1, 3: 1})
+        self.assertEqual(self.counts([1, 2, 3]), {1: 1, 2: 1, 3: 1})
+
+    def test_flushes_after_the_interval(self):
+        self.like(self.users[0], 1)
+        counters.flush_if_due()
+        self.assertEqual(self.stored(), {})
+        with override_settings(LIKE_COUNTER_FLUSH_INTERVAL=0.01):
+            time.sleep(0.02)
+            self.client.get('/')
+        self.assertEqual(self.stored(), {1: 1})
+
+    def test_failed_flush_keeps_the_deltas(self):
+        self.like(self.users[0], 1)
+        self.like(self.users[1], 1)
+        self.like(self.users[0], 2)
+        failing = mock.patch.object(LikeCount.objects, 'bulk_create', side_effect=DatabaseError('locked'))
+        with failing, self.assertLogs('likes.signals', 'ERROR'):
+            # The like is committed all the same
+            like = self.like(self.users[0], 3)
+        self.assertTrue(Likes.objects.filter(pk=like.pk).exists())
+        self.assertEqual(self.stored(), {})
+        self.assertEqual(self.counts([1, 2, 3]), {1: 2, 2: 1, 3: 1})
+        counters.flush()
+        self.assertEqual(self.stored(), {1: 2, 2: 1, 3: 1})
+
+    def test_reconcile_rebuilds_from_likes(self):
+        for user in self.users:
+            self.like(user, 5)
+        LikeCount.objects.update(count=100)
+        call_command('reconcile_like_counts', stdout=io.StringIO())
+        self.assertEqual(self.stored(), {5: 4})
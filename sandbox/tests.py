@@ -1,3 +1,141 @@
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
 
-# Create your tests here.
+from likes.models import Likes
+from shop.models import Collection, Product, Promotions
+from store.testing import QueryBudget, load_seed_data
+from tags.models import TaggedItem, Tags
+
+
+class ViewQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def test_static_views(self):
+        with QueryBudget(0):
+            self.get('/playground/hello/')
+            self.get('/playground/html/')
+
+    def test_query_list(self):
+        # The ETag query and the page
+        with QueryBudget(2):
+            response = self.get('/playground/filter/')
+        with QueryBudget(2):
+            self.get('/playground/filter/?cursor=' + response.context['page'].next_cursor)
+        # From the response cache, only the ETag is worked out again
+        with QueryBudget(1):
+            self.get('/playground/filter/')
+
+    def test_related_list(self):
+        # Collections come with the products (select_related), not one query per row
+        with QueryBudget(2):
+            self.get('/playground/related/')
+        for stream in ['html', 'ndjson']:
+            with QueryBudget(2):
+                self.get(f'/playground/related/?stream={stream}')
+
+
+class ETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        cls.promotion = Promotions.objects.create(description='Summer sale', discount=0.1)
+        cls.promotion.products.add(*Product.objects.filter(price__range=(20, 30))[:5])
+
+    def setUp(self):
+        cache.clear()
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def assertETagChanges(self, url, change):
+        etag = self.etag(url)
+        change()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertNotEqual(self.etag(url), etag)
+
+    def test_if_none_match(self):
+        etag = self.etag('/playground/filter/')
+        with QueryBudget(1):
+            response = self.client.get('/playground/filter/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_collection_edit(self):
+        def rename():
+            collection = Collection.objects.first()
+            collection.title = 'Renamed'
+            collection.save()
+        self.assertETagChanges('/playground/related/', rename)
+
+    def test_promotion_edit(self):
+        def discount():
+            self.promotion.discount = 0.5
+            self.promotion.save()
+        self.assertETagChanges('/playground/filter/', discount)
+
+    def test_queryset_update(self):
+        # Whatever the field, update() moves last_update and drops the cached pages
+        product = Product.objects.filter(price__range=(20, 30)).first()
+        self.assertETagChanges(
+            '/playground/filter/', lambda: Product.objects.filter(pk=product.pk).update(inventory=0)
+        )
+        with QueryBudget(2):
+            self.etag('/playground/filter/')
+
+
+class AsyncViewTests(TransactionTestCase):
+    # Tags and likes are looked up from worker threads, on their own connections, so the data
+    # has to be committed; outside transactions reads go to the read-only alias
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        load_seed_data()
+        product_type = ContentType.objects.get_for_model(Product)
+        self.user = User.objects.create(username='shopper')
+        # First on the related page
+        self.product = Product.objects.order_by('title', 'id').first()
+        TaggedItem.objects.create(
+            tag=Tags.objects.create(label='fresh'), content_type=product_type, object_id=self.product.pk
+        )
+        Likes.objects.create(user=self.user, content_type=product_type, object_id=self.product.pk)
+
+    async def test_listings_match_the_sync_views(self):
+        for url, async_url in [
+            ('/playground/filter/', '/playground/filter/async/'),
+            ('/playground/related/', '/playground/related/async/'),
+        ]:
+            sync = await self.async_client.get(url)
+            response = await self.async_client.get(async_url)
+            self.assertEqual(response.status_code, 200)
+            for product in sync.context['page']:
+                self.assertContains(response, product.title)
+        count = await Product.objects.filter(price__range=(20, 30)).acount()
+        self.assertContains(response, ' [fresh] (1 likes)')
+        self.assertContains(await self.async_client.get('/playground/filter/async/'), f'{count} products')
+
+    async def test_product(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        response = await self.async_client.get(f'/playground/products/{self.product.pk}/async/')
+        self.assertEqual(response.status_code, 200)
+        product = response.json()
+        self.assertEqual(product['title'], self.product.title)
+        self.assertEqual((product['tags'], product['like_count'], product['liked']), (['fresh'], 1, True))
+        self.assertEqual((await self.async_client.get('/playground/products/0/async/')).status_code, 404)
@@ -6,4 +6,7 @@ urlpatterns = [
     path('html/', views.html_hello),
     path('filter/', views.query_list), 
     path('related/', views.related_list),
+    path('filter/async/', views.query_list_async),
+    path('related/async/', views.related_list_async),
+    path('products/<int:pk>/async/', views.product_async),
 ]
\ No newline at end of file
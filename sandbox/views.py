@@ -1,7 +1,24 @@
+import asyncio
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.core.paginator import InvalidPage
+from django.template.loader import render_to_string
+from django.views.decorators.http import condition
+
+from shop.cache import cache_response
+from shop.catalog import product_etag
+from shop.models import Collection, Product, attach_like_counts, attach_tags
+from shop.pagination import KeysetPaginator
+from shop.views import product_json
 
-from shop.models import Product
+PAGE_SIZE = 50
+# Rows fetched from the database and rendered per streamed chunk
+STREAM_CHUNK_SIZE = 2000
 
 # Create your views here.
 def say_hello(request):
@@ -10,10 +27,128 @@ def say_hello(request):
 def html_hello(request):
     return render(request, 'hello.html', {'name': 'Amik'})
 
+def paginate(request, query_set):
+    # Keyset pagination on (title, id), see shop.pagination
+    try:
+        return KeysetPaginator(query_set, PAGE_SIZE).page(request.GET.get('cursor'))
+    except InvalidPage:
+        raise Http404('Invalid cursor')
+
+def chunks(query_set):
+    # .iterator() keeps only one chunk of rows in memory instead of caching the whole table
+    products = query_set.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    while chunk := list(islice(products, STREAM_CHUNK_SIZE)):
+        yield chunk
+
+def stream_html(query_set, context):
+    yield render_to_string('related_stream_head.html', context)
+    for chunk in chunks(query_set):
+        yield render_to_string('related_rows.html', {'products': chunk})
+    yield render_to_string('related_stream_tail.html', context)
+
+def stream_ndjson(query_set):
+    for chunk in chunks(query_set):
+        yield ''.join(
+            json.dumps({
+                'id': p.id,
+                'title': p.title,
+                'price': str(p.price),
+                'effective_price': str(p.effective_price),
+                'collection': p.collection.title,
+            }) + '\n'
+            for p in chunk
+        )
+
+def query_list_products():
+    return Product.objects.filter(price__range=(20,30))
+
+def related_list_products():
+    return Product.objects.select_related('collection').all()
+
+# ETags answer repeat polls with a 304 before anything is queried or rendered,
+# the query string is part of the tag since it picks the page / stream format
+def query_list_etag(request):
+    return product_etag(query_list_products(), request.GET.urlencode())
+
+def related_list_etag(request):
+    return product_etag(related_list_products(), request.GET.urlencode())
+
+@condition(etag_func=query_list_etag)
+@cache_response(Product)
 def query_list(request):
-    query_set = Product.objects.filter(price__range=(20,30))
-    return render(request, 'query_list.html', {'product': list(query_set)})
+    query_set = query_list_products()
+    return render(request, 'query_list.html', {'page': paginate(request, query_set)})
 
+@condition(etag_func=related_list_etag)
+@cache_response(Product, Collection)
 def related_list(request):
-    query_set = Product.objects.select_related('collection').all()
-    return render(request, 'related.html', {'products': list(query_set), 'user': 'Amik'})
\ No newline at end of file
+    query_set = related_list_products()
+    # ?stream=html or ?stream=ndjson sends the whole catalog, chunk by chunk
+    stream = request.GET.get('stream')
+    if stream == 'html':
+        return StreamingHttpResponse(stream_html(query_set, {'user': 'Amik'}))
+    if stream == 'ndjson':
+        return StreamingHttpResponse(stream_ndjson(query_set), content_type='application/x-ndjson')
+    return render(request, 'related.html', {'page': paginate(request, query_set), 'user': 'Amik'})
+
+
+# Async versions of the listings, for the ASGI deployment (store/asgi.py). While one of them
+# waits on the database the event loop serves other requests instead of holding a worker.
+# They skip the ETag and response cache of the sync views, both of which are sync only.
+
+async def apaginate(request, query_set):
+    try:
+        return await KeysetPaginator(query_set, PAGE_SIZE).apage(request.GET.get('cursor'))
+    except InvalidPage:
+        raise Http404('Invalid cursor')
+
+def in_worker_thread(function, *args):
+    # Runs function in a thread (and database connection) of its own, so two of them overlap
+    # instead of queueing up on the request's one thread like thread_sensitive calls do
+    def call():
+        close_old_connections()
+        try:
+            return function(*args)
+        finally:
+            close_old_connections()
+    return sync_to_async(call, thread_sensitive=False)()
+
+def authenticated_user(request):
+    # request.user is loaded lazily by a sync query
+    return request.user if request.user.is_authenticated else None
+
+async def attach_tags_and_likes(request, products, *awaitables):
+    # Tags and likes live in different tables (and caches), look them up side by side,
+    # together with anything else the view needs
+    user = await sync_to_async(authenticated_user)(request)
+    results = await asyncio.gather(
+        in_worker_thread(attach_tags, products),
+        in_worker_thread(attach_like_counts, products, user),
+        *awaitables,
+    )
+    return results[2:]
+
+async def query_list_async(request):
+    query_set = query_list_products()
+    page = await apaginate(request, query_set)
+    count, = await attach_tags_and_likes(request, page.object_list, query_set.acount())
+    return await sync_to_async(render)(request, 'query_list.html', {'page': page, 'count': count})
+
+async def related_list_async(request):
+    page = await apaginate(request, related_list_products())
+    await attach_tags_and_likes(request, page.object_list)
+    return await sync_to_async(render)(request, 'related.html', {'page': page, 'user': 'Amik'})
+
+async def product_async(request, pk):
+    try:
+        product = await related_list_products().aget(pk=pk)
+    except Product.DoesNotExist:
+        raise Http404('No such product')
+    await attach_tags_and_likes(request, [product])
+    return JsonResponse({
+        **product_json(product),
+        'collection_title': product.collection.title,
+        'tags': [tag.label for tag in product.tags],
+        'like_count': product.like_count,
+        'liked': product.liked,
+    })
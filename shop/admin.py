@@ -1,8 +1,9 @@
 from django.contrib import admin, messages
-from django.db.models.aggregates import Count
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
 from django.urls import reverse
 from django.utils.html import format_html, urlencode
-from . import models
+from . import autocomplete, models, search
+from .pagination import EstimatedCountPaginator, cached_count
 
 
 # Register your models here normally by
@@ -14,8 +15,9 @@ class InventoryFilter(admin.SimpleListFilter):
     parameter_name = 'inventory'
 
     def lookups(self,request,model_admin):
+        low = cached_count(model_admin.get_queryset(request).filter(inventory__lt = 20))
         return [
-            ('<20', 'Low')
+            ('<20', f'Low ({low})')
         ]
     
     def queryset(self,request,queryset):
@@ -24,16 +26,71 @@ class InventoryFilter(admin.SimpleListFilter):
 
 
 
+# Product counts next to each collection, straight from the stored Collection.product_count
+class CollectionCountFilter(admin.RelatedFieldListFilter):
+    def field_choices(self, field, request, model_admin):
+        return [
+            (collection.pk, f'{collection} ({collection.product_count})')
+            for collection in models.Collection.objects.all()
+        ]
+
+
+# Date ranges with cached counts (see pagination.cached_count)
+class CachedCountDateFilter(admin.DateFieldListFilter):
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        query_set = model_admin.get_queryset(request)
+        links = []
+        for title, date_params in self.links:
+            if date_params:
+                title = f'{title} ({cached_count(query_set.filter(**date_params))})'
+            links.append((title, date_params))
+        self.links = tuple(links)
+
+
+# Full text search for the admin search box. search_fields would turn into LIKE '%term%'
+# scans, this goes through the FTS5 index (see shop.search) and lists the best matches first
+class RankedSearchChangeList(ChangeList):
+    def get_ordering(self, request, queryset):
+        if self.query and ORDER_VAR not in self.params and 'search_rank' in queryset.query.annotations:
+            return ['search_rank', '-pk']
+        return super().get_ordering(request, queryset)
+
+
+class RankedSearchMixin:
+    # Autocomplete widgets pointing at this model search the in-memory prefix index instead
+    autocomplete_index = None
+    autocomplete_limit = 100
+
+    def get_changelist(self, request, **kwargs):
+        return RankedSearchChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        if self.autocomplete_index is not None and request.path == reverse('admin:autocomplete'):
+            ids = self.autocomplete_index.search(search_term, self.autocomplete_limit)
+            if ids is not None:
+                return queryset.filter(pk__in=ids), False
+        return search.search(queryset, search_term), False
+
+
 # The Admin portal class
 @admin.register(models.Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(RankedSearchMixin, admin.ModelAdmin):
     actions = ['clear_inventory']
-    list_display = ['title', 'price', 'Inventory_Status', 'collection', 'collection_id']
+    list_display = ['title', 'price', 'effective_price', 'Inventory_Status', 'collection', 'collection_id']
     list_editable = ['price']
     # similar to select_related, just in admin panel
     list_select_related = ['collection']
-    list_filter = ['collection', 'last_update', InventoryFilter]
+    list_filter = [
+        ('collection', CollectionCountFilter), ('last_update', CachedCountDateFilter), InventoryFilter
+    ]
     search_fields = ['title']
+    autocomplete_index = autocomplete.products
+    # COUNT(*) on every changelist view is most of the page time on big tables
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     # We cannot directly access the collection id as Collection will return it's string representation 
     # Which is title in our case, so we have to define an seperate method
@@ -58,11 +115,14 @@ class ProductAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Customer)
-class CustomerAdmin(admin.ModelAdmin):
+class CustomerAdmin(RankedSearchMixin, admin.ModelAdmin):
     list_display = ['first_name', 'last_name', 'membership']
     list_editable = ['membership']
     ordering = ['first_name', 'last_name']
-    search_fields = ['first_name', 'last_name']
+    search_fields = ['first_name', 'last_name', 'email']
+    autocomplete_index = autocomplete.customers
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     # We can use various look ups as well
     # search_fields = ['first_name__startswith', 'last_name__startswith'] # Case sensitive
     # search_fields = ['first_name__istartswith', 'last_name__istartswith'] # Case insensitive
@@ -85,7 +145,11 @@ class OrderAdmin(admin.ModelAdmin):
     list_select_related = ['customer']
     inlines = [OrderItemsInline]
     list_display = ['id', 'customer_name','placed_at','payment_status' ]
+    # Kept in step with the items by shop.signals
+    readonly_fields = ['total']
     ordering = ['placed_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
 
     @admin.display(ordering='customer.first_name') # for sorting order in Admin Panel
@@ -95,17 +159,44 @@ class OrderAdmin(admin.ModelAdmin):
     
 
 
-# The collection admin page setting to showcase how to 
-# Over write the Basic Query Set 
+# Archived orders are history, browsable but not editable (see shop.archive)
+class ArchivedOrderItemsInline(admin.TabularInline):
+    model = models.ArchivedOrderItems
+    fields = ['products', 'quantity', 'unitPrice']
+    readonly_fields = fields
+    can_delete = False
+    extra = 0
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(models.ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_select_related = ['customer']
+    inlines = [ArchivedOrderItemsInline]
+    list_display = ['id', 'customer', 'placed_at', 'payment_status', 'total']
+    ordering = ['-placed_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+# The collection admin page setting
 @admin.register(models.Collection)
 class CollectionAdmin(admin.ModelAdmin):
     list_display = ['title', 'product_count']  
-    # but product_count is not a defined feild inside collection, so we need to define that as well
+    # product_count is a stored column on Collection, this wraps it in a link to the products
     @admin.display(ordering = 'product_count')
     def product_count(self,collection):
-        # return collection.product_count 
-        # but product_count is not defined inside collection, so we need to define that as well
-
         # The url redirection implementation
         url = reverse('admin:shop_product_changelist')
         
@@ -120,9 +211,5 @@ class CollectionAdmin(admin.ModelAdmin):
         link = format_html('<a href={} >{}</a>',url,collection.product_count)
         return link
 
-    def get_queryset(self, request):
-        # return super().get_queryset(request) # This is the default implementation
-        # Over-writing it 
-        return super().get_queryset(request).annotate(
-            product_count = Count('product')
-        )
+    # get_queryset used to annotate Count('product') here, which joined and grouped the whole
+    # product table on every page load. Reading the stored column needs neither.
@@ -0,0 +1,80 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .cache import invalidate_model
+from .models import ArchivedOrder, ArchivedOrderItems, Order, OrderItems
+from .reports import refresh_sales_rollups
+
+# Hot / cold split of the orders. Old orders and their items are copied into ArchivedOrder /
+# ArchivedOrderItems and deleted from the hot tables one batch per transaction, so the admin,
+# the reports and checkout only ever touch recent orders. The copies and deletes are plain SQL
+# statements: going through model instances was most of the time on big tables.
+
+ARCHIVE_BATCH_SIZE = 1000
+
+ORDER_FIELDS = ['id', 'placed_at', 'payment_status', 'customer_id', 'total']
+ITEM_FIELDS = ['id', 'order_id', 'products_id', 'quantity', 'unitPrice']
+
+
+def archive_cutoff(days=None):
+    # Start of the day `days` (ORDER_ARCHIVE_AFTER_DAYS by default) ago. Whole days only, so
+    # no day's sales rollup ends up half in the archive.
+    days = settings.ORDER_ARCHIVE_AFTER_DAYS if days is None else days
+    day = timezone.localdate() - timedelta(days=days)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def archive_orders(cutoff, batch_size=ARCHIVE_BATCH_SIZE):
+    # Moves the orders placed before cutoff, returns how many. The rollups are brought up to
+    # date first: archived days keep the rows they have, see refresh_sales_rollups.
+    refresh_sales_rollups()
+    moved = 0
+    while True:
+        with transaction.atomic():
+            ids = list(Order.objects.filter(placed_at__lt=cutoff).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            copy_rows(Order.objects.filter(pk__in=ids), ArchivedOrder, ORDER_FIELDS)
+            copy_rows(OrderItems.objects.filter(order_id__in=ids), ArchivedOrderItems, ITEM_FIELDS)
+            # Straight DELETEs: the OrderItems delete signals would recount the totals and
+            # rewind the rollups of orders that are only moving
+            delete_rows(OrderItems, 'order_id', ids)
+            delete_rows(Order, 'id', ids)
+        moved += len(ids)
+    if moved:
+        invalidate_model(OrderItems)
+    return moved
+
+
+def copy_rows(query_set, model, fields):
+    # INSERT ... SELECT with the SELECT compiled from the queryset, the rows never leave the database
+    using = router.db_for_write(model)
+    connection = connections[using]
+    select, params = query_set.order_by().values_list(*fields).query.get_compiler(using).as_sql()
+    columns = ', '.join(connection.ops.quote_name(model._meta.get_field(field).column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {connection.ops.quote_name(model._meta.db_table)} ({columns}) {select}', params)
+
+
+def delete_rows(model, column, ids):
+    connection = connections[router.db_for_write(model)]
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)} WHERE {column} IN ({placeholders})', ids
+        )
+
+
+def lookup_order(order_id):
+    # Read-through for historical lookups: the hot table first, then the archive.
+    # Returns (order, items, archived) or None.
+    order = Order.objects.select_related('customer').filter(pk=order_id).first()
+    if order is not None:
+        return order, list(order.orderitems_set.order_by('id')), False
+    order = ArchivedOrder.objects.select_related('customer').filter(pk=order_id).first()
+    if order is not None:
+        return order, list(order.archivedorderitems_set.order_by('id')), True
+    return None
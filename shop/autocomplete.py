@@ -0,0 +1,156 @@
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import connection
+
+from .models import Customer, Product
+
+# In-process sorted prefix indexes for the admin autocomplete widgets. Every searchable word
+# maps to a sorted (word, id) list, so a lookup is one bisect plus a short walk instead of a
+# LIKE query per keystroke. Saves and deletes in this process update it straight away (see
+# shop.signals); changes made by other processes show up after the periodic rebuild.
+
+# Entries looked at per search at most, so a one letter term can't walk the whole index
+MAX_SCAN = 2000
+
+
+def max_age():
+    # Seconds before an index rebuilds itself in the background, None to never do it
+    return getattr(settings, 'AUTOCOMPLETE_INDEX_MAX_AGE', 15 * 60)
+
+
+class PrefixIndex:
+    def __init__(self, model, fields, order_by, words):
+        self.model = model
+        self.fields = fields
+        self.order_by = order_by
+        self.words = words
+        self._entries = []
+        self._keys = {}
+        self._labels = {}
+        self._built_at = None
+        self._rebuilding = False
+        self._lock = threading.RLock()
+
+    def _index_keys(self, row):
+        return sorted({word.lower() for word in self.words(row) if word})
+
+    def rebuild(self):
+        entries, keys, labels = [], {}, {}
+        query_set = self.model.objects.order_by(*self.order_by).values_list('id', *self.fields)
+        for row in query_set.iterator(chunk_size=10000):
+            obj_id, values = row[0], row[1:]
+            obj_keys = self._index_keys(values)
+            keys[obj_id] = obj_keys
+            labels[obj_id] = self.label(values)
+            entries.extend((key, obj_id) for key in obj_keys)
+        # The first key of every row arrives in index order already, timsort makes short work of it
+        entries.sort()
+        with self._lock:
+            self._entries, self._keys, self._labels = entries, keys, labels
+            self._built_at = time.monotonic()
+            self._rebuilding = False
+
+    def _rebuild_in_background(self):
+        def run():
+            try:
+                self.rebuild()
+            finally:
+                self._rebuilding = False
+                connection.close()
+        self._rebuilding = True
+        threading.Thread(target=run, daemon=True).start()
+
+    def _ensure_built(self):
+        # False until the first build is done, which happens in the background as well:
+        # on a million rows it takes several seconds that no request should have to wait for
+        with self._lock:
+            stale = self._built_at is None or (
+                max_age() is not None and time.monotonic() - self._built_at > max_age()
+            )
+            if stale and not self._rebuilding:
+                self._rebuild_in_background()
+            return self._built_at is not None
+
+    def _range(self, word):
+        # Positions of the entries whose key starts with word
+        return bisect_left(self._entries, (word,)), bisect_left(self._entries, (word + '\uffff',))
+
+    def search(self, term, limit=20):
+        # Ids whose words start with every word of term, in key order. None while the index
+        # is still loading, callers fall back to the database then.
+        words = term.lower().split()
+        if not words:
+            return []
+        if not self._ensure_built():
+            return None
+        with self._lock:
+            # Walk the narrowest of the word ranges and check the other words against each id
+            start, end = min(
+                (self._range(word) for word in words), key=lambda bounds: bounds[1] - bounds[0]
+            )
+            ids = []
+            for key, obj_id in self._entries[start:min(end, start + MAX_SCAN)]:
+                obj_keys = self._keys.get(obj_id, ())
+                if obj_id not in ids and all(any(k.startswith(w) for k in obj_keys) for w in words):
+                    ids.append(obj_id)
+                    if len(ids) == limit:
+                        break
+            return ids
+
+    def label(self, values):
+        return ' '.join(str(value) for value in values)
+
+    def labels(self, ids):
+        with self._lock:
+            return [(obj_id, self._labels[obj_id]) for obj_id in ids if obj_id in self._labels]
+
+    def update(self, obj):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove(obj.pk)
+            values = tuple(getattr(obj, field) for field in self.fields)
+            obj_keys = self._index_keys(values)
+            self._keys[obj.pk] = obj_keys
+            self._labels[obj.pk] = self.label(values)
+            for key in obj_keys:
+                insort(self._entries, (key, obj.pk))
+
+    def remove(self, obj_id):
+        with self._lock:
+            self._remove(obj_id)
+
+    def _remove(self, obj_id):
+        for key in self._keys.pop(obj_id, ()):
+            position = bisect_left(self._entries, (key, obj_id))
+            if position < len(self._entries) and self._entries[position] == (key, obj_id):
+                del self._entries[position]
+        self._labels.pop(obj_id, None)
+
+
+class CustomerIndex(PrefixIndex):
+    def label(self, values):
+        first_name, last_name, email = values
+        return f'{first_name} {last_name}'
+
+
+customers = CustomerIndex(
+    Customer,
+    fields=['first_name', 'last_name', 'email'],
+    # Reads the table in the order of the (last_name, first_name) index
+    order_by=['last_name', 'first_name'],
+    words=lambda values: values,
+)
+
+products = PrefixIndex(
+    Product,
+    fields=['title'],
+    order_by=['title'],
+    # The whole title plus each word in it, so 'ale' finds 'Beer - Alexander Kieths, Pale Ale'
+    words=lambda values: [values[0], *values[0].replace(',', ' ').split()],
+)
+
+INDEXES = {'customer': customers, 'product': products}
@@ -0,0 +1,81 @@
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Cached catalog responses. Every entry's key carries the current generation of each model
+# it was built from; a save/delete on one of those models bumps its generation (shop.signals),
+# so only the entries that depend on it stop being found while everything else keeps hitting.
+
+
+def get_cache():
+    return caches[getattr(settings, 'CATALOG_CACHE_ALIAS', 'default')]
+
+
+def generation_key(model):
+    return f'cachegen:{model._meta.label_lower}'
+
+
+def generations(models):
+    cache = get_cache()
+    keys = [generation_key(model) for model in models]
+    found = cache.get_many(keys)
+    return [found.get(key) or cache.get_or_set(key, time.time_ns, None) for key in keys]
+
+
+def invalidate_model(model):
+    get_cache().set(generation_key(model), time.time_ns(), None)
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+@contextmanager
+def single_flight(key):
+    # Concurrent misses on the same key queue up behind one lock, so the first request
+    # builds the response and the rest pick it up from the cache
+    with _flights_lock:
+        flight = _flights.setdefault(key, [threading.Lock(), 0])
+        flight[1] += 1
+    try:
+        with flight[0]:
+            yield
+    finally:
+        with _flights_lock:
+            flight[1] -= 1
+            if not flight[1]:
+                del _flights[key]
+
+
+def response_key(view, request, models):
+    raw = f'{request.get_full_path()}|{generations(models)}'
+    return f'response:{view.__module__}.{view.__qualname__}:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def cache_response(*models, timeout=None):
+    # @cache_response(Product, Collection) caches successful GET responses until one of
+    # the listed models changes (or the timeout, CATALOG_CACHE_TIMEOUT by default, runs out)
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            cache = get_cache()
+            key = response_key(view, request, models)
+            response = cache.get(key)
+            if response is not None:
+                return response
+            with single_flight(key):
+                response = cache.get(key)
+                if response is None:
+                    response = view(request, *args, **kwargs)
+                    if response.status_code == 200 and not response.streaming:
+                        cache.set(key, response, timeout or getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,186 @@
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Cart, CartItem
+from .services import EmptyCart, place_order
+
+# Write-behind cart store. Add-to-cart clicks only touch the cache; Cart / CartItem rows are
+# written in batches on checkout, once a cart has been idle for CART_IDLE_TIMEOUT seconds,
+# or by flush(). Carts are addressed by an opaque token and only get a Cart row on first flush.
+#
+# The set of carts waiting to be written is kept per process, like likes.counters, so the
+# periodic flush runs at the end of requests (see shop.signals) rather than from a command.
+
+_dirty = {}
+_lock = threading.Lock()
+_last_flush = 0.0
+
+
+def get_cache():
+    # A cache of its own (see CACHES in settings): the cache holds the only copy of a cart
+    # between flushes, so it must not share its room with entries that are fine to cull
+    return caches[getattr(settings, 'CART_CACHE_ALIAS', 'default')]
+
+
+def idle_timeout():
+    return getattr(settings, 'CART_IDLE_TIMEOUT', 30 * 60)
+
+
+def cache_key(token):
+    return f'cart:{token}'
+
+
+def _cached(token):
+    # None when the cart isn't cached (never used, checked out or evicted)
+    return get_cache().get(cache_key(token))
+
+
+def _load(token):
+    return _cached(token) or {'cart_id': None, 'items': {}}
+
+
+def _store(token, state):
+    # Cached a good while past the idle timeout so the flush always gets to it first
+    get_cache().set(cache_key(token), state, idle_timeout() * 4)
+
+
+def new_cart():
+    return uuid.uuid4().hex
+
+
+def get_items(token):
+    # {product_id: quantity}
+    return dict(_load(token)['items'])
+
+
+def _update(token, product_id, change):
+    with _lock:
+        state = _load(token)
+        quantity = change(state['items'].get(product_id, 0))
+        if quantity > 0:
+            state['items'][product_id] = quantity
+        else:
+            state['items'].pop(product_id, None)
+        _store(token, state)
+        _dirty[token] = time.monotonic()
+
+
+def set_quantity(token, product_id, quantity):
+    _update(token, product_id, lambda current: quantity)
+
+
+def add_item(token, product_id, quantity=1):
+    _update(token, product_id, lambda current: current + quantity)
+
+
+def remove_item(token, product_id):
+    set_quantity(token, product_id, 0)
+
+
+def flush(tokens=None):
+    # Writes the given carts (all dirty ones by default) with one bulk_create for new carts
+    # and one bulk_create / bulk_update / delete each for their items. Returns the number written.
+    # A cart missing from the cache is never written, whatever its rows hold stays as it was
+    # rather than being wiped by a state that was lost. A cart emptied by hand is written: its
+    # items go and its row stays. One that never had a row doesn't get one until it has items.
+    with _lock:
+        tokens = [token for token in (tokens if tokens is not None else list(_dirty)) if token in _dirty]
+        states = {}
+        for token in tokens:
+            del _dirty[token]
+            state = _cached(token)
+            if state and (state['items'] or state['cart_id']):
+                states[token] = state
+    if not states:
+        return 0
+
+    try:
+        _write(states)
+    except Exception:
+        # Nothing was written, put the carts back in line for the next flush
+        with _lock:
+            for token in states:
+                _dirty.setdefault(token, time.monotonic())
+        raise
+
+    with _lock:
+        for token, state in states.items():
+            cached = _cached(token)
+            if cached is not None:
+                cached['cart_id'] = state['cart_id']
+                _store(token, cached)
+    return len(states)
+
+
+@transaction.atomic
+def _write(states):
+    # Carts without a row yet, or whose row was pruned meanwhile, get a fresh one if they have items
+    alive = set(Cart.objects.\
+        filter(pk__in=[state['cart_id'] for state in states.values() if state['cart_id']]).\
+        values_list('id', flat=True))
+    new = {
+        token: Cart() for token, state in states.items()
+        if state['cart_id'] not in alive and state['items']
+    }
+    Cart.objects.bulk_create(new.values())
+    for token, cart in new.items():
+        states[token]['cart_id'] = cart.pk
+    Cart.objects.filter(pk__in=alive).update(updated_at=timezone.now())
+
+    existing = {
+        (item.cart_id, item.items_id): item
+        for item in CartItem.objects.filter(cart_id__in=[state['cart_id'] for state in states.values()])
+    }
+    created, updated, wanted = [], [], set()
+    for state in states.values():
+        for product_id, quantity in state['items'].items():
+            key = (state['cart_id'], product_id)
+            wanted.add(key)
+            item = existing.get(key)
+            if item is None:
+                created.append(CartItem(cart_id=key[0], items_id=product_id, quantity=quantity))
+            elif item.quantity != quantity:
+                item.quantity = quantity
+                updated.append(item)
+    CartItem.objects.bulk_create(created)
+    CartItem.objects.bulk_update(updated, ['quantity'])
+    removed = [item.pk for key, item in existing.items() if key not in wanted]
+    if removed:
+        CartItem.objects.filter(pk__in=removed).delete()
+
+
+def flush_idle(idle=None):
+    idle = idle_timeout() if idle is None else idle
+    cutoff = time.monotonic() - idle
+    with _lock:
+        tokens = [token for token, touched in _dirty.items() if touched <= cutoff]
+    return flush(tokens)
+
+
+def flush_periodically():
+    # Called at the end of every request, does the idle flush at most once a minute
+    global _last_flush
+    interval = getattr(settings, 'CART_FLUSH_INTERVAL', 60)
+    if time.monotonic() - _last_flush < interval:
+        return
+    _last_flush = time.monotonic()
+    flush_idle()
+
+
+def checkout(token, customer, **kwargs):
+    # Writes the cart and turns it into an order (see services.place_order)
+    with _lock:
+        _dirty.setdefault(token, time.monotonic())
+    flush([token])
+    state = _load(token)
+    if not state['items']:
+        raise EmptyCart(f'Cart {token} is empty')
+    order = place_order(Cart(pk=state['cart_id']), customer, **kwargs)
+    get_cache().delete(cache_key(token))
+    return order
@@ -0,0 +1,79 @@
+import hashlib
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.core.cache import cache
+from django.db.models import Case, Count, Max, OuterRef, Subquery, Sum, When
+
+from .models import Collection, OrderItems, Product
+
+# Product.last_update moves with every product save, but collection and promotion edits
+# don't touch it, so those bump this token instead (see shop.signals)
+CATALOG_VERSION_KEY = 'catalog:version'
+
+
+def catalog_version():
+    return cache.get_or_set(CATALOG_VERSION_KEY, time.time_ns, None)
+
+
+def bump_catalog_version():
+    # A fresh token rather than incr(), so an evicted key can never come back as an old value
+    cache.set(CATALOG_VERSION_KEY, time.time_ns(), None)
+
+
+def catalog_products(params):
+    # ?collection=<id>&price_min=<x>&price_max=<y>, raises ValueError on bad input.
+    # The price range is on what customers pay, promotions included
+    query_set = Product.objects.all()
+    try:
+        if params.get('collection'):
+            query_set = query_set.filter(collection_id=int(params['collection']))
+        if params.get('price_min'):
+            query_set = query_set.filter(effective_price__gte=Decimal(params['price_min']))
+        if params.get('price_max'):
+            query_set = query_set.filter(effective_price__lte=Decimal(params['price_max']))
+    except (InvalidOperation, ValueError):
+        raise ValueError('Invalid catalog filter')
+    return query_set
+
+
+def product_etag(query_set, *parts):
+    # Cheap validator for a filtered product list: newest last_update plus the row count
+    # (so deletes show up too) plus the catalog version. Anything else that shapes the
+    # response, like the page cursor, goes in parts.
+    stats = query_set.order_by().aggregate(last_update=Max('last_update'), count=Count('id'))
+    raw = f'{stats["last_update"]}|{stats["count"]}|{catalog_version()}|{"|".join(parts)}'
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def catalog_etag(request):
+    try:
+        query_set = catalog_products(request.GET)
+    except ValueError:
+        return None
+    return product_etag(query_set, request.GET.urlencode())
+
+
+def storefront_collections():
+    # Every collection with the product to show for it, in two queries whatever the number of
+    # collections: the featured product comes through select_related, and collections without
+    # one get the id of their best seller by units sold, looked up with in_bulk afterwards
+    best_seller = OrderItems.objects.\
+        filter(products__collection=OuterRef('pk')).\
+        order_by().\
+        values('products').\
+        annotate(sold=Sum('quantity')).\
+        order_by('-sold', 'products').\
+        values('products')[:1]
+    collections = list(
+        Collection.objects.
+        select_related('featured_products').
+        # CASE keeps the database from ranking sales for collections that have a featured product
+        annotate(best_seller_id=Case(When(featured_products__isnull=True, then=Subquery(best_seller))))
+    )
+    best_sellers = Product.objects.in_bulk(
+        {collection.best_seller_id for collection in collections if collection.best_seller_id}
+    )
+    for collection in collections:
+        collection.storefront_product = collection.featured_products or best_sellers.get(collection.best_seller_id)
+    return collections
@@ -0,0 +1,131 @@
+import csv
+import heapq
+import io
+import json
+import zlib
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+from django.utils import timezone
+
+from .models import ArchivedOrder, Order
+
+# Orders with their customer and items for finance, see `manage.py export_orders` and
+# /exports/orders/. One query joins the three tables and is read with .iterator() in chunks
+# as plain tuples, and every chunk is serialized and passed on before the next one is read.
+# Orders moved to the archive (see shop.archive) come from a second such query over the
+# archive tables, merged with the first by order id.
+
+EXPORT_CHUNK_SIZE = 2000
+
+CSV_COLUMNS = [
+    'order_id', 'placed_at', 'payment_status', 'total',
+    'customer_id', 'first_name', 'last_name', 'email',
+    'item_id', 'product_id', 'quantity', 'unit_price',
+]
+# The values_list fields behind CSV_COLUMNS, an order without items comes out once with None items
+FIELDS = [
+    'id', 'placed_at', 'payment_status', 'total',
+    'customer_id', 'customer__first_name', 'customer__last_name', 'customer__email',
+    'orderitems__id', 'orderitems__products_id', 'orderitems__quantity', 'orderitems__unitPrice',
+]
+ARCHIVED_FIELDS = [field.replace('orderitems__', 'archivedorderitems__') for field in FIELDS]
+
+
+def export_orders(start=None, end=None, payment_status=None, include_archived=True):
+    # ?start=2021-01-01&end=2021-01-31&status=C, all optional, both days inclusive.
+    # Returns the querysets to pass to export_chunks. Raises ValueError on bad input.
+    filters = {}
+    try:
+        if start:
+            filters['placed_at__gte'] = start_of_day(date.fromisoformat(start))
+        if end:
+            filters['placed_at__lt'] = start_of_day(date.fromisoformat(end) + timedelta(days=1))
+    except ValueError:
+        raise ValueError('start and end must be YYYY-MM-DD')
+    if payment_status:
+        if payment_status not in dict(Order.PAYMENT_STATUS):
+            raise ValueError('status must be one of ' + ', '.join(dict(Order.PAYMENT_STATUS)))
+        filters['payment_status'] = payment_status
+    query_sets = [Order.objects.filter(**filters).order_by('id', 'orderitems__id').values_list(*FIELDS)]
+    if include_archived:
+        query_sets.append(ArchivedOrder.objects.\
+            filter(**filters).\
+            order_by('id', 'archivedorderitems__id').\
+            values_list(*ARCHIVED_FIELDS))
+    return query_sets
+
+
+def start_of_day(day):
+    # A range on placed_at itself can use its index, placed_at__date can't
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def csv_chunks(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+    for chunk in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(row[:1] + (row[1].isoformat(),) + row[2:] for row in chunk)
+        yield buffer.getvalue()
+
+
+def ndjson_chunks(rows):
+    # One line per order with its items nested. An order's rows are consecutive, one can run
+    # over the end of a chunk, so the last order of every chunk waits for the next one.
+    order = None
+    for chunk in rows:
+        lines = []
+        for row in chunk:
+            if order is None or order['id'] != row[0]:
+                if order is not None:
+                    lines.append(json.dumps(order))
+                order = {
+                    'id': row[0],
+                    'placed_at': row[1].isoformat(),
+                    'payment_status': row[2],
+                    'total': str(row[3]),
+                    'customer': {'id': row[4], 'first_name': row[5], 'last_name': row[6], 'email': row[7]},
+                    'items': [],
+                }
+            if row[8] is not None:
+                order['items'].append(
+                    {'id': row[8], 'product': row[9], 'quantity': row[10], 'unit_price': str(row[11])}
+                )
+        yield ''.join(line + '\n' for line in lines)
+    if order is not None:
+        yield json.dumps(order) + '\n'
+
+
+FORMATS = {
+    # format: (serializer, content type, file extension)
+    'csv': (csv_chunks, 'text/csv', 'csv'),
+    'ndjson': (ndjson_chunks, 'application/x-ndjson', 'ndjson'),
+}
+
+
+def export_chunks(query_sets, format, chunk_size=EXPORT_CHUNK_SIZE):
+    # Text, one chunk per chunk_size rows of the joins. Each queryset is read in (order id,
+    # item id) order and they are merged in the same order, every order's rows stay together.
+    rows = heapq.merge(
+        *[query_set.iterator(chunk_size=chunk_size) for query_set in query_sets],
+        key=lambda row: (row[0], row[8] or 0),
+    )
+    return FORMATS[format][0](iter(lambda: list(islice(rows, chunk_size)), []))
+
+
+def encoded(chunks, gzip=False):
+    # UTF-8 bytes, optionally as one gzip stream compressed chunk by chunk
+    if not gzip:
+        for chunk in chunks:
+            yield chunk.encode()
+        return
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,71 @@
+# SQLite FTS5 indexes behind admin and product search (see shop.search). They are external
+# content tables, so they only store the index, and triggers keep them in step with every
+# insert / update / delete, bulk ones included.
+#
+# SQLite can't alter most columns in place, so a migration that does rebuilds the table under
+# a new name and drops its triggers with it. Such a migration ends with restore_triggers().
+SEARCH_INDEXES = [
+    ('shop_product', 'shop_product_fts', ['title', 'description']),
+    ('shop_customers', 'shop_customers_fts', ['first_name', 'last_name', 'email']),
+]
+
+
+def table_sql(table, index, columns):
+    return [
+        f"CREATE VIRTUAL TABLE {index} USING fts5({', '.join(columns)}, content='{table}', content_rowid='id')",
+    ]
+
+
+def trigger_sql(table, index, columns):
+    names = ', '.join(columns)
+    new = ', '.join(f'new.{column}' for column in columns)
+    old = ', '.join(f'old.{column}' for column in columns)
+    return drop_trigger_sql(table, index, columns) + [
+        f"CREATE TRIGGER {index}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {index}(rowid, {names}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER {index}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {index}({index}, rowid, {names}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER {index}_update AFTER UPDATE OF {names} ON {table} BEGIN "
+        f"INSERT INTO {index}({index}, rowid, {names}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {index}(rowid, {names}) VALUES (new.id, {new}); END",
+    ]
+
+
+def rebuild_sql(table, index, columns):
+    # Reads the whole content table again, catches up on any rows written without triggers
+    return [f"INSERT INTO {index}({index}) VALUES ('rebuild')"]
+
+
+def drop_trigger_sql(table, index, columns):
+    return [f'DROP TRIGGER IF EXISTS {index}_{event}' for event in ('insert', 'delete', 'update')]
+
+
+def drop_sql(table, index, columns):
+    return drop_trigger_sql(table, index, columns) + [f'DROP TABLE IF EXISTS {index}']
+
+
+def run(*builds, tables=None):
+    # A RunPython function executing the statements of builds for every index, or only for the
+    # indexes on tables
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for table, index, columns in SEARCH_INDEXES:
+            if tables is not None and table not in tables:
+                continue
+            for build in builds:
+                for statement in build(table, index, columns):
+                    schema_editor.execute(statement)
+    return operation
+
+
+def create_indexes():
+    return run(table_sql, trigger_sql, rebuild_sql)
+
+
+def drop_indexes():
+    return run(drop_sql)
+
+
+def restore_triggers(*tables):
+    return run(trigger_sql, rebuild_sql, tables=tables)
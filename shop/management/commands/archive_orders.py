@@ -0,0 +1,34 @@
+from datetime import date, datetime, time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from shop.archive import ARCHIVE_BATCH_SIZE, archive_cutoff, archive_orders
+from shop.pagination import refresh_table_statistics
+
+
+class Command(BaseCommand):
+    help = 'Move old orders and their items into the archive tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.ORDER_ARCHIVE_AFTER_DAYS,
+            help='Archive orders placed more than this many days ago',
+        )
+        parser.add_argument('--before', help='Archive orders placed before this day, YYYY-MM-DD (overrides --days)')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help='Orders per transaction')
+
+    def handle(self, *args, **options):
+        if options['before']:
+            try:
+                cutoff = timezone.make_aware(datetime.combine(date.fromisoformat(options['before']), time.min))
+            except ValueError:
+                raise CommandError('--before must be YYYY-MM-DD')
+        else:
+            cutoff = archive_cutoff(options['days'])
+        moved = archive_orders(cutoff, options['batch_size'])
+        if moved:
+            # The row count estimates of the admin changelists come from these statistics
+            refresh_table_statistics()
+        self.stdout.write(f'Archived {moved} orders placed before {cutoff:%Y-%m-%d}')
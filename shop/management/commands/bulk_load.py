@@ -0,0 +1,195 @@
+import csv
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from itertools import islice
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from shop.models import Collection, Customer, Order, OrderItems, Product
+from shop.pagination import refresh_table_statistics
+
+
+# The order matters: Product and Order PROTECT their parents, so the parents have to exist first.
+# Collection.featured_products points back at Product (the circular dependency), so that column
+# is held back while collections load and patched in once the products are there.
+LOAD_ORDER = [
+    ('collections', Collection),
+    ('products', Product),
+    ('customers', Customer),
+    ('orders', Order),
+    ('order_items', OrderItems),
+]
+
+
+def read_rows(path):
+    # Rows are yielded one at a time so a 10M line file never sits in memory
+    path = Path(path)
+    if path.suffix == '.csv':
+        with path.open(newline='') as file:
+            yield from csv.DictReader(file)
+    elif path.suffix in ('.ndjson', '.jsonl'):
+        with path.open() as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise CommandError(f'{path}: expected a .csv or .ndjson file')
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@contextmanager
+def preserve_timestamps(model):
+    # auto_now / auto_now_add would overwrite the loaded last_update and placed_at values
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+@contextmanager
+def deferred_indexes(models):
+    # Dropping the secondary indexes and rebuilding them once at the end is much cheaper than
+    # updating them row by row. UNIQUE constraints are auto indexes (sql IS NULL) and stay put.
+    if connection.vendor != 'sqlite' or not models:
+        yield
+        return
+    tables = [model._meta.db_table for model in models]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({', '.join(['%s'] * len(tables))})",
+            tables,
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX {connection.ops.quote_name(name)}')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for _, sql in indexes:
+                cursor.execute(sql)
+
+
+class Command(BaseCommand):
+    help = 'Stream CSV / NDJSON files into the shop tables with batched bulk_create.'
+
+    def add_arguments(self, parser):
+        for option, model in LOAD_ORDER:
+            parser.add_argument(
+                f'--{option.replace("_", "-")}', dest=option,
+                help=f'CSV or NDJSON file with {model._meta.verbose_name_plural} rows',
+            )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--keep-indexes', action='store_true',
+            help='Maintain indexes while loading instead of rebuilding them afterwards',
+        )
+
+    def handle(self, *args, **options):
+        plan = [(option, model, options[option]) for option, model in LOAD_ORDER if options[option]]
+        if not plan:
+            raise CommandError('Nothing to load, pass at least one of ' + ', '.join(
+                f'--{option.replace("_", "-")}' for option, _ in LOAD_ORDER
+            ))
+        self.batch_size = options['batch_size']
+
+        started = time.perf_counter()
+        total = 0
+        featured = []
+        indexes = deferred_indexes([]) if options['keep_indexes'] else \
+            deferred_indexes([model for _, model, _ in plan])
+        with indexes:
+            for option, model, path in plan:
+                count, elapsed = self.load(model, path, featured)
+                total += count
+                self.report(option.replace("_", " "), count, elapsed)
+            if featured:
+                self.link_featured_products(featured)
+            if options['order_items']:
+                # bulk_create skips the signals that keep Order.total in step
+                Order.objects.refresh_totals()
+        self.report('total (including index rebuild)', total, time.perf_counter() - started)
+        # The row count estimates of the admin changelists come from these statistics
+        started = time.perf_counter()
+        refresh_table_statistics()
+        self.stdout.write(f'analyze: {time.perf_counter() - started:.2f}s')
+
+    def load(self, model, path, featured):
+        fields = {}
+        for field in model._meta.concrete_fields:
+            fields[field.name] = fields[field.attname] = field
+        auto_fields = [
+            field for field in model._meta.concrete_fields
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+        ]
+
+        started = time.perf_counter()
+        count = 0
+        with preserve_timestamps(model):
+            for batch in batched(read_rows(path), self.batch_size):
+                objs = []
+                for row in batch:
+                    count += 1
+                    obj = model(**self.convert(model, fields, auto_fields, row, count, path))
+                    if model is Collection and obj.featured_products_id is not None:
+                        featured.append((obj, obj.featured_products_id))
+                        obj.featured_products_id = None
+                    objs.append(obj)
+                with transaction.atomic():
+                    model.objects.bulk_create(objs)
+        return count, time.perf_counter() - started
+
+    def convert(self, model, fields, auto_fields, row, line, path):
+        values = {}
+        for key, value in row.items():
+            field = fields.get(key)
+            if field is None:
+                raise CommandError(f'{path}: {model.__name__} has no field {key!r}')
+            if value == '' and field.null:
+                value = None
+            elif value is not None:
+                try:
+                    value = field.to_python(value)
+                except ValidationError as error:
+                    raise CommandError(f'{path}, row {line}: {key}: {" ".join(error.messages)}')
+            if isinstance(value, datetime) and timezone.is_naive(value):
+                value = timezone.make_aware(value, dt_timezone.utc)
+            values[field.attname] = value
+        for field in auto_fields:
+            values.setdefault(field.attname, timezone.now())
+        return values
+
+    def link_featured_products(self, featured):
+        started = time.perf_counter()
+        for batch in batched(featured, self.batch_size):
+            for collection, product_id in batch:
+                collection.featured_products_id = product_id
+            with transaction.atomic():
+                Collection.objects.bulk_update(
+                    [collection for collection, _ in batch], ['featured_products']
+                )
+        self.report('featured products', len(featured), time.perf_counter() - started)
+
+    def report(self, label, count, elapsed):
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(f'{label}: {count} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)')
@@ -0,0 +1,43 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from shop.exports import EXPORT_CHUNK_SIZE, FORMATS, encoded, export_chunks, export_orders
+
+
+class Command(BaseCommand):
+    help = 'Stream orders with their customer and items out as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--gzip', action='store_true', help='Compress the output')
+        parser.add_argument('--start', help='First day of placed_at, YYYY-MM-DD')
+        parser.add_argument('--end', help='Last day of placed_at, YYYY-MM-DD')
+        parser.add_argument('--status', help='Only this payment status (C, P or F)')
+        parser.add_argument(
+            '--skip-archived', action='store_true', help='Leave out the orders moved to the archive',
+        )
+        parser.add_argument('--output', help='File to write, standard output by default')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            query_sets = export_orders(
+                options['start'], options['end'], options['status'], include_archived=not options['skip_archived']
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        started = time.perf_counter()
+        chunks = encoded(export_chunks(query_sets, options['format'], options['chunk_size']), options['gzip'])
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        written = 0
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if options['output']:
+                output.close()
+        self.stderr.write(f'Wrote {written} bytes in {time.perf_counter() - started:.1f}s')
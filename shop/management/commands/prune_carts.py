@@ -0,0 +1,36 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from shop.models import Cart, CartItem
+
+
+class Command(BaseCommand):
+    help = 'Delete carts nobody has touched for a while, a chunk at a time.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help='Delete carts idle for this many days')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--pause', type=float, default=0.05,
+                            help='Seconds to sleep between chunks so other writers get the lock')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        total = 0
+        # Short transactions, each holding the write lock for one chunk only
+        while True:
+            ids = list(Cart.objects.
+                filter(updated_at__lt=cutoff).
+                order_by('id').
+                values_list('id', flat=True)[:options['chunk_size']])
+            if not ids:
+                break
+            with transaction.atomic():
+                CartItem.objects.filter(cart_id__in=ids).delete()
+                Cart.objects.filter(id__in=ids).delete()
+            total += len(ids)
+            time.sleep(options['pause'])
+        self.stdout.write(f'Deleted {total} abandoned carts')
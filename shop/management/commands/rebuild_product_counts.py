@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from shop.models import Collection
+
+
+class Command(BaseCommand):
+    help = 'Recount Collection.product_count from the product table.'
+
+    def handle(self, *args, **options):
+        updated = Collection.objects.refresh_product_counts()
+        self.stdout.write(f'Recounted products for {updated} collections')
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from shop.cache import invalidate_model
+from shop.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Recompute Product.effective_price from the promotions.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        updated = Product.objects.refresh_effective_prices(batch_size=options['batch_size'])
+        invalidate_model(Product)
+        self.stdout.write(f'Repriced {updated} products')
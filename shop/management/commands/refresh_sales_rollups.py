@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from shop.reports import refresh_sales_rollups
+
+
+class Command(BaseCommand):
+    help = 'Bring the daily sales rollups up to date from the last high-water mark.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Recount every day from scratch')
+
+    def handle(self, *args, **options):
+        start = refresh_sales_rollups(full=options['full'])
+        self.stdout.write(f'Sales rollups refreshed from {start or "the beginning"}')
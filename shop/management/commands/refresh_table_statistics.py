@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from shop.pagination import refresh_table_statistics
+
+
+class Command(BaseCommand):
+    help = 'Run ANALYZE so the planner and the admin row count estimates see the current tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        refresh_table_statistics(options['database'])
+        self.stdout.write(f'Analyzed {options["database"]} in {time.perf_counter() - started:.1f}s')
@@ -0,0 +1,31 @@
+# Generated by Django 4.1.5 on 2026-10-18 04:02
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0005_rename_store_custo_last_na_e6a359_idx_shop_custom_last_na_5b83ef_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='collection',
+            options={'ordering': ['title']},
+        ),
+        migrations.AlterModelOptions(
+            name='product',
+            options={'ordering': ['title']},
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='price',
+            field=models.DecimalField(decimal_places=2, max_digits=6, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['title', 'id'], name='shop_produc_title_fe6c35_idx'),
+        ),
+    ]
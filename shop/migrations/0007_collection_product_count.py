@@ -0,0 +1,29 @@
+# Generated by Django 4.1.5 on 2026-10-18 04:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_products(apps, schema_editor):
+    Collection = apps.get_model('shop', 'Collection')
+    Product = apps.get_model('shop', 'Product')
+    counts = Product.objects.filter(collection=OuterRef('pk')).order_by().\
+        values('collection').annotate(count=Count('id')).values('count')
+    Collection.objects.update(product_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0006_product_title_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collection',
+            name='product_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_products, migrations.RunPython.noop),
+    ]
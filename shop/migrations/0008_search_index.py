@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from shop import fts
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0007_collection_product_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(fts.create_indexes(), fts.drop_indexes()),
+    ]
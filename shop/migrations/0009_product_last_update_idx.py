@@ -0,0 +1,17 @@
+# Generated by Django 4.1.5 on 2026-10-18 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0008_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['last_update'], name='shop_produc_last_up_506e84_idx'),
+        ),
+    ]
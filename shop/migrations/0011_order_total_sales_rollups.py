@@ -0,0 +1,74 @@
+# Generated by Django 4.1.5 on 2026-10-18 04:13
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def compute_totals(apps, schema_editor):
+    Order = apps.get_model('shop', 'Order')
+    OrderItems = apps.get_model('shop', 'OrderItems')
+    totals = OrderItems.objects.filter(order=OuterRef('pk')).order_by().values('order').\
+        annotate(total=Sum(F('quantity') * F('unitPrice'), output_field=DecimalField())).values('total')
+    Order.objects.update(total=Coalesce(Subquery(totals), 0, output_field=DecimalField()))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0010_cart_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCollectionSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('quantity', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyPaymentStatusSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('payment_status', models.CharField(choices=[('C', 'Complete'), ('P', 'Pending'), ('F', 'Failed')], max_length=1)),
+                ('orders', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RollupState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('high_water', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['placed_at'], name='shop_order_placed__5a6344_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailypaymentstatussales',
+            constraint=models.UniqueConstraint(fields=('day', 'payment_status'), name='unique_daily_payment_status_sales'),
+        ),
+        migrations.AddField(
+            model_name='dailycollectionsales',
+            name='collection',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='shop.collection'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailycollectionsales',
+            constraint=models.UniqueConstraint(fields=('day', 'collection'), name='unique_daily_collection_sales'),
+        ),
+        migrations.RunPython(compute_totals, migrations.RunPython.noop),
+    ]
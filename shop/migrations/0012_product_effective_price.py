@@ -0,0 +1,45 @@
+# Generated by Django 4.1.5 on 2026-10-18 09:02
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+from shop import fts
+
+
+def compute_effective_prices(apps, schema_editor):
+    Product = apps.get_model('shop', 'Product')
+    Product.objects.update(effective_price=F('price'))
+    # Only the products with promotions need the discount worked out
+    discounted = Product.objects.\
+        filter(promotions__isnull=False).\
+        order_by().\
+        annotate(best_discount=Max('promotions__discount')).\
+        values_list('pk', 'price', 'best_discount')
+    stale = []
+    for pk, price, best_discount in discounted:
+        discount = min(max(Decimal(str(best_discount)), Decimal(0)), Decimal(1))
+        stale.append(Product(pk=pk, effective_price=(price * (1 - discount)).quantize(Decimal('0.01'), ROUND_HALF_UP)))
+    Product.objects.bulk_update(stale, ['effective_price'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0011_order_total_sales_rollups'),
+    ]
+
+    # Adding a column rebuilds shop_product on SQLite, which drops its search index triggers.
+    # They are put back after the rebuild either way the migration runs.
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, fts.restore_triggers('shop_product')),
+        migrations.AddField(
+            model_name='product',
+            name='effective_price',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=6),
+            preserve_default=False,
+        ),
+        migrations.RunPython(compute_effective_prices, migrations.RunPython.noop),
+        migrations.RunPython(fts.restore_triggers('shop_product'), migrations.RunPython.noop),
+    ]
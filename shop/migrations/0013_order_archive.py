@@ -0,0 +1,38 @@
+# Generated by Django 4.1.5 on 2026-10-18 04:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0012_product_effective_price'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('placed_at', models.DateTimeField()),
+                ('payment_status', models.CharField(choices=[('C', 'Complete'), ('P', 'Pending'), ('F', 'Failed')], max_length=1)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='shop.customer')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedOrderItems',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('quantity', models.PositiveSmallIntegerField()),
+                ('unitPrice', models.DecimalField(decimal_places=2, max_digits=6)),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='shop.archivedorder')),
+                ('products', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='shop.product')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedorder',
+            index=models.Index(fields=['placed_at'], name='shop_archiv_placed__50ee82_idx'),
+        ),
+    ]
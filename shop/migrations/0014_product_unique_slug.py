@@ -0,0 +1,55 @@
+# Generated by Django 4.1.5 on 2026-10-18 10:31
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+from shop import fts
+
+
+def fill_slugs(apps, schema_editor):
+    # Every product had the placeholder '-'. Slugs set by hand stay unless they are repeated,
+    # the rest are made from the titles with a -<n> suffix where a title is taken already.
+    Product = apps.get_model('shop', 'Product')
+    rows = Product.objects.order_by('id').values_list('id', 'title', 'slug')
+    used, numbers, changes = set(), {}, []
+    for _, _, slug in rows.exclude(slug__in=['', '-']).iterator(chunk_size=2000):
+        used.add(slug)
+    kept = set()
+    for pk, title, slug in rows.iterator(chunk_size=2000):
+        if slug not in ('', '-') and slug not in kept:
+            kept.add(slug)
+            continue
+        base = slugify(title)[:40].strip('-') or 'product'
+        if base in used:
+            number = numbers.get(base, 1) + 1
+            while f'{base}-{number}' in used:
+                number += 1
+            numbers[base] = number
+            base = f'{base}-{number}'
+        used.add(base)
+        changes.append((base, pk))
+
+    table = schema_editor.quote_name(Product._meta.db_table)
+    with schema_editor.connection.cursor() as cursor:
+        for start in range(0, len(changes), 2000):
+            cursor.executemany(f'UPDATE {table} SET slug = %s WHERE id = %s', changes[start:start + 2000])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0013_order_archive'),
+    ]
+
+    # The unique constraint rebuilds shop_product on SQLite, which drops its search index
+    # triggers. They are put back after the rebuild either way the migration runs.
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, fts.restore_triggers('shop_product')),
+        migrations.RunPython(fill_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='product',
+            name='slug',
+            field=models.SlugField(blank=True, unique=True),
+        ),
+        migrations.RunPython(fts.restore_triggers('shop_product'), migrations.RunPython.noop),
+    ]
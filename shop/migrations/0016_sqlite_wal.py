@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from store.sqlite import is_read_only, set_journal_mode
+
+
+def enable_wal(apps, schema_editor):
+    # Readers and the writer no longer block each other. WAL sticks to the file, so this is
+    # the one place it is set (see store.sqlite)
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite' and not is_read_only(connection):
+        set_journal_mode(connection, 'wal')
+
+
+class Migration(migrations.Migration):
+    # SQLite can't change the journal mode inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('shop', '0015_order_total_not_editable'),
+    ]
+
+    operations = [
+        migrations.RunPython(enable_wal, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,45 @@
-from django.db import models
+from collections import Counter
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import Count, DecimalField, F, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.query import ModelIterable
+from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MinValueValidator
+from django.utils import timezone
+from django.utils.text import slugify
+
+from likes.models import LikeCount, Likes
+from tags.models import TaggedItem
 
 # Create your models here.
 
+class CollectionManager(models.Manager):
+    def adjust_product_counts(self, deltas):
+        # deltas is {collection_id: change}, applied with F() so concurrent writers add up
+        for collection_id, delta in deltas.items():
+            if collection_id is not None and delta:
+                self.filter(pk=collection_id).update(product_count=F('product_count') + delta)
+
+    def refresh_product_counts(self, collection_ids=None):
+        # Recount from the product table, for all collections or just the given ones
+        counts = Product.objects.\
+            filter(collection=OuterRef('pk')).\
+            order_by().\
+            values('collection').\
+            annotate(count=Count('id')).\
+            values('count')
+        query_set = self.all() if collection_ids is None else self.filter(pk__in=collection_ids)
+        return query_set.update(product_count=Coalesce(Subquery(counts), 0))
+
+
 # Defining Collection 
 class Collection(models.Model):
     title = models.CharField(max_length=255)
+    # Denormalized number of products, so the admin doesn't have to COUNT the product table.
+    # Kept in sync by shop.signals and ProductQuerySet, rebuilt by `manage.py rebuild_product_counts`
+    product_count = models.PositiveIntegerField(default=0, editable=False)
 
     # This is a circular dependency between collection and Product
     featured_products = models.ForeignKey('Product', on_delete = models.SET_NULL, null = True, related_name='+')
@@ -18,6 +52,9 @@ class Collection(models.Model):
     # To change column names in admin 
     def __str__(self) -> str:
         return self.title
+
+    objects = CollectionManager()
+
     # To change the oredering and stuff in the Admin panel 
     class Meta:
         ordering = ['title']
@@ -26,18 +63,247 @@ class Collection(models.Model):
 
 class Promotions(models.Model):
     description = models.CharField(max_length=255)
+    # The fraction taken off the price, 0.15 is 15% off
     discount = models.FloatField(default=0)
 
 
+def discounted_price(price, discount):
+    # What a product costs with the best of its promotions applied, to the cent
+    discount = min(max(Decimal(str(discount or 0)), Decimal(0)), Decimal(1))
+    return (Decimal(str(price)) * (1 - discount)).quantize(Decimal('0.01'), ROUND_HALF_UP)
+
+
+def products_changed():
+    # For writes that send no save signal (QuerySet.update(), the raw SQL effective prices):
+    # lets the cached catalog pages and their ETags go
+    from .cache import invalidate_model
+    from .catalog import bump_catalog_version
+    bump_catalog_version()
+    invalidate_model(Product)
+
+
+# Tags and Likes point at products through a GenericForeignKey, so there is no reverse relation
+# for prefetch_related to follow. These attach them to a page of products in a fixed number of queries.
+def attach_tags(products):
+    tagged = TaggedItem.objects.get_tags_for_many(Product, [product.id for product in products])
+    for product in products:
+        product.tags = [item.tag for item in tagged[product.id]]
+
+
+def attach_like_counts(products, user=None):
+    ids = [product.id for product in products]
+    counts = LikeCount.objects.like_counts_for(Product, ids)
+    liked = set()
+    if user is not None and user.is_authenticated:
+        liked = set(Likes.objects.filter(
+            user = user, content_type = ContentType.objects.get_for_model(Product), object_id__in = ids
+        ).values_list('object_id', flat=True))
+    for product in products:
+        product.like_count = counts[product.id]
+        product.liked = product.id in liked
+
+
+EFFECTIVE_PRICE_BATCH_SIZE = 2000
+# Product.slug is 50 characters, this leaves room for a -<n> suffix
+SLUG_BASE_LENGTH = 40
+SLUG_BATCH_SIZE = 2000
+# How many numbers a save tries when other saves keep taking its slug first
+SLUG_RETRIES = 10
+
+
+def slug_base(title):
+    return slugify(title)[:SLUG_BASE_LENGTH].strip('-') or 'product'
+
+
+def needs_slug(product):
+    # '-' is what every product had before slugs were generated
+    return product.slug in ('', '-', None)
+
+
+def next_slug(slug):
+    # milk -> milk-2, milk-2 -> milk-3
+    base, _, number = slug.rpartition('-')
+    if base and number.isdigit():
+        return f'{base}-{int(number) + 1}'
+    return f'{slug}-2'
+
+
+class ProductQuerySet(models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._with_tags = False
+        self._with_likes = False
+        self._likes_user = None
+
+    # Product.objects.with_tags().with_like_counts(request.user)
+    def with_tags(self):
+        clone = self._chain()
+        clone._with_tags = True
+        return clone
+
+    def with_like_counts(self, user=None):
+        clone = self._chain()
+        clone._with_likes = True
+        clone._likes_user = user
+        return clone
+
+    def refresh_effective_prices(self, batch_size=EFFECTIVE_PRICE_BATCH_SIZE):
+        # Recompute effective_price for the products in this queryset. Per batch one aggregate
+        # query finds every product's best discount, then only the prices that moved are written.
+        # The aggregate starts over from the ids, a filter on promotions here would narrow the MAX.
+        ids = self.order_by('pk').values_list('pk', flat=True)
+        using = router.db_for_write(Product)
+        changed = 0
+        batch = list(ids[:batch_size])
+        while batch:
+            rows = Product.objects.\
+                filter(pk__in=batch).\
+                order_by().\
+                annotate(best_discount=Max('promotions__discount')).\
+                values_list('pk', 'price', 'effective_price', 'best_discount')
+            stale = []
+            for pk, price, current, best_discount in rows:
+                price = discounted_price(price, best_discount)
+                if price != current:
+                    stale.append((price, pk))
+            if stale:
+                # One prepared UPDATE run per row, bulk_update's CASE WHEN gets slow on wide batches
+                with transaction.atomic(using=using, savepoint=False), connections[using].cursor() as cursor:
+                    cursor.executemany(
+                        f'UPDATE {Product._meta.db_table} SET effective_price = %s WHERE id = %s', stale
+                    )
+                changed += len(stale)
+            batch = list(ids.filter(pk__gt=batch[-1])[:batch_size])
+        if changed:
+            transaction.on_commit(products_changed, using=using)
+        return changed
+
+    def assign_slugs(self, objs):
+        # Gives objs unique slugs made from their titles, a second "Milk" becomes milk-2. One query
+        # finds the titles already taken and one per 100 of those the -<n> numbers in use.
+        groups = {}
+        for obj in objs:
+            groups.setdefault(slug_base(obj.title), []).append(obj)
+        others = Product.objects.exclude(pk__in=[obj.pk for obj in objs if obj.pk is not None])
+        taken = set(others.filter(slug__in=list(groups)).values_list('slug', flat=True))
+        crowded = [base for base, group in groups.items() if base in taken or len(group) > 1]
+        numbers = {}
+        for start in range(0, len(crowded), 100):
+            # base-... sorts between 'base-' and 'base.', a range the unique index can answer
+            ranges = Q()
+            for base in crowded[start:start + 100]:
+                ranges |= Q(slug__gt=f'{base}-', slug__lt=f'{base}.')
+            for slug in others.filter(ranges).values_list('slug', flat=True):
+                base, _, number = slug.rpartition('-')
+                if number.isdigit():
+                    numbers[base] = max(numbers.get(base, 1), int(number))
+
+        used = set()
+        for base, group in groups.items():
+            if base not in taken:
+                group[0].slug = base
+                used.add(base)
+        for base, group in groups.items():
+            number = numbers.get(base, 1)
+            for obj in group[0 if base in taken else 1:]:
+                number += 1
+                # Another title in this batch may slugify to base-<number> itself
+                while f'{base}-{number}' in used:
+                    number += 1
+                obj.slug = f'{base}-{number}'
+                used.add(obj.slug)
+
+    def _reslug(self, ids):
+        for start in range(0, len(ids), SLUG_BATCH_SIZE):
+            objs = list(Product.objects.filter(pk__in=ids[start:start + SLUG_BATCH_SIZE]).only('title', 'slug'))
+            self.assign_slugs(objs)
+            Product.objects.bulk_update(objs, ['slug'])
+
+    # Bulk operations skip the save / delete signals, so they keep Collection.product_count,
+    # effective_price and the slugs right themselves. (QuerySet.delete() does send post_delete for every product.)
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            # New products have no promotions yet
+            if obj.effective_price is None:
+                obj.effective_price = obj.price
+        self.assign_slugs([obj for obj in objs if needs_slug(obj)])
+        objs = super().bulk_create(objs, *args, **kwargs)
+        Collection.objects.adjust_product_counts(Counter(obj.collection_id for obj in objs))
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if 'title' in fields and 'slug' not in fields:
+            # The slug follows the title
+            self.assign_slugs(objs)
+            fields = [*fields, 'slug']
+        moves = 'collection' in fields or 'collection_id' in fields
+        if moves:
+            affected = set(self.filter(pk__in=[obj.pk for obj in objs]).values_list('collection_id', flat=True))
+        updated = super().bulk_update(objs, fields, *args, **kwargs)
+        if moves:
+            Collection.objects.refresh_product_counts(affected | {obj.collection_id for obj in objs})
+        if 'price' in fields:
+            Product.objects.filter(pk__in=[obj.pk for obj in objs]).refresh_effective_prices()
+        return updated
+
+    def update(self, **kwargs):
+        # update() skips auto_now, last_update has to move for the catalog ETags to change
+        kwargs.setdefault('last_update', timezone.now())
+        moves = 'collection' in kwargs or 'collection_id' in kwargs
+        reslug = 'title' in kwargs and 'slug' not in kwargs
+        # The update may change what this queryset matches, so remember the rows first
+        if moves:
+            affected = set(self.order_by().values_list('collection_id', flat=True).distinct())
+        if 'price' in kwargs or reslug:
+            ids = list(self.order_by().values_list('pk', flat=True))
+        updated = super().update(**kwargs)
+        if updated:
+            transaction.on_commit(products_changed, using=self.db)
+        if moves:
+            new = kwargs.get('collection_id', kwargs.get('collection'))
+            affected.add(new.pk if isinstance(new, Collection) else new)
+            Collection.objects.refresh_product_counts(affected)
+        if 'price' in kwargs:
+            for start in range(0, len(ids), EFFECTIVE_PRICE_BATCH_SIZE):
+                Product.objects.filter(pk__in=ids[start:start + EFFECTIVE_PRICE_BATCH_SIZE]).refresh_effective_prices()
+        if reslug:
+            self._reslug(ids)
+        return updated
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._with_tags = self._with_tags
+        clone._with_likes = self._with_likes
+        clone._likes_user = self._likes_user
+        return clone
+
+    def _fetch_all(self):
+        # Runs once per evaluation, .iterator() skips this just like it skips prefetch_related
+        fetched = self._result_cache is None
+        super()._fetch_all()
+        if fetched and self._result_cache and self._iterable_class is ModelIterable:
+            if self._with_tags:
+                attach_tags(self._result_cache)
+            if self._with_likes:
+                attach_like_counts(self._result_cache, self._likes_user)
+
+
 # Defining the Product class which will be used to create object
 class Product(models.Model):
     # By default Django creates an ID, to avoid this define a primary key as shown in next line 
     # sku = models.CharField(max_length= 10, primary_key = True)
     title = models.CharField(max_length=255)
     description = models.TextField()
-    slug = models.SlugField(default='-')
+    # Unique and made from the title (ProductQuerySet.assign_slugs) unless set by hand,
+    # /products/<slug>/ looks products up by it
+    slug = models.SlugField(unique=True, blank=True)
     price = models.DecimalField(max_digits=6, decimal_places=2, 
         validators=[MinValueValidator(1)]) # The min Value should be greater than or equal to 1
+    # price with the best promotion applied, what listings show and orders charge. Kept in sync by
+    # shop.signals and ProductQuerySet, rebuilt by `manage.py refresh_effective_prices`
+    effective_price = models.DecimalField(max_digits=6, decimal_places=2, editable=False)
     inventory = models.IntegerField()
     last_update = models.DateTimeField(auto_now=True) # To update everytime
     # use auto_now_add -> to only update when the object is created for the first time 
@@ -49,6 +315,31 @@ class Product(models.Model):
     promotions = models.ManyToManyField(Promotions, related_name="products")
     # In many-to-many relationship Django will create a filed in Promotions as well to store product set
     # This field name can be changed using `related_name`
+
+    objects = ProductQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember what the row was loaded with, so a save can tell it moved collection or was renamed
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_collection_id = instance.__dict__.get('collection_id')
+        instance._loaded_title = instance.__dict__.get('title')
+        instance._loaded_slug = instance.__dict__.get('slug')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # assign_slugs (run by shop.signals) reads the slugs in use before the write, so another save
+        # can take the same one in between. The unique index turns that into an IntegrityError, then
+        # the next number is tried. The savepoint keeps an enclosing transaction usable.
+        self._slug_assigned = False
+        for attempt in range(SLUG_RETRIES):
+            try:
+                with transaction.atomic(using=kwargs.get('using') or router.db_for_write(Product, instance=self)):
+                    return super().save(*args, **kwargs)
+            except IntegrityError as error:
+                if not self._slug_assigned or 'slug' not in str(error) or attempt == SLUG_RETRIES - 1:
+                    raise
+                self.slug = next_slug(self.slug)
     
     # To change column names in admin 
     def __str__(self) -> str:
@@ -56,6 +347,12 @@ class Product(models.Model):
     # To change the oredering and stuff in the Admin panel 
     class Meta:
         ordering = ['title']
+        # Keyset pagination walks (title, id), see shop.pagination
+        indexes = [
+            models.Index(fields = ['title', 'id']),
+            # last_update filter in the admin and its facet counts
+            models.Index(fields = ['last_update']),
+        ]
 
 
 
@@ -94,6 +391,19 @@ class Customer(models.Model):
         ]
    
 
+class OrderManager(models.Manager):
+    def refresh_totals(self, order_ids=None):
+        # Recompute Order.total from the items, for every order or just the given ones
+        totals = OrderItems.objects.\
+            filter(order=OuterRef('pk')).\
+            order_by().\
+            values('order').\
+            annotate(total=Sum(F('quantity') * F('unitPrice'), output_field=DecimalField())).\
+            values('total')
+        query_set = self.all() if order_ids is None else self.filter(pk__in=order_ids)
+        return query_set.update(total=Coalesce(Subquery(totals), 0, output_field=DecimalField()))
+
+
 # The order class to define an order
 class Order(models.Model):
 
@@ -113,6 +423,17 @@ class Order(models.Model):
     # many to one relationship
     customer = models.ForeignKey(Customer, on_delete=models.PROTECT)
 
+    # Sum of quantity * unitPrice over the items, kept in sync by shop.signals
+    total = models.DecimalField(max_digits=10, decimal_places=2, default=0, editable=False)
+
+    objects = OrderManager()
+
+    class Meta:
+        # Admin ordering and the sales rollups high-water mark both go by placed_at
+        indexes = [
+            models.Index(fields = ['placed_at'])
+        ]
+
 # Defining an address class
 class Address(models.Model):
     street = models.CharField(max_length=255)
@@ -134,6 +455,8 @@ class Address(models.Model):
 
 class Cart(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
+    # Last time the cart was written, `manage.py prune_carts` removes the ones left behind
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
 
 class OrderItems(models.Model):
@@ -147,3 +470,57 @@ class CartItem(models.Model):
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE)
     quantity = models.PositiveSmallIntegerField()
 
+
+# Sales rollups, refreshed incrementally by `manage.py refresh_sales_rollups` (see shop.reports)
+class DailyCollectionSales(models.Model):
+    day = models.DateField()
+    collection = models.ForeignKey(Collection, on_delete=models.CASCADE)
+    quantity = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields = ['day', 'collection'], name = 'unique_daily_collection_sales')
+        ]
+
+
+class DailyPaymentStatusSales(models.Model):
+    day = models.DateField()
+    payment_status = models.CharField(max_length=1, choices = Order.PAYMENT_STATUS)
+    orders = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields = ['day', 'payment_status'], name = 'unique_daily_payment_status_sales')
+        ]
+
+
+# How far a rollup has got: orders placed before high_water (by day) are already counted
+class RollupState(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+    high_water = models.DateTimeField(null=True)
+
+
+# Cold storage for orders older than ORDER_ARCHIVE_AFTER_DAYS, moved here with their items by
+# `manage.py archive_orders` (see shop.archive). Same columns and the same ids as Order and
+# OrderItems, and the same PROTECT on customers and products.
+class ArchivedOrder(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    placed_at = models.DateTimeField()
+    payment_status = models.CharField(max_length=1, choices = Order.PAYMENT_STATUS)
+    customer = models.ForeignKey(Customer, on_delete=models.PROTECT)
+    total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields = ['placed_at'])
+        ]
+
+
+class ArchivedOrderItems(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    order = models.ForeignKey(ArchivedOrder, on_delete=models.CASCADE)
+    products = models.ForeignKey(Product, on_delete=models.PROTECT)
+    quantity = models.PositiveSmallIntegerField()
+    unitPrice = models.DecimalField(max_digits=6, decimal_places=2)
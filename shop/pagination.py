@@ -0,0 +1,223 @@
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connections
+from django.db.models import Max, Q
+from django.utils.functional import cached_property
+
+# How long a COUNT(*) result may be served from the cache
+COUNT_CACHE_TIMEOUT = 60
+# Tables smaller than this are counted, COUNT(*) on them is cheap and never stale
+ESTIMATE_MIN_ROWS = 100_000
+
+logger = logging.getLogger(__name__)
+
+
+# Keyset (cursor) pagination: instead of OFFSET n, every page asks for the rows that sort after
+# the last row of the previous page, e.g. WHERE title > 'x' OR (title = 'x' AND id > 7).
+# With an index on the ordering columns page 10,000 costs the same as page one.
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    # Matches Product.Meta.ordering, with id as the tie breaker so the key is unique
+    default_ordering = ('title', 'id')
+
+    def __init__(self, queryset, per_page, ordering=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering or self.default_ordering)
+        self.fields = [name.lstrip('-') for name in self.ordering]
+
+    def page(self, cursor=None):
+        queryset, forward, first = self._page_queryset(cursor)
+        return self._page(list(queryset), forward, first)
+
+    async def apage(self, cursor=None):
+        # page() for async views
+        queryset, forward, first = self._page_queryset(cursor)
+        return self._page([obj async for obj in queryset.aiterator()], forward, first)
+
+    def _page_queryset(self, cursor):
+        # One row more than the page, to know whether there is another one
+        if cursor is None:
+            return self.queryset.order_by(*self.ordering)[:self.per_page + 1], True, True
+        values, forward = self.decode_cursor(cursor)
+        queryset = self.queryset.filter(self._after(values, forward))
+        ordering = self.ordering if forward else [self._flip(name) for name in self.ordering]
+        return queryset.order_by(*ordering)[:self.per_page + 1], forward, False
+
+    def _page(self, rows, forward, first=False):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not forward:
+            rows.reverse()
+        if not rows:
+            return KeysetPage(rows)
+
+        # Going forward there is always a way back (unless this is the first page), and
+        # going backwards there is always a way forward, the extra row answers the other side
+        next_cursor = self.encode_cursor(rows[-1], forward=True) if has_more or not forward else None
+        previous_cursor = None
+        if (forward and not first) or (not forward and has_more):
+            previous_cursor = self.encode_cursor(rows[0], forward=False)
+        return KeysetPage(rows, next_cursor, previous_cursor)
+
+    def _after(self, values, forward):
+        # (a, b) > (x, y)  ==  a > x OR (a = x AND b > y), spelled out for any number of columns
+        condition = Q()
+        for position, name in enumerate(self.ordering):
+            descending = name.startswith('-') == forward
+            lookup = 'lt' if descending else 'gt'
+            field = self.fields[position]
+            clause = Q(**{f'{field}__{lookup}': values[position]})
+            for previous, value in zip(self.fields[:position], values):
+                clause &= Q(**{previous: value})
+            condition |= clause
+        return condition
+
+    @staticmethod
+    def _flip(name):
+        return name[1:] if name.startswith('-') else '-' + name
+
+    def encode_cursor(self, obj, forward=True):
+        values = [getattr(obj, field) for field in self.fields]
+        payload = json.dumps({'k': values, 'f': forward}, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            values, forward = payload['k'], bool(payload['f'])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidPage('Invalid cursor')
+        if len(values) != len(self.fields):
+            raise InvalidPage('Invalid cursor')
+        model = self.queryset.model
+        try:
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except ValidationError:
+            raise InvalidPage('Invalid cursor')
+        return values, forward
+
+
+def cached_count(query_set, timeout=COUNT_CACHE_TIMEOUT):
+    # COUNT(*) for query_set, reused for `timeout` seconds by any query with the same SQL
+    sql, params = query_set.query.sql_with_params()
+    key = 'count:' + hashlib.md5(f'{query_set.db}|{sql}|{params}'.encode()).hexdigest()
+    count = cache.get(key)
+    if count is None:
+        count = query_set.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+def estimated_table_rows(model, using='default'):
+    # Row count from the planner statistics, None if the table was never analyzed
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == 'sqlite':
+        # ANALYZE fills sqlite_stat1 with a row per index (or one with idx NULL for a table
+        # without any), the first number of `stat` is the rows in the index. A partial index
+        # holds fewer than the table, so take the largest.
+        sql = 'SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = %s'
+    elif connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass AND reltuples >= 0'
+    else:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None or row[0] is None:
+        return None
+    return int(row[0])
+
+
+def estimated_count(query_set):
+    # Unfiltered big tables use the statistics, anything else a cached COUNT(*). The statistics
+    # are as of the last ANALYZE (see refresh_table_statistics): below ESTIMATE_MIN_ROWS a stale
+    # estimate could put the whole table on one page, and one above MAX(pk), which the primary
+    # key index answers at once, is certainly stale.
+    query = query_set.query
+    if not query.where and not query.distinct and not query.low_mark and query.high_mark is None:
+        estimate = estimated_table_rows(query_set.model, query_set.db)
+        if estimate is not None and estimate >= ESTIMATE_MIN_ROWS:
+            max_pk = query_set.order_by().aggregate(max_pk=Max('pk'))['max_pk']
+            if isinstance(max_pk, int) and estimate <= max_pk:
+                return estimate
+    return cached_count(query_set)
+
+
+def refresh_table_statistics(using='default'):
+    # ANALYZE for the planner and estimated_table_rows. Run by `manage.py refresh_table_statistics`,
+    # after bulk_load and archive_orders, and every TABLE_STATISTICS_INTERVAL by analyze_periodically
+    with connections[using].cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+_analyze_lock = threading.Lock()
+_last_analyze = time.monotonic()
+
+
+def analyze_periodically():
+    # Called at the end of every request (see shop.signals). ANALYZE reads every table, so it
+    # runs in a thread of its own instead of holding up the response.
+    global _last_analyze
+    interval = getattr(settings, 'TABLE_STATISTICS_INTERVAL', 6 * 60 * 60)
+    with _analyze_lock:
+        if interval is None or time.monotonic() - _last_analyze < interval:
+            return
+        _last_analyze = time.monotonic()
+
+    def run():
+        try:
+            refresh_table_statistics()
+        except DatabaseError:
+            logger.exception('ANALYZE failed')
+        finally:
+            connections['default'].close()
+    threading.Thread(target=run, daemon=True).start()
+
+
+# For admin changelists over big tables: page counts come from estimated_count instead of a
+# fresh COUNT(*) on every view. Use together with show_full_result_count = False.
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            return estimated_count(self.object_list)
+        return len(self.object_list)
@@ -0,0 +1,81 @@
+from datetime import datetime, time as day_start, timedelta
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import ArchivedOrder, DailyCollectionSales, DailyPaymentStatusSales, Order, OrderItems, RollupState
+
+SALES_ROLLUP = 'sales'
+
+
+def rewind_sales_rollup(placed_at):
+    # An order from an already rolled up day changed, recount from that day on the next refresh
+    RollupState.objects.\
+        filter(name=SALES_ROLLUP, high_water__gt=placed_at).\
+        update(high_water=placed_at)
+
+
+@transaction.atomic
+def refresh_sales_rollups(full=False):
+    # Recounts every day from the day of the high-water mark onwards (or every day that is not
+    # archived with full=True) and moves the mark up to the newest order. Returns the first day
+    # that was recounted.
+    state, _ = RollupState.objects.select_for_update().get_or_create(name=SALES_ROLLUP)
+    newest = Order.objects.aggregate(newest=Max('placed_at'))['newest']
+    if newest is None:
+        return None
+
+    start = None
+    if not full and state.high_water is not None:
+        start = timezone.make_aware(
+            datetime.combine(timezone.localdate(state.high_water), day_start.min)
+        )
+    # Archived days are final and their orders are gone from the hot tables (shop.archive),
+    # so even a full recount keeps their rows
+    archived = ArchivedOrder.objects.aggregate(newest=Max('placed_at'))['newest']
+    if archived is not None:
+        archive_end = timezone.make_aware(
+            datetime.combine(timezone.localdate(archived) + timedelta(days=1), day_start.min)
+        )
+        start = archive_end if start is None else max(start, archive_end)
+
+    orders = Order.objects.all()
+    items = OrderItems.objects.all()
+    collection_rows = DailyCollectionSales.objects.all()
+    status_rows = DailyPaymentStatusSales.objects.all()
+    if start is not None:
+        orders = orders.filter(placed_at__gte=start)
+        items = items.filter(order__placed_at__gte=start)
+        collection_rows = collection_rows.filter(day__gte=start.date())
+        status_rows = status_rows.filter(day__gte=start.date())
+    collection_rows.delete()
+    status_rows.delete()
+
+    by_collection = items.\
+        annotate(day=TruncDate('order__placed_at')).\
+        values('day', 'products__collection_id').\
+        annotate(
+            sold=Sum('quantity'),
+            revenue=Sum(F('quantity') * F('unitPrice'), output_field=DecimalField()),
+        ).\
+        order_by()
+    DailyCollectionSales.objects.bulk_create(
+        DailyCollectionSales(
+            day=row['day'], collection_id=row['products__collection_id'],
+            quantity=row['sold'], revenue=row['revenue'],
+        )
+        for row in by_collection
+    )
+
+    by_status = orders.\
+        annotate(day=TruncDate('placed_at')).\
+        values('day', 'payment_status').\
+        annotate(orders=Count('id'), revenue=Sum('total')).\
+        order_by()
+    DailyPaymentStatusSales.objects.bulk_create(DailyPaymentStatusSales(**row) for row in by_status)
+
+    state.high_water = newest
+    state.save()
+    return start.date() if start else None
@@ -0,0 +1,71 @@
+import re
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from .models import Customer, Product
+
+# Public search results are capped, nobody pages past the first few hundred matches
+SEARCH_LIMIT = 500
+# Without a cap (the admin), this many best matches are ranked and the rest follow them
+RANKED_MATCHES = 500
+
+SEARCH_INDEXES = {
+    Product: ('shop_product_fts', ['title', 'description']),
+    Customer: ('shop_customers_fts', ['first_name', 'last_name', 'email']),
+}
+
+
+def fts_query(term):
+    # Every word becomes a quoted prefix match, so user input can't inject FTS5 syntax
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', term))
+
+
+def search_ids(model, term, limit=SEARCH_LIMIT):
+    # Ids of the best matches, best first (FTS5 rank is bm25, lower is better)
+    index, _ = SEARCH_INDEXES[model]
+    query = fts_query(term)
+    if not query:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid FROM {index} WHERE {index} MATCH %s ORDER BY rank LIMIT %s', [query, limit]
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search(query_set, term, limit=None):
+    # Narrows query_set to the best limit matches, or to every match when limit is None,
+    # annotated with search_rank (0 is the best match)
+    model = query_set.model
+    if connection.vendor != 'sqlite':
+        # No FTS5 index outside SQLite, fall back to the LIKE scan the admin used to do
+        condition = Q()
+        for field in SEARCH_INDEXES[model][1]:
+            condition |= Q(**{f'{field}__icontains': term})
+        return query_set.filter(condition).annotate(search_rank=Value(0))
+
+    ids = search_ids(model, term, RANKED_MATCHES if limit is None else limit)
+    if not ids:
+        return query_set.none().annotate(search_rank=Value(0))
+    if limit is None:
+        index, _ = SEARCH_INDEXES[model]
+        query_set = query_set.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {index} WHERE {index} MATCH %s', [fts_query(term)])
+        )
+    else:
+        query_set = query_set.filter(pk__in=ids)
+    return query_set.annotate(search_rank=Case(
+        *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+        default=Value(len(ids)),
+        output_field=IntegerField(),
+    ))
+
+
+def search_products(term, limit=SEARCH_LIMIT):
+    return search(Product.objects.all(), term, limit).order_by('search_rank')
+
+
+def search_customers(term, limit=SEARCH_LIMIT):
+    return search(Customer.objects.all(), term, limit).order_by('search_rank')
@@ -0,0 +1,76 @@
+import random
+import time
+from collections import Counter
+
+from django.db import OperationalError, connection, transaction
+from django.db.models import F
+
+from .models import Cart, CartItem, Order, OrderItems, Product
+
+# SQLite reports lock contention between concurrent checkouts as "database is locked"
+# instead of waiting, the whole checkout is retried with a short random backoff for up to
+# this many seconds. A count of attempts runs out too soon under a burst of checkouts.
+CHECKOUT_RETRY_SECONDS = 20
+CHECKOUT_MAX_BACKOFF = 0.1
+
+
+class CheckoutError(Exception):
+    pass
+
+
+class EmptyCart(CheckoutError):
+    pass
+
+
+class InsufficientInventory(CheckoutError):
+    def __init__(self, product_id):
+        super().__init__(f'Not enough inventory for product {product_id}')
+        self.product_id = product_id
+
+
+def place_order(cart, customer, payment_status=Order.PENDING_STATUS):
+    # Turns a cart into an order in one transaction: reserves inventory, snapshots prices
+    # into OrderItems and deletes the cart. Raises InsufficientInventory rather than overselling.
+    if connection.in_atomic_block:
+        # Can't retry inside someone else's transaction, let them handle it
+        return _place_order(cart, customer, payment_status)
+    deadline = time.monotonic() + CHECKOUT_RETRY_SECONDS
+    attempt = 0
+    while True:
+        try:
+            return _place_order(cart, customer, payment_status)
+        except OperationalError as error:
+            if 'locked' not in str(error) or time.monotonic() >= deadline:
+                raise
+            time.sleep(random.uniform(0, min(0.005 * 2 ** attempt, CHECKOUT_MAX_BACKOFF)))
+            attempt += 1
+
+
+@transaction.atomic
+def _place_order(cart, customer, payment_status):
+    wanted = Counter()
+    for product_id, quantity in CartItem.objects.filter(cart=cart).values_list('items_id', 'quantity'):
+        wanted[product_id] += quantity
+    if not wanted:
+        raise EmptyCart(f'Cart {cart.pk} is empty')
+
+    # The conditional UPDATE is the reservation: it only matches while there is enough stock,
+    # so two checkouts racing for the last unit can't both win. Sorted to lock rows in one order.
+    for product_id, quantity in sorted(wanted.items()):
+        reserved = Product.objects.\
+            filter(pk=product_id, inventory__gte=quantity).\
+            update(inventory=F('inventory') - quantity)
+        if not reserved:
+            raise InsufficientInventory(product_id)
+
+    # Customers pay the promotional price, kept on the product by shop.signals
+    prices = dict(Product.objects.filter(pk__in=wanted).values_list('id', 'effective_price'))
+    # bulk_create skips the OrderItems signals, so the total is filled in here
+    total = sum(prices[product_id] * quantity for product_id, quantity in wanted.items())
+    order = Order.objects.create(customer=customer, payment_status=payment_status, total=total)
+    OrderItems.objects.bulk_create([
+        OrderItems(order=order, products_id=product_id, quantity=quantity, unitPrice=prices[product_id])
+        for product_id, quantity in wanted.items()
+    ])
+    Cart.objects.filter(pk=cart.pk).delete()
+    return order
@@ -0,0 +1,162 @@
+from collections import Counter
+
+from django.core.signals import request_finished
+from django.db.models import Max
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import autocomplete, carts, pagination, slugs
+from .cache import invalidate_model
+from .catalog import bump_catalog_version
+from .models import Collection, Customer, Order, OrderItems, Product, Promotions, discounted_price, needs_slug
+from .reports import rewind_sales_rollup
+
+
+# Product.effective_price follows the promotions. These run before the cache invalidation below,
+# so nothing gets cached from the old prices.
+@receiver(pre_save, sender=Product)
+def price_saved_product(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    best_discount = None
+    if instance.pk is not None:
+        best_discount = Promotions.objects.filter(products=instance.pk).aggregate(best=Max('discount'))['best']
+    instance.effective_price = discounted_price(instance.price, best_discount)
+
+
+@receiver(post_save, sender=Promotions)
+def reprice_promotion_products(sender, instance, created, **kwargs):
+    # A new promotion has no products yet
+    if not created:
+        Product.objects.filter(promotions=instance).refresh_effective_prices()
+
+
+@receiver(pre_delete, sender=Promotions)
+def remember_promotion_products(sender, instance, **kwargs):
+    instance._product_ids = list(instance.products.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Promotions)
+def reprice_deleted_promotion_products(sender, instance, **kwargs):
+    Product.objects.filter(pk__in=instance._product_ids).refresh_effective_prices()
+
+
+@receiver(m2m_changed, sender=Product.promotions.through)
+def reprice_promotion_links(sender, instance, action, reverse, pk_set, **kwargs):
+    # reverse means promotion.products changed and pk_set holds product ids
+    if action == 'pre_clear' and reverse:
+        instance._product_ids = list(instance.products.values_list('pk', flat=True))
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        ids = pk_set if action != 'post_clear' else instance._product_ids
+        Product.objects.filter(pk__in=ids).refresh_effective_prices()
+    else:
+        Product.objects.filter(pk=instance.pk).refresh_effective_prices()
+        instance.refresh_from_db(fields=['effective_price'])
+
+
+@receiver([post_save, post_delete], sender=Collection)
+@receiver([post_save, post_delete], sender=Promotions)
+def collection_or_promotion_changed(sender, **kwargs):
+    bump_catalog_version()
+    invalidate_model(sender)
+
+
+@receiver([post_save, post_delete], sender=Product)
+def product_changed(sender, **kwargs):
+    invalidate_model(Product)
+
+
+@receiver(pre_save, sender=Product)
+def remember_product_collection(sender, instance, raw, **kwargs):
+    # Products built by hand (not loaded through from_db) need one lookup to learn the old collection
+    if instance.pk is not None and not hasattr(instance, '_loaded_collection_id') and not raw:
+        instance._loaded_collection_id = Product.objects.\
+            filter(pk=instance.pk).values_list('collection_id', flat=True).first()
+
+
+@receiver(post_save, sender=Product)
+def count_saved_product(sender, instance, created, **kwargs):
+    previous = None if created else getattr(instance, '_loaded_collection_id', None)
+    if previous != instance.collection_id:
+        Collection.objects.adjust_product_counts(Counter({instance.collection_id: 1, previous: -1}))
+    instance._loaded_collection_id = instance.collection_id
+
+
+@receiver(post_delete, sender=Product)
+def count_deleted_product(sender, instance, **kwargs):
+    Collection.objects.adjust_product_counts({instance.collection_id: -1})
+
+
+@receiver(m2m_changed, sender=Product.promotions.through)
+def product_promotions_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_catalog_version()
+        invalidate_model(Product)
+        invalidate_model(Promotions)
+
+
+@receiver(request_finished)
+def flush_idle_carts(sender, **kwargs):
+    carts.flush_periodically()
+
+
+@receiver(request_finished)
+def refresh_table_statistics(sender, **kwargs):
+    pagination.analyze_periodically()
+
+
+@receiver([post_save, post_delete], sender=OrderItems)
+def order_items_changed(sender, instance, **kwargs):
+    Order.objects.refresh_totals([instance.order_id])
+    # The storefront falls back to best sellers
+    invalidate_model(OrderItems)
+    placed_at = Order.objects.filter(pk=instance.order_id).values_list('placed_at', flat=True).first()
+    if placed_at is not None:
+        rewind_sales_rollup(placed_at)
+
+
+@receiver(post_save, sender=Order)
+def order_changed(sender, instance, created, **kwargs):
+    # New orders are past the high-water mark anyway, edits to old ones (payment status) are not
+    if not created:
+        rewind_sales_rollup(instance.placed_at)
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_save, sender=Product)
+def index_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.INDEXES[sender._meta.model_name].update(instance)
+
+
+@receiver(post_delete, sender=Customer)
+@receiver(post_delete, sender=Product)
+def unindex_for_autocomplete(sender, instance, **kwargs):
+    autocomplete.INDEXES[sender._meta.model_name].remove(instance.pk)
+
+
+@receiver(pre_save, sender=Product)
+def slug_saved_product(sender, instance, raw, update_fields, **kwargs):
+    # New products get a slug from their title, and a renamed one follows its new title
+    # unless the slug was changed by hand in the same save
+    if raw or (update_fields is not None and 'title' not in update_fields):
+        return
+    renamed = getattr(instance, '_loaded_title', instance.title) != instance.title
+    slug_kept = getattr(instance, '_loaded_slug', instance.slug) == instance.slug
+    if needs_slug(instance) or (renamed and slug_kept):
+        Product.objects.assign_slugs([instance])
+        # Product.save may move a generated slug on, never one set by hand
+        instance._slug_assigned = True
+
+
+@receiver(post_save, sender=Product)
+def forget_product_slug(sender, instance, **kwargs):
+    slugs.cache.discard(getattr(instance, '_loaded_slug', None), instance.slug)
+    instance._loaded_title = instance.title
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_delete, sender=Product)
+def forget_deleted_product_slug(sender, instance, **kwargs):
+    slugs.cache.discard(instance.slug)
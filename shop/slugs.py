@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .models import Product
+
+# Slug -> product id for /products/<slug>/, so a hot product page is one primary key lookup.
+# A bounded LRU in this process: saves and deletes here drop the slugs they touch (see
+# shop.signals), and every hit is checked against the product it loads, so a slug changed by
+# another process or a bulk update is noticed and looked up again rather than served stale.
+
+
+def max_size():
+    return getattr(settings, 'PRODUCT_SLUG_CACHE_SIZE', 10000)
+
+
+class SlugCache:
+    def __init__(self):
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, slug):
+        with self._lock:
+            product_id = self._ids.get(slug)
+            if product_id is not None:
+                self._ids.move_to_end(slug)
+            return product_id
+
+    def put(self, slug, product_id):
+        with self._lock:
+            self._ids[slug] = product_id
+            self._ids.move_to_end(slug)
+            while len(self._ids) > max_size():
+                self._ids.popitem(last=False)
+
+    def discard(self, *slugs):
+        with self._lock:
+            for slug in slugs:
+                self._ids.pop(slug, None)
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+
+    def __len__(self):
+        return len(self._ids)
+
+
+cache = SlugCache()
+
+
+def product_for_slug(slug):
+    product_id = cache.get(slug)
+    if product_id is not None:
+        product = Product.objects.filter(pk=product_id).first()
+        if product is not None and product.slug == slug:
+            return product
+        cache.discard(slug)
+    product = Product.objects.filter(slug=slug).first()
+    if product is not None:
+        cache.put(slug, product.pk)
+    return product
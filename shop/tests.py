@@ -1,3 +1,945 @@
-from django.test import TestCase
+import base64
+import csv
+import gzip
+import io
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.core.paginator import InvalidPage
+from django.db import IntegrityError, connection, transaction
+from django.db.models import ProtectedError
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from likes import counters
+from likes.models import Likes
+from store.testing import QueryBudget, load_seed_data
+from tags.models import TaggedItem, Tags
+
+from . import archive, autocomplete, carts, search, slugs, views
+from .cache import cache_response, invalidate_model
+from .exports import export_chunks, export_orders
+from .models import (
+    ArchivedOrder, ArchivedOrderItems, Cart, CartItem, Collection, Customer, DailyCollectionSales,
+    DailyPaymentStatusSales, Order, OrderItems, Product, ProductQuerySet, Promotions,
+)
+from .pagination import EstimatedCountPaginator, KeysetPaginator, cached_count, estimated_table_rows
+from .reports import refresh_sales_rollups
+from .services import EmptyCart, InsufficientInventory, place_order
+
 
 # Create your tests here.
+class ProductGenericRelationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        product_type = ContentType.objects.get_for_model(Product)
+        cls.user = User.objects.create(username='shopper')
+        tags = Tags.objects.bulk_create([Tags(label='fresh'), Tags(label='sale')])
+        TaggedItem.objects.bulk_create(
+            TaggedItem(tag=tags[product_id % 2], content_type=product_type, object_id=product_id)
+            for product_id in range(1, 200)
+        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            for product_id in range(1, 200, 3):
+                Likes.objects.create(user=cls.user, content_type=product_type, object_id=product_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        # The likes above may still be buffered, written here they are rolled back with the class
+        counters.flush()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+
+    def count_queries(self, page_size):
+        with CaptureQueriesContext(connection) as queries:
+            products = list(Product.objects.with_tags().with_like_counts(self.user)[:page_size])
+            for product in products:
+                [tag.label for tag in product.tags]
+                product.like_count, product.liked
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self.assertEqual(self.count_queries(10), self.count_queries(200))
+
+    def test_attaches_tags_and_likes(self):
+        product = Product.objects.with_tags().with_like_counts(self.user).get(pk=1)
+        self.assertEqual([tag.label for tag in product.tags], ['sale'])
+        self.assertEqual(product.like_count, 1)
+        self.assertTrue(product.liked)
+
+        product = Product.objects.with_tags().with_like_counts().get(pk=2)
+        self.assertEqual([tag.label for tag in product.tags], ['fresh'])
+        self.assertEqual(product.like_count, 0)
+        self.assertFalse(product.liked)
+
+
+class BulkLoadTests(TestCase):
+    FILES = {
+        'collections.csv': 'id,title,featured_products\n1,Bakery,2\n2,Dairy,\n',
+        'products.ndjson': ''.join(json.dumps(row) + '\n' for row in [
+            {'id': 1, 'title': 'Sourdough Bread', 'description': '', 'price': '4.50', 'inventory': 10, 'collection': 1},
+            {'id': 2, 'title': 'Sourdough Bread', 'description': '', 'price': '5.00', 'inventory': 3, 'collection': 1},
+            {'id': 3, 'title': 'Milk', 'slug': 'whole-milk', 'description': '', 'price': '2.00', 'inventory': 8,
+             'collection': 2},
+        ]),
+        'customers.csv': 'id,first_name,last_name,email,phone,birth_date\n1,Mara,Cammack,m@c.com,1,\n',
+        'orders.csv': 'id,placed_at,payment_status,customer\n1,2021-03-01 10:00:00,C,1\n2,2021-03-02 10:00:00,P,1\n',
+        'order_items.csv': 'order,products,quantity,unitPrice\n1,1,2,4.50\n1,3,1,2.00\n2,2,1,5.00\n',
+    }
+
+    def load(self, *args):
+        with tempfile.TemporaryDirectory() as directory:
+            options = []
+            for name, content in self.FILES.items():
+                with open(f'{directory}/{name}', 'w') as file:
+                    file.write(content)
+                options += [f'--{name.split(".")[0].replace("_", "-")}', f'{directory}/{name}']
+            output = io.StringIO()
+            call_command('bulk_load', *options, '--batch-size', '2', *args, stdout=output)
+        return output.getvalue()
+
+    def test_loads_every_table(self):
+        output = self.load()
+        self.assertIn('products: 3 rows', output)
+        self.assertEqual(
+            [Model.objects.count() for Model in (Collection, Product, Customer, Order, OrderItems)], [2, 3, 1, 2, 3]
+        )
+        self.assertEqual(
+            list(Collection.objects.order_by('id').values_list('featured_products_id', 'product_count')),
+            [(2, 2), (None, 1)],
+        )
+        self.assertEqual(list(Product.objects.order_by('id').values_list('slug', 'effective_price')), [
+            ('sourdough-bread', Decimal('4.50')),
+            ('sourdough-bread-2', Decimal('5.00')),
+            ('whole-milk', Decimal('2.00')),
+        ])
+        self.assertEqual(dict(Order.objects.values_list('id', 'total')), {1: Decimal('11.00'), 2: Decimal('5.00')})
+        # Timestamps are loaded as given, not stamped by auto_now_add
+        self.assertEqual(Order.objects.get(pk=1).placed_at, datetime(2021, 3, 1, 10, tzinfo=dt_timezone.utc))
+
+    def test_rebuilds_the_dropped_indexes(self):
+        def indexes():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'shop_product'")
+                return {row[0] for row in cursor.fetchall()}
+
+        before = indexes()
+        self.load()
+        self.assertEqual(indexes(), before)
+
+    def test_reports_bad_rows(self):
+        self.FILES = {**self.FILES, 'customers.csv': 'id,first_name,email,age\n1,Mara,m@c.com,30\n'}
+        with self.assertRaisesMessage(CommandError, "Customer has no field 'age'"):
+            self.load()
+
+
+class CacheResponseTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def view(self, request):
+        self.calls += 1
+        time.sleep(0.05)
+        return HttpResponse(f'call {self.calls}')
+
+    def test_invalidated_only_by_its_models(self):
+        view = cache_response(Product)(self.view)
+        request = RequestFactory().get('/catalog/')
+        self.assertEqual(view(request).content, b'call 1')
+        self.assertEqual(view(request).content, b'call 1')
+
+        invalidate_model(Collection)
+        self.assertEqual(view(request).content, b'call 1')
+        invalidate_model(Product)
+        self.assertEqual(view(request).content, b'call 2')
+
+    def test_concurrent_misses_run_the_view_once(self):
+        view = cache_response(Product)(self.view)
+        responses = []
+        threads = [
+            threading.Thread(target=lambda: responses.append(view(RequestFactory().get('/catalog/'))))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({response.content for response in responses}, {b'call 1'})
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        collection = Collection.objects.create(title='Grocery')
+        Product.objects.bulk_create([
+            Product(title=title, description='', price=price, inventory=1, collection=collection)
+            for title, price in [
+                ('Bread', 3), ('Apples', 2), ('Bread', 5), ('Cheese', 5), ('Bread', 1), ('Apples', 4), ('Dates', 5),
+            ]
+        ])
+
+    def walk(self, ordering=None, per_page=2):
+        # Every page forward from the first, then every page back from the last
+        paginator = KeysetPaginator(Product.objects.all(), per_page, ordering)
+        pages = [paginator.page()]
+        while pages[-1].has_next:
+            pages.append(paginator.page(pages[-1].next_cursor))
+        backwards = [pages[-1]]
+        while backwards[-1].has_previous:
+            backwards.append(paginator.page(backwards[-1].previous_cursor))
+        return [[product.pk for product in page] for page in pages], \
+            [[product.pk for product in page] for page in reversed(backwards)]
+
+    def test_walks_both_ways_across_ties(self):
+        expected = list(Product.objects.order_by('title', 'id').values_list('pk', flat=True))
+        forward, backward = self.walk()
+        self.assertEqual(forward, [expected[0:2], expected[2:4], expected[4:6], expected[6:]])
+        self.assertEqual(backward, forward)
+
+    def test_descending_orderings(self):
+        for ordering in [('-price', 'id'), ('-title', '-id'), ('price', '-title', 'id')]:
+            expected = list(Product.objects.order_by(*ordering).values_list('pk', flat=True))
+            forward, backward = self.walk(ordering, per_page=3)
+            self.assertEqual([pk for page in forward for pk in page], expected, ordering)
+            self.assertEqual(backward, forward, ordering)
+
+    def test_first_and_last_pages(self):
+        paginator = KeysetPaginator(Product.objects.all(), 10)
+        page = paginator.page()
+        self.assertEqual((len(page), page.has_next, page.has_previous), (7, False, False))
+        self.assertEqual(len(KeysetPaginator(Product.objects.none(), 10).page()), 0)
+
+    def test_invalid_cursors(self):
+        paginator = KeysetPaginator(Product.objects.all(), 2)
+
+        def encoded(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        for cursor in [
+            'not a cursor', encoded([1, 2]), encoded({'k': ['Bread', 1]}), encoded({'k': ['Bread'], 'f': True}),
+            encoded({'k': ['Bread', 'one'], 'f': True}), encoded({'k': 'Br', 'f': True}),
+        ]:
+            with self.assertRaises(InvalidPage, msg=cursor):
+                paginator.page(cursor)
+        self.assertEqual(self.client.get('/catalog/', {'cursor': 'not a cursor'}).status_code, 400)
+        values, forward = paginator.decode_cursor(encoded({'k': ['Bread', '3'], 'f': 0}))
+        self.assertEqual((values, forward), (['Bread', 3], False))
+
+
+class EstimatedCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        collection = Collection.objects.create(title='Grocery')
+        Product.objects.bulk_create([
+            Product(title=f'Product {number}', description='', price=1, inventory=number, collection=collection)
+            for number in range(30)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def analyze(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {table}')
+
+    def test_reads_the_table_row_count_from_the_statistics(self):
+        self.assertIsNone(estimated_table_rows(Product))
+        self.analyze('shop_product')
+        with connection.cursor() as cursor:
+            # A partial index counts only some of the rows, it must not be taken for the table
+            # even when its row comes first
+            cursor.execute("SELECT tbl, idx, stat FROM sqlite_stat1 WHERE tbl = 'shop_product'")
+            rows = cursor.fetchall()
+            cursor.execute("DELETE FROM sqlite_stat1 WHERE tbl = 'shop_product'")
+            cursor.executemany(
+                'INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (%s, %s, %s)', [('shop_product', 'partial', '3 1')] + rows
+            )
+        self.assertEqual(estimated_table_rows(Product), 30)
+        self.assertIsNone(estimated_table_rows(Customer))
+
+    def test_paginator_uses_statistics_only_for_whole_tables(self):
+        call_command('refresh_table_statistics', stdout=io.StringIO())
+        Product.objects.filter(inventory__lt=10).delete()
+        with mock.patch('shop.pagination.ESTIMATE_MIN_ROWS', 20):
+            # The statistics are as of the ANALYZE, filtered lists are counted
+            self.assertEqual(EstimatedCountPaginator(Product.objects.all(), 10).count, 30)
+            self.assertEqual(EstimatedCountPaginator(Product.objects.filter(inventory__gte=25), 10).count, 5)
+            # Not analysed: a real count
+            Customer.objects.create(first_name='Mara', last_name='Cammack', email='m@c.com', phone=1)
+            self.assertEqual(EstimatedCountPaginator(Customer.objects.order_by('id'), 10).count, 1)
+        # Small tables are always counted
+        self.assertEqual(EstimatedCountPaginator(Product.objects.all(), 10).count, 20)
+
+    def test_stale_statistics_never_turn_pagination_off(self):
+        self.analyze('shop_product')
+        collection = Collection.objects.get()
+        Product.objects.bulk_create([
+            Product(title=f'New {number}', description='', price=1, inventory=1, collection=collection)
+            for number in range(500)
+        ])
+        self.client.force_login(User.objects.create(username='admin', is_staff=True, is_superuser=True))
+        changelist = self.client.get('/admin/shop/product/').context['cl']
+        self.assertEqual(changelist.result_count, 530)
+        self.assertTrue(changelist.multi_page)
+        self.assertEqual(len(changelist.result_list), changelist.list_per_page)
+
+    def test_estimates_past_the_last_id_are_not_trusted(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE sqlite_master')
+            cursor.execute("INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES ('shop_product', NULL, '1000')")
+        with mock.patch('shop.pagination.ESTIMATE_MIN_ROWS', 20):
+            self.assertEqual(estimated_table_rows(Product), 1000)
+            self.assertEqual(EstimatedCountPaginator(Product.objects.all(), 10).count, 30)
+
+    def test_cached_count_is_reused_until_it_expires(self):
+        query_set = Product.objects.filter(inventory__gte=20)
+        self.assertEqual(cached_count(query_set), 10)
+        Product.objects.filter(inventory=29).delete()
+        with self.assertNumQueries(0):
+            self.assertEqual(cached_count(Product.objects.filter(inventory__gte=20)), 10)
+        self.assertEqual(cached_count(Product.objects.filter(inventory__gte=21)), 8)
+        cache.clear()
+        self.assertEqual(cached_count(query_set), 9)
+
+
+class PlaceOrderTests(TransactionTestCase):
+    # Reads outside a transaction go to the read-only alias, see store.routers
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        collection = Collection.objects.create(title='Grocery')
+        self.product = Product.objects.create(
+            title='Bread', description='', price=4, inventory=50, collection=collection
+        )
+        self.customer = Customer.objects.create(
+            first_name='Faydra', last_name='Corhard', email='fcorhard0@dot.gov', phone=1
+        )
+
+    def cart(self, quantity):
+        cart = Cart.objects.create()
+        CartItem.objects.create(cart=cart, items=self.product, quantity=quantity)
+        return cart
+
+    def test_snapshots_price_and_consumes_cart(self):
+        cart = self.cart(3)
+        order = place_order(cart, self.customer)
+        item = order.orderitems_set.get()
+        self.assertEqual((item.quantity, item.unitPrice), (3, 4))
+        self.assertFalse(Cart.objects.filter(pk=cart.pk).exists())
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.inventory, 47)
+
+    def test_charges_the_promotional_price(self):
+        self.product.promotions.add(Promotions.objects.create(description='Spring', discount=0.25))
+        order = place_order(self.cart(2), self.customer)
+        self.assertEqual(order.orderitems_set.get().unitPrice, 3)
+        self.assertEqual(order.total, 6)
+
+    def test_refuses_to_oversell(self):
+        with self.assertRaises(InsufficientInventory):
+            place_order(self.cart(51), self.customer)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.inventory, 50)
+
+    def test_concurrent_checkouts_never_oversell(self):
+        threads, attempts_per_thread = 8, 10
+        carts = [[self.cart(1) for _ in range(attempts_per_thread)] for _ in range(threads)]
+        placed, refused, errors = [], [], []
+
+        def checkout(thread_carts):
+            try:
+                for cart in thread_carts:
+                    try:
+                        placed.append(place_order(cart, self.customer))
+                    except InsufficientInventory:
+                        refused.append(cart)
+            except Exception as error:
+                # An exception would otherwise end the thread without failing the test
+                errors.append(error)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=checkout, args=(thread_carts,)) for thread_carts in carts]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.inventory, 0)
+        self.assertEqual(len(placed), 50)
+        self.assertEqual(len(refused), threads * attempts_per_thread - 50)
+        self.assertEqual(sum(OrderItems.objects.values_list('quantity', flat=True)), 50)
+
+
+class EffectivePriceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        collection = Collection.objects.create(title='Grocery')
+        cls.bread, cls.milk, cls.eggs = Product.objects.bulk_create([
+            Product(title=title, description='', price=price, inventory=10, collection=collection)
+            for title, price in [('Bread', '4.00'), ('Milk', '2.50'), ('Eggs', '9.99')]
+        ])
+        cls.spring = Promotions.objects.create(description='Spring', discount=0.1)
+        cls.clearance = Promotions.objects.create(description='Clearance', discount=0.5)
+
+    def prices(self):
+        return dict(Product.objects.values_list('title', 'effective_price'))
+
+    def test_follows_promotion_changes(self):
+        self.assertEqual(self.prices(), {'Bread': Decimal('4.00'), 'Milk': Decimal('2.50'), 'Eggs': Decimal('9.99')})
+        self.spring.products.add(self.bread, self.milk)
+        self.eggs.promotions.add(self.spring, self.clearance)
+        self.assertEqual(self.eggs.effective_price, Decimal('5.00'))
+        self.assertEqual(self.prices(), {'Bread': Decimal('3.60'), 'Milk': Decimal('2.25'), 'Eggs': Decimal('5.00')})
+
+        self.spring.discount = 0.2
+        self.spring.save()
+        self.assertEqual(self.prices(), {'Bread': Decimal('3.20'), 'Milk': Decimal('2.00'), 'Eggs': Decimal('5.00')})
+
+        self.spring.products.remove(self.milk)
+        self.clearance.delete()
+        self.assertEqual(self.prices(), {'Bread': Decimal('3.20'), 'Milk': Decimal('2.50'), 'Eggs': Decimal('7.99')})
+
+        self.spring.products.clear()
+        self.assertEqual(self.prices(), {'Bread': Decimal('4.00'), 'Milk': Decimal('2.50'), 'Eggs': Decimal('9.99')})
+
+    def test_follows_price_changes(self):
+        self.bread.promotions.add(self.clearance)
+        bread = Product.objects.get(pk=self.bread.pk)
+        bread.price = 6
+        bread.save()
+        Product.objects.filter(pk=self.milk.pk).update(price=3)
+        self.assertEqual(self.prices()['Bread'], Decimal('3.00'))
+        self.assertEqual(self.prices()['Milk'], Decimal('3.00'))
+
+    def test_batches_keep_the_query_count_flat(self):
+        self.spring.products.add(self.bread, self.milk, self.eggs)
+        Product.objects.update(effective_price=0)
+        # Per batch: the ids, the aggregate and the UPDATE, then one query finding no more ids
+        with self.assertNumQueries(4):
+            self.assertEqual(Product.objects.refresh_effective_prices(), 3)
+        Product.objects.update(effective_price=0)
+        with self.assertNumQueries(7):
+            Product.objects.refresh_effective_prices(batch_size=2)
+
+    def test_catalog_filters_on_what_customers_pay(self):
+        self.eggs.promotions.add(self.clearance)
+        results = self.client.get('/catalog/', {'price_min': '4.50', 'price_max': '5'}).json()['results']
+        self.assertEqual([(p['title'], p['price'], p['effective_price']) for p in results], [('Eggs', '9.99', '5.00')])
+
+    def test_cached_pages_follow_repricing(self):
+        cache.clear()
+
+        def eggs():
+            results = self.client.get('/catalog/', {'collection': self.eggs.collection_id}).json()['results']
+            return {p['title']: p['effective_price'] for p in results}['Eggs']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.eggs.promotions.add(self.clearance)
+        self.assertEqual(eggs(), '5.00')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.clearance.discount = 0.2
+            self.clearance.save()
+        self.assertEqual(eggs(), '7.99')
+
+        # A queryset update fires no signals, the repricing afterwards lets the page go
+        Promotions.objects.filter(pk=self.clearance.pk).update(discount=0.5)
+        self.assertEqual(eggs(), '7.99')
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('refresh_effective_prices', stdout=io.StringIO())
+        self.assertEqual(eggs(), '5.00')
+
+
+class StorefrontTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        Collection.objects.filter(pk=3).update(featured_products=12)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_featured_or_best_seller_in_constant_queries(self):
+        with self.assertNumQueries(2):
+            results = {row['id']: row for row in self.client.get('/').json()['results']}
+        self.assertEqual(len(results), Collection.objects.count())
+        self.assertTrue(results[3]['featured'])
+        self.assertEqual(results[3]['product']['id'], 12)
+
+        sold = Counter()
+        for product_id, quantity in OrderItems.objects.filter(products__collection=5).values_list('products', 'quantity'):
+            sold[product_id] += quantity
+        best = max(sold.items(), key=lambda item: (item[1], -item[0]))[0]
+        self.assertFalse(results[5]['featured'])
+        self.assertEqual(results[5]['product']['id'], best)
+
+    def test_refreshed_when_a_featured_product_changes(self):
+        self.client.get('/')
+        product = Product.objects.get(pk=12)
+        product.inventory = 1234
+        product.save()
+        results = {row['id']: row for row in self.client.get('/').json()['results']}
+        self.assertEqual(results[3]['product']['inventory'], 1234)
+
+
+class OrderExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        cls.staff = User.objects.create_user('finance', is_staff=True)
+
+    def test_csv_has_a_row_per_item(self):
+        chunks = list(export_chunks(export_orders(), 'csv'))
+        rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+        self.assertEqual(len(rows), OrderItems.objects.count() + Order.objects.filter(orderitems__isnull=True).count())
+        item = OrderItems.objects.select_related('order__customer').get(pk=rows[0]['item_id'])
+        self.assertEqual(
+            (rows[0]['order_id'], rows[0]['email'], rows[0]['quantity'], rows[0]['unit_price']),
+            (str(item.order_id), item.order.customer.email, str(item.quantity), str(item.unitPrice)),
+        )
+
+    def test_chunks_are_written_as_they_are_read(self):
+        query_sets = export_orders(payment_status='C')
+        orders = Order.objects.filter(payment_status='C').count()
+        # One cursor over each join (the hot tables and the archive), fetched 100 rows at a time
+        with self.assertNumQueries(2):
+            chunks = export_chunks(query_sets, 'ndjson', chunk_size=100)
+            first = next(chunks)
+            self.assertLess(len(first.splitlines()), 100)
+            lines = first.splitlines() + ''.join(chunks).splitlines()
+        self.assertEqual(len(lines), orders)
+        self.assertEqual({json.loads(line)['payment_status'] for line in lines}, {'C'})
+        items = sum(len(json.loads(line)['items']) for line in lines)
+        self.assertEqual(items, OrderItems.objects.filter(order__payment_status='C').count())
+
+    def test_endpoint_filters_and_gzips(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(
+            '/exports/orders/', {'format': 'ndjson', 'start': '2021-01-01', 'end': '2021-01-31', 'gzip': '1'}
+        )
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="orders.ndjson.gz"')
+        lines = gzip.decompress(b''.join(response.streaming_content)).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)['id'] for line in lines],
+            list(Order.objects.filter(placed_at__year=2021, placed_at__month=1).order_by('id').values_list('id', flat=True)),
+        )
+        self.assertEqual(self.client.get('/exports/orders/', {'status': 'X'}).status_code, 400)
+
+    def test_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = f'{directory}/orders.csv.gz'
+            call_command('export_orders', '--gzip', '--status', 'F', '--output', path, stderr=io.StringIO())
+            with gzip.open(path, 'rt', newline='') as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual({row['payment_status'] for row in rows}, {'F'})
+        self.assertEqual(len({row['order_id'] for row in rows}), Order.objects.filter(payment_status='F').count())
+
+    def test_archived_orders_stay_in_the_export(self):
+        def export(**kwargs):
+            return ''.join(export_chunks(export_orders(**kwargs), 'ndjson', chunk_size=7))
+
+        before = export()
+        hot = export(start='2021-01-01')
+        cutoff = timezone.make_aware(datetime(2021, 1, 1))
+        self.assertGreater(archive.archive_orders(cutoff), 0)
+        self.assertEqual(export(), before)
+        self.assertEqual(export(include_archived=False), hot)
+        june = export(start='2020-06-01', end='2020-06-30', payment_status='C')
+        self.assertTrue(june)
+        self.assertEqual(june, ''.join(
+            line + '\n' for line in before.splitlines()
+            if json.loads(line)['placed_at'].startswith('2020-06') and json.loads(line)['payment_status'] == 'C'
+        ))
+        self.client.force_login(self.staff)
+        response = self.client.get('/exports/orders/', {'archived': '0'})
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertFalse(ArchivedOrder.objects.filter(pk__in={row['order_id'] for row in rows}).exists())
+
+
+class OrderArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        cls.staff = User.objects.create_user('finance', is_staff=True)
+        cls.cutoff = timezone.make_aware(datetime(2021, 1, 1))
+
+    def rollups(self):
+        return sorted(DailyCollectionSales.objects.values_list('day', 'collection_id', 'quantity', 'revenue')), \
+            sorted(DailyPaymentStatusSales.objects.values_list('day', 'payment_status', 'orders', 'revenue'))
+
+    def test_moves_old_orders_with_their_items(self):
+        old = Order.objects.filter(placed_at__lt=self.cutoff)
+        expected_orders = sorted(old.values_list('id', 'customer_id', 'total'))
+        expected_items = sorted(OrderItems.objects.filter(order__in=old).values_list('id', 'order_id', 'quantity', 'unitPrice'))
+        hot = Order.objects.count() - len(expected_orders)
+
+        self.assertEqual(archive.archive_orders(self.cutoff, batch_size=50), len(expected_orders))
+        self.assertEqual(Order.objects.count(), hot)
+        self.assertFalse(Order.objects.filter(placed_at__lt=self.cutoff).exists())
+        self.assertEqual(sorted(ArchivedOrder.objects.values_list('id', 'customer_id', 'total')), expected_orders)
+        self.assertEqual(
+            sorted(ArchivedOrderItems.objects.values_list('id', 'order_id', 'quantity', 'unitPrice')), expected_items
+        )
+        # Customers and products stay protected by their archived orders
+        customer = ArchivedOrder.objects.exclude(customer__order__isnull=False).first().customer
+        with self.assertRaises(ProtectedError):
+            customer.delete()
+
+    def test_rollups_keep_archived_days(self):
+        refresh_sales_rollups(full=True)
+        before = self.rollups()
+        archive.archive_orders(self.cutoff)
+        refresh_sales_rollups(full=True)
+        self.assertEqual(self.rollups(), before)
+
+    def test_lookup_reads_through_to_the_archive(self):
+        old = Order.objects.filter(placed_at__lt=self.cutoff).first()
+        recent = Order.objects.filter(placed_at__gte=self.cutoff).first()
+        items = OrderItems.objects.filter(order=old).count()
+        archive.archive_orders(self.cutoff)
+        self.client.force_login(self.staff)
+        response = self.client.get(f'/orders/{old.pk}/').json()
+        self.assertEqual((response['archived'], response['total']), (True, str(old.total)))
+        self.assertEqual(len(response['items']), items)
+        self.assertFalse(self.client.get(f'/orders/{recent.pk}/').json()['archived'])
+        self.assertEqual(self.client.get('/orders/999999/').status_code, 404)
+
+
+class ProductSlugTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collection = Collection.objects.create(title='Grocery')
+        cls.milks = Product.objects.bulk_create([
+            Product(title=title, description='', price=2, inventory=5, collection=cls.collection)
+            for title in ['Milk', 'Milk', 'Milk 2', 'Milk']
+        ])
+
+    def setUp(self):
+        slugs.cache.clear()
+
+    def test_unique_slugs_from_titles(self):
+        self.assertEqual([milk.slug for milk in self.milks], ['milk', 'milk-3', 'milk-2', 'milk-4'])
+        product = Product.objects.create(title='Milk!', description='', price=2, inventory=5, collection=self.collection)
+        self.assertEqual(product.slug, 'milk-5')
+
+    def test_slug_taken_before_the_write(self):
+        # Another save takes milk-5 between assign_slugs and the INSERT
+        assign_slugs = ProductQuerySet.assign_slugs
+
+        def racing(query_set, objs):
+            assign_slugs(query_set, objs)
+            for obj in objs:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'INSERT INTO shop_product (title, description, slug, price, effective_price, inventory, '
+                        'last_update, collection_id) VALUES (%s, %s, %s, 2, 2, 5, %s, %s)',
+                        ['Milk', '', obj.slug, timezone.now(), self.collection.pk],
+                    )
+
+        with transaction.atomic():
+            with mock.patch.object(ProductQuerySet, 'assign_slugs', racing):
+                product = Product.objects.create(title='Milk', description='', price=2, inventory=5, collection=self.collection)
+            # The failed INSERT only rolled back to its savepoint
+            self.assertEqual(Product.objects.get(pk=product.pk).slug, 'milk-6')
+
+        product.slug = 'milk'
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            # Slugs set by hand are not moved on
+            product.save()
+
+    def test_detail_is_one_primary_key_lookup_when_hot(self):
+        self.assertEqual(self.client.get('/products/milk-2/').json()['title'], 'Milk 2')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get('/products/milk-2/').json()['id'], self.milks[2].pk)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"shop_product"."id" =', queries[0]['sql'])
+        self.assertEqual(self.client.get('/products/cheese/').status_code, 404)
+
+    def test_renames_move_the_slug(self):
+        self.client.get('/products/milk-4/')
+        product = Product.objects.get(pk=self.milks[3].pk)
+        product.title = 'Oat Milk'
+        product.save()
+        self.assertEqual(self.client.get('/products/milk-4/').status_code, 404)
+        self.assertEqual(self.client.get('/products/oat-milk/').json()['id'], product.pk)
+
+        Product.objects.filter(pk=product.pk).update(title='Soy Milk')
+        self.assertEqual(Product.objects.get(pk=product.pk).slug, 'soy-milk')
+
+    def test_stale_entries_are_looked_up_again(self):
+        # As left behind by a change in another process
+        slugs.cache.put('milk', self.milks[1].pk)
+        self.assertEqual(slugs.product_for_slug('milk').pk, self.milks[0].pk)
+
+    @override_settings(PRODUCT_SLUG_CACHE_SIZE=2)
+    def test_cache_is_bounded(self):
+        for slug in ['milk', 'milk-2', 'milk-3']:
+            slugs.product_for_slug(slug)
+        self.assertEqual(len(slugs.cache), 2)
+        self.assertIsNone(slugs.cache.get('milk'))
+
+
+class CartStoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        carts.get_cache().clear()
+        collection = Collection.objects.create(title='Grocery')
+        self.bread, self.milk = Product.objects.bulk_create([
+            Product(title='Bread', description='', price=4, inventory=10, collection=collection),
+            Product(title='Milk', description='', price=2, inventory=10, collection=collection),
+        ])
+
+    def test_writes_only_on_flush(self):
+        token = carts.new_cart()
+        with self.assertNumQueries(0):
+            carts.add_item(token, self.bread.pk)
+            carts.add_item(token, self.bread.pk, 2)
+            carts.add_item(token, self.milk.pk)
+        self.assertFalse(Cart.objects.exists())
+
+        carts.flush()
+        self.assertEqual(
+            dict(CartItem.objects.values_list('items_id', 'quantity')), {self.bread.pk: 3, self.milk.pk: 1}
+        )
+        carts.remove_item(token, self.milk.pk)
+        carts.set_quantity(token, self.bread.pk, 5)
+        carts.flush()
+        self.assertEqual(dict(CartItem.objects.values_list('items_id', 'quantity')), {self.bread.pk: 5})
+        self.assertEqual(Cart.objects.count(), 1)
+
+    def test_checkout(self):
+        customer = Customer.objects.create(first_name='Mara', last_name='Cammack', email='m@c.com', phone=1)
+        token = carts.new_cart()
+        carts.add_item(token, self.milk.pk, 4)
+        order = carts.checkout(token, customer)
+        self.assertEqual(list(order.orderitems_set.values_list('products_id', 'quantity')), [(self.milk.pk, 4)])
+        self.assertEqual(carts.get_items(token), {})
+        self.assertFalse(Cart.objects.exists())
+
+    def test_survives_a_full_shared_cache(self):
+        token = carts.new_cart()
+        carts.add_item(token, self.bread.pk)
+        for number in range(1000):
+            cache.set(f'filler:{number}', number)
+        self.assertEqual(carts.get_items(token), {self.bread.pk: 1})
+
+    def test_emptied_cart_is_written(self):
+        token = carts.new_cart()
+        carts.add_item(token, self.bread.pk, 2)
+        carts.flush()
+        carts.remove_item(token, self.bread.pk)
+        self.assertEqual(carts.flush(), 1)
+        self.assertFalse(CartItem.objects.exists())
+        self.assertEqual(Cart.objects.count(), 1)
+        # A cart emptied before it was ever written still gets no row
+        token = carts.new_cart()
+        carts.add_item(token, self.milk.pk)
+        carts.remove_item(token, self.milk.pk)
+        self.assertEqual(carts.flush(), 0)
+        self.assertEqual(Cart.objects.count(), 1)
+
+    def test_lost_state_never_overwrites_rows(self):
+        customer = Customer.objects.create(first_name='Mara', last_name='Cammack', email='m@c.com', phone=1)
+        token = carts.new_cart()
+        carts.add_item(token, self.bread.pk, 2)
+        carts.flush()
+        carts.add_item(token, self.milk.pk)
+        carts.get_cache().delete(carts.cache_key(token))
+        self.assertEqual(carts.flush(), 0)
+        self.assertEqual(dict(CartItem.objects.values_list('items_id', 'quantity')), {self.bread.pk: 2})
+        with self.assertRaises(EmptyCart):
+            carts.checkout(token, customer)
+        self.assertFalse(Order.objects.exists())
+
+
+class SalesRollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+
+    def revenue_by_status(self):
+        return {
+            status: sum(DailyPaymentStatusSales.objects.filter(payment_status=status).values_list('revenue', flat=True))
+            for status in 'CPF'
+        }
+
+    def raw_revenue_by_status(self):
+        return {
+            status: sum(Order.objects.filter(payment_status=status).values_list('total', flat=True))
+            for status in 'CPF'
+        }
+
+    def test_order_total_follows_items(self):
+        order = Order.objects.get(pk=357)
+        item = order.orderitems_set.first()
+        item.quantity += 1
+        item.save()
+        order.refresh_from_db()
+        self.assertEqual(order.total, sum(i.quantity * i.unitPrice for i in order.orderitems_set.all()))
+
+    def test_admin_shows_total_read_only(self):
+        self.client.force_login(User.objects.create(username='admin', is_staff=True, is_superuser=True))
+        response = self.client.get('/admin/shop/order/357/change/')
+        self.assertContains(response, str(Order.objects.get(pk=357).total))
+        self.assertNotIn('total', response.context['adminform'].form.fields)
+
+    def test_incremental_refresh_matches_raw_orders(self):
+        refresh_sales_rollups()
+        self.assertEqual(
+            sum(DailyCollectionSales.objects.values_list('revenue', flat=True)),
+            sum(Order.objects.values_list('total', flat=True)),
+        )
+
+        # A new order lands after the high-water mark, an old one changes status
+        Order.objects.create(customer_id=1).orderitems_set.create(products_id=1, quantity=2, unitPrice=5)
+        old = Order.objects.filter(payment_status='P').earliest('placed_at')
+        old.payment_status = 'C'
+        old.save()
+
+        refresh_sales_rollups()
+        self.assertEqual(self.revenue_by_status(), self.raw_revenue_by_status())
+
+
+class AutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+
+    def setUp(self):
+        autocomplete.products.rebuild()
+
+    def test_matches_word_prefixes(self):
+        ids = autocomplete.products.search('pale al')
+        self.assertIn(12, ids)
+        for title in Product.objects.filter(pk__in=ids).values_list('title', flat=True):
+            words = title.lower().replace(',', ' ').split()
+            self.assertTrue(any(w.startswith('pale') for w in words) and any(w.startswith('al') for w in words))
+        with self.assertNumQueries(0):
+            autocomplete.products.search('beer')
+
+    def test_follows_saves_and_deletes(self):
+        product = Product.objects.get(pk=1)
+        product.title = 'Zanzibar Cloves'
+        product.save()
+        self.assertEqual(autocomplete.products.search('zanz'), [1])
+        self.assertEqual(autocomplete.products.labels([1]), [(1, 'Zanzibar Cloves')])
+        Product.objects.create(title='Zanzibar Tea', description='', price=1, inventory=1, collection_id=3)
+        self.assertEqual(len(autocomplete.products.search('zanzibar')), 2)
+
+    def test_view_falls_back_to_the_database_while_loading(self):
+        self.client.force_login(User.objects.create(username='admin', is_staff=True))
+        with mock.patch.object(autocomplete.products, 'search', return_value=None):
+            results = self.client.get('/autocomplete/', {'model': 'product', 'term': 'pale al'}).json()['results']
+        self.assertIn(12, [result['id'] for result in results])
+
+
+class SearchIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.collection = Collection.objects.create(title='Grocery')
+        cls.bread, cls.milk, cls.chocolate, cls.oat = Product.objects.bulk_create([
+            Product(title=title, description=description, price=2, inventory=1, collection=cls.collection)
+            for title, description in [
+                ('Bread', 'Goes well with butter'),
+                ('Milk', 'Whole milk, the milk of grass fed cows'),
+                ('Milk Chocolate', ''),
+                ('Oat Drink', 'Plant based'),
+            ]
+        ])
+        cls.admin = User.objects.create(username='admin', is_staff=True, is_superuser=True)
+
+    def test_matches_word_prefixes_best_first(self):
+        ids = search.search_ids(Product, 'mil')
+        self.assertEqual(ids[0], self.milk.pk)
+        self.assertEqual(set(ids), {self.milk.pk, self.chocolate.pk})
+        self.assertEqual(search.search_ids(Product, 'milk choc'), [self.chocolate.pk])
+        # FTS5 syntax in the input is taken as plain words
+        self.assertEqual(search.search_ids(Product, 'plant" OR "*'), [])
+        self.assertEqual(search.search_ids(Product, '"*'), [])
+        self.assertEqual(list(search.search_customers('corh')), [])
+        customer = Customer.objects.create(first_name='Faydra', last_name='Corhard', email='f@c.com', phone=1)
+        self.assertEqual(list(search.search_customers('corh')), [customer])
+
+    def test_follows_bulk_updates_and_deletes(self):
+        Product.objects.filter(pk=self.bread.pk).update(description='Sourdough, best with milk')
+        self.assertEqual(set(search.search_ids(Product, 'milk')), {self.milk.pk, self.chocolate.pk, self.bread.pk})
+        self.assertEqual(search.search_ids(Product, 'butter'), [])
+        Product.objects.filter(pk=self.chocolate.pk).delete()
+        self.assertEqual(set(search.search_ids(Product, 'milk')), {self.milk.pk, self.bread.pk})
+
+    def test_triggers_survive_the_product_table_rebuilds(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'shop_product'")
+            triggers = {row[0] for row in cursor.fetchall()}
+        self.assertEqual(triggers, {'shop_product_fts_insert', 'shop_product_fts_delete', 'shop_product_fts_update'})
+        milk = Product.objects.create(title='Milkshake', description='', price=2, inventory=1, collection=self.collection)
+        self.assertIn(milk.pk, search.search_ids(Product, 'milks'))
+
+    def test_admin_search_is_not_capped(self):
+        self.client.force_login(self.admin)
+        Product.objects.filter(pk=self.oat.pk).update(description='Oat milk')
+        with mock.patch.object(search, 'RANKED_MATCHES', 1):
+            changelist = self.client.get('/admin/shop/product/', {'q': 'milk'}).context['cl']
+        self.assertEqual(changelist.result_count, 3)
+        self.assertEqual(changelist.result_list[0], self.milk)
+
+    def test_public_search(self):
+        results = self.client.get('/search/', {'q': 'MILK'}).json()['results']
+        self.assertEqual([product['title'] for product in results][0], 'Milk')
+        self.assertEqual(len(results), 2)
+        with mock.patch.object(views, 'SEARCH_PAGE_SIZE', 1):
+            self.assertEqual(len(self.client.get('/search/', {'q': 'milk'}).json()['results']), 1)
+        self.assertEqual(self.client.get('/search/', {'q': ' '}).json(), {'results': []})
+
+
+class ChangelistQueryBudgetTests(TestCase):
+    # Session, user, then the changelist itself: a missing list_select_related shows up here
+    # as one customer / collection query per row
+    @classmethod
+    def setUpTestData(cls):
+        load_seed_data()
+        cls.admin = User.objects.create(username='admin', is_staff=True, is_superuser=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def get(self, url):
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_product_changelist(self):
+        # The last_update filter counts each of its date ranges once (cached, see CachedCountDateFilter)
+        with QueryBudget(11, repeats=4):
+            self.get('/admin/shop/product/')
+
+    def test_customer_changelist(self):
+        with QueryBudget(5):
+            self.get('/admin/shop/customer/')
+
+    def test_order_changelist(self):
+        with QueryBudget(5):
+            self.get('/admin/shop/order/')
+
+    def test_collection_changelist(self):
+        # Result count and full result count are the same query without filters
+        with QueryBudget(5, repeats=2):
+            self.get('/admin/shop/collection/')
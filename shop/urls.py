@@ -0,0 +1,13 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.homepage),
+    path('catalog/', views.catalog),
+    path('search/', views.product_search),
+    path('products/<slug:slug>/', views.product_detail),
+    path('reports/sales/', views.sales_report),
+    path('autocomplete/', views.autocomplete),
+    path('exports/orders/', views.orders_export),
+    path('orders/<int:pk>/', views.order_detail),
+]
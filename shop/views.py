@@ -1,3 +1,178 @@
-from django.shortcuts import render
+from datetime import date
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import condition, require_safe
+
+from .archive import lookup_order
+from .autocomplete import INDEXES as AUTOCOMPLETE_INDEXES
+from .cache import cache_response
+from .catalog import catalog_etag, catalog_products, storefront_collections
+from .exports import FORMATS as EXPORT_FORMATS, encoded, export_chunks, export_orders
+from .models import Collection, DailyCollectionSales, DailyPaymentStatusSales, OrderItems, Product
+from .pagination import KeysetPaginator
+from .search import search, search_products
+from .slugs import product_for_slug
+
+CATALOG_PAGE_SIZE = 50
+SEARCH_PAGE_SIZE = 20
+
 
 # Create your views here.
+def product_json(product):
+    return {
+        'id': product.id,
+        'title': product.title,
+        'slug': product.slug,
+        'price': str(product.price),
+        'effective_price': str(product.effective_price),
+        'inventory': product.inventory,
+        'collection': product.collection_id,
+        'last_update': product.last_update.isoformat(),
+    }
+
+
+@require_safe
+@condition(etag_func=catalog_etag)
+@cache_response(Product)
+def catalog(request):
+    try:
+        query_set = catalog_products(request.GET)
+        page = KeysetPaginator(query_set, CATALOG_PAGE_SIZE).page(request.GET.get('cursor'))
+    except (ValueError, InvalidPage) as error:
+        return HttpResponseBadRequest(str(error))
+    return JsonResponse({
+        'results': [product_json(product) for product in page],
+        'next': page.next_cursor,
+        'previous': page.previous_cursor,
+    })
+
+
+@require_safe
+@cache_response(Collection, Product, OrderItems)
+def homepage(request):
+    # Every collection with its featured product, or its best seller when none is set
+    return JsonResponse({'results': [
+        {
+            'id': collection.id,
+            'title': collection.title,
+            'product_count': collection.product_count,
+            'featured': collection.featured_products_id is not None,
+            'product': product_json(collection.storefront_product) if collection.storefront_product else None,
+        }
+        for collection in storefront_collections()
+    ]})
+
+
+@require_safe
+def product_detail(request, slug):
+    # /products/<slug>/, one primary key lookup once the slug is in shop.slugs' cache
+    product = product_for_slug(slug)
+    if product is None:
+        raise Http404('No such product')
+    return JsonResponse(product_json(product))
+
+
+@require_safe
+def product_search(request):
+    # /search/?q=<words>, best matches first
+    term = request.GET.get('q', '')
+    products = search_products(term, limit=SEARCH_PAGE_SIZE) if term.strip() else []
+    return JsonResponse({'results': [product_json(product) for product in products]})
+
+
+SALES_REPORTS = {
+    'collection': (DailyCollectionSales, ['day', 'collection_id', 'quantity', 'revenue']),
+    'payment_status': (DailyPaymentStatusSales, ['day', 'payment_status', 'orders', 'revenue']),
+}
+
+
+@require_safe
+@staff_member_required
+def sales_report(request):
+    # /reports/sales/?by=collection|payment_status&start=2021-01-01&end=2021-01-31, read from
+    # the daily rollups (manage.py refresh_sales_rollups) instead of summing raw order items
+    report = SALES_REPORTS.get(request.GET.get('by', 'collection'))
+    if report is None:
+        return HttpResponseBadRequest('by must be collection or payment_status')
+    model, fields = report
+    query_set = model.objects.order_by('day', fields[1])
+    try:
+        if request.GET.get('start'):
+            query_set = query_set.filter(day__gte=date.fromisoformat(request.GET['start']))
+        if request.GET.get('end'):
+            query_set = query_set.filter(day__lte=date.fromisoformat(request.GET['end']))
+    except ValueError:
+        return HttpResponseBadRequest('start and end must be YYYY-MM-DD')
+    rows = [
+        {**row, 'day': row['day'].isoformat(), 'revenue': str(row['revenue'])}
+        for row in query_set.values(*fields)
+    ]
+    return JsonResponse({'results': rows})
+
+
+@require_safe
+@staff_member_required
+def autocomplete(request):
+    # /autocomplete/?model=customer|product&term=..., answered from the in-process prefix index
+    index = AUTOCOMPLETE_INDEXES.get(request.GET.get('model'))
+    if index is None:
+        return HttpResponseBadRequest('model must be customer or product')
+    term = request.GET.get('term', '')
+    ids = index.search(term, limit=20)
+    if ids is None:
+        # Still loading, ask the database this once
+        matches = search(index.model.objects.all(), term, limit=20).order_by('search_rank')
+        results = [(obj.pk, str(obj)) for obj in matches] if term.strip() else []
+    else:
+        results = index.labels(ids)
+    return JsonResponse({'results': [{'id': obj_id, 'text': label} for obj_id, label in results]})
+
+
+@require_safe
+@staff_member_required
+def orders_export(request):
+    # /exports/orders/?format=csv|ndjson&start=2021-01-01&end=2021-01-31&status=C&gzip=1&archived=0,
+    # streamed as it is read so it never sits in memory whole. Archived orders are in unless archived=0.
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest('format must be csv or ndjson')
+    try:
+        query_sets = export_orders(
+            request.GET.get('start'), request.GET.get('end'), request.GET.get('status'),
+            include_archived=request.GET.get('archived') != '0',
+        )
+    except ValueError as error:
+        return HttpResponseBadRequest(str(error))
+    gzip = request.GET.get('gzip') == '1'
+    _, content_type, extension = EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(
+        encoded(export_chunks(query_sets, export_format), gzip),
+        content_type='application/gzip' if gzip else content_type,
+    )
+    filename = f'orders.{extension}.gz' if gzip else f'orders.{extension}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@require_safe
+@staff_member_required
+def order_detail(request, pk):
+    # /orders/<id>/, found in the hot tables or the archive
+    found = lookup_order(pk)
+    if found is None:
+        raise Http404('No such order')
+    order, items, archived = found
+    return JsonResponse({
+        'id': order.id,
+        'placed_at': order.placed_at.isoformat(),
+        'payment_status': order.payment_status,
+        'total': str(order.total),
+        'customer': {'id': order.customer_id, 'name': str(order.customer)},
+        'items': [
+            {'product': item.products_id, 'quantity': item.quantity, 'unit_price': str(item.unitPrice)}
+            for item in items
+        ],
+        'archived': archived,
+    })
@@ -0,0 +1,2 @@
+# Connection setup for SQLite, see store.sqlite
+from . import sqlite  # noqa: F401
@@ -5,6 +5,18 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
+
+Serve it with an ASGI server, for example:
+
+    uvicorn store.asgi:application --workers 4
+
+The async views (sandbox.views.*_async) then wait on the database without holding a worker.
+The sync views still work; every request to one of them runs in a thread of its own.
+With DEBUG off (the default) the middleware in settings.MIDDLEWARE is all async capable,
+so async views stay async all the way through. DJANGO_DEBUG=1 also adds the debug toolbar,
+whose middleware is sync only; set DJANGO_DEBUG_TOOLBAR=0 as well to keep async views
+async while debugging. benchmarks/asgi.py compares this deployment with the WSGI one, with
+settings built by benchmarks.common.setup, which leaves the toolbar out.
 """
 
 import os
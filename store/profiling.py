@@ -0,0 +1,233 @@
+import asyncio
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import Http404, HttpResponse
+from django.template.base import Template
+
+# Lightweight request profiling for production, in place of debug_toolbar. A sample of the
+# requests (PROFILING_SAMPLE_RATE, 0.0 - 1.0) records per URL pattern: latency, SQL query
+# count and time, template render time and response size. The histograms live in memory,
+# per process, and are served in the Prometheus text format by metrics() at /metrics.
+# Like any Prometheus histogram they are cumulative, the scraper turns them into rates.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS = {
+    # name: (help, buckets)
+    'django_request_duration_seconds': ('Request latency', LATENCY_BUCKETS),
+    'django_db_queries': ('SQL queries per request', QUERY_BUCKETS),
+    'django_db_query_duration_seconds': ('Time spent in SQL per request', LATENCY_BUCKETS),
+    'django_template_render_seconds': ('Time spent rendering templates per request', LATENCY_BUCKETS),
+    'django_response_size_bytes': ('Response body size, streaming responses excluded', SIZE_BUCKETS),
+}
+
+
+def sample_rate():
+    return getattr(settings, 'PROFILING_SAMPLE_RATE', 0.1)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One slot per bucket plus +Inf, not cumulative until exported
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {labels: {metric name: Histogram}}
+        self._series = {}
+
+    def observe(self, labels, values):
+        # labels: tuple of (name, value) pairs, values: {metric name: observed value}
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {
+                    name: Histogram(buckets) for name, (_, buckets) in METRICS.items()
+                }
+            for name, value in values.items():
+                series[name].observe(value)
+
+    def totals(self, name):
+        # {labels: (observations, sum)} for one metric
+        with self._lock:
+            return {
+                labels: (sum(series[name].counts), series[name].sum)
+                for labels, series in self._series.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def export(self):
+        with self._lock:
+            snapshot = {
+                labels: {name: (list(histogram.counts), histogram.sum) for name, histogram in series.items()}
+                for labels, series in self._series.items()
+            }
+        lines = [
+            '# HELP django_profiling_sample_rate Fraction of the requests that are profiled',
+            '# TYPE django_profiling_sample_rate gauge',
+            f'django_profiling_sample_rate {sample_rate()}',
+        ]
+        for name, (help_text, buckets) in METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for labels, series in sorted(snapshot.items()):
+                counts, total = series[name]
+                if not any(counts):
+                    continue
+                label_text = ','.join(f'{key}="{escape(value)}"' for key, value in labels)
+                cumulative = 0
+                for bound, count in zip((*buckets, '+Inf'), counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{label_text}}} {total}')
+                lines.append(f'{name}_count{{{label_text}}} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+registry = Registry()
+
+
+class _Sample:
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+
+
+# A ContextVar rather than a thread local: under ASGI one request hops between the event loop
+# and sync_to_async threads, which all see the same context
+_sample = ContextVar('profiling_sample', default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    # Installed on every connection once (see below), records only while a sample is running
+    sample = _sample.get()
+    if sample is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample.query_time += time.perf_counter() - started
+        sample.queries += 1
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    # Sent on every (re)connect, the wrapper list belongs to the longer lived wrapper object.
+    # Goes first in the list: connection.execute_wrapper() blocks pop() the last entry on exit.
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+# Connections this thread opened before the module was imported
+for connection in connections.all(initialized_only=True):
+    install_query_recorder(None, connection)
+
+
+_render = Template.render
+
+
+def _timed_render(self, context):
+    # Only the outermost render is timed, {% include %} and {% extends %} render inside it
+    sample = _sample.get()
+    if sample is None or sample.template_depth:
+        return _render(self, context)
+    sample.template_depth += 1
+    started = time.perf_counter()
+    try:
+        return _render(self, context)
+    finally:
+        sample.template_time += time.perf_counter() - started
+        sample.template_depth -= 1
+
+
+Template.render = _timed_render
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Marks this instance as a coroutine function, the way Django's MiddlewareMixin does
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        if random.random() >= sample_rate():
+            return self.get_response(request)
+
+        sample = _Sample()
+        token = _sample.set(sample)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _sample.reset(token)
+        self.record(request, response, sample, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= sample_rate():
+            return await self.get_response(request)
+
+        sample = _Sample()
+        token = _sample.set(sample)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _sample.reset(token)
+        self.record(request, response, sample, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, sample, elapsed):
+        match = request.resolver_match
+        route = match.route if match is not None else 'unmatched'
+        values = {
+            'django_request_duration_seconds': elapsed,
+            'django_db_queries': sample.queries,
+            'django_db_query_duration_seconds': sample.query_time,
+            'django_template_render_seconds': sample.template_time,
+        }
+        # Streaming bodies are produced after this returns, their size isn't known here
+        if not response.streaming:
+            values['django_response_size_bytes'] = len(response.content)
+        registry.observe((('route', route), ('method', request.method)), values)
+
+
+def metrics(request):
+    # Only answers INTERNAL_IPS, to everyone else /metrics does not exist
+    if request.META.get('REMOTE_ADDR') not in settings.INTERNAL_IPS:
+        raise Http404
+    return HttpResponse(registry.export(), content_type='text/plain; version=0.0.4; charset=utf-8')
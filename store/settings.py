@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -23,9 +24,13 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-6@_^(olp730zxxo-72lle@8et=_h2$ed+m!+16n)u356$uzh^l'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Off unless the environment asks for it: DJANGO_DEBUG=1 python manage.py runserver
+DEBUG = os.environ.get('DJANGO_DEBUG') == '1'
 
-ALLOWED_HOSTS = []
+# The debug toolbar comes with DEBUG, DJANGO_DEBUG_TOOLBAR=0 leaves it out
+DEBUG_TOOLBAR = DEBUG and os.environ.get('DJANGO_DEBUG_TOOLBAR', '1') == '1'
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
 
 
 # Application definition
@@ -38,13 +43,13 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'sandbox',
-    'debug_toolbar',
     'shop', 
     'tags',
     'likes', 
 ]
 
 MIDDLEWARE = [
+    'store.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -52,9 +57,17 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
+# debug_toolbar costs several times the request itself, so it only runs in development.
+# store.profiling samples requests everywhere instead, see /metrics.
+if DEBUG_TOOLBAR:
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
+
+# Fraction of the requests store.profiling records, 0 turns it off
+PROFILING_SAMPLE_RATE = 0.1
+
 ROOT_URLCONF = 'store.urls'
 
 TEMPLATES = [
@@ -83,9 +96,72 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        # Seconds a connection waits for another one's write lock before "database is locked"
+        'OPTIONS': {'timeout': 20},
+        # Keep connections open between requests instead of reconnecting every time
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+    },
+    # The same file opened read-only, for listing and reporting reads (see store.routers)
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f'file:{BASE_DIR / "db.sqlite3"}?mode=ro',
+        'OPTIONS': {'timeout': 20},
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+DATABASE_ROUTERS = ['store.routers.ReadReplicaRouter']
+
+# Set on every new SQLite connection by store.sqlite. The journal mode (WAL) is stored in the
+# database file and set once, by the shop 0016_sqlite_wal migration
+SQLITE_PRAGMAS = {
+    # With WAL only checkpoints need an fsync, a crash can't corrupt the database
+    'synchronous': 'normal',
+    # 64 MB page cache (negative = KiB) and up to 256 MB of the file memory-mapped
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'memory',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# locmem works offline and per process, point 'default' at redis / memcached to share it
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'store',
+    },
+    # Carts live only here until they are flushed (see shop.carts), so this one is sized never
+    # to cull. In production point it at a shared store that doesn't evict, not an LRU.
+    'carts': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'carts',
+        'OPTIONS': {'MAX_ENTRIES': 10_000_000},
+    },
 }
 
+# Catalog response cache, see shop.cache
+CATALOG_CACHE_ALIAS = 'default'
+CATALOG_CACHE_TIMEOUT = 300
+
+# Write-behind carts, see shop.carts
+CART_CACHE_ALIAS = 'carts'
+
+# Slugs the /products/<slug>/ lookup keeps in memory per process, see shop.slugs
+PRODUCT_SLUG_CACHE_SIZE = 10000
+
+# Seconds between the ANALYZE runs behind the admin row count estimates (see shop.pagination),
+# None to leave it to `manage.py refresh_table_statistics`
+TABLE_STATISTICS_INTERVAL = 6 * 60 * 60
+
+# Orders older than this move to the archive tables, see `manage.py archive_orders`
+ORDER_ARCHIVE_AFTER_DAYS = 730
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
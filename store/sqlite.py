@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Applies settings.SQLITE_PRAGMAS to every new SQLite connection. These pragmas only last as
+# long as the connection, so they have to be set each time one is opened.
+#
+# The journal mode is kept in the database file itself, so it is set once instead, by the
+# shop 0016_sqlite_wal migration (or set_journal_mode() for a file built some other way).
+# Setting it on every connection would write to the file each time one is opened.
+
+
+def is_read_only(connection):
+    return 'mode=ro' in str(connection.settings_dict['NAME'])
+
+
+def set_journal_mode(connection, mode='wal'):
+    # Returns the mode in effect afterwards: 'memory' for in-memory databases, which have no
+    # journal file. Fails inside a transaction.
+    with connection.cursor() as cursor:
+        cursor.execute(f'PRAGMA journal_mode = {mode}')
+        return cursor.fetchone()[0]
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -0,0 +1,105 @@
+import re
+import traceback
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.db import connections
+
+# Test helpers shared by the apps' tests.py files.
+
+
+def load_seed_data(using='default'):
+    # Runs data_population_query.sql (collections, products, customers, orders and order items)
+    # against the test database, one statement at a time
+    sql = (settings.BASE_DIR / 'data_population_query.sql').read_text()
+    with connections[using].cursor() as cursor:
+        for statement in sql.split(';'):
+            if statement.strip():
+                cursor.execute(statement)
+
+
+# Literals that make otherwise identical raw SQL look different
+_NUMBERS = re.compile(r'\b\d+(\.\d+)?\b')
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_IN_LISTS = re.compile(r'\bIN \((?:%s, )*%s\)')
+
+
+def query_shape(sql):
+    # The query with its parameters and literals blanked out: an N+1 runs one shape per row
+    sql = _STRINGS.sub('%s', sql)
+    sql = _NUMBERS.sub('%s', sql)
+    return _IN_LISTS.sub('IN (...)', sql)
+
+
+def project_stack():
+    # The frames of this project (not Django's or the standard library's) that led to a query
+    base = str(settings.BASE_DIR)
+    return [
+        frame for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(base) and 'site-packages' not in frame.filename
+        and frame.filename != __file__
+    ]
+
+
+class QueryBudget(ContextDecorator):
+    """
+    Fails when the block runs more than `budget` queries, or the same query shape more than
+    `repeats` times (an N+1). Works as a context manager or as a test method decorator:
+
+        with QueryBudget(4):
+            self.client.get('/admin/shop/product/')
+
+        @QueryBudget(4, repeats=2)
+        def test_changelist(self): ...
+
+    Queries on every database alias count (reads outside transactions go to the replica, see
+    store.routers), or only those on `using`, an alias or a list of them.
+    The failure lists every query, and for a repeated shape where it was issued from.
+    """
+
+    def __init__(self, budget, repeats=1, using=None):
+        self.budget = budget
+        self.repeats = repeats
+        self.using = [using] if isinstance(using, str) else using
+
+    def __enter__(self):
+        self.queries = []
+        self._wrappers = [
+            connections[alias].execute_wrapper(self._recorder(alias))
+            for alias in (self.using or connections)
+        ]
+        for wrapper in self._wrappers:
+            wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        for wrapper in reversed(self._wrappers):
+            wrapper.__exit__(exc_type, exc_value, tb)
+        if exc_type is None:
+            self.check()
+
+    def _recorder(self, alias):
+        def record(execute, sql, params, many, context):
+            self.queries.append((sql, project_stack(), alias))
+            return execute(sql, params, many, context)
+        return record
+
+    def check(self):
+        problems = []
+        if len(self.queries) > self.budget:
+            problems.append(f'{len(self.queries)} queries, the budget is {self.budget}')
+
+        shapes = {}
+        for sql, stack, _ in self.queries:
+            shapes.setdefault(query_shape(sql), []).append(stack)
+        for shape, stacks in shapes.items():
+            if len(stacks) > self.repeats:
+                where = ''.join(traceback.format_list(stacks[-1])) or '  (outside the project)\n'
+                problems.append(f'N+1: ran {len(stacks)} times: {shape}\nlast issued from:\n{where}')
+
+        if problems:
+            queries = '\n'.join(
+                f'{number}. [{alias}] {sql}' for number, (sql, _, alias) in enumerate(self.queries, 1)
+            )
+            raise AssertionError('\n\n'.join(problems) + f'\n\nQueries:\n{queries}')
+
@@ -0,0 +1,140 @@
+import os
+import runpy
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.db import connection, connections, router, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from shop.models import Collection, Product
+
+from .profiling import registry
+from .sqlite import set_journal_mode
+from .testing import QueryBudget, query_shape
+
+
+@override_settings(PROFILING_SAMPLE_RATE=1)
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        registry.clear()
+
+    def test_records_per_route(self):
+        Collection.objects.create(title='Grocery')
+        self.client.get('/playground/html/')
+        self.client.get('/playground/html/')
+        self.client.get('/catalog/')
+
+        metrics = self.client.get('/metrics').content.decode()
+        self.assertIn('django_request_duration_seconds_count{route="playground/html/",method="GET"} 2', metrics)
+        self.assertIn('django_template_render_seconds_count{route="playground/html/",method="GET"} 2', metrics)
+        self.assertIn('django_db_queries_bucket{route="playground/html/",method="GET",le="0"} 2', metrics)
+        self.assertIn('django_db_queries_count{route="catalog/",method="GET"} 1', metrics)
+        self.assertIn('django_db_queries_bucket{route="catalog/",method="GET",le="0"} 0', metrics)
+
+    @override_settings(PROFILING_SAMPLE_RATE=0)
+    def test_sampling_off(self):
+        self.client.get('/playground/html/')
+        self.assertNotIn('route="playground/html/"', self.client.get('/metrics').content.decode())
+
+    def test_metrics_only_for_internal_ips(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.1.2.3').status_code, 404)
+
+
+class QueryBudgetTests(TestCase):
+    def test_over_budget(self):
+        with self.assertRaisesMessage(AssertionError, '2 queries, the budget is 1'):
+            with QueryBudget(1):
+                list(Collection.objects.all())
+                list(Collection.objects.filter(title='Grocery'))
+
+    def test_repeated_shape_points_at_its_caller(self):
+        collections = Collection.objects.bulk_create([Collection(title='Grocery'), Collection(title='Toys')])
+        with self.assertRaises(AssertionError) as failure:
+            with QueryBudget(10):
+                for collection in collections:
+                    Collection.objects.get(pk=collection.pk)
+        self.assertIn('N+1: ran 2 times', str(failure.exception))
+        self.assertIn('in test_repeated_shape_points_at_its_caller', str(failure.exception))
+
+    def test_shapes_ignore_literals(self):
+        self.assertEqual(
+            query_shape("SELECT * FROM t WHERE id IN (1, 2) AND name = 'x'"),
+            query_shape("SELECT * FROM t WHERE id IN (3) AND name = 'it''s'"),
+        )
+
+
+class ReadReplicaRouterTests(TransactionTestCase):
+    databases = {'default', 'replica'}
+
+    def test_reads_leave_transactions_alone(self):
+        self.assertEqual(router.db_for_read(Product), 'replica')
+        self.assertEqual(router.db_for_write(Product), 'default')
+        with transaction.atomic():
+            Collection.objects.create(title='Grocery')
+            self.assertEqual(router.db_for_read(Product), 'default')
+            self.assertEqual(Collection.objects.get().title, 'Grocery')
+        self.assertEqual(Collection.objects.all().db, 'replica')
+        self.assertEqual(Collection.objects.get().title, 'Grocery')
+
+    def test_query_budget_counts_every_alias(self):
+        # Opened beforehand, so the connection's own PRAGMAs (see store.sqlite) stay out of the count
+        connections['replica'].ensure_connection()
+        with self.assertRaises(AssertionError) as failure:
+            with QueryBudget(1):
+                Collection.objects.create(title='Grocery')
+                list(Collection.objects.all())
+        self.assertIn('2 queries, the budget is 1', str(failure.exception))
+        self.assertIn('[replica] SELECT', str(failure.exception))
+        with QueryBudget(0, using='default'):
+            list(Collection.objects.all())
+
+    def test_pragmas(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute('PRAGMA cache_size')
+            self.assertEqual(cursor.fetchone()[0], -64000)
+
+    def test_journal_mode_is_set_once(self):
+        def journal_mode(path):
+            scratch = connections['default'].__class__({**connection.settings_dict, 'NAME': path}, alias='scratch')
+            try:
+                with scratch.cursor() as cursor:
+                    cursor.execute('PRAGMA journal_mode')
+                    mode = cursor.fetchone()[0]
+                    if mode != 'wal':
+                        set_journal_mode(scratch, 'wal')
+                return mode
+            finally:
+                scratch.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'db.sqlite3')
+            # Opening a connection leaves the file as it was, WAL then stays with it
+            self.assertEqual(journal_mode(path), 'delete')
+            self.assertEqual(journal_mode(path), 'wal')
+
+
+class SettingsTests(SimpleTestCase):
+    def settings_with(self, **environ):
+        # store/settings.py evaluated afresh under the given environment
+        with mock.patch.dict(os.environ, environ):
+            for name in ('DJANGO_DEBUG', 'DJANGO_DEBUG_TOOLBAR'):
+                if name not in environ:
+                    os.environ.pop(name, None)
+            return runpy.run_path(str(settings.BASE_DIR / 'store' / 'settings.py'))
+
+    def test_debug_and_toolbar_are_off_by_default(self):
+        for environ, debug, toolbar in [
+            ({}, False, False),
+            ({'DJANGO_DEBUG': '1'}, True, True),
+            ({'DJANGO_DEBUG': '1', 'DJANGO_DEBUG_TOOLBAR': '0'}, True, False),
+            ({'DJANGO_DEBUG_TOOLBAR': '1'}, False, False),
+        ]:
+            values = self.settings_with(**environ)
+            self.assertEqual(values['DEBUG'], debug, environ)
+            self.assertEqual('debug_toolbar' in values['INSTALLED_APPS'], toolbar, environ)
+            self.assertEqual(
+                'debug_toolbar.middleware.DebugToolbarMiddleware' in values['MIDDLEWARE'], toolbar, environ
+            )
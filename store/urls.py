@@ -13,9 +13,12 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from .profiling import metrics
+
 # Admin panel customisation 
 admin.site.site_header = 'Store Admin Portal' # Changes the main Title header
 admin.site.index_title = 'Hello Admin!' # Changes the index title seen below the header
@@ -23,5 +26,9 @@ admin.site.index_title = 'Hello Admin!' # Changes the index title seen below the
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('playground/', include('sandbox.urls')),
-    path('__debug__/', include('debug_toolbar.urls')),
+    path('', include('shop.urls')),
+    path('metrics', metrics),
 ]
+
+if 'debug_toolbar' in settings.INSTALLED_APPS:
+    urlpatterns.append(path('__debug__/', include('debug_toolbar.urls')))
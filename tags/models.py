@@ -1,12 +1,22 @@
 from django.db import models
+from django.core.cache import cache
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 
 # The Tagged Item manger
 
+# Cached tag lists live under tags:<content_type_id>:<object_id> in the default cache
+TAGS_CACHE_TIMEOUT = 60 * 60
+
+
+def tags_cache_key(content_type_id, object_id):
+    return f'tags:{content_type_id}:{object_id}'
+
+
 class TaggedItemsManager(models.Manager): # inherits from the models.Manager class
     def get_tags_for(self, obj_type, obj_id):
-        content_type = ContentType.objects.get_from_model(obj_type)
+        # get_for_model keeps its own cache, so this doesn't hit the database every call
+        content_type = ContentType.objects.get_for_model(obj_type)
         query_set = TaggedItem.objects.\
             select_related('tag').\
             filter(
@@ -15,6 +25,32 @@ class TaggedItemsManager(models.Manager): # inherits from the models.Manager cla
     # Returns a query set
         return query_set
 
+    def get_tags_for_many(self, obj_type, obj_ids):
+        # Returns {object_id: [TaggedItem, ...]} for every id, fetching all the misses in one query
+        content_type = ContentType.objects.get_for_model(obj_type)
+        keys = {tags_cache_key(content_type.id, obj_id): obj_id for obj_id in obj_ids}
+        cached = cache.get_many(keys)
+        tags = {keys[key]: items for key, items in cached.items()}
+
+        missing = [obj_id for key, obj_id in keys.items() if key not in cached]
+        if missing:
+            fetched = {obj_id: [] for obj_id in missing}
+            query_set = TaggedItem.objects.\
+                select_related('tag').\
+                filter(content_type = content_type, object_id__in = missing)
+            for item in query_set:
+                fetched[item.object_id].append(item)
+            # Empty lists are cached too, untagged objects are the common case
+            cache.set_many(
+                {tags_cache_key(content_type.id, obj_id): items for obj_id, items in fetched.items()},
+                TAGS_CACHE_TIMEOUT,
+            )
+            tags.update(fetched)
+        return tags
+
+    def invalidate(self, content_type_id, object_id):
+        cache.delete(tags_cache_key(content_type_id, object_id))
+
 
 # Create your models here.
 
@@ -34,3 +70,16 @@ class TaggedItem(models.Model):
     # defining object of the TaggedItemManager class
     objects = TaggedItemsManager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember what the row pointed at, so a save that moves it can drop the old cached list too
+        instance = super().from_db(db, field_names, values)
+        if 'content_type_id' in instance.__dict__ and 'object_id' in instance.__dict__:
+            instance._loaded_key = (instance.content_type_id, instance.object_id)
+        return instance
+
+    class Meta:
+        # Every lookup goes through (content_type, object_id)
+        indexes = [
+            models.Index(fields = ['content_type', 'object_id'])
+        ]
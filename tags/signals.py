@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import TaggedItem, Tags
+
+
+@receiver(pre_save, sender=TaggedItem)
+def remember_tagged_object(sender, instance, raw, **kwargs):
+    # Items built by hand (not loaded through from_db) need one lookup to learn the old object
+    if instance.pk is not None and not hasattr(instance, '_loaded_key') and not raw:
+        instance._loaded_key = TaggedItem.objects.\
+            filter(pk=instance.pk).values_list('content_type_id', 'object_id').first()
+
+
+@receiver([post_save, post_delete], sender=TaggedItem)
+def invalidate_tagged_item(sender, instance, **kwargs):
+    # The object the item points at now and, when a save moved it, the one it pointed at before
+    current = (instance.content_type_id, instance.object_id)
+    for content_type_id, object_id in {current, getattr(instance, '_loaded_key', None)} - {None}:
+        TaggedItem.objects.invalidate(content_type_id, object_id)
+    instance._loaded_key = current
+
+
+@receiver(post_save, sender=Tags)
+def invalidate_tag_label(sender, instance, created, **kwargs):
+    # Cached lists carry the tag itself, so a renamed label has to drop every object using it
+    if created:
+        return
+    tagged = TaggedItem.objects.filter(tag=instance).values_list('content_type_id', 'object_id')
+    for content_type_id, object_id in tagged.iterator():
+        TaggedItem.objects.invalidate(content_type_id, object_id)
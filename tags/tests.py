@@ -1,3 +1,55 @@
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import TestCase
 
+from .models import TaggedItem, Tags
+
+
 # Create your tests here.
+class TagsCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user_type = ContentType.objects.get_for_model(User)
+        cls.fresh = Tags.objects.create(label='fresh')
+        cls.vegan = Tags.objects.create(label='vegan')
+        cls.item = TaggedItem.objects.create(tag=cls.fresh, content_type=cls.user_type, object_id=1)
+
+    def setUp(self):
+        cache.clear()
+
+    def labels(self, ids):
+        tags = TaggedItem.objects.get_tags_for_many(User, ids)
+        return {obj_id: [item.tag.label for item in items] for obj_id, items in tags.items()}
+
+    def test_read_through(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.labels([1, 2]), {1: ['fresh'], 2: []})
+        # Untagged objects are cached as well
+        with self.assertNumQueries(0):
+            self.assertEqual(self.labels([1, 2]), {1: ['fresh'], 2: []})
+
+    def test_save_and_delete(self):
+        self.labels([1])
+        item = TaggedItem.objects.create(tag=self.vegan, content_type=self.user_type, object_id=1)
+        self.assertEqual(self.labels([1]), {1: ['fresh', 'vegan']})
+        item.delete()
+        self.assertEqual(self.labels([1]), {1: ['fresh']})
+
+    def test_moved_item(self):
+        # Loaded from the database, and built by hand with only the pk known
+        for item in [TaggedItem.objects.get(pk=self.item.pk),
+                     TaggedItem(pk=self.item.pk, tag=self.fresh, content_type=self.user_type, object_id=1)]:
+            with self.subTest(item=item):
+                self.labels([1, 2])
+                item.object_id = 2
+                item.save()
+                self.assertEqual(self.labels([1, 2]), {1: [], 2: ['fresh']})
+                item.object_id = 1
+                item.save()
+
+    def test_renamed_label(self):
+        self.labels([1])
+        self.fresh.label = 'seasonal'
+        self.fresh.save()
+        self.assertEqual(self.labels([1]), {1: ['seasonal']})